@@ -53,6 +53,7 @@ class UserProfileDTO(BaseModel):
 
 class UserListDTO(BaseModel):
     users: List[UserProfileDTO]
+    next_cursor: Optional[str] = None
 
 class UserUpdateDTO(BaseModel):
     email: Optional[EmailStr] = None
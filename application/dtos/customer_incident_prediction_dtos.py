@@ -1,7 +1,6 @@
 from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
-from decimal import Decimal
 from domain.entities.customer_incident_prediction import IncidentType
 
 class CustomerIncidentPredictionDTO(BaseModel):
@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+from typing import Optional, Dict, Any, List
+from datetime import datetime
+from domain.entities.import_job import ImportJobStatus
+
+class ImportJobDTO(BaseModel):
+    id: str
+    kind: str
+    filename: str
+    status: ImportJobStatus
+    progress: float = 0.0
+    total_rows: int = 0
+    created_count: int = 0
+    failed_count: int = 0
+    error_count: int = 0
+    errors: List[str] = []
+    message: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+class ImportJobAcceptedDTO(BaseModel):
+    job_id: str
+    status: ImportJobStatus
+    status_url: str
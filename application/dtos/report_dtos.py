@@ -2,8 +2,8 @@ from pydantic import BaseModel
 from typing import List, Dict, Any
 
 class ChurnTrendsDTO(BaseModel):
-    months: List[str]
-    churn_rates: List[float]
+    months: List[str]  # months clients were added, e.g. "Jan 2025", oldest first
+    average_churn_risk: List[float]  # 0-100, of the clients added in each month
 
 class ChurnSegmentDTO(BaseModel):
     name: str
@@ -25,6 +25,7 @@ class RetentionActionDTO(BaseModel):
     effectiveness: int
     cost: int
     roi: int
+    recommendations: int = 0
 
 class RetentionActionsDTO(BaseModel):
     actions: List[RetentionActionDTO]
@@ -0,0 +1,29 @@
+# Sparse fieldsets for list endpoints
+#
+# A caller may ask for a subset of a DTO's fields (`?fields=id,name`). The
+# service then reads only the columns behind those fields and returns plain
+# dicts holding just the requested values, validated as the DTO would.
+from pydantic import BaseModel, ValidationError, validate_model
+from typing import Any, Dict, List, Mapping, Sequence, Type
+
+def columns_for_fields(fields: Sequence[str], field_columns: Mapping[str, Sequence[str]] = None) -> List[str]:
+    """Table columns needed to build the given DTO fields
+
+    A field reads the column of the same name unless `field_columns` lists
+    the columns it is derived from.
+    """
+    field_columns = field_columns or {}
+    columns: List[str] = []
+    for name in fields:
+        columns.extend(field_columns.get(name, (name,)))
+    return list(dict.fromkeys(columns))
+
+def sparse_dto(dto_class: Type[BaseModel], values: Dict[str, Any], fields: Sequence[str]) -> Dict[str, Any]:
+    """Validate only the requested DTO fields and return them as a dict"""
+    validated, _, error = validate_model(dto_class, {name: values.get(name) for name in fields})
+    if error:
+        # Fields that were not requested are reported as missing; ignore those
+        errors = [e for e in error.raw_errors if getattr(e, "_loc", None) in fields]
+        if errors:
+            raise ValidationError(errors, dto_class)
+    return {name: validated.get(name) for name in fields}
@@ -1,26 +1,71 @@
 from domain.entities.user import User, UserRole
 from domain.value_objects.auth_token import AuthToken
 from domain.repositories.user_repository_interface import UserRepositoryInterface
+from domain.value_objects.page import PageRequest
 from application.dtos.auth_dtos import UserCreateDTO, UserLoginDTO, TokenResponseDTO, UserProfileDTO, UserListDTO, UserUpdateDTO
+from application.dtos.sparse_fields import columns_for_fields, sparse_dto
 from infrastructure.services.jwt_service import JWTService
+from infrastructure.services.entity_cache import get_entity_cache
 from fastapi import HTTPException, status
 from datetime import datetime, timedelta
 from supabase import Client as SupabaseClient
 from passlib.context import CryptContext
-from typing import List
+from typing import Any, Dict, List, Optional
+import os
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# AUTH_MODE=stateless resolves the current user's id and role from the access
+# token instead of reading the users table on every request. Tokens carry no
+# other profile data. Stateless tokens expire after JWT_STATELESS_EXPIRE_MINUTES
+# (default 15), which bounds how long a changed role or a deleted account keeps
+# working; older tokens, and tokens without a role claim, are resolved from the
+# users table.
+AUTH_MODE_DATABASE = "database"
+AUTH_MODE_STATELESS = "stateless"
+
+def get_auth_mode() -> str:
+    mode = os.getenv("AUTH_MODE", AUTH_MODE_DATABASE).strip().lower()
+    return mode if mode in (AUTH_MODE_DATABASE, AUTH_MODE_STATELESS) else AUTH_MODE_DATABASE
+
+def get_stateless_token_lifetime() -> timedelta:
+    return timedelta(minutes=int(os.getenv("JWT_STATELESS_EXPIRE_MINUTES", "15")))
+
 class AuthApplicationService:
     def __init__(
         self, 
         user_repository: UserRepositoryInterface,
         jwt_service: JWTService,
-        supabase: SupabaseClient
+        supabase: Optional[SupabaseClient] = None
     ):
         self.user_repository = user_repository
         self.jwt_service = jwt_service
         self.supabase = supabase
+        self.auth_mode = get_auth_mode()
+        self.stateless_token_lifetime = get_stateless_token_lifetime()
+        # Stateless mode fallback for tokens it cannot trust
+        self.profile_cache = get_entity_cache("auth_profiles", default_ttl_seconds=60, default_max_entries=10000)
+    
+    def _to_profile_dto(self, user: User) -> UserProfileDTO:
+        return UserProfileDTO(**self._profile_values(user))
+    
+    def _profile_values(self, user: User) -> Dict[str, Any]:
+        return dict(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            role=user.role.value,
+            cin=user.cin,
+            code=user.code,
+            created_at=user.created_at.isoformat() if user.created_at else None
+        )
+    
+    def _create_token(self, user: User) -> str:
+        """Issue an access token identifying the user and their role"""
+        claims = {"sub": user.id, "role": user.role.value}
+        if self.auth_mode == AUTH_MODE_STATELESS:
+            return self.jwt_service.create_access_token(claims, expires_delta=self.stateless_token_lifetime)
+        return self.jwt_service.create_access_token(claims)
     
     async def register_user(self, user_data: UserCreateDTO) -> TokenResponseDTO:
         """Register a new user"""
@@ -74,7 +119,7 @@ class AuthApplicationService:
                 )
             
             # Generate JWT token
-            token = self.jwt_service.create_access_token({"sub": created_user.id})
+            token = self._create_token(created_user)
             
             return TokenResponseDTO(
                 access_token=token,
@@ -107,7 +152,7 @@ class AuthApplicationService:
                 )
             
             # Generate JWT token
-            token = self.jwt_service.create_access_token({"sub": user.id})
+            token = self._create_token(user)
             
             return TokenResponseDTO(
                 access_token=token,
@@ -137,36 +182,53 @@ class AuthApplicationService:
                 detail="User not found"
             )
         
-        return UserProfileDTO(
-            id=user.id,
-            email=user.email,
-            full_name=user.full_name,
-            role=user.role.value,
-            cin=user.cin,
-            code=user.code,
-            created_at=user.created_at.isoformat() if user.created_at else None
-        )
+        return self._to_profile_dto(user)
+    
+    async def get_current_user_from_claims(self, claims: Dict[str, Any]) -> UserProfileDTO:
+        """Resolve the current user from decoded token claims according to AUTH_MODE
+
+        In stateless mode the returned profile only has `id` and `role` set;
+        use `get_current_user` for the full profile.
+        """
+        user_id = claims["sub"]
+        if self.auth_mode != AUTH_MODE_STATELESS:
+            return await self.get_current_user(user_id)
+        
+        role = claims.get("role")
+        issued_at = claims.get("iat")
+        token_age = datetime.utcnow() - datetime.utcfromtimestamp(issued_at) if issued_at is not None else None
+        if role is not None and token_age is not None and token_age <= self.stateless_token_lifetime:
+            return UserProfileDTO.construct(id=user_id, role=role)
+        
+        profile = self.profile_cache.get(user_id)
+        if profile is None:
+            profile = await self.get_current_user(user_id)
+            self.profile_cache.set(user_id, profile)
+        return profile
     
-    async def get_all_users(self, current_user: UserProfileDTO) -> UserListDTO:
-        """Get all users (admin only)"""
+    async def get_all_users(self, current_user: UserProfileDTO, page_request: Optional[PageRequest] = None,
+                            fields: Optional[List[str]] = None) -> UserListDTO:
+        """Get one page of users (admin only)
+
+        Only profile columns are read, never password hashes. With `fields`,
+        the users are dicts of just those profile fields.
+        """
         if current_user.role != UserRole.ADMIN.value:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only administrators can access this endpoint"
             )
         
-        users = await self.user_repository.get_all()
-        return UserListDTO(users=[
-            UserProfileDTO(
-                id=user.id,
-                email=user.email,
-                full_name=user.full_name,
-                role=user.role.value,
-                cin=user.cin,
-                code=user.code,
-                created_at=user.created_at.isoformat() if user.created_at else None
-            ) for user in users
-        ])
+        page_request = page_request or PageRequest()
+        page_request.columns = columns_for_fields(fields or list(UserProfileDTO.__fields__))
+        page = await self.user_repository.get_page(page_request)
+        if fields:
+            # construct() skips re-validating the already validated partial users
+            return UserListDTO.construct(
+                users=[sparse_dto(UserProfileDTO, self._profile_values(user), fields) for user in page.items],
+                next_cursor=page.next_cursor
+            )
+        return UserListDTO(users=[self._to_profile_dto(user) for user in page.items], next_cursor=page.next_cursor)
     
     async def delete_user(self, user_id: str, current_user: UserProfileDTO) -> bool:
         """Delete a user (admin only)"""
@@ -191,7 +253,9 @@ class AuthApplicationService:
                 detail="Cannot delete your own account"
             )
         
-        return await self.user_repository.delete(user_id)
+        deleted = await self.user_repository.delete(user_id)
+        self.profile_cache.invalidate(user_id)
+        return deleted
     
     async def update_user(self, user_id: str, user_data: UserUpdateDTO, current_user: UserProfileDTO) -> UserProfileDTO:
         """Update a user (admin only)"""
@@ -251,13 +315,6 @@ class AuthApplicationService:
         
         # Update user in repository
         updated_user = await self.user_repository.update(user)
+        self.profile_cache.invalidate(user_id)
         
-        return UserProfileDTO(
-            id=updated_user.id,
-            email=updated_user.email,
-            full_name=updated_user.full_name,
-            role=updated_user.role.value,
-            cin=updated_user.cin,
-            code=updated_user.code,
-            created_at=updated_user.created_at.isoformat() if updated_user.created_at else None
-        )
+        return self._to_profile_dto(updated_user)
@@ -1,7 +1,8 @@
 # File: application/services/client_service.py
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+from uuid import UUID
 
 from fastapi import HTTPException, status
 
@@ -10,6 +11,8 @@ from domain.repositories.client_repository_interface import ClientRepositoryInte
 from domain.repositories.interaction_repository_interface import InteractionRepositoryInterface
 from domain.repositories.recommendation_repository_interface import RecommendationRepositoryInterface
 from domain.repositories.factor_repository_interface import FactorRepositoryInterface
+from domain.value_objects.client_detail import ClientDetail
+from domain.value_objects.page import InvalidPageRequestError, Page, PageRequest
 
 from application.dtos.client_dtos import (
     ClientDTO,
@@ -17,6 +20,10 @@ from application.dtos.client_dtos import (
     ClientCreateDTO,
     ContactDTO,
 )
+from application.dtos.sparse_fields import columns_for_fields, sparse_dto
+
+# Upper bound on client IDs per batch detail request
+MAX_DETAIL_BATCH_SIZE = 100
 
 
 class ClientApplicationService:
@@ -42,49 +49,35 @@ class ClientApplicationService:
                 detail=f"Failed to fetch clients: {str(e)}",
             )
 
-        result: List[ClientDTO] = []
-        for client in clients:
-            # Map domain Contact → ContactDTO
-            contact_dto: Optional[ContactDTO] = None
-            if client.contacts:
-                cd = client.contacts
-                contact_dto = ContactDTO(
-                    primary=cd.primary,
-                    secondary=cd.secondary,
-                    preferred_time=cd.preferred_time,
-                    last_call=cd.last_call,
-                )
+        return [self._to_dto(client) for client in clients]
 
-            result.append(
-                ClientDTO(
-                    id=client.id,
-                    name=client.name,
-                    segment=client.segment,
-                    since=client.since,
-                    churn_risk=client.churn_risk,
-                    contacts=contact_dto,
-                )
-            )
-        return result
+    async def get_clients_page(self, page_request: PageRequest, fields: Optional[List[str]] = None) -> Page:
+        """Get one keyset page of clients (list view)
 
-    async def get_client_by_id(self, client_id: str) -> ClientDTO:
-        """Get a single client by ID (list‐style DTO)"""
+        Only the columns behind ClientDTO are read. With `fields`, only those
+        fields are loaded and items are dicts of just those fields.
+        """
+        page_request.columns = columns_for_fields(fields or list(ClientDTO.__fields__))
         try:
-            client = await self.client_repository.get_by_id(client_id)
-        except HTTPException:
+            page = await self.client_repository.get_page(page_request)
+        except InvalidPageRequestError:
             raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to fetch client: {str(e)}",
+                detail=f"Failed to fetch clients: {str(e)}",
             )
+        if fields:
+            items = [sparse_dto(ClientDTO, self._dto_values(client), fields) for client in page.items]
+        else:
+            items = [self._to_dto(client) for client in page.items]
+        return Page(items=items, next_cursor=page.next_cursor)
 
-        if not client:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Client with ID {client_id} not found",
-            )
+    def _to_dto(self, client: Client) -> ClientDTO:
+        return ClientDTO(**self._dto_values(client))
 
+    def _dto_values(self, client: Client) -> Dict[str, Any]:
+        # Map domain Contact → ContactDTO
         contact_dto: Optional[ContactDTO] = None
         if client.contacts:
             cd = client.contacts
@@ -95,7 +88,7 @@ class ClientApplicationService:
                 last_call=cd.last_call,
             )
 
-        return ClientDTO(
+        return dict(
             id=client.id,
             name=client.name,
             segment=client.segment,
@@ -104,9 +97,8 @@ class ClientApplicationService:
             contacts=contact_dto,
         )
 
-    async def get_client_detail(self, client_id: str) -> ClientDetailDTO:
-        """Get detailed client information by ID"""
-        # Fetch base client
+    async def get_client_by_id(self, client_id: str) -> ClientDTO:
+        """Get a single client by ID (list‐style DTO)"""
         try:
             client = await self.client_repository.get_by_id(client_id)
         except HTTPException:
@@ -114,7 +106,7 @@ class ClientApplicationService:
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to fetch client detail: {str(e)}",
+                detail=f"Failed to fetch client: {str(e)}",
             )
 
         if not client:
@@ -123,7 +115,6 @@ class ClientApplicationService:
                 detail=f"Client with ID {client_id} not found",
             )
 
-        # Map Contact
         contact_dto: Optional[ContactDTO] = None
         if client.contacts:
             cd = client.contacts
@@ -134,29 +125,72 @@ class ClientApplicationService:
                 last_call=cd.last_call,
             )
 
-        # Fetch and map related lists
-        interactions = await self.interaction_repository.get_by_client_id(client_id)
-        interactions_data = [i.to_dict() for i in interactions]
-
-        recommendations = await self.recommendation_repository.get_by_client_id(client_id)
-        recommendations_data = [r.to_dict() for r in recommendations]
-
-        factors = await self.factor_repository.get_by_client_id(client_id)
-        factors_data = [f.to_dict() for f in factors]
-
-        return ClientDetailDTO(
+        return ClientDTO(
             id=client.id,
             name=client.name,
             segment=client.segment,
             since=client.since,
             churn_risk=client.churn_risk,
             contacts=contact_dto,
+        )
+
+    async def get_client_detail(self, client_id: str) -> ClientDetailDTO:
+        """Get detailed client information by ID"""
+        details = await self._fetch_details([client_id])
+        if not details:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Client with ID {client_id} not found",
+            )
+        return self._to_detail_dto(details[0])
+
+    async def get_client_details(self, client_ids: List[str]) -> List[ClientDetailDTO]:
+        """Get detailed information for several clients (unknown IDs are skipped)"""
+        client_ids = list(dict.fromkeys(client_ids))
+        if len(client_ids) > MAX_DETAIL_BATCH_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {MAX_DETAIL_BATCH_SIZE} client IDs can be requested at once",
+            )
+        for client_id in client_ids:
+            try:
+                UUID(client_id)
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid client ID: {client_id}",
+                )
+        return [self._to_detail_dto(detail) for detail in await self._fetch_details(client_ids)]
+
+    async def _fetch_details(self, client_ids: List[str]) -> List[ClientDetail]:
+        # Clients and their child collections come back from a single
+        # repository call instead of four sequential round trips
+        try:
+            return await self.client_repository.get_details_by_ids(client_ids)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to fetch client detail: {str(e)}",
+            )
+
+    def _to_detail_dto(self, detail: ClientDetail) -> ClientDetailDTO:
+        client = detail.client
+        summary = self._to_dto(client)
+        return ClientDetailDTO(
+            id=summary.id,
+            name=summary.name,
+            segment=summary.segment,
+            since=summary.since,
+            churn_risk=summary.churn_risk,
+            contacts=summary.contacts,
             monthly_revenue=client.monthly_revenue,
             churn_trend=client.churn_trend,
             churn_trend_days=client.churn_trend_days,
-            interactions=interactions_data,
-            recommendations=recommendations_data,
-            factors=factors_data,
+            interactions=[i.to_dict() for i in detail.interactions],
+            recommendations=[r.to_dict() for r in detail.recommendations],
+            factors=[f.to_dict() for f in detail.factors],
         )
 
     async def create_client(self, client_data: ClientCreateDTO) -> ClientDTO:
@@ -0,0 +1,155 @@
+# Vectorized validation of CSV chunks
+#
+# A chunk of CSV rows is transposed into one array of stripped strings per
+# column, and each check runs over a whole column at once: required fields,
+# numeric conversion and ranges, and membership in a set of allowed values.
+# Each check only looks at rows that are still valid, so a row reports the
+# first check it fails, in the order the checks are applied. Rejected rows
+# are reported in row order with their CSV row number.
+#
+# Numeric columns are converted with a single array cast. When a column
+# holds a value that is not a number, the cast fails and that column alone is
+# converted value by value to find the offending rows. String columns are kept
+# as object arrays: NumPy's fixed-width unicode arrays are slower to build and
+# to convert than the Python strings the csv module already produced.
+from application.services.csv_ingestion import CsvChunk
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+import numpy as np
+
+Message = Union[str, Callable[[str], str]]
+
+
+class ColumnarChunk:
+    def __init__(self, chunk: CsvChunk, columns: Sequence[str], defaults: Optional[Dict[str, str]] = None):
+        self.row_numbers = np.arange(chunk.first_row, chunk.first_row + len(chunk), dtype=np.int64)
+        self.text: Dict[str, np.ndarray] = {
+            name: _object_array(list(map(str.strip, values)))
+            for name, values in chunk.columns(columns, defaults).items()
+        }
+        self.numbers: Dict[str, np.ndarray] = {}
+        self.valid = np.ones(len(chunk), dtype=bool)
+        self._errors: List[Tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def reject(self, mask: np.ndarray, message: Message, column: Optional[str] = None) -> None:
+        """Mark the still-valid rows selected by `mask` as invalid
+
+        `message` is either a fixed string or a function of the rejected
+        row's value in `column`.
+        """
+        rejected = np.flatnonzero(mask & self.valid)
+        if not len(rejected):
+            return
+        self.valid[rejected] = False
+        values = self.text[column][rejected].tolist() if column else [None] * len(rejected)
+        for index, value in zip(rejected.tolist(), values):
+            self._errors.append((index, message(value) if callable(message) else message))
+
+    def require(self, name: str, message: Optional[str] = None) -> None:
+        """Reject rows where the column is blank"""
+        self.reject(self.text[name] == "", message or f"{name} is required")
+
+    def parse_numbers(self, names: Sequence[str], message: Message, required: bool = True,
+                      minimum: Optional[float] = None, maximum: Optional[float] = None,
+                      range_message: Optional[str] = None) -> None:
+        """Convert columns to float64 arrays in `numbers`, rejecting invalid values
+
+        Blank values are rejected when `required`, otherwise they become NaN.
+        Infinite and NaN values written in the file are always rejected.
+        """
+        for name in names:
+            text = self.text[name]
+            blank = text == ""
+            values, invalid = _to_float(np.where(blank, "nan", text).tolist() if blank.any() else text.tolist())
+            invalid |= ~blank & ~np.isfinite(values)
+            if required:
+                invalid |= blank
+            self.reject(invalid, message, name)
+            self.numbers[name] = values
+        if minimum is None and maximum is None:
+            return
+        for name in names:
+            values = self.numbers[name]
+            out_of_range = np.zeros(len(values), dtype=bool)
+            if minimum is not None:
+                out_of_range |= values < minimum
+            if maximum is not None:
+                out_of_range |= values > maximum
+            self.reject(out_of_range, range_message or f"{name} must be between {minimum} and {maximum}")
+
+    def check_choices(self, name: str, choices: Sequence[str], message: Message) -> None:
+        """Reject rows whose value in the column is not one of `choices`"""
+        self.reject(~np.isin(self.text[name], list(choices)), message, name)
+
+    def reject_duplicates(self, name: str, seen: Set[str], message: Message) -> None:
+        """Reject rows repeating a value of an earlier row, in this chunk or in `seen`
+
+        The values of the rows still valid are added to `seen`, so passing the
+        same set for every chunk detects duplicates across a whole file.
+        """
+        candidates = np.flatnonzero(self.valid)
+        values = self.text[name][candidates]
+        duplicate = np.ones(len(candidates), dtype=bool)
+        duplicate[np.unique(values, return_index=True)[1]] = False
+        if seen:
+            duplicate |= np.fromiter((value in seen for value in values.tolist()), dtype=bool, count=len(values))
+        seen.update(values.tolist())
+        mask = np.zeros(len(self), dtype=bool)
+        mask[candidates[duplicate]] = True
+        self.reject(mask, message, name)
+
+    def valid_indices(self) -> Optional[np.ndarray]:
+        """Positions of the valid rows, or None when every row is valid"""
+        if self.valid.all():
+            return None
+        return np.flatnonzero(self.valid)
+
+    def row_numbers_of(self, indices: Optional[np.ndarray]) -> List[int]:
+        return _take(self.row_numbers, indices).tolist()
+
+    def values(self, name: str, indices: Optional[np.ndarray]) -> List[str]:
+        """Stripped values of a column for the given rows"""
+        return _take(self.text[name], indices).tolist()
+
+    def number_values(self, name: str, indices: Optional[np.ndarray]) -> List[Optional[float]]:
+        """Parsed values of a numeric column for the given rows; blanks are None"""
+        values = _take(self.numbers[name], indices)
+        blank = np.isnan(values)
+        if not blank.any():
+            return values.tolist()
+        return [None if is_blank else value for is_blank, value in zip(blank.tolist(), values.tolist())]
+
+    def report_errors(self, report: Callable[[str], None]) -> None:
+        for index, message in sorted(self._errors, key=lambda error: error[0]):
+            report(f"Row {int(self.row_numbers[index])}: {message}")
+
+
+def _take(values: np.ndarray, indices: Optional[np.ndarray]) -> np.ndarray:
+    return values if indices is None else values[indices]
+
+
+def _object_array(values: List[str]) -> np.ndarray:
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _parse_float(value: str) -> Optional[float]:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _to_float(text: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Cast strings to float64, returning the values and a mask of unparseable entries"""
+    try:
+        return np.array(text, dtype=np.float64), np.zeros(len(text), dtype=bool)
+    except ValueError:
+        pass
+    parsed = [_parse_float(value) for value in text]
+    invalid = np.fromiter((value is None for value in parsed), dtype=bool, count=len(parsed))
+    # None becomes NaN
+    return np.array(parsed, dtype=np.float64), invalid
@@ -0,0 +1,230 @@
+# Incremental CSV ingestion for the upload endpoints
+#
+# Uploads are parsed straight from the spooled upload file instead of being
+# read and decoded into one string. Rows are decoded and split lazily, then
+# validated and written CSV_UPLOAD_CHUNK_SIZE rows at a time. Each chunk is
+# released before the next one is read, so peak memory is bounded by the chunk
+# size rather than the file size. Reading and row validation run on a small
+# dedicated thread pool (CSV_PARSE_WORKERS). This offloads the blocking reads
+# of the upload, which is spooled to disk, and keeps each chunk from holding
+# the event loop for its whole parse: the parse threads hand the GIL back at
+# the interpreter's switch interval. Parsing is pure Python and still holds
+# the GIL while it runs, so it shares the CPU with request handling rather
+# than moving off it; more workers do not parse faster.
+#
+# Chunks are committed as they go: if the file turns out to be malformed part
+# way through, the rows before that point stay inserted and the error says
+# where processing stopped.
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from domain.value_objects.batch_write_result import BatchWriteResult
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, Awaitable, Iterator, List, Optional, Sequence, Tuple
+import asyncio
+import csv
+import io
+import itertools
+import logging
+import os
+import threading
+
+# Errors listed in an upload response; further errors are only counted
+MAX_REPORTED_ERRORS = 1000
+
+CsvRow = Tuple[int, Dict[str, str]]
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_upload_chunk_size() -> int:
+    return int(os.getenv("CSV_UPLOAD_CHUNK_SIZE", "5000"))
+
+
+def get_csv_executor() -> ThreadPoolExecutor:
+    """Return the shared CSV parsing executor, creating it on first use"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                max_workers = int(os.getenv("CSV_PARSE_WORKERS", "2"))
+                _executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix="csv-parse"
+                )
+                logging.info(f"CSV parse executor started with {max_workers} workers")
+    return _executor
+
+
+def shutdown_csv_executor() -> None:
+    """Stop the shared CSV parsing executor, waiting for chunks being parsed"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+
+@dataclass
+class CsvIngestionResult:
+    total_rows: int = 0
+    created_count: int = 0
+    failed_count: int = 0
+    error_count: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    def add_error(self, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+    @property
+    def reported_errors(self) -> List[str]:
+        """Errors for the response, noting how many were left out"""
+        omitted = self.error_count - len(self.errors)
+        if omitted > 0:
+            return self.errors + [f"... and {omitted} more errors"]
+        return self.errors
+
+
+@dataclass
+class CsvChunk:
+    """Consecutive data rows of a CSV file, each a list of fields"""
+    fieldnames: List[str]
+    first_row: int  # CSV row number of rows[0]; the header is row 1
+    rows: List[List[str]]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def last_row(self) -> int:
+        return self.first_row + len(self.rows) - 1
+
+    def records(self) -> Iterator[CsvRow]:
+        """(row number, row) pairs with rows as dicts, like csv.DictReader
+
+        Fields missing from the end of a short row are None.
+        """
+        width = len(self.fieldnames)
+        for offset, row in enumerate(self.rows):
+            if len(row) < width:
+                row = row + [None] * (width - len(row))
+            yield self.first_row + offset, dict(zip(self.fieldnames, row))
+
+    def columns(self, names: Sequence[str], defaults: Optional[Dict[str, str]] = None) -> Dict[str, Sequence[str]]:
+        """Values of the named columns, transposed in a single pass
+
+        Fields missing from a short row are empty strings. A column absent
+        from the header takes its value from `defaults`, or is empty.
+        """
+        defaults = defaults or {}
+        positions = {name: position for position, name in enumerate(self.fieldnames)}
+        transposed = list(itertools.zip_longest(*self.rows, fillvalue=""))
+        columns = {}
+        for name in names:
+            position = positions.get(name)
+            if position is None:
+                columns[name] = [defaults.get(name, "")] * len(self.rows)
+            elif position < len(transposed):
+                columns[name] = transposed[position]
+            else:
+                columns[name] = [""] * len(self.rows)
+        return columns
+
+
+# parse_chunk(chunk, report) -> (entities of the valid rows, their row numbers)
+ChunkParser = Callable[[CsvChunk, Callable[[str], None]], Tuple[List[Any], List[int]]]
+
+
+def _read_chunk(rows: Iterator[List[str]], chunk_size: int) -> List[List[str]]:
+    return list(itertools.islice(rows, chunk_size))
+
+
+def parse_rows(parse_row: Callable[[int, Dict[str, str], Callable[[str], None]], Any]) -> ChunkParser:
+    """Chunk parser validating one row at a time with `parse_row(row_number, row, report)`
+
+    `parse_row` returns the entity for a row, or raises ValueError/KeyError
+    to reject it; `report` records a non-fatal warning.
+    """
+    def parse_chunk(chunk: CsvChunk, report: Callable[[str], None]) -> Tuple[List[Any], List[int]]:
+        entities = []
+        row_numbers = []
+        for row_num, row in chunk.records():
+            try:
+                entity = parse_row(row_num, row, report)
+            except (ValueError, KeyError, TypeError) as e:
+                report(f"Row {row_num}: {str(e)}")
+                continue
+            entities.append(entity)
+            row_numbers.append(row_num)
+        return entities, row_numbers
+    return parse_chunk
+
+
+async def iter_csv_chunks(stream: BinaryIO, chunk_size: Optional[int] = None) -> AsyncIterator[CsvChunk]:
+    """Yield chunks of rows read incrementally from a binary CSV stream
+
+    The stream is rewound first, so a file can be read more than once. The
+    first row is the header, and blank rows are skipped as csv.DictReader
+    does. Raises UnicodeDecodeError on invalid UTF-8.
+    """
+    chunk_size = chunk_size or get_upload_chunk_size()
+    loop = asyncio.get_running_loop()
+    stream.seek(0)
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    try:
+        rows = filter(None, csv.reader(text))
+        fieldnames = await loop.run_in_executor(get_csv_executor(), next, rows, None)
+        if fieldnames is None:
+            return
+        first_row = 2
+        while True:
+            chunk = await loop.run_in_executor(get_csv_executor(), _read_chunk, rows, chunk_size)
+            if not chunk:
+                return
+            yield CsvChunk(fieldnames, first_row, chunk)
+            first_row += len(chunk)
+    finally:
+        # Hand the stream back to the upload without closing it
+        text.detach()
+
+
+async def ingest_csv(
+    stream: BinaryIO,
+    parse_chunk: ChunkParser,
+    write_chunk: Callable[[List[Any]], Awaitable[BatchWriteResult]],
+    chunk_size: Optional[int] = None,
+    progress: Optional[Callable[[CsvIngestionResult], None]] = None
+) -> CsvIngestionResult:
+    """Validate and insert a CSV upload chunk by chunk
+
+    `parse_chunk(rows, report)` validates a chunk and returns the entities
+    of its valid rows with their row numbers, reporting rejected rows through
+    `report`; see `parse_rows` for per-row validation. It runs on the CSV
+    parse executor, one chunk at a time. Valid rows of each chunk are passed
+    to `write_chunk` together, after which `progress` is called with the
+    running totals.
+    """
+    loop = asyncio.get_running_loop()
+    result = CsvIngestionResult()
+    last_row = 1
+    try:
+        async for chunk in iter_csv_chunks(stream, chunk_size):
+            last_row = chunk.last_row
+            result.total_rows += len(chunk)
+            entities, row_numbers = await loop.run_in_executor(
+                get_csv_executor(), parse_chunk, chunk, result.add_error
+            )
+            if entities:
+                written = await write_chunk(entities)
+                result.created_count += written.created_count
+                result.failed_count += written.failed_count
+                for message in written.failure_messages(row_numbers):
+                    result.add_error(message)
+            if progress:
+                progress(result)
+    except UnicodeDecodeError:
+        if result.total_rows == 0:
+            raise
+        result.add_error(f"File is not valid UTF-8 after row {last_row}; the remaining rows were not processed")
+    return result
@@ -1,16 +1,31 @@
 from domain.repositories.customer_incident_prediction_repository_interface import CustomerIncidentPredictionRepositoryInterface
-from domain.entities.customer_incident_prediction import CustomerIncidentPrediction, IncidentType
+from domain.entities.customer_incident_prediction import CustomerIncidentPrediction, IncidentType, risk_level_for
+from domain.value_objects.page import Page, PageRequest
+from domain.value_objects.prediction_collection import PredictionCollection
 from application.dtos.customer_incident_prediction_dtos import (
     CustomerIncidentPredictionDTO, 
     CustomerIncidentPredictionCreateDTO, 
     CustomerIncidentPredictionUpdateDTO,
     CustomerRiskAnalysisDTO
 )
-from typing import List, Optional
-from decimal import Decimal
+from application.dtos.sparse_fields import columns_for_fields, sparse_dto
+from application.services.columnar_validation import ColumnarChunk
+from application.services.csv_ingestion import CsvChunk, CsvIngestionResult, get_csv_executor, ingest_csv, iter_csv_chunks
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Set, Tuple
+import asyncio
 import logging
-import csv
-import io
+
+# DTO fields computed from several columns
+QUARTER_PREDICTION_COLUMNS = ("q1_prediction", "q2_prediction", "q3_prediction", "q4_prediction")
+PREDICTION_FIELD_COLUMNS = {
+    "avg_risk_percentage": QUARTER_PREDICTION_COLUMNS,
+    "risk_level": QUARTER_PREDICTION_COLUMNS
+}
+
+# CSV upload columns; quarter predictions are percentages
+REQUIRED_CSV_COLUMNS = ("customer_id", "client_region", "client_type", "most_likely_incident", "recommendation")
+PREDICTION_CSV_COLUMNS = REQUIRED_CSV_COLUMNS + ("client_category",) + QUARTER_PREDICTION_COLUMNS
+INCIDENT_TYPES = {incident_type.value: incident_type for incident_type in IncidentType}
 
 class CustomerIncidentPredictionApplicationService:
     def __init__(self, prediction_repository: CustomerIncidentPredictionRepositoryInterface):
@@ -18,7 +33,18 @@ class CustomerIncidentPredictionApplicationService:
     
     async def get_all_predictions(self) -> List[CustomerIncidentPredictionDTO]:
         predictions = await self.prediction_repository.get_all()
-        return [self._to_dto(prediction) for prediction in predictions]
+        return self._to_dtos(predictions)
+    
+    async def get_predictions_page(self, page_request: PageRequest, fields: Optional[List[str]] = None) -> Page:
+        """One keyset page; with `fields`, only those fields are loaded and items are dicts"""
+        if fields:
+            page_request.columns = columns_for_fields(fields, PREDICTION_FIELD_COLUMNS)
+        page = await self.prediction_repository.get_page(page_request)
+        if fields:
+            items = [sparse_dto(CustomerIncidentPredictionDTO, self._dto_values(prediction), fields) for prediction in page.items]
+        else:
+            items = [self._to_dto(prediction) for prediction in page.items]
+        return Page(items=items, next_cursor=page.next_cursor)
     
     async def get_prediction_by_id(self, prediction_id: int) -> Optional[CustomerIncidentPredictionDTO]:
         prediction = await self.prediction_repository.get_by_id(prediction_id)
@@ -34,26 +60,26 @@ class CustomerIncidentPredictionApplicationService:
     
     async def get_predictions_by_region(self, client_region: str) -> List[CustomerIncidentPredictionDTO]:
         predictions = await self.prediction_repository.get_by_region(client_region)
-        return [self._to_dto(prediction) for prediction in predictions]
+        return self._to_dtos(predictions)
     
     async def get_predictions_by_incident_type(self, incident_type: IncidentType) -> List[CustomerIncidentPredictionDTO]:
         predictions = await self.prediction_repository.get_by_incident_type(incident_type)
-        return [self._to_dto(prediction) for prediction in predictions]
+        return self._to_dtos(predictions)
     
     async def get_high_risk_predictions(self, min_risk: float = 60.0) -> List[CustomerIncidentPredictionDTO]:
         predictions = await self.prediction_repository.get_by_risk_level(min_risk)
-        return [self._to_dto(prediction) for prediction in predictions]
+        return self._to_dtos(predictions)
     
     async def create_prediction(self, create_dto: CustomerIncidentPredictionCreateDTO) -> CustomerIncidentPredictionDTO:
         prediction = CustomerIncidentPrediction(
             customer_id=create_dto.customer_id,
             client_region=create_dto.client_region,
             client_type=create_dto.client_type,
-            client_category=Decimal(str(create_dto.client_category)) if create_dto.client_category is not None else None,
-            q1_prediction=Decimal(str(create_dto.q1_prediction)),
-            q2_prediction=Decimal(str(create_dto.q2_prediction)),
-            q3_prediction=Decimal(str(create_dto.q3_prediction)),
-            q4_prediction=Decimal(str(create_dto.q4_prediction)),
+            client_category=create_dto.client_category,
+            q1_prediction=create_dto.q1_prediction,
+            q2_prediction=create_dto.q2_prediction,
+            q3_prediction=create_dto.q3_prediction,
+            q4_prediction=create_dto.q4_prediction,
             most_likely_incident=create_dto.most_likely_incident,
             recommendation=create_dto.recommendation
         )
@@ -62,170 +88,141 @@ class CustomerIncidentPredictionApplicationService:
     
     async def check_existing_customer_ids(self, customer_ids: List[str]) -> List[str]:
         """Check which customer IDs already exist in the database"""
-        existing_ids = []
-        for customer_id in customer_ids:
-            existing_prediction = await self.prediction_repository.get_by_customer_id(customer_id)
-            if existing_prediction:
-                existing_ids.append(customer_id)
-        return existing_ids
+        existing_ids = await self.prediction_repository.get_existing_customer_ids(customer_ids)
+        return [customer_id for customer_id in customer_ids if customer_id in existing_ids]
 
-    async def process_csv_file(self, csv_content: str) -> dict:
-        """Process CSV file content and insert customer incident predictions
+    async def process_csv_file(self, csv_file: BinaryIO,
+                               progress: Optional[Callable[[CsvIngestionResult], None]] = None) -> dict:
+        """Process an uploaded CSV file incrementally and insert customer incident predictions
         
         Expected CSV headers: customer_id,client_region,client_type,client_category,q1_prediction,q2_prediction,q3_prediction,q4_prediction,most_likely_incident,recommendation
+        
+        The file is read twice: a first pass validates the rows and checks the
+        customer_ids of the valid ones against the database, so an upload
+        containing existing ids is rejected before anything is inserted, and a
+        second pass validates and inserts the rows chunk by chunk.
         """
         try:
-            # Parse CSV content
-            csv_reader = csv.DictReader(io.StringIO(csv_content))
-            predictions = []
-            errors = []
-            processed_count = 0
-            customer_ids_in_csv = set()  # Track customer_ids in CSV to detect duplicates
-            
-            for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 because row 1 is headers
-                try:
-                    # Validate required fields
-                    customer_id = row.get('customer_id', '').strip()
-                    client_region = row.get('client_region', '').strip()
-                    client_type = row.get('client_type', '').strip()
-                    most_likely_incident = row.get('most_likely_incident', '').strip()
-                    recommendation = row.get('recommendation', '').strip()
-                    
-                    if not customer_id:
-                        errors.append(f"Row {row_num}: customer_id is required")
-                        continue
-                    if not client_region:
-                        errors.append(f"Row {row_num}: client_region is required")
-                        continue
-                    if not client_type:
-                        errors.append(f"Row {row_num}: client_type is required")
-                        continue
-                    if not most_likely_incident:
-                        errors.append(f"Row {row_num}: most_likely_incident is required")
-                        continue
-                    if not recommendation:
-                        errors.append(f"Row {row_num}: recommendation is required")
-                        continue
-                    
-                    # Check for duplicate customer_id within the CSV
-                    if customer_id in customer_ids_in_csv:
-                        errors.append(f"Row {row_num}: Duplicate customer_id '{customer_id}' found in CSV")
-                        continue
-                    customer_ids_in_csv.add(customer_id)
-                    
-                    # Parse optional client_category
-                    client_category = None
-                    if row.get('client_category', '').strip():
-                        try:
-                            client_category = Decimal(str(row.get('client_category')))
-                        except (ValueError, TypeError):
-                            errors.append(f"Row {row_num}: Invalid client_category value")
-                            continue
-                    
-                    # Parse prediction values
-                    try:
-                        q1_prediction = Decimal(str(row.get('q1_prediction', '0.0')))
-                        q2_prediction = Decimal(str(row.get('q2_prediction', '0.0')))
-                        q3_prediction = Decimal(str(row.get('q3_prediction', '0.0')))
-                        q4_prediction = Decimal(str(row.get('q4_prediction', '0.0')))
-                    except (ValueError, TypeError):
-                        errors.append(f"Row {row_num}: Invalid prediction values")
-                        continue
-                    
-                    # Validate incident type
-                    try:
-                        incident_type = IncidentType(most_likely_incident)
-                    except ValueError:
-                        valid_types = [e.value for e in IncidentType]
-                        errors.append(f"Row {row_num}: Invalid incident type '{most_likely_incident}'. Valid types: {valid_types}")
-                        continue
-                    
-                    # Create prediction object
-                    prediction = CustomerIncidentPrediction(
-                        customer_id=customer_id,
-                        client_region=client_region,
-                        client_type=client_type,
-                        client_category=client_category,
-                        q1_prediction=q1_prediction,
-                        q2_prediction=q2_prediction,
-                        q3_prediction=q3_prediction,
-                        q4_prediction=q4_prediction,
-                        most_likely_incident=incident_type,
-                        recommendation=recommendation
-                    )
-                    predictions.append(prediction)
-                    processed_count += 1
-                    
-                except Exception as e:
-                    errors.append(f"Row {row_num}: {str(e)}")
-                    continue
-            
-            # Batch insert valid records
-            if predictions:
-                try:
-                    existing_customer_ids = await self.check_existing_customer_ids([prediction.customer_id for prediction in predictions])
-                    if existing_customer_ids:
-                        return {
-                            "success": False,
-                            "message": f"The following customer_ids already exist in the database: {', '.join(existing_customer_ids)}",
-                            "processed_count": 0,
-                            "errors": errors,
-                            "total_rows": processed_count + len(errors)
-                        }
-                    created_predictions = await self.prediction_repository.batch_create(predictions)
-                    return {
-                        "success": True,
-                        "message": f"Successfully processed {len(created_predictions)} customer incident predictions",
-                        "processed_count": len(created_predictions),
-                        "errors": errors,
-                        "total_rows": processed_count + len(errors)
-                    }
-                except ValueError as e:
-                    # Handle unique constraint violations specifically
-                    if "duplicate" in str(e).lower():
-                        return {
-                            "success": False,
-                            "message": "Some customer_ids already exist in the database. Each customer_id must be unique.",
-                            "processed_count": 0,
-                            "errors": errors + [f"Database error: {str(e)}"],
-                            "total_rows": processed_count + len(errors),
-                            "suggestion": "Please check your CSV for duplicate customer_ids or remove existing records from the database before uploading."
-                        }
-                    else:
-                        return {
-                            "success": False,
-                            "message": f"Database error occurred: {str(e)}",
-                            "processed_count": 0,
-                            "errors": errors + [f"Database error: {str(e)}"],
-                            "total_rows": processed_count + len(errors)
-                        }
-                except Exception as e:
-                    # Handle other database errors
-                    error_msg = str(e)
-                    return {
-                        "success": False,
-                        "message": f"Database error occurred: {error_msg}",
-                        "processed_count": 0,
-                        "errors": errors + [f"Database error: {error_msg}"],
-                        "total_rows": processed_count + len(errors)
-                    }
-            else:
+            existing_customer_ids = await self._find_existing_customer_ids(csv_file)
+            if existing_customer_ids:
                 return {
                     "success": False,
-                    "message": "No valid records found in CSV",
+                    "message": f"The following customer_ids already exist in the database: {', '.join(sorted(existing_customer_ids))}",
                     "processed_count": 0,
-                    "errors": errors,
-                    "total_rows": len(errors)
+                    "errors": [],
+                    "total_rows": 0
                 }
-                
+            
+            customer_ids_in_csv = set()  # Track customer_ids in CSV to detect duplicates
+            result = await ingest_csv(
+                csv_file,
+                lambda chunk, report: self._parse_csv_chunk(chunk, report, customer_ids_in_csv),
+                self.prediction_repository.batch_create,
+                progress=progress
+            )
+        except UnicodeDecodeError:
+            raise
         except Exception as e:
+            # Handle database errors
+            error_msg = str(e)
+            if "duplicate" in error_msg.lower():
+                return {
+                    "success": False,
+                    "message": "Some customer_ids already exist in the database. Each customer_id must be unique.",
+                    "processed_count": 0,
+                    "errors": [f"Database error: {error_msg}"],
+                    "total_rows": 0,
+                    "suggestion": "Please check your CSV for duplicate customer_ids or remove existing records from the database before uploading."
+                }
             return {
                 "success": False,
-                "message": f"Error processing CSV file: {str(e)}",
+                "message": f"Database error occurred: {error_msg}",
                 "processed_count": 0,
-                "errors": [str(e)],
+                "errors": [f"Database error: {error_msg}"],
                 "total_rows": 0
             }
+        
+        if result.created_count == 0 and result.failed_count == 0:
+            return {
+                "success": False,
+                "message": "No valid records found in CSV",
+                "processed_count": 0,
+                "errors": result.reported_errors,
+                "total_rows": result.total_rows
+            }
+        if result.created_count == 0 and any("duplicate" in error.lower() for error in result.errors):
+            return {
+                "success": False,
+                "message": "Some customer_ids already exist in the database. Each customer_id must be unique.",
+                "processed_count": 0,
+                "errors": result.reported_errors,
+                "total_rows": result.total_rows,
+                "suggestion": "Please check your CSV for duplicate customer_ids or remove existing records from the database before uploading."
+            }
+        message = f"Successfully processed {result.created_count} customer incident predictions"
+        if result.failed_count:
+            message += f", {result.failed_count} rows failed to insert"
+        return {
+            "success": result.created_count > 0,
+            "message": message,
+            "processed_count": result.created_count,
+            "errors": result.reported_errors,
+            "total_rows": result.total_rows
+        }
+    
+    async def _find_existing_customer_ids(self, csv_file: BinaryIO) -> Set[str]:
+        """First pass over an upload: customer_ids of valid rows that are already stored
+
+        Rows are validated exactly as the insert pass does, so a row that
+        would be rejected anyway does not block the upload.
+        """
+        loop = asyncio.get_running_loop()
+        existing: Set[str] = set()
+        customer_ids_in_csv: Set[str] = set()
+        async for chunk in iter_csv_chunks(csv_file):
+            predictions, _ = await loop.run_in_executor(
+                get_csv_executor(), self._parse_csv_chunk, chunk, lambda message: None, customer_ids_in_csv
+            )
+            if predictions:
+                existing.update(await self.check_existing_customer_ids([prediction.customer_id for prediction in predictions]))
+        return existing
+    
+    def _parse_csv_chunk(self, chunk: CsvChunk, report: Callable[[str], None],
+                         customer_ids_in_csv: Set[str]) -> Tuple[List[CustomerIncidentPrediction], List[int]]:
+        rows = ColumnarChunk(chunk, PREDICTION_CSV_COLUMNS, defaults={name: "0.0" for name in QUARTER_PREDICTION_COLUMNS})
+        for name in REQUIRED_CSV_COLUMNS:
+            rows.require(name)
+        # Duplicates are checked before the remaining fields, so a rejected
+        # row still claims its customer_id
+        rows.reject_duplicates("customer_id", customer_ids_in_csv,
+                               lambda customer_id: f"Duplicate customer_id '{customer_id}' found in CSV")
+        rows.parse_numbers(["client_category"], "Invalid client_category value", required=False)
+        rows.parse_numbers(QUARTER_PREDICTION_COLUMNS, "Invalid prediction values", minimum=0, maximum=100,
+                           range_message="Prediction values must be between 0 and 100")
+        valid_types = list(INCIDENT_TYPES)
+        rows.check_choices("most_likely_incident", valid_types,
+                           lambda incident: f"Invalid incident type '{incident}'. Valid types: {valid_types}")
+        rows.report_errors(report)
+        
+        indices = rows.valid_indices()
+        columns = [rows.values(name, indices) for name in REQUIRED_CSV_COLUMNS]
+        columns += [rows.number_values(name, indices) for name in ("client_category",) + QUARTER_PREDICTION_COLUMNS]
+        predictions = [
+            CustomerIncidentPrediction(
+                customer_id=customer_id,
+                client_region=client_region,
+                client_type=client_type,
+                client_category=client_category,
+                q1_prediction=q1,
+                q2_prediction=q2,
+                q3_prediction=q3,
+                q4_prediction=q4,
+                most_likely_incident=INCIDENT_TYPES[incident],
+                recommendation=recommendation
+            )
+            for customer_id, client_region, client_type, incident, recommendation, client_category, q1, q2, q3, q4 in zip(*columns)
+        ]
+        return predictions, rows.row_numbers_of(indices)
     
     async def update_prediction(self, prediction_id: int, update_dto: CustomerIncidentPredictionUpdateDTO) -> Optional[CustomerIncidentPredictionDTO]:
         existing_prediction = await self.prediction_repository.get_by_id(prediction_id)
@@ -240,15 +237,15 @@ class CustomerIncidentPredictionApplicationService:
         if update_dto.client_type is not None:
             existing_prediction.client_type = update_dto.client_type
         if update_dto.client_category is not None:
-            existing_prediction.client_category = Decimal(str(update_dto.client_category))
+            existing_prediction.client_category = update_dto.client_category
         if update_dto.q1_prediction is not None:
-            existing_prediction.q1_prediction = Decimal(str(update_dto.q1_prediction))
+            existing_prediction.q1_prediction = update_dto.q1_prediction
         if update_dto.q2_prediction is not None:
-            existing_prediction.q2_prediction = Decimal(str(update_dto.q2_prediction))
+            existing_prediction.q2_prediction = update_dto.q2_prediction
         if update_dto.q3_prediction is not None:
-            existing_prediction.q3_prediction = Decimal(str(update_dto.q3_prediction))
+            existing_prediction.q3_prediction = update_dto.q3_prediction
         if update_dto.q4_prediction is not None:
-            existing_prediction.q4_prediction = Decimal(str(update_dto.q4_prediction))
+            existing_prediction.q4_prediction = update_dto.q4_prediction
         if update_dto.most_likely_incident is not None:
             existing_prediction.most_likely_incident = update_dto.most_likely_incident
         if update_dto.recommendation is not None:
@@ -263,20 +260,32 @@ class CustomerIncidentPredictionApplicationService:
         return await self.prediction_repository.delete(prediction_id)
     
     def _to_dto(self, prediction: CustomerIncidentPrediction) -> CustomerIncidentPredictionDTO:
-        return CustomerIncidentPredictionDTO(
+        return CustomerIncidentPredictionDTO(**self._dto_values(prediction))
+    
+    def _to_dtos(self, predictions: PredictionCollection) -> List[CustomerIncidentPredictionDTO]:
+        """Convert a bulk result, taking the average risks from its columns in one pass"""
+        return [
+            CustomerIncidentPredictionDTO(**self._dto_values(prediction, average_risk))
+            for prediction, average_risk in zip(predictions, predictions.average_risk())
+        ]
+    
+    def _dto_values(self, prediction: CustomerIncidentPrediction, average_risk: Optional[float] = None) -> Dict[str, Any]:
+        if average_risk is None:
+            average_risk = prediction.get_average_risk_percentage()
+        return dict(
             id=prediction.id,
             customer_id=prediction.customer_id,
             client_region=prediction.client_region,
             client_type=prediction.client_type,
-            client_category=float(prediction.client_category) if prediction.client_category is not None else None,
-            q1_prediction=float(prediction.q1_prediction),
-            q2_prediction=float(prediction.q2_prediction),
-            q3_prediction=float(prediction.q3_prediction),
-            q4_prediction=float(prediction.q4_prediction),
+            client_category=prediction.client_category,
+            q1_prediction=prediction.q1_prediction,
+            q2_prediction=prediction.q2_prediction,
+            q3_prediction=prediction.q3_prediction,
+            q4_prediction=prediction.q4_prediction,
             most_likely_incident=prediction.most_likely_incident,
             recommendation=prediction.recommendation,
             created_at=prediction.created_at,
             updated_at=prediction.updated_at,
-            avg_risk_percentage=prediction.get_average_risk_percentage(),
-            risk_level=prediction.get_risk_level()
+            avg_risk_percentage=average_risk,
+            risk_level=risk_level_for(average_risk)
         ) 
\ No newline at end of file
@@ -1,9 +1,13 @@
 from domain.repositories.customer_issue_repository_interface import CustomerIssueRepositoryInterface
 from domain.entities.customer_issue import CustomerIssue
+from domain.value_objects.page import Page, PageRequest
 from application.dtos.customer_issue_dtos import CustomerIssueDTO, CustomerIssueCreateDTO, CustomerIssueUpdateDTO
-from typing import List, Optional
-import csv
-import io
+from application.services.columnar_validation import ColumnarChunk
+from application.services.csv_ingestion import CsvChunk, CsvIngestionResult, ingest_csv
+from typing import BinaryIO, Callable, List, Optional, Tuple
+
+# Numeric CSV upload columns, all optional
+ISSUE_NUMBER_COLUMNS = ("customer_id", "code_contrat", "client_type", "client_region", "client_categorie", "churn_risk")
 
 class CustomerIssueApplicationService:
     def __init__(self, customer_issue_repository: CustomerIssueRepositoryInterface):
@@ -13,6 +17,10 @@ class CustomerIssueApplicationService:
         customer_issues = await self.customer_issue_repository.get_all()
         return [self._to_dto(issue) for issue in customer_issues]
     
+    async def get_customer_issues_page(self, page_request: PageRequest) -> Page[CustomerIssueDTO]:
+        page = await self.customer_issue_repository.get_page(page_request)
+        return Page(items=[self._to_dto(issue) for issue in page.items], next_cursor=page.next_cursor)
+    
     async def get_customer_issues_by_customer_id(self, customer_id: float) -> List[CustomerIssueDTO]:
         customer_issues = await self.customer_issue_repository.get_by_customer_id(customer_id)
         return [self._to_dto(issue) for issue in customer_issues]
@@ -31,54 +39,13 @@ class CustomerIssueApplicationService:
         created_issue = await self.customer_issue_repository.create(customer_issue)
         return self._to_dto(created_issue)
     
-    async def process_csv_file(self, csv_content: str) -> dict:
-        """Process CSV file content and insert customer issues"""
+    async def process_csv_file(self, csv_file: BinaryIO,
+                               progress: Optional[Callable[[CsvIngestionResult], None]] = None) -> dict:
+        """Process an uploaded CSV file incrementally and insert customer issues"""
         try:
-            # Parse CSV content
-            csv_reader = csv.DictReader(io.StringIO(csv_content))
-            customer_issues = []
-            errors = []
-            processed_count = 0
-            
-            for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 because row 1 is headers
-                try:
-                    # Validate and convert data types
-                    customer_issue = CustomerIssue(
-                        customer_id=float(row['customer_id']) if row.get('customer_id') and row['customer_id'].strip() else None,
-                        code_contrat=float(row['code_contrat']) if row.get('code_contrat') and row['code_contrat'].strip() else None,
-                        client_type=float(row['client_type']) if row.get('client_type') and row['client_type'].strip() else None,
-                        client_region=float(row['client_region']) if row.get('client_region') and row['client_region'].strip() else None,
-                        client_categorie=float(row['client_categorie']) if row.get('client_categorie') and row['client_categorie'].strip() else None,
-                        incident_title=row.get('incident_title', '').strip() if row.get('incident_title') else None,
-                        churn_risk=float(row['churn_risk']) if row.get('churn_risk') and row['churn_risk'].strip() else None,
-                        status="not sent"  # Default status for CSV imports
-                    )
-                    customer_issues.append(customer_issue)
-                    processed_count += 1
-                    
-                except (ValueError, KeyError) as e:
-                    errors.append(f"Row {row_num}: {str(e)}")
-                    continue
-            
-            # Batch insert valid records
-            if customer_issues:
-                created_issues = await self.customer_issue_repository.batch_create(customer_issues)
-                return {
-                    "success": True,
-                    "message": f"Successfully processed {len(created_issues)} customer issues",
-                    "processed_count": len(created_issues),
-                    "errors": errors,
-                    "total_rows": processed_count + len(errors)
-                }
-            else:
-                return {
-                    "success": False,
-                    "message": "No valid records found in CSV",
-                    "processed_count": 0,
-                    "errors": errors,
-                    "total_rows": len(errors)
-                }
-                
+            result = await ingest_csv(csv_file, self._parse_csv_chunk, self.customer_issue_repository.batch_create, progress=progress)
+        except UnicodeDecodeError:
+            raise
         except Exception as e:
             return {
                 "success": False,
@@ -87,6 +54,49 @@ class CustomerIssueApplicationService:
                 "errors": [str(e)],
                 "total_rows": 0
             }
+        
+        if result.created_count == 0 and result.failed_count == 0:
+            return {
+                "success": False,
+                "message": "No valid records found in CSV",
+                "processed_count": 0,
+                "errors": result.reported_errors,
+                "total_rows": result.total_rows
+            }
+        message = f"Successfully processed {result.created_count} customer issues"
+        if result.failed_count:
+            message += f", {result.failed_count} rows failed to insert"
+        return {
+            "success": result.created_count > 0,
+            "message": message,
+            "processed_count": result.created_count,
+            "errors": result.reported_errors,
+            "total_rows": result.total_rows
+        }
+    
+    def _parse_csv_chunk(self, chunk: CsvChunk, report: Callable[[str], None]) -> Tuple[List[CustomerIssue], List[int]]:
+        rows = ColumnarChunk(chunk, ISSUE_NUMBER_COLUMNS + ("incident_title",))
+        for name in ISSUE_NUMBER_COLUMNS:
+            rows.parse_numbers([name], lambda value, name=name: f"Invalid {name} value '{value}'", required=False)
+        rows.report_errors(report)
+        
+        indices = rows.valid_indices()
+        numbers = [rows.number_values(name, indices) for name in ISSUE_NUMBER_COLUMNS]
+        issues = [
+            CustomerIssue(
+                customer_id=customer_id,
+                code_contrat=code_contrat,
+                client_type=client_type,
+                client_region=client_region,
+                client_categorie=client_categorie,
+                incident_title=incident_title or None,
+                churn_risk=churn_risk,
+                status="not sent"  # Default status for CSV imports
+            )
+            for customer_id, code_contrat, client_type, client_region, client_categorie, churn_risk, incident_title
+            in zip(*numbers, rows.values("incident_title", indices))
+        ]
+        return issues, rows.row_numbers_of(indices)
     
     async def update_customer_issue(self, customer_id: float, incident_title: str, update_dto: CustomerIssueUpdateDTO) -> bool:
         customer_issue = CustomerIssue(
@@ -1,5 +1,6 @@
 from domain.repositories.email_notification_repository_interface import EmailNotificationRepositoryInterface
 from domain.entities.email_notification import EmailNotification, NotificationStatus
+from domain.value_objects.page import Page, PageRequest
 from application.dtos.email_notification_dtos import (
     EmailNotificationDTO, 
     EmailNotificationCreateDTO, 
@@ -8,21 +9,31 @@ from application.dtos.email_notification_dtos import (
     EmailSendResponseDTO
 )
 from infrastructure.services.email_service import EmailService
-from typing import List, Optional
-from datetime import datetime
+from infrastructure.services.email_dispatcher import BatchOutcome, DispatchProgress, email_dispatcher_from_env
+from application.services.csv_ingestion import CsvIngestionResult, ingest_csv, parse_rows
+from typing import Awaitable, BinaryIO, Callable, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
 import logging
-import csv
-import io
+import os
+
+def get_sending_claim_timeout() -> timedelta:
+    """Age after which a SENDING claim counts as abandoned and force_resend may take it over"""
+    return timedelta(minutes=float(os.getenv("EMAIL_SENDING_CLAIM_TIMEOUT_MINUTES", "30")))
 
 class EmailNotificationApplicationService:
     def __init__(self, email_notification_repository: EmailNotificationRepositoryInterface):
         self.email_notification_repository = email_notification_repository
         self.email_service = EmailService()
+        self.email_dispatcher = email_dispatcher_from_env()
     
     async def get_all_email_notifications(self) -> List[EmailNotificationDTO]:
         notifications = await self.email_notification_repository.get_all()
         return [self._to_dto(notification) for notification in notifications]
     
+    async def get_email_notifications_page(self, page_request: PageRequest) -> Page[EmailNotificationDTO]:
+        page = await self.email_notification_repository.get_page(page_request)
+        return Page(items=[self._to_dto(notification) for notification in page.items], next_cursor=page.next_cursor)
+    
     async def get_email_notification_by_id(self, notification_id: int) -> Optional[EmailNotificationDTO]:
         notification = await self.email_notification_repository.get_by_id(notification_id)
         if not notification:
@@ -43,73 +54,13 @@ class EmailNotificationApplicationService:
         created_notification = await self.email_notification_repository.create(notification)
         return self._to_dto(created_notification)
     
-    async def process_csv_file(self, csv_content: str) -> dict:
-        """Process CSV file content and insert email notifications"""
+    async def process_csv_file(self, csv_file: BinaryIO,
+                               progress: Optional[Callable[[CsvIngestionResult], None]] = None) -> dict:
+        """Process an uploaded CSV file incrementally and insert email notifications"""
         try:
-            # Parse CSV content
-            csv_reader = csv.DictReader(io.StringIO(csv_content))
-            email_notifications = []
-            errors = []
-            processed_count = 0
-            
-            for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 because row 1 is headers
-                try:
-                    # Validate required fields
-                    email = row.get('email', '').strip()
-                    name = row.get('name', '').strip()
-                    issue = row.get('issue', '').strip()
-                    
-                    if not email:
-                        errors.append(f"Row {row_num}: Email is required")
-                        continue
-                    if not name:
-                        errors.append(f"Row {row_num}: Name is required")
-                        continue
-                    if not issue:
-                        errors.append(f"Row {row_num}: Issue is required")
-                        continue
-                    
-                    # Parse status (optional, defaults to pending)
-                    status_str = row.get('status', 'pending').strip().lower()
-                    try:
-                        status = NotificationStatus(status_str)
-                    except ValueError:
-                        status = NotificationStatus.PENDING
-                        errors.append(f"Row {row_num}: Invalid status '{status_str}', defaulting to 'pending'")
-                    
-                    # Create notification object
-                    notification = EmailNotification(
-                        email=email,
-                        name=name,
-                        issue=issue,
-                        status=status
-                    )
-                    email_notifications.append(notification)
-                    processed_count += 1
-                    
-                except Exception as e:
-                    errors.append(f"Row {row_num}: {str(e)}")
-                    continue
-            
-            # Batch insert valid records
-            if email_notifications:
-                created_notifications = await self.email_notification_repository.batch_create(email_notifications)
-                return {
-                    "success": True,
-                    "message": f"Successfully processed {len(created_notifications)} email notifications",
-                    "processed_count": len(created_notifications),
-                    "errors": errors,
-                    "total_rows": processed_count + len(errors)
-                }
-            else:
-                return {
-                    "success": False,
-                    "message": "No valid records found in CSV",
-                    "processed_count": 0,
-                    "errors": errors,
-                    "total_rows": len(errors)
-                }
-                
+            result = await ingest_csv(csv_file, parse_rows(self._parse_csv_row), self.email_notification_repository.batch_create, progress=progress)
+        except UnicodeDecodeError:
+            raise
         except Exception as e:
             import traceback
             logging.error(f"Error processing CSV file: {str(e)}")
@@ -130,6 +81,53 @@ class EmailNotificationApplicationService:
                 "errors": [str(e)],
                 "total_rows": 0
             }
+        
+        if result.created_count == 0 and result.failed_count == 0:
+            return {
+                "success": False,
+                "message": "No valid records found in CSV",
+                "processed_count": 0,
+                "errors": result.reported_errors,
+                "total_rows": result.total_rows
+            }
+        message = f"Successfully processed {result.created_count} email notifications"
+        if result.failed_count:
+            message += f", {result.failed_count} rows failed to insert"
+        return {
+            "success": result.created_count > 0,
+            "message": message,
+            "processed_count": result.created_count,
+            "errors": result.reported_errors,
+            "total_rows": result.total_rows
+        }
+    
+    def _parse_csv_row(self, row_num: int, row: Dict[str, str], report: Callable[[str], None]) -> EmailNotification:
+        # Validate required fields
+        email = (row.get('email') or '').strip()
+        name = (row.get('name') or '').strip()
+        issue = (row.get('issue') or '').strip()
+        
+        if not email:
+            raise ValueError("Email is required")
+        if not name:
+            raise ValueError("Name is required")
+        if not issue:
+            raise ValueError("Issue is required")
+        
+        # Parse status (optional, defaults to pending)
+        status_str = (row.get('status') or 'pending').strip().lower()
+        try:
+            status = NotificationStatus(status_str)
+        except ValueError:
+            status = NotificationStatus.PENDING
+            report(f"Row {row_num}: Invalid status '{status_str}', defaulting to 'pending'")
+        
+        return EmailNotification(
+            email=email,
+            name=name,
+            issue=issue,
+            status=status
+        )
     
     async def update_email_notification(self, notification_id: int, update_dto: EmailNotificationUpdateDTO) -> Optional[EmailNotificationDTO]:
         existing_notification = await self.email_notification_repository.get_by_id(notification_id)
@@ -151,24 +149,91 @@ class EmailNotificationApplicationService:
             return None
         return self._to_dto(updated_notification)
     
-    async def send_emails(self, send_request: EmailSendRequestDTO) -> EmailSendResponseDTO:
-        """Send email notifications"""
+    async def send_emails(self, send_request: EmailSendRequestDTO,
+                          on_batch: Optional[Callable[[DispatchProgress[EmailNotification]], Awaitable[None]]] = None
+                          ) -> EmailSendResponseDTO:
+        """Send email notifications
+
+        Messages are sent concurrently by the email dispatcher; `on_batch` is
+        awaited with the running totals after each batch. Each batch is claimed
+        as SENDING in one statement and its SENT and FAILED outcomes are
+        recorded with one statement each, so notifications claimed by a
+        concurrent send are skipped, even when force resending. If a batch's
+        outcomes cannot be recorded, sending stops and the response counts
+        the messages that went out.
+        """
         try:
             # Get notifications to send
+            stale_before = None
             if send_request.notification_ids:
-                # Send specific notifications
-                notifications_to_send = []
-                for notification_id in send_request.notification_ids:
-                    notification = await self.email_notification_repository.get_by_id(notification_id)
-                    if notification:
-                        # Check if we should send (pending or force resend)
-                        if notification.status == NotificationStatus.PENDING or send_request.force_resend:
-                            notifications_to_send.append(notification)
+                # Send specific notifications: pending ones, or any not being sent when force resending
+                notification_ids = list(dict.fromkeys(send_request.notification_ids))
+                if send_request.force_resend:
+                    claimable = [NotificationStatus.PENDING, NotificationStatus.SENT, NotificationStatus.FAILED]
+                    # Claims left behind by an interrupted send can be taken over
+                    stale_before = datetime.now(timezone.utc) - get_sending_claim_timeout()
+                else:
+                    claimable = [NotificationStatus.PENDING]
             else:
                 # Send all pending notifications
-                notifications_to_send = await self.email_notification_repository.get_by_status(NotificationStatus.PENDING)
+                pending = await self.email_notification_repository.get_by_status(NotificationStatus.PENDING)
+                notification_ids = [notification.id for notification in pending]
+                claimable = [NotificationStatus.PENDING]
             
-            if not notifications_to_send:
+            async def claim_batch(batch_ids: List[int]) -> List[EmailNotification]:
+                return await self.email_notification_repository.claim_for_sending(batch_ids, claimable, stale_before)
+            
+            async def record_outcome(outcome: BatchOutcome[EmailNotification], sent_at: datetime) -> None:
+                if outcome.sent:
+                    await self.email_notification_repository.update_statuses(
+                        [notification.id for notification in outcome.sent], NotificationStatus.SENT, sent_at
+                    )
+                if outcome.failed:
+                    await self.email_notification_repository.update_statuses(
+                        [notification.id for notification, _ in outcome.failed], NotificationStatus.FAILED
+                    )
+            
+            async def record_batch(outcome: BatchOutcome[EmailNotification]) -> None:
+                sent_at = datetime.now(timezone.utc)
+                try:
+                    await record_outcome(outcome, sent_at)
+                except Exception as e:
+                    # Both updates are idempotent: retry once before giving up. Rows
+                    # still not recorded stay SENDING until their claim goes stale.
+                    logging.warning(f"Recording email send outcomes failed, retrying: {str(e)}")
+                    await record_outcome(outcome, sent_at)
+            
+            async def log_batch(progress: DispatchProgress[EmailNotification]) -> None:
+                logging.info(
+                    f"Email send batch {progress.batch}/{progress.batches}: "
+                    f"{progress.sent} sent, {progress.failed} failed of {progress.total}"
+                )
+                if on_batch is not None:
+                    await on_batch(progress)
+
+            progress = await self.email_dispatcher.dispatch(
+                notification_ids,
+                lambda notification: notification.email,
+                self._send_notification,
+                log_batch,
+                claim_batch=claim_batch,
+                record_batch=record_batch
+            )
+            sent_count = progress.sent
+            failed_count = progress.failed
+            errors = [f"ID {notification.id}: {error}" for notification, error in progress.errors]
+            
+            if progress.error is not None:
+                logging.error(f"Email send stopped: {progress.error}")
+                return EmailSendResponseDTO(
+                    success=False,
+                    message=f"Sending stopped after {sent_count} emails sent and {failed_count} failed: {progress.error}",
+                    sent_count=sent_count,
+                    failed_count=failed_count,
+                    errors=errors + [progress.error]
+                )
+            
+            if sent_count == 0 and failed_count == 0:
                 return EmailSendResponseDTO(
                     success=True,
                     message="No notifications to send",
@@ -176,52 +241,6 @@ class EmailNotificationApplicationService:
                     failed_count=0
                 )
             
-            sent_count = 0
-            failed_count = 0
-            errors = []
-            
-            for notification in notifications_to_send:
-                try:
-                    # Update status to sending
-                    await self.email_notification_repository.update_status(
-                        notification.id, 
-                        NotificationStatus.SENDING
-                    )
-                    
-                    # Send email
-                    success, error_msg = await self.email_service.send_email(
-                        notification.email,
-                        notification.name,
-                        notification.issue
-                    )
-                    
-                    if success:
-                        # Update status to sent
-                        await self.email_notification_repository.update_status(
-                            notification.id,
-                            NotificationStatus.SENT,
-                            datetime.now()
-                        )
-                        sent_count += 1
-                    else:
-                        # Update status to failed
-                        await self.email_notification_repository.update_status(
-                            notification.id,
-                            NotificationStatus.FAILED
-                        )
-                        failed_count += 1
-                        if error_msg:
-                            errors.append(f"ID {notification.id}: {error_msg}")
-                        
-                except Exception as e:
-                    # Update status to failed
-                    await self.email_notification_repository.update_status(
-                        notification.id,
-                        NotificationStatus.FAILED
-                    )
-                    failed_count += 1
-                    errors.append(f"ID {notification.id}: {str(e)}")
-            
             success = failed_count == 0
             message = f"Sent {sent_count} emails successfully"
             if failed_count > 0:
@@ -245,6 +264,16 @@ class EmailNotificationApplicationService:
                 errors=[str(e)]
             )
     
+    async def _send_notification(self, notification: EmailNotification) -> None:
+        """Send one claimed notification; raises when it could not be sent"""
+        success, error_msg = await self.email_service.send_email(
+            notification.email,
+            notification.name,
+            notification.issue
+        )
+        if not success:
+            raise RuntimeError(error_msg or "Email could not be sent")
+    
     async def delete_email_notification(self, notification_id: int) -> bool:
         return await self.email_notification_repository.delete(notification_id)
     
@@ -0,0 +1,136 @@
+# Background CSV import jobs
+#
+# An upload is copied to a temporary file and queued as an import job; the
+# request returns straight away with the job id and the client polls
+# GET /imports/{job_id}. Jobs run on the "imports" task queue, so at most
+# TASK_QUEUE_IMPORTS_WORKERS imports write to the database at once, and their
+# CSV parsing runs on the CSV parse executor. Job state lives in this process
+# only: the most recent IMPORT_JOB_RETENTION jobs are kept, and jobs that were
+# queued or running when the process stopped are lost.
+from fastapi import HTTPException, status
+from domain.entities.import_job import ImportJob, ImportJobStatus
+from domain.entities.user import UserRole
+from application.dtos.auth_dtos import UserProfileDTO
+from application.dtos.import_job_dtos import ImportJobDTO
+from application.services.csv_ingestion import CsvIngestionResult, get_csv_executor
+from infrastructure.services.task_queue import TaskQueueFullError, get_task_queue
+from collections import OrderedDict
+from datetime import datetime
+from typing import Awaitable, BinaryIO, Callable, Optional, Tuple
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+
+CsvProcessor = Callable[[BinaryIO, Callable[[CsvIngestionResult], None]], Awaitable[dict]]
+
+
+def _spool_to_disk(upload: BinaryIO) -> Tuple[str, int]:
+    upload.seek(0)
+    with tempfile.NamedTemporaryFile(prefix="import-", suffix=".csv", delete=False) as target:
+        shutil.copyfileobj(upload, target)
+        return target.name, target.tell()
+
+
+class ImportJobApplicationService:
+    def __init__(self, retention: Optional[int] = None):
+        self.retention = retention or int(os.getenv("IMPORT_JOB_RETENTION", "500"))
+        self.queue = get_task_queue("imports", default_workers=2, default_max_size=100)
+        self._jobs: "OrderedDict[str, ImportJob]" = OrderedDict()
+
+    async def submit_csv_import(self, kind: str, filename: str, upload: BinaryIO,
+                                process: CsvProcessor, current_user: UserProfileDTO) -> ImportJob:
+        """Queue an uploaded CSV file for `process(csv_file, progress)`"""
+        loop = asyncio.get_running_loop()
+        # The upload is closed once the request ends, so the job reads its own copy
+        path, size = await loop.run_in_executor(get_csv_executor(), _spool_to_disk, upload)
+        job = ImportJob(
+            id=str(uuid.uuid4()),
+            kind=kind,
+            filename=filename,
+            owner_id=current_user.id,
+            total_bytes=size,
+            created_at=datetime.now()
+        )
+        try:
+            self.queue.submit(lambda: self._run(job, path, process))
+        except TaskQueueFullError:
+            os.unlink(path)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many imports are queued. Please try again later."
+            )
+        self._jobs[job.id] = job
+        self._evict_finished()
+        return job
+
+    def get_job(self, job_id: str, current_user: UserProfileDTO) -> ImportJobDTO:
+        """Get an import job started by the current user (admins see every job)"""
+        job = self._jobs.get(job_id)
+        if job is None or (job.owner_id != current_user.id and current_user.role != UserRole.ADMIN.value):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Import job not found")
+        return self._to_dto(job)
+
+    async def _run(self, job: ImportJob, path: str, process: CsvProcessor) -> None:
+        job.status = ImportJobStatus.RUNNING
+        job.started_at = datetime.now()
+        try:
+            with open(path, "rb") as csv_file:
+                def progress(result: CsvIngestionResult) -> None:
+                    job.processed_bytes = csv_file.tell()
+                    self._update_counts(job, result)
+
+                result = await process(csv_file, progress)
+            job.result = {key: value for key, value in result.items() if key != "errors"}
+            job.message = result["message"]
+            job.total_rows = result["total_rows"]
+            job.created_count = result["processed_count"]
+            job.errors = result["errors"]
+            job.status = ImportJobStatus.COMPLETED if result["success"] else ImportJobStatus.FAILED
+        except UnicodeDecodeError:
+            job.message = "File must be a valid UTF-8 encoded CSV file"
+            job.status = ImportJobStatus.FAILED
+        except Exception as e:
+            logging.error(f"Import job {job.id} ({job.kind}) failed: {str(e)}")
+            job.message = f"Error processing file: {str(e)}"
+            job.status = ImportJobStatus.FAILED
+        finally:
+            job.finished_at = datetime.now()
+            os.unlink(path)
+
+    @staticmethod
+    def _update_counts(job: ImportJob, result: CsvIngestionResult) -> None:
+        job.total_rows = result.total_rows
+        job.created_count = result.created_count
+        job.failed_count = result.failed_count
+        job.error_count = result.error_count
+        job.errors = result.errors
+
+    def _evict_finished(self) -> None:
+        """Forget the oldest finished jobs beyond the retention limit"""
+        excess = len(self._jobs) - self.retention
+        if excess <= 0:
+            return
+        for job_id in [job.id for job in self._jobs.values() if job.is_finished][:excess]:
+            del self._jobs[job_id]
+
+    def _to_dto(self, job: ImportJob) -> ImportJobDTO:
+        return ImportJobDTO(
+            id=job.id,
+            kind=job.kind,
+            filename=job.filename,
+            status=job.status,
+            progress=round(job.progress, 4),
+            total_rows=job.total_rows,
+            created_count=job.created_count,
+            failed_count=job.failed_count,
+            error_count=job.error_count,
+            errors=list(job.errors),
+            message=job.message,
+            result=job.result,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at
+        )
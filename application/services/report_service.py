@@ -1,40 +1,80 @@
 from application.dtos.report_dtos import (
-    ChurnTrendsDTO, 
-    ChurnBySegmentDTO, 
+    ChurnTrendsDTO,
+    ChurnBySegmentDTO,
     ChurnSegmentDTO,
     ChurnFactorsDTO,
     ChurnFactorDTO,
     RetentionActionsDTO,
     RetentionActionDTO
 )
+from domain.repositories.report_repository_interface import ReportRepositoryInterface
 from fastapi import HTTPException, status
+from typing import Dict
+import json
+import os
+
+# Months (by when clients were added) shown in the churn trend
+TREND_MONTHS = 12
+SEGMENT_COLORS = ["#f97316", "#fb923c", "#fdba74", "#fed7aa", "#ffedd5"]
+
+def get_retention_action_costs() -> Dict[str, int]:
+    """Cost per client of each retention action by title, from RETENTION_ACTION_COSTS (JSON)"""
+    return {title: int(cost) for title, cost in json.loads(os.getenv("RETENTION_ACTION_COSTS", "{}")).items()}
+
+def get_default_retention_action_cost() -> int:
+    """Cost per client of a retention action missing from RETENTION_ACTION_COSTS"""
+    return int(os.getenv("RETENTION_ACTION_DEFAULT_COST", "100"))
+
+def _share(part: float, total: float) -> int:
+    """Percentage of `total` taken by `part`, rounded"""
+    return round(part * 100 / total) if total else 0
+
+def _roi(gain: float, cost: int) -> int:
+    """Return on `cost`, in percent, of an action expected to bring `gain`"""
+    return round((gain - cost) * 100 / cost) if cost else 0
 
 class ReportApplicationService:
+    """Churn reports, read from the summary tables kept up to date by database triggers"""
+
+    def __init__(self, report_repository: ReportRepositoryInterface):
+        self.report_repository = report_repository
+
     async def get_churn_trends(self) -> ChurnTrendsDTO:
-        """Get churn trend data for reports"""
+        """Get churn trend data for reports
+
+        Average churn risk of the clients added in each of the last months in
+        which clients were added, oldest first.
+        """
         try:
-            # In a real app, you would query a repository for this data
-            # For now, return mock data
+            months = await self.report_repository.get_monthly_client_totals(TREND_MONTHS)
             return ChurnTrendsDTO(
-                months=["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"],
-                churn_rates=[4.2, 4.3, 4.5, 4.7, 4.6, 4.5, 4.4, 4.3, 4.2, 4.1, 4.0, 3.9]
+                months=[totals.month.strftime("%b %Y") for totals in months],
+                average_churn_risk=[round(totals.average_risk, 1) for totals in months]
             )
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to fetch churn trends: {str(e)}"
             )
-    
+
     async def get_churn_by_segment(self) -> ChurnBySegmentDTO:
-        """Get churn data by segment for reports"""
+        """Get churn data by segment for reports
+
+        Each segment's share of the total churn risk, i.e. of the clients
+        expected to churn, largest first.
+        """
         try:
-            # In a real app, you would query a repository for this data
-            # For now, return mock data
+            segments = await self.report_repository.get_segment_client_totals()
+            segments.sort(key=lambda totals: totals.risk_sum, reverse=True)
+            total_risk = sum(totals.risk_sum for totals in segments)
             return ChurnBySegmentDTO(
                 segments=[
-                    ChurnSegmentDTO(name="Premium", percentage=35, color="#f97316"),
-                    ChurnSegmentDTO(name="Standard", percentage=45, color="#fb923c"),
-                    ChurnSegmentDTO(name="Basic", percentage=20, color="#fdba74")
+                    ChurnSegmentDTO(
+                        name=totals.segment,
+                        percentage=_share(totals.risk_sum, total_risk),
+                        color=SEGMENT_COLORS[min(index, len(SEGMENT_COLORS) - 1)]
+                    )
+                    for index, totals in enumerate(segments)
                 ]
             )
         except Exception as e:
@@ -42,18 +82,21 @@ class ReportApplicationService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to fetch churn by segment: {str(e)}"
             )
-    
+
     async def get_churn_factors(self) -> ChurnFactorsDTO:
-        """Get churn factors data for reports"""
+        """Get churn factors data for reports
+
+        Each factor's share of the combined weight of all client churn
+        factors, largest first.
+        """
         try:
-            # In a real app, you would query a repository for this data
-            # For now, return mock data
+            factors = await self.report_repository.get_factor_totals()
+            factors.sort(key=lambda totals: totals.percentage_sum, reverse=True)
+            total_weight = sum(totals.percentage_sum for totals in factors)
             return ChurnFactorsDTO(
                 factors=[
-                    ChurnFactorDTO(name="Problèmes techniques", percentage=42),
-                    ChurnFactorDTO(name="Augmentation tarifaire", percentage=28),
-                    ChurnFactorDTO(name="Sous-utilisation", percentage=18),
-                    ChurnFactorDTO(name="Offres concurrentes", percentage=12)
+                    ChurnFactorDTO(name=totals.name, percentage=_share(totals.percentage_sum, total_weight))
+                    for totals in factors
                 ]
             )
         except Exception as e:
@@ -61,21 +104,36 @@ class ReportApplicationService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to fetch churn factors: {str(e)}"
             )
-    
+
     async def get_retention_actions(self) -> RetentionActionsDTO:
-        """Get retention actions data for reports"""
+        """Get retention actions data for reports
+
+        Effectiveness is the average churn risk reduction, in points, expected
+        from each recommended action, most effective first. Cost is the
+        configured cost per client of the action. ROI weighs it against the
+        revenue the action is expected to keep: the average client's yearly
+        revenue times the drop in churn probability.
+        """
         try:
-            # In a real app, you would query a repository for this data
-            # For now, return mock data
-            return RetentionActionsDTO(
-                actions=[
-                    RetentionActionDTO(name="Résolution technique", effectiveness=78, cost=120, roi=320),
-                    RetentionActionDTO(name="Offre fidélité", effectiveness=65, cost=85, roi=240),
-                    RetentionActionDTO(name="Upgrade technologique", effectiveness=58, cost=150, roi=180),
-                    RetentionActionDTO(name="Formation client", effectiveness=45, cost=60, roi=210),
-                    RetentionActionDTO(name="Remise commerciale", effectiveness=40, cost=100, roi=150)
-                ]
-            )
+            actions = await self.report_repository.get_recommendation_totals()
+            actions.sort(key=lambda totals: totals.average_impact)
+            segments = await self.report_repository.get_segment_client_totals()
+            revenue_count = sum(totals.revenue_count for totals in segments)
+            average_yearly_revenue = 12 * sum(totals.revenue_sum for totals in segments) / revenue_count if revenue_count else 0.0
+            costs = get_retention_action_costs()
+            default_cost = get_default_retention_action_cost()
+            retention_actions = []
+            for totals in actions:
+                effectiveness = round(-totals.average_impact)
+                cost = costs.get(totals.title, default_cost)
+                retention_actions.append(RetentionActionDTO(
+                    name=totals.title,
+                    effectiveness=effectiveness,
+                    cost=cost,
+                    roi=_roi(effectiveness / 100 * average_yearly_revenue, cost),
+                    recommendations=totals.recommendation_count
+                ))
+            return RetentionActionsDTO(actions=retention_actions)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,123 @@
+# Precomputed report snapshots
+#
+# ReportSnapshotScheduler recomputes all four churn reports in the background
+# every `interval_seconds` and keeps the latest result in memory, so report
+# requests are answered without touching the database. Each recomputation
+# gets the next generation number.
+#
+# Before each refresh the scheduler reads the change counters of the tables
+# behind the reports. When none changed since the current snapshot was
+# computed, the snapshot is kept and only marked as checked, so idle data
+# costs one small query per interval. The counters read before computing are
+# stored with the snapshot: they describe data at least as old as what the
+# snapshot holds, which keeps ETags derived from them safe to compare across
+# workers whose snapshots were computed at different times.
+#
+# Snapshots are per worker process. A failed refresh is logged and the
+# previous snapshot keeps being served.
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Dict, Optional
+from application.dtos.report_dtos import ChurnBySegmentDTO, ChurnFactorsDTO, ChurnTrendsDTO, RetentionActionsDTO
+from application.services.report_service import ReportApplicationService
+from domain.repositories.table_version_repository_interface import TableVersionRepositoryInterface
+import asyncio
+import logging
+
+# Tables each report is computed from
+REPORT_TABLES = {
+    "churn_trends": ("clients",),
+    "churn_by_segment": ("clients",),
+    "churn_factors": ("factors",),
+    "retention_actions": ("recommendations",),
+}
+SOURCE_TABLES = tuple(sorted({table for tables in REPORT_TABLES.values() for table in tables}))
+
+
+@dataclass(frozen=True)
+class ReportSnapshot:
+    generation: int
+    computed_at: datetime
+    checked_at: datetime  # last refresh that found the snapshot current
+    versions: Optional[Dict[str, int]]  # source table versions, None when unavailable
+    churn_trends: ChurnTrendsDTO
+    churn_by_segment: ChurnBySegmentDTO
+    churn_factors: ChurnFactorsDTO
+    retention_actions: RetentionActionsDTO
+
+    def age_seconds(self, now: Optional[datetime] = None) -> float:
+        """Seconds since the snapshot was last known to be current"""
+        return max(((now or datetime.now(timezone.utc)) - self.checked_at).total_seconds(), 0.0)
+
+
+class ReportSnapshotScheduler:
+    def __init__(self, report_service: ReportApplicationService,
+                 table_version_repository: TableVersionRepositoryInterface, interval_seconds: float):
+        self.report_service = report_service
+        self.table_version_repository = table_version_repository
+        self.interval_seconds = interval_seconds
+        self.current: Optional[ReportSnapshot] = None
+        self._generation = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval_seconds > 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        """Start refreshing on the running event loop; the first refresh runs at once"""
+        if self.running or not self.enabled:
+            return
+        self._task = asyncio.create_task(self._run(), name="report-snapshots")
+        logging.info(f"Report snapshots refreshed every {self.interval_seconds:g}s")
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def refresh(self) -> ReportSnapshot:
+        """Recompute the snapshot, unless its source tables have not changed"""
+        try:
+            versions = await self.table_version_repository.get_versions(SOURCE_TABLES)
+        except Exception as e:
+            logging.warning(f"Table versions unavailable, recomputing report snapshot: {str(e)}")
+            versions = None
+        now = datetime.now(timezone.utc)
+        if self.current is not None and versions is not None and versions == self.current.versions:
+            self.current = replace(self.current, checked_at=now)
+            return self.current
+        churn_trends, churn_by_segment, churn_factors, retention_actions = await asyncio.gather(
+            self.report_service.get_churn_trends(),
+            self.report_service.get_churn_by_segment(),
+            self.report_service.get_churn_factors(),
+            self.report_service.get_retention_actions()
+        )
+        self._generation += 1
+        self.current = ReportSnapshot(
+            generation=self._generation,
+            computed_at=now,
+            checked_at=now,
+            versions=versions,
+            churn_trends=churn_trends,
+            churn_by_segment=churn_by_segment,
+            churn_factors=churn_factors,
+            retention_actions=retention_actions
+        )
+        return self.current
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"Report snapshot refresh failed: {str(e)}")
+            await asyncio.sleep(self.interval_seconds)
@@ -0,0 +1,170 @@
+"""Concurrency benchmark for GET /clients.
+
+Fires a burst of concurrent requests at `/clients` and reports latency
+percentiles.
+
+By default the benchmark runs in-process: the FastAPI app is mounted on an
+httpx ASGI transport, authentication is overridden, and the Supabase client is
+replaced with a stand-in whose `execute()` blocks for `--latency-ms`, exactly
+like a real PostgREST round trip made with the synchronous client. It runs
+twice:
+
+* before - queries are executed inline on the event loop (previous behaviour)
+* after  - queries go through the bounded query executor
+
+Pass `--url` and `--token` to benchmark a running server instead.
+
+Usage:
+    python benchmarks/bench_clients_concurrency.py --concurrency 200
+    python benchmarks/bench_clients_concurrency.py --url http://localhost:8000 --token <jwt>
+
+Requires `httpx` in addition to the application requirements.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import List, Optional
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The API modules build a Supabase client at import time
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "eyJhbGciOiJIUzI1NiJ9.eyJyb2xlIjoiYW5vbiJ9.benchmark")
+
+
+class _FakeResponse:
+    def __init__(self, data: list):
+        self.data = data
+
+
+class _FakeQuery:
+    """Chainable stand-in for a PostgREST request builder"""
+
+    def __init__(self, rows: list, latency: float):
+        self._rows = rows
+        self._latency = latency
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def execute(self) -> _FakeResponse:
+        time.sleep(self._latency)  # blocking, like the sync supabase client
+        return _FakeResponse(self._rows)
+
+
+class _FakeSupabase:
+    def __init__(self, rows: list, latency: float):
+        self._rows = rows
+        self._latency = latency
+
+    def table(self, name: str) -> _FakeQuery:
+        return _FakeQuery(self._rows, self._latency)
+
+    from_ = table
+
+
+def _sample_rows(count: int) -> list:
+    return [
+        {
+            "id": f"00000000-0000-0000-0000-{i:012d}",
+            "name": f"Client {i}",
+            "segment": "Premium",
+            "since": "2 ans",
+            "churn_risk": "42",
+            "contacts": {"primary": "+33 6 00 00 00 00"},
+            "created_at": "2024-01-01T00:00:00+00:00",
+        }
+        for i in range(count)
+    ]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _report(label: str, latencies: List[float], wall: float) -> None:
+    ms = [value * 1000 for value in latencies]
+    print(
+        f"{label:<8} n={len(ms):<5} "
+        f"p50={_percentile(ms, 50):8.1f}ms "
+        f"p95={_percentile(ms, 95):8.1f}ms "
+        f"p99={_percentile(ms, 99):8.1f}ms "
+        f"mean={statistics.mean(ms):8.1f}ms "
+        f"wall={wall * 1000:8.1f}ms"
+    )
+
+
+async def _burst(client: httpx.AsyncClient, concurrency: int, headers: dict) -> tuple:
+    async def one() -> float:
+        started = time.perf_counter()
+        response = await client.get("/clients/", headers=headers)
+        response.raise_for_status()
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(one() for _ in range(concurrency)))
+    return list(latencies), time.perf_counter() - started
+
+
+async def run_in_process(concurrency: int, latency_ms: float, rows: int) -> None:
+    from main import app
+    from application.dtos.auth_dtos import UserProfileDTO
+    from presentation.api import client_api
+    from presentation.api.auth_api import get_current_user
+    import infrastructure.repositories.client_repository as client_repository_module
+    from infrastructure.services import query_executor
+
+    app.dependency_overrides[get_current_user] = lambda: UserProfileDTO(
+        id="bench", email="bench@example.com", full_name="Bench", role="admin", cin="00000", code="000"
+    )
+    client_api.client_repository.supabase = _FakeSupabase(_sample_rows(rows), latency_ms / 1000)
+
+    async def execute_inline(query):
+        return query.execute()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        client_repository_module.execute_query = execute_inline
+        latencies, wall = await _burst(client, concurrency, {})
+        _report("before", latencies, wall)
+
+        client_repository_module.execute_query = query_executor.execute_query
+        await _burst(client, min(concurrency, 8), {})  # warm up the thread pool
+        latencies, wall = await _burst(client, concurrency, {})
+        _report("after", latencies, wall)
+
+    query_executor.shutdown_query_executor()
+
+
+async def run_remote(url: str, token: Optional[str], concurrency: int) -> None:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        latencies, wall = await _burst(client, concurrency, headers)
+        _report("remote", latencies, wall)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="simulated PostgREST round trip")
+    parser.add_argument("--rows", type=int, default=50, help="clients returned per query")
+    parser.add_argument("--url", help="benchmark a running server instead of the in-process app")
+    parser.add_argument("--token", help="bearer token for --url")
+    args = parser.parse_args()
+
+    if args.url:
+        asyncio.run(run_remote(args.url, args.token, args.concurrency))
+    else:
+        asyncio.run(run_in_process(args.concurrency, args.latency_ms, args.rows))
+
+
+if __name__ == "__main__":
+    main()
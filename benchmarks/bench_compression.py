@@ -0,0 +1,171 @@
+"""Bytes saved and CPU cost of response compression.
+
+Serves synthetic list responses shaped like the client, prediction and email
+notification endpoints, plus a streamed NDJSON prediction export, from an
+in-process app wrapped in `CompressionMiddleware`
+(`presentation/api/compression.py`), and requests each one with
+`Accept-Encoding: identity`, `gzip` and `br`. For every endpoint and
+encoding it reports the bytes sent, the saving over identity and the CPU
+time the server spends per request on top of the uncompressed response
+(decoding on the client side is not counted).
+
+Usage:
+    python benchmarks/bench_compression.py --rows 5000 --gzip-level 6 --brotli-quality 4
+
+Requires `httpx` in addition to the application requirements.
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain.entities.customer_incident_prediction import IncidentType, risk_level_for
+from presentation.api.compression import CompressionMiddleware
+from presentation.api.json_responses import dump_json
+
+ENCODINGS = ["identity", "gzip", "br"]
+
+
+def clients(count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": f"{rng.getrandbits(128):032x}",
+            "name": f"Client {i}",
+            "segment": rng.choice(["Enterprise", "SMB", "Residential"]),
+            "since": str(rng.randint(2010, 2024)),
+            "churn_risk": rng.randint(0, 100),
+            "contacts": {"primary": f"+216 {rng.randint(20000000, 99999999)}", "secondary": None,
+                         "preferred_time": rng.choice(["Morning", "Afternoon"]), "last_call": "25/05/2023 - Support"},
+            "monthly_revenue": round(rng.uniform(20, 5000), 2),
+            "churn_trend": rng.choice(["up", "down", "stable"]),
+            "churn_trend_days": rng.randint(1, 90),
+            "created_at": f"2024-01-{rng.randint(1, 28):02d}T10:{rng.randint(0, 59):02d}:00+00:00",
+            "updated_at": None
+        }
+        for i in range(count)
+    ]
+
+
+def predictions(count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    rows = []
+    for i in range(count):
+        quarters = [round(rng.uniform(0, 100), 2) for _ in range(4)]
+        average = sum(quarters) / 4
+        rows.append({
+            "id": i + 1,
+            "customer_id": f"C{i:08d}",
+            "client_region": rng.choice(["Tunis", "Sfax", "Sousse", "Bizerte"]),
+            "client_type": rng.choice(["B2B", "B2C"]),
+            "client_category": rng.choice([None, 1.0, 2.0, 3.0]),
+            "q1_prediction": quarters[0],
+            "q2_prediction": quarters[1],
+            "q3_prediction": quarters[2],
+            "q4_prediction": quarters[3],
+            "most_likely_incident": rng.choice([incident_type.value for incident_type in IncidentType]),
+            "recommendation": "Schedule a technician visit and call the customer",
+            "created_at": f"2024-02-{rng.randint(1, 28):02d}T08:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}+00:00",
+            "updated_at": None,
+            "avg_risk_percentage": average,
+            "risk_level": risk_level_for(average)
+        })
+    return rows
+
+
+def notifications(count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": i + 1,
+            "email": f"customer{i}@example.com",
+            "name": f"Customer {i}",
+            "issue": rng.choice(["Slow connection", "WiFi issue", "Disconnection"]),
+            "status": rng.choice(["pending", "sent", "failed"]),
+            "created_at": f"2024-03-{rng.randint(1, 28):02d}T09:00:00+00:00",
+            "updated_at": None,
+            "sent_at": None
+        }
+        for i in range(count)
+    ]
+
+
+class CpuTimer:
+    """ASGI wrapper recording the CPU time the server spent on the last request"""
+
+    def __init__(self, app):
+        self.app = app
+        self.last = 0.0
+
+    async def __call__(self, scope, receive, send):
+        started = time.process_time()
+        await self.app(scope, receive, send)
+        self.last = time.process_time() - started
+
+
+def build_app(payloads: Dict[str, bytes], export_rows: List[Dict[str, Any]], args: argparse.Namespace) -> CpuTimer:
+    app = FastAPI()
+    for path, body in payloads.items():
+        app.add_api_route(path, lambda body=body: Response(body, media_type="application/json"))
+
+    @app.get("/customer-incident-predictions/export")
+    async def export():
+        async def stream():
+            for start in range(0, len(export_rows), 1000):
+                yield b"".join(dump_json(row) + b"\n" for row in export_rows[start:start + 1000])
+        return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+    app.add_middleware(CompressionMiddleware, minimum_size=args.minimum_size,
+                       gzip_level=args.gzip_level, brotli_quality=args.brotli_quality)
+    return CpuTimer(app)
+
+
+async def measure(client: httpx.AsyncClient, timer: CpuTimer, path: str, encoding: str, requests: int) -> tuple:
+    """Bytes sent and median server CPU seconds per request"""
+    timings = []
+    for _ in range(requests):
+        response = await client.get(path, headers={"Accept-Encoding": encoding})
+        response.raise_for_status()
+        timings.append(timer.last)
+    return response.num_bytes_downloaded, statistics.median(timings)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=5)
+    parser.add_argument("--minimum-size", type=int, default=1024)
+    parser.add_argument("--gzip-level", type=int, default=6)
+    parser.add_argument("--brotli-quality", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    export_rows = predictions(args.rows, rng)
+    payloads = {
+        "/clients/": dump_json(clients(args.rows, rng)),
+        "/customer-incident-predictions/": dump_json(predictions(args.rows, rng)),
+        "/email-notifications/": dump_json(notifications(args.rows, rng)),
+    }
+    timer = build_app(payloads, export_rows, args)
+
+    print(f"{args.rows} rows, gzip level {args.gzip_level}, brotli quality {args.brotli_quality}")
+    print(f"{'endpoint':<40} {'encoding':<9} {'bytes':>11} {'saved':>7} {'cpu ms':>8}")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=timer), base_url="http://bench") as client:
+        for path in list(payloads) + ["/customer-incident-predictions/export"]:
+            identity_bytes, identity_cpu = await measure(client, timer, path, "identity", args.requests)
+            for encoding in ENCODINGS:
+                size, cpu = (identity_bytes, identity_cpu) if encoding == "identity" else await measure(client, timer, path, encoding, args.requests)
+                saved = 1 - size / identity_bytes
+                print(f"{path:<40} {encoding:<9} {size:>11,} {saved:>6.0%} {(cpu - identity_cpu) * 1000:>+8.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
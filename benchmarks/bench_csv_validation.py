@@ -0,0 +1,173 @@
+"""Throughput benchmark for CSV upload validation.
+
+Validates synthetic chunks of customer incident prediction and customer issue
+rows, as the upload endpoints do after reading a chunk of the file, and
+reports rows per second for:
+
+* before - row-by-row validation (the previous `_parse_csv_row` methods,
+  reproduced here): strips, `Decimal(str(...))`/`float()` conversions and an
+  enum lookup per row
+* after  - the columnar validation used by the services now
+  (`application/services/columnar_validation.py`)
+
+Reading and decoding the file are excluded; they are the same in both cases.
+A fraction of the rows is made invalid (`--invalid-ratio`) so that the error
+reporting paths are exercised as well.
+
+Usage:
+    python benchmarks/bench_csv_validation.py --rows 200000 --chunk-size 5000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from application.services.csv_ingestion import CsvChunk, parse_rows
+from application.services.customer_incident_prediction_service import CustomerIncidentPredictionApplicationService
+from application.services.customer_issue_service import CustomerIssueApplicationService
+from domain.entities.customer_incident_prediction import CustomerIncidentPrediction, IncidentType
+from domain.entities.customer_issue import CustomerIssue
+
+INCIDENTS = [incident_type.value for incident_type in IncidentType]
+
+
+def prediction_rows(count: int, invalid_ratio: float, rng: random.Random) -> List[Dict[str, str]]:
+    rows = []
+    for i in range(count):
+        row = {
+            "customer_id": f"C{i:08d}",
+            "client_region": rng.choice(["North", "South", "East", "West"]),
+            "client_type": rng.choice(["B2B", "B2C"]),
+            "client_category": str(rng.randint(1, 5)),
+            "q1_prediction": f"{rng.uniform(0, 100):.2f}",
+            "q2_prediction": f"{rng.uniform(0, 100):.2f}",
+            "q3_prediction": f"{rng.uniform(0, 100):.2f}",
+            "q4_prediction": f"{rng.uniform(0, 100):.2f}",
+            "most_likely_incident": rng.choice(INCIDENTS),
+            "recommendation": "Call the customer"
+        }
+        if rng.random() < invalid_ratio:
+            row[rng.choice(["q2_prediction", "most_likely_incident", "recommendation"])] = rng.choice(["", "n/a"])
+        rows.append(row)
+    return rows
+
+
+def issue_rows(count: int, invalid_ratio: float, rng: random.Random) -> List[Dict[str, str]]:
+    rows = []
+    for i in range(count):
+        row = {
+            "customer_id": str(i),
+            "code_contrat": str(rng.randint(1000, 9999)),
+            "client_type": str(rng.randint(1, 3)),
+            "client_region": str(rng.randint(1, 24)),
+            "client_categorie": str(rng.randint(1, 5)),
+            "incident_title": "Slow connection",
+            "churn_risk": f"{rng.uniform(0, 1):.4f}"
+        }
+        if rng.random() < invalid_ratio:
+            row["churn_risk"] = "n/a"
+        rows.append(row)
+    return rows
+
+
+def parse_prediction_row(row_num: int, row: Dict[str, str], customer_ids_in_csv: set) -> CustomerIncidentPrediction:
+    """Row-by-row prediction validation, as before the columnar engine"""
+    customer_id = (row.get('customer_id') or '').strip()
+    client_region = (row.get('client_region') or '').strip()
+    client_type = (row.get('client_type') or '').strip()
+    most_likely_incident = (row.get('most_likely_incident') or '').strip()
+    recommendation = (row.get('recommendation') or '').strip()
+    for name, value in (("customer_id", customer_id), ("client_region", client_region), ("client_type", client_type),
+                        ("most_likely_incident", most_likely_incident), ("recommendation", recommendation)):
+        if not value:
+            raise ValueError(f"{name} is required")
+    if customer_id in customer_ids_in_csv:
+        raise ValueError(f"Duplicate customer_id '{customer_id}' found in CSV")
+    customer_ids_in_csv.add(customer_id)
+    client_category = None
+    if (row.get('client_category') or '').strip():
+        try:
+            client_category = Decimal(str(row.get('client_category')))
+        except (ArithmeticError, ValueError, TypeError):
+            raise ValueError("Invalid client_category value")
+    try:
+        q1_prediction = Decimal(str(row.get('q1_prediction', '0.0')))
+        q2_prediction = Decimal(str(row.get('q2_prediction', '0.0')))
+        q3_prediction = Decimal(str(row.get('q3_prediction', '0.0')))
+        q4_prediction = Decimal(str(row.get('q4_prediction', '0.0')))
+    except (ArithmeticError, ValueError, TypeError):
+        raise ValueError("Invalid prediction values")
+    try:
+        incident_type = IncidentType(most_likely_incident)
+    except ValueError:
+        raise ValueError(f"Invalid incident type '{most_likely_incident}'. Valid types: {INCIDENTS}")
+    return CustomerIncidentPrediction(
+        customer_id=customer_id, client_region=client_region, client_type=client_type,
+        client_category=client_category, q1_prediction=q1_prediction, q2_prediction=q2_prediction,
+        q3_prediction=q3_prediction, q4_prediction=q4_prediction,
+        most_likely_incident=incident_type, recommendation=recommendation
+    )
+
+
+def parse_issue_row(row_num: int, row: Dict[str, str], report) -> CustomerIssue:
+    """Row-by-row issue validation, as before the columnar engine"""
+    return CustomerIssue(
+        customer_id=float(row['customer_id']) if row.get('customer_id') and row['customer_id'].strip() else None,
+        code_contrat=float(row['code_contrat']) if row.get('code_contrat') and row['code_contrat'].strip() else None,
+        client_type=float(row['client_type']) if row.get('client_type') and row['client_type'].strip() else None,
+        client_region=float(row['client_region']) if row.get('client_region') and row['client_region'].strip() else None,
+        client_categorie=float(row['client_categorie']) if row.get('client_categorie') and row['client_categorie'].strip() else None,
+        incident_title=row.get('incident_title', '').strip() if row.get('incident_title') else None,
+        churn_risk=float(row['churn_risk']) if row.get('churn_risk') and row['churn_risk'].strip() else None,
+        status="not sent"
+    )
+
+
+def measure(rows: List[Dict[str, str]], chunk_size: int, make_parser: Callable[[], Callable]) -> float:
+    """Rows per second validating `rows` chunk by chunk"""
+    fieldnames = list(rows[0])
+    fields = [[row[name] for name in fieldnames] for row in rows]
+    chunks = [CsvChunk(fieldnames, start + 2, fields[start:start + chunk_size]) for start in range(0, len(fields), chunk_size)]
+    errors: List[str] = []
+    parse_chunk = make_parser()
+    started = time.perf_counter()
+    for chunk in chunks:
+        parse_chunk(chunk, errors.append)
+    return len(rows) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--invalid-ratio", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    prediction_service = CustomerIncidentPredictionApplicationService(None)
+    issue_service = CustomerIssueApplicationService(None)
+    cases = [
+        ("predictions", prediction_rows(args.rows, args.invalid_ratio, rng),
+         lambda: (lambda seen: parse_rows(lambda n, row, report: parse_prediction_row(n, row, seen)))(set()),
+         lambda: (lambda seen: lambda chunk, report: prediction_service._parse_csv_chunk(chunk, report, seen))(set())),
+        ("customer issues", issue_rows(args.rows, args.invalid_ratio, rng),
+         lambda: parse_rows(parse_issue_row),
+         lambda: issue_service._parse_csv_chunk),
+    ]
+
+    print(f"{args.rows} rows, chunks of {args.chunk_size}, {args.invalid_ratio:.0%} invalid")
+    print(f"{'table':<16} {'before rows/s':>14} {'after rows/s':>14} {'speedup':>8}")
+    for name, rows, before, after in cases:
+        before_rate = measure(rows, args.chunk_size, before)
+        after_rate = measure(rows, args.chunk_size, after)
+        print(f"{name:<16} {before_rate:>14,.0f} {after_rate:>14,.0f} {after_rate / before_rate:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""Micro-benchmark for entity hydration from row dictionaries.
+
+Hydrates the same synthetic PostgREST rows with:
+
+* before - the previous hand-written `from_dict` methods (reproduced here):
+  two or three `data.get` calls per field and a
+  `datetime.fromisoformat(...replace('Z', '+00:00'))` per timestamp
+* after  - the compiled hydrators the entities use now
+  (`domain/entities/hydration.py`)
+
+for customer incident predictions, email notifications and clients, and
+reports rows per second. Rows written in the same batch share their
+timestamps; `--rows-per-timestamp` sets how many rows share one value
+(1 makes every timestamp distinct, the worst case for the memo).
+
+Usage:
+    python benchmarks/bench_hydration.py --rows 100000 --rows-per-timestamp 50
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain.entities.client import Client, Contact
+from domain.entities.customer_incident_prediction import CustomerIncidentPrediction, IncidentType
+from domain.entities.email_notification import EmailNotification, NotificationStatus
+
+INCIDENTS = [incident_type.value for incident_type in IncidentType]
+
+
+def prediction_before(data: Dict[str, Any]) -> CustomerIncidentPrediction:
+    return CustomerIncidentPrediction(
+        id=data.get('id'),
+        customer_id=data.get('customer_id', ''),
+        client_region=data.get('client_region', ''),
+        client_type=data.get('client_type', ''),
+        client_category=float(data.get('client_category')) if data.get('client_category') is not None else None,
+        q1_prediction=float(data.get('q1_prediction') or 0.0),
+        q2_prediction=float(data.get('q2_prediction') or 0.0),
+        q3_prediction=float(data.get('q3_prediction') or 0.0),
+        q4_prediction=float(data.get('q4_prediction') or 0.0),
+        most_likely_incident=IncidentType(data.get('most_likely_incident', 'other_incident')),
+        recommendation=data.get('recommendation', ''),
+        created_at=datetime.fromisoformat(data.get('created_at').replace('Z', '+00:00')) if data.get('created_at') else None,
+        updated_at=datetime.fromisoformat(data.get('updated_at').replace('Z', '+00:00')) if data.get('updated_at') else None
+    )
+
+
+def notification_before(data: Dict[str, Any]) -> EmailNotification:
+    return EmailNotification(
+        id=data.get('id'),
+        email=data.get('email', ''),
+        name=data.get('name', ''),
+        issue=data.get('issue', ''),
+        status=NotificationStatus(data.get('status', 'pending')),
+        created_at=datetime.fromisoformat(data.get('created_at').replace('Z', '+00:00')) if data.get('created_at') else None,
+        updated_at=datetime.fromisoformat(data.get('updated_at').replace('Z', '+00:00')) if data.get('updated_at') else None,
+        sent_at=datetime.fromisoformat(data.get('sent_at').replace('Z', '+00:00')) if data.get('sent_at') else None
+    )
+
+
+def client_before(data: Dict[str, Any]) -> Client:
+    contacts_data = data.get('contacts', {})
+    contacts = Contact(
+        primary=contacts_data.get('primary', ''),
+        secondary=contacts_data.get('secondary'),
+        preferred_time=contacts_data.get('preferred_time'),
+        last_call=contacts_data.get('last_call')
+    )
+    return Client(
+        id=data.get('id', ''),
+        name=data.get('name', ''),
+        segment=data.get('segment', ''),
+        since=data.get('since', ''),
+        churn_risk=data.get('churn_risk', ''),
+        contacts=contacts,
+        monthly_revenue=float(data.get('monthly_revenue')) if data.get('monthly_revenue') is not None else None,
+        churn_trend=data.get('churn_trend'),
+        churn_trend_days=data.get('churn_trend_days'),
+        created_at=datetime.fromisoformat(data.get('created_at')) if data.get('created_at') else datetime.now(),
+        updated_at=datetime.fromisoformat(data.get('updated_at')) if data.get('updated_at') else None
+    )
+
+
+def timestamps(count: int, rows_per_timestamp: int) -> List[str]:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [(start + timedelta(seconds=i // rows_per_timestamp, microseconds=i % 997)).isoformat()
+            if rows_per_timestamp == 1 else (start + timedelta(seconds=i // rows_per_timestamp)).isoformat()
+            for i in range(count)]
+
+
+def prediction_rows(count: int, stamps: List[str], rng: random.Random) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": i + 1,
+            "customer_id": f"C{i:08d}",
+            "client_region": rng.choice(["North", "South", "East", "West"]),
+            "client_type": rng.choice(["B2B", "B2C"]),
+            "client_category": rng.choice([None, "1", "2", "3"]),
+            "q1_prediction": round(rng.uniform(0, 100), 2),
+            "q2_prediction": round(rng.uniform(0, 100), 2),
+            "q3_prediction": round(rng.uniform(0, 100), 2),
+            "q4_prediction": round(rng.uniform(0, 100), 2),
+            "most_likely_incident": rng.choice(INCIDENTS),
+            "recommendation": "Call the customer",
+            "created_at": stamps[i],
+            "updated_at": stamps[i]
+        }
+        for i in range(count)
+    ]
+
+
+def notification_rows(count: int, stamps: List[str], rng: random.Random) -> List[Dict[str, Any]]:
+    rows = []
+    for i in range(count):
+        status = rng.choice(["pending", "sent", "failed"])
+        rows.append({
+            "id": i + 1,
+            "email": f"customer{i}@example.com",
+            "name": f"Customer {i}",
+            "issue": "Slow connection",
+            "status": status,
+            "created_at": stamps[i],
+            "updated_at": stamps[i],
+            "sent_at": stamps[i] if status == "sent" else None
+        })
+    return rows
+
+
+def client_rows(count: int, stamps: List[str], rng: random.Random) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": f"client-{i}",
+            "name": f"Client {i}",
+            "segment": rng.choice(["Enterprise", "SMB"]),
+            "since": "2019",
+            "churn_risk": rng.choice(["low", "medium", "high"]),
+            "contacts": {"primary": f"+1555{i:07d}", "secondary": None, "preferred_time": "morning", "last_call": None},
+            "monthly_revenue": round(rng.uniform(100, 10000), 2),
+            "churn_trend": rng.choice(["up", "down"]),
+            "churn_trend_days": rng.randint(1, 90),
+            "created_at": stamps[i],
+            "updated_at": stamps[i]
+        }
+        for i in range(count)
+    ]
+
+
+def measure(rows: List[Dict[str, Any]], hydrate: Callable[[Dict[str, Any]], Any], repeat: int) -> float:
+    """Best rows per second over `repeat` runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for row in rows:
+            hydrate(row)
+        best = min(best, time.perf_counter() - started)
+    return len(rows) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--rows-per-timestamp", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    stamps = timestamps(args.rows, args.rows_per_timestamp)
+    cases = [
+        ("predictions", prediction_rows(args.rows, stamps, rng), prediction_before, CustomerIncidentPrediction.from_dict),
+        ("notifications", notification_rows(args.rows, stamps, rng), notification_before, EmailNotification.from_dict),
+        ("clients", client_rows(args.rows, stamps, rng), client_before, Client.from_dict),
+    ]
+
+    print(f"{args.rows} rows, {args.rows_per_timestamp} rows per timestamp")
+    print(f"{'entity':<16} {'before rows/s':>14} {'after rows/s':>14} {'speedup':>8}")
+    for name, rows, before, after in cases:
+        before_rate = measure(rows, before, args.repeat)
+        after_rate = measure(rows, after, args.repeat)
+        print(f"{name:<16} {before_rate:>14,.0f} {after_rate:>14,.0f} {after_rate / before_rate:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
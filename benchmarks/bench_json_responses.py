@@ -0,0 +1,110 @@
+"""Serialization benchmark for large JSON list responses.
+
+Serves the same list of `CustomerIncidentPredictionDTO`s, built in memory
+as the prediction service builds them, from two in-process apps and reports
+the median time of a request over an httpx ASGI transport:
+
+* before - FastAPI's default path: `JSONResponse`, with every DTO validated
+  again against `response_model=List[CustomerIncidentPredictionDTO]` and
+  walked with `jsonable_encoder`
+* after  - `FastJSONRoute` and `FastJSONResponse`
+  (`presentation/api/json_responses.py`), as configured in `main.py`
+
+Database access and authentication are left out, so the difference is the
+response path alone.
+
+Usage:
+    python benchmarks/bench_json_responses.py --rows 1000 10000 50000
+
+Requires `httpx` in addition to the application requirements.
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import httpx
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import JSONResponse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from application.dtos.customer_incident_prediction_dtos import CustomerIncidentPredictionDTO
+from domain.entities.customer_incident_prediction import IncidentType, risk_level_for
+from presentation.api.json_responses import FastJSONResponse, FastJSONRoute
+
+
+def predictions(count: int, rng: random.Random) -> List[CustomerIncidentPredictionDTO]:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    dtos = []
+    for i in range(count):
+        quarters = [round(rng.uniform(0, 100), 2) for _ in range(4)]
+        average = sum(quarters) / 4
+        created_at = start + timedelta(seconds=i)
+        dtos.append(CustomerIncidentPredictionDTO(
+            id=i + 1,
+            customer_id=f"C{i:08d}",
+            client_region=rng.choice(["North", "South", "East", "West"]),
+            client_type=rng.choice(["B2B", "B2C"]),
+            client_category=rng.choice([None, 1.0, 2.0, 3.0]),
+            q1_prediction=quarters[0],
+            q2_prediction=quarters[1],
+            q3_prediction=quarters[2],
+            q4_prediction=quarters[3],
+            most_likely_incident=rng.choice(list(IncidentType)),
+            recommendation="Call the customer",
+            created_at=created_at,
+            updated_at=created_at,
+            avg_risk_percentage=average,
+            risk_level=risk_level_for(average)
+        ))
+    return dtos
+
+
+def build_app(items: List[CustomerIncidentPredictionDTO], fast: bool) -> FastAPI:
+    app = FastAPI(default_response_class=FastJSONResponse if fast else JSONResponse)
+    router = APIRouter(route_class=FastJSONRoute) if fast else APIRouter()
+
+    @router.get("/", response_model=List[CustomerIncidentPredictionDTO])
+    async def get_predictions():
+        return items
+
+    app.include_router(router, prefix="/customer-incident-predictions")
+    return app
+
+
+async def measure(app: FastAPI, requests: int) -> float:
+    """Median seconds per request"""
+    timings = []
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = await client.get("/customer-incident-predictions/")
+            response.raise_for_status()
+            timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--requests", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'rows':>8} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for count in args.rows:
+        items = predictions(count, rng)
+        before = await measure(build_app(items, fast=False), args.requests)
+        after = await measure(build_app(items, fast=True), args.requests)
+        print(f"{count:>8} {before * 1000:>10,.1f} {after * 1000:>10,.1f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
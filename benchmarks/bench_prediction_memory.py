@@ -0,0 +1,147 @@
+"""Memory and conversion benchmark for bulk customer incident prediction results.
+
+Builds the same synthetic PostgREST rows into:
+
+* before     - the previous Decimal-backed dataclass (reproduced here), with
+  `Decimal(str(...))` conversions in `from_dict`
+* entities   - a list of the float-backed `CustomerIncidentPrediction`
+* collection - a `PredictionCollection`, as the bulk repository methods return
+
+and reports the memory held by the result (traced with `tracemalloc`), the
+time to build it, and the time to compute every row's average risk and risk
+level, as the DTO conversion does.
+
+Usage:
+    python benchmarks/bench_prediction_memory.py --rows 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain.entities.customer_incident_prediction import CustomerIncidentPrediction, IncidentType
+from domain.value_objects.prediction_collection import PredictionCollection
+
+INCIDENTS = [incident_type.value for incident_type in IncidentType]
+
+
+@dataclass
+class DecimalPrediction:
+    """The prediction entity as it was before the float representation"""
+    id: Optional[int] = None
+    customer_id: str = ""
+    client_region: str = ""
+    client_type: str = ""
+    client_category: Optional[Decimal] = None
+    q1_prediction: Decimal = Decimal('0.0')
+    q2_prediction: Decimal = Decimal('0.0')
+    q3_prediction: Decimal = Decimal('0.0')
+    q4_prediction: Decimal = Decimal('0.0')
+    most_likely_incident: IncidentType = IncidentType.OTHER_INCIDENT
+    recommendation: str = ""
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DecimalPrediction':
+        return cls(
+            id=data.get('id'),
+            customer_id=data.get('customer_id', ''),
+            client_region=data.get('client_region', ''),
+            client_type=data.get('client_type', ''),
+            client_category=Decimal(str(data.get('client_category'))) if data.get('client_category') is not None else None,
+            q1_prediction=Decimal(str(data.get('q1_prediction', '0.0'))),
+            q2_prediction=Decimal(str(data.get('q2_prediction', '0.0'))),
+            q3_prediction=Decimal(str(data.get('q3_prediction', '0.0'))),
+            q4_prediction=Decimal(str(data.get('q4_prediction', '0.0'))),
+            most_likely_incident=IncidentType(data.get('most_likely_incident', 'other_incident')),
+            recommendation=data.get('recommendation', ''),
+            created_at=datetime.fromisoformat(data.get('created_at').replace('Z', '+00:00')) if data.get('created_at') else None,
+            updated_at=datetime.fromisoformat(data.get('updated_at').replace('Z', '+00:00')) if data.get('updated_at') else None
+        )
+
+    def get_average_risk_percentage(self) -> float:
+        return float((self.q1_prediction + self.q2_prediction + self.q3_prediction + self.q4_prediction) / 4)
+
+    def get_risk_level(self) -> str:
+        avg_risk = self.get_average_risk_percentage()
+        if avg_risk >= 60:
+            return "High"
+        elif avg_risk >= 30:
+            return "Medium"
+        else:
+            return "Low"
+
+
+def rows(count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": i + 1,
+            "customer_id": f"C{i:08d}",
+            "client_region": rng.choice(["North", "South", "East", "West"]),
+            "client_type": rng.choice(["B2B", "B2C"]),
+            "client_category": rng.choice([None, "1", "2", "3"]),
+            "q1_prediction": round(rng.uniform(0, 100), 2),
+            "q2_prediction": round(rng.uniform(0, 100), 2),
+            "q3_prediction": round(rng.uniform(0, 100), 2),
+            "q4_prediction": round(rng.uniform(0, 100), 2),
+            "most_likely_incident": rng.choice(INCIDENTS),
+            "recommendation": "Call the customer",
+            "created_at": "2024-01-15T10:30:00+00:00",
+            "updated_at": "2024-01-15T10:30:00+00:00"
+        }
+        for i in range(count)
+    ]
+
+
+def measure(build: Callable[[], Any], risk_levels: Callable[[Any], List[str]]) -> tuple:
+    """Bytes held by the built result, seconds to build it and seconds to derive risk levels
+
+    The result is built twice, since tracing allocations slows the build down.
+    """
+    tracemalloc.start()
+    result = build()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    started = time.perf_counter()
+    result = build()
+    build_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    risk_levels(result)
+    return held, build_seconds, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    data = rows(args.rows, random.Random(args.seed))
+    cases = [
+        ("before", lambda: [DecimalPrediction.from_dict(row) for row in data],
+         lambda result: [prediction.get_risk_level() for prediction in result]),
+        ("entities", lambda: [CustomerIncidentPrediction.from_dict(row) for row in data],
+         lambda result: [prediction.get_risk_level() for prediction in result]),
+        ("collection", lambda: PredictionCollection.from_rows(data),
+         lambda result: result.risk_levels()),
+    ]
+
+    print(f"{args.rows} rows")
+    print(f"{'representation':<16} {'bytes/row':>10} {'build ms':>10} {'risk ms':>10}")
+    for name, build, risk_levels in cases:
+        held, build_seconds, risk_seconds = measure(build, risk_levels)
+        print(f"{name:<16} {held / args.rows:>10,.0f} {build_seconds * 1000:>10,.0f} {risk_seconds * 1000:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Churn report query time: summary tables versus aggregating on the fly.
+
+Inserts synthetic clients, each with churn factors and recommendations, into
+the database at SUPABASE_DB_URL (migrations 0006 applied) and, for each
+report, reports the median time of
+
+* on the fly - the GROUP BY over clients, factors or recommendations the
+  report would need without summary tables
+* summary    - the query `PostgresReportRepository` runs against the
+  trigger-maintained summary tables
+
+It also prints the time the bulk inserts took, summary triggers included.
+Everything runs inside a transaction that is rolled back at the end, so the
+database is left unchanged.
+
+Usage:
+    SUPABASE_DB_URL=postgresql://... python benchmarks/bench_reports.py --clients 1000 10000 100000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import asyncpg
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from application.services.report_service import TREND_MONTHS
+from infrastructure.repositories.postgres import report_repository
+
+INSERT_CLIENTS = """
+INSERT INTO clients (name, segment, since, churn_risk, contacts, created_at)
+SELECT 'Client ' || g, (ARRAY['Premium', 'Standard', 'Basic', 'Enterprise'])[1 + g % 4], '2020',
+       (g * 37 % 100)::text, '{"primary": "+216 20000000"}'::jsonb,
+       NOW() - (g % 730) * interval '1 day'
+FROM generate_series(1, $1) g
+RETURNING id
+"""
+INSERT_FACTORS = """
+INSERT INTO factors (clientId, name, percentage)
+SELECT id, (ARRAY['Technical issues', 'Price increase', 'Low usage', 'Competitor offer'])[1 + n], 10 + (n * 13) % 40
+FROM unnest($1::uuid[]) id, generate_series(0, 3) n
+"""
+INSERT_RECOMMENDATIONS = """
+INSERT INTO recommendations (clientId, title, impact, details)
+SELECT id, (ARRAY['Technical fix', 'Loyalty offer', 'Upgrade'])[1 + n], -5 - n * 10, 'Synthetic'
+FROM unnest($1::uuid[]) id, generate_series(0, 2) n
+"""
+
+# Report queries without summary tables
+ON_THE_FLY = {
+    "churn-trends": ("""
+        SELECT * FROM (
+            SELECT date_trunc('month', created_at AT TIME ZONE 'UTC')::date AS month, count(*),
+                   sum(churn_risk_value(churn_risk)), count(churn_risk_value(churn_risk))
+            FROM clients WHERE created_at IS NOT NULL
+            GROUP BY 1 ORDER BY 1 DESC LIMIT $1
+        ) recent ORDER BY month""", (TREND_MONTHS,)),
+    "churn-by-segment": ("""
+        SELECT segment, count(*), sum(churn_risk_value(churn_risk)), count(churn_risk_value(churn_risk))
+        FROM clients GROUP BY segment""", ()),
+    "churn-factors": ("SELECT name, count(*), sum(percentage) FROM factors GROUP BY name", ()),
+    "retention-actions": ("SELECT title, count(*), sum(impact) FROM recommendations GROUP BY title", ()),
+}
+SUMMARY = {
+    "churn-trends": (report_repository.SELECT_CLIENT_MONTHS, (TREND_MONTHS,)),
+    "churn-by-segment": (report_repository.SELECT_CLIENT_SEGMENTS, ()),
+    "churn-factors": (report_repository.SELECT_FACTOR_TOTALS, ()),
+    "retention-actions": (report_repository.SELECT_RECOMMENDATION_TOTALS, ()),
+}
+
+
+async def measure(conn: asyncpg.Connection, sql: str, args: tuple, requests: int) -> float:
+    """Median seconds per query"""
+    await conn.fetch(sql, *args)
+    timings = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        await conn.fetch(sql, *args)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    conn = await asyncpg.connect(os.environ["SUPABASE_DB_URL"])
+    try:
+        print(f"{'clients':>8} {'report':<18} {'on the fly ms':>14} {'summary ms':>11} {'speedup':>8}")
+        for count in args.clients:
+            transaction = conn.transaction()
+            await transaction.start()
+            try:
+                started = time.perf_counter()
+                client_ids = [record["id"] for record in await conn.fetch(INSERT_CLIENTS, count)]
+                await conn.execute(INSERT_FACTORS, client_ids)
+                await conn.execute(INSERT_RECOMMENDATIONS, client_ids)
+                inserted = time.perf_counter() - started
+                for report in SUMMARY:
+                    before = await measure(conn, *ON_THE_FLY[report], args.requests)
+                    after = await measure(conn, *SUMMARY[report], args.requests)
+                    print(f"{count:>8} {report:<18} {before * 1000:>14,.2f} {after * 1000:>11,.2f} {before / after:>7.1f}x")
+                print(f"{count:>8} {'(bulk insert)':<18} {inserted * 1000:>14,.0f} ms for {count * 8:,} rows")
+            finally:
+                await transaction.rollback()
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,149 @@
+"""SMTP sending throughput: one connection per message versus a connection pool.
+
+Starts a local SMTP stand-in server on a free port and sends the same batch of
+notification emails to it three ways, reporting messages per second:
+
+* per message  - the previous `EmailService.send_email` path: connect, log
+  in, send and quit for every message, one message after another
+* pool (1)     - `SmtpConnectionPool` (`infrastructure/services/smtp_pool.py`)
+  with a single connection, messages sent one after another as
+  `send_emails` does
+* pool (N)     - the pool with N connections and N messages in flight
+
+The stand-in speaks just enough SMTP for smtplib (EHLO, AUTH, MAIL, RCPT,
+DATA, RSET, NOOP, QUIT) and discards what it receives. It has no TLS, so
+STARTTLS is emulated: every new connection waits `--handshake-ms` before the
+greeting, standing in for the TLS handshake, and every reply waits
+`--rtt-ms`, standing in for the network round trip to a real server.
+
+Usage:
+    python benchmarks/bench_smtp_pool.py --messages 500 --rtt-ms 5 --handshake-ms 20 --pool-size 4
+"""
+import argparse
+import asyncio
+import os
+import smtplib
+import socketserver
+import sys
+import threading
+import time
+from email.mime.text import MIMEText
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infrastructure.services.smtp_pool import SmtpConnectionPool
+
+USERNAME = "bench"
+PASSWORD = "secret"
+FROM_EMAIL = "support@example.com"
+
+
+class StandInServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, rtt: float, handshake: float):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.rtt = rtt
+        self.handshake = handshake
+        self.connections = 0
+        self.messages = 0
+        self.lock = threading.Lock()
+
+
+class StandInHandler(socketserver.StreamRequestHandler):
+    def reply(self, text: str) -> None:
+        time.sleep(self.server.rtt)
+        self.wfile.write(text.encode("ascii") + b"\r\n")
+        self.wfile.flush()
+
+    def handle(self) -> None:
+        with self.server.lock:
+            self.server.connections += 1
+        time.sleep(self.server.handshake)
+        self.reply("220 stand-in ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("ascii", "replace").strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                self.reply("250-stand-in\r\n250-AUTH PLAIN LOGIN\r\n250 8BITMIME")
+            elif command.startswith("AUTH"):
+                self.reply("235 2.7.0 Authentication successful")
+            elif command.startswith(("MAIL", "RCPT", "RSET", "NOOP")):
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b".\n", b""):
+                    pass
+                with self.server.lock:
+                    self.server.messages += 1
+                self.reply("250 OK queued")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+def notification(index: int) -> MIMEText:
+    message = MIMEText(f"Dear Customer {index},\n\nWe wanted to inform you about the following issue: Slow connection\n")
+    message["From"] = FROM_EMAIL
+    message["To"] = f"customer{index}@example.com"
+    message["Subject"] = "Issue Notification: Slow connection"
+    return message
+
+
+def send_per_message(port: int, messages: list) -> None:
+    for message in messages:
+        server = smtplib.SMTP("127.0.0.1", port)
+        server.login(USERNAME, PASSWORD)
+        server.sendmail(FROM_EMAIL, message["To"], message.as_string())
+        server.quit()
+
+
+async def send_pooled(port: int, messages: list, pool_size: int, concurrent: bool) -> int:
+    """Send through a fresh pool; returns the number of connections it opened"""
+    pool = SmtpConnectionPool("127.0.0.1", port, USERNAME, PASSWORD, starttls=False, max_connections=pool_size)
+    try:
+        if concurrent:
+            await asyncio.gather(*(pool.send_message(message) for message in messages))
+        else:
+            for message in messages:
+                await pool.send_message(message)
+        return pool.connections_opened
+    finally:
+        pool.close()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--rtt-ms", type=float, default=5.0)
+    parser.add_argument("--handshake-ms", type=float, default=20.0)
+    parser.add_argument("--pool-size", type=int, default=4)
+    args = parser.parse_args()
+
+    server = StandInServer(args.rtt_ms / 1000, args.handshake_ms / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    messages = [notification(i) for i in range(args.messages)]
+
+    print(f"{args.messages} messages, {args.rtt_ms:g} ms round trip, {args.handshake_ms:g} ms handshake")
+    print(f"{'mode':<14} {'seconds':>8} {'msg/s':>8} {'connections':>12} {'speedup':>8}")
+    started = time.perf_counter()
+    await asyncio.to_thread(send_per_message, port, messages)
+    baseline = time.perf_counter() - started
+    print(f"{'per message':<14} {baseline:>8.2f} {args.messages / baseline:>8.1f} {args.messages:>12} {1:>7.1f}x")
+    for pool_size, concurrent in ((1, False), (args.pool_size, True)):
+        started = time.perf_counter()
+        connections = await send_pooled(port, messages, pool_size, concurrent)
+        elapsed = time.perf_counter() - started
+        mode = f"pool ({pool_size})"
+        print(f"{mode:<14} {elapsed:>8.2f} {args.messages / elapsed:>8.1f} {connections:>12} {baseline / elapsed:>7.1f}x")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
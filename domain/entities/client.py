@@ -2,15 +2,16 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from uuid import UUID
+from domain.entities.hydration import compile_hydrator, nested, number, timestamp, value
 
-@dataclass
+@dataclass(slots=True)
 class Contact:
     primary: str
     secondary: Optional[str] = None
     preferred_time: Optional[str] = None
     last_call: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Client:
     id: str
     name: str
@@ -26,27 +27,7 @@ class Client:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Client':
-        contacts_data = data.get('contacts', {})
-        contacts = Contact(
-            primary=contacts_data.get('primary', ''),
-            secondary=contacts_data.get('secondary'),
-            preferred_time=contacts_data.get('preferred_time'),
-            last_call=contacts_data.get('last_call')
-        )
-        
-        return cls(
-            id=data.get('id', ''),
-            name=data.get('name', ''),
-            segment=data.get('segment', ''),
-            since=data.get('since', ''),
-            churn_risk=data.get('churn_risk', ''),  # Use snake_case
-            contacts=contacts,
-            monthly_revenue=float(data.get('monthly_revenue')) if data.get('monthly_revenue') is not None else None,
-            churn_trend=data.get('churn_trend'),
-            churn_trend_days=data.get('churn_trend_days'),
-            created_at=datetime.fromisoformat(data.get('created_at')) if data.get('created_at') else datetime.now(),
-            updated_at=datetime.fromisoformat(data.get('updated_at')) if data.get('updated_at') else None
-        )
+        return _hydrate_client(data)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -67,3 +48,24 @@ class Client:
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+
+_hydrate_contact = compile_hydrator(Contact, {
+    'primary': value('primary', ''),
+    'secondary': value('secondary'),
+    'preferred_time': value('preferred_time'),
+    'last_call': value('last_call')
+})
+
+_hydrate_client = compile_hydrator(Client, {
+    'id': value('id', ''),
+    'name': value('name', ''),
+    'segment': value('segment', ''),
+    'since': value('since', ''),
+    'churn_risk': value('churn_risk', ''),  # Use snake_case
+    'contacts': nested(_hydrate_contact, 'contacts', {}),
+    'monthly_revenue': number('monthly_revenue'),
+    'churn_trend': value('churn_trend'),
+    'churn_trend_days': value('churn_trend_days'),
+    'created_at': timestamp('created_at', default_factory=datetime.now),
+    'updated_at': timestamp('updated_at')
+})
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict, Any
 from enum import Enum
-from decimal import Decimal
+from domain.entities.hydration import choice, compile_hydrator, number, timestamp, value, TRUTHY
 
 class IncidentType(str, Enum):
     INTERNET_PROBLEM = "internet_problem"
@@ -12,17 +12,30 @@ class IncidentType(str, Enum):
     DISCONNECTION = "disconnection"
     OTHER_INCIDENT = "other_incident"
 
-@dataclass
+# Average risk thresholds, mirrored by the generated risk_level column
+HIGH_RISK_THRESHOLD = 60
+MEDIUM_RISK_THRESHOLD = 30
+
+def risk_level_for(average_risk: float) -> str:
+    """Risk level for an average risk percentage"""
+    if average_risk >= HIGH_RISK_THRESHOLD:
+        return "High"
+    elif average_risk >= MEDIUM_RISK_THRESHOLD:
+        return "Medium"
+    else:
+        return "Low"
+
+@dataclass(slots=True)
 class CustomerIncidentPrediction:
     id: Optional[int] = None
     customer_id: str = ""
     client_region: str = ""
     client_type: str = ""
-    client_category: Optional[Decimal] = None
-    q1_prediction: Decimal = Decimal('0.0')
-    q2_prediction: Decimal = Decimal('0.0')
-    q3_prediction: Decimal = Decimal('0.0')
-    q4_prediction: Decimal = Decimal('0.0')
+    client_category: Optional[float] = None
+    q1_prediction: float = 0.0
+    q2_prediction: float = 0.0
+    q3_prediction: float = 0.0
+    q4_prediction: float = 0.0
     most_likely_incident: IncidentType = IncidentType.OTHER_INCIDENT
     recommendation: str = ""
     created_at: Optional[datetime] = None
@@ -30,21 +43,7 @@ class CustomerIncidentPrediction:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'CustomerIncidentPrediction':
-        return cls(
-            id=data.get('id'),
-            customer_id=data.get('customer_id', ''),
-            client_region=data.get('client_region', ''),
-            client_type=data.get('client_type', ''),
-            client_category=Decimal(str(data.get('client_category'))) if data.get('client_category') is not None else None,
-            q1_prediction=Decimal(str(data.get('q1_prediction', '0.0'))),
-            q2_prediction=Decimal(str(data.get('q2_prediction', '0.0'))),
-            q3_prediction=Decimal(str(data.get('q3_prediction', '0.0'))),
-            q4_prediction=Decimal(str(data.get('q4_prediction', '0.0'))),
-            most_likely_incident=IncidentType(data.get('most_likely_incident', 'other_incident')),
-            recommendation=data.get('recommendation', ''),
-            created_at=datetime.fromisoformat(data.get('created_at').replace('Z', '+00:00')) if data.get('created_at') else None,
-            updated_at=datetime.fromisoformat(data.get('updated_at').replace('Z', '+00:00')) if data.get('updated_at') else None
-        )
+        return _hydrate_prediction(data)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -52,11 +51,11 @@ class CustomerIncidentPrediction:
             'customer_id': self.customer_id,
             'client_region': self.client_region,
             'client_type': self.client_type,
-            'client_category': float(self.client_category) if self.client_category is not None else None,
-            'q1_prediction': float(self.q1_prediction),
-            'q2_prediction': float(self.q2_prediction),
-            'q3_prediction': float(self.q3_prediction),
-            'q4_prediction': float(self.q4_prediction),
+            'client_category': self.client_category,
+            'q1_prediction': self.q1_prediction,
+            'q2_prediction': self.q2_prediction,
+            'q3_prediction': self.q3_prediction,
+            'q4_prediction': self.q4_prediction,
             'most_likely_incident': self.most_likely_incident.value,
             'recommendation': self.recommendation,
             'created_at': self.created_at.isoformat() if self.created_at else None,
@@ -65,14 +64,24 @@ class CustomerIncidentPrediction:
     
     def get_average_risk_percentage(self) -> float:
         """Calculate average risk percentage across all quarters"""
-        return float((self.q1_prediction + self.q2_prediction + self.q3_prediction + self.q4_prediction) / 4)
+        return (self.q1_prediction + self.q2_prediction + self.q3_prediction + self.q4_prediction) / 4
     
     def get_risk_level(self) -> str:
         """Get risk level based on average risk percentage"""
-        avg_risk = self.get_average_risk_percentage()
-        if avg_risk >= 60:
-            return "High"
-        elif avg_risk >= 30:
-            return "Medium"
-        else:
-            return "Low" 
\ No newline at end of file
+        return risk_level_for(self.get_average_risk_percentage())
+
+_hydrate_prediction = compile_hydrator(CustomerIncidentPrediction, {
+    'id': value('id'),
+    'customer_id': value('customer_id', ''),
+    'client_region': value('client_region', ''),
+    'client_type': value('client_type', ''),
+    'client_category': number('client_category'),
+    'q1_prediction': number('q1_prediction', 0.0, when=TRUTHY),
+    'q2_prediction': number('q2_prediction', 0.0, when=TRUTHY),
+    'q3_prediction': number('q3_prediction', 0.0, when=TRUTHY),
+    'q4_prediction': number('q4_prediction', 0.0, when=TRUTHY),
+    'most_likely_incident': choice(IncidentType, 'most_likely_incident', 'other_incident'),
+    'recommendation': value('recommendation', ''),
+    'created_at': timestamp('created_at'),
+    'updated_at': timestamp('updated_at')
+})
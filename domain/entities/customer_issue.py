@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict, Any
+from domain.entities.hydration import compile_hydrator, number, value
 
-@dataclass
+@dataclass(slots=True)
 class CustomerIssue:
     customer_id: Optional[float] = None
     code_contrat: Optional[float] = None
@@ -15,16 +16,7 @@ class CustomerIssue:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'CustomerIssue':
-        return cls(
-            customer_id=float(data.get('customer_id')) if data.get('customer_id') is not None else None,
-            code_contrat=float(data.get('code_contrat')) if data.get('code_contrat') is not None else None,
-            client_type=float(data.get('client_type')) if data.get('client_type') is not None else None,
-            client_region=float(data.get('client_region')) if data.get('client_region') is not None else None,
-            client_categorie=float(data.get('client_categorie')) if data.get('client_categorie') is not None else None,
-            incident_title=data.get('incident_title'),
-            churn_risk=float(data.get('churn_risk')) if data.get('churn_risk') is not None else None,
-            status=data.get('status', 'not sent')
-        )
+        return _hydrate_customer_issue(data)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -36,4 +28,15 @@ class CustomerIssue:
             'incident_title': self.incident_title,
             'churn_risk': self.churn_risk,
             'status': self.status
-        } 
\ No newline at end of file
+        } 
+
+_hydrate_customer_issue = compile_hydrator(CustomerIssue, {
+    'customer_id': number('customer_id'),
+    'code_contrat': number('code_contrat'),
+    'client_type': number('client_type'),
+    'client_region': number('client_region'),
+    'client_categorie': number('client_categorie'),
+    'incident_title': value('incident_title'),
+    'churn_risk': number('churn_risk'),
+    'status': value('status', 'not sent')
+})
@@ -2,6 +2,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict, Any
 from enum import Enum
+from domain.entities.hydration import choice, compile_hydrator, timestamp, value
 
 class NotificationStatus(str, Enum):
     PENDING = "pending"
@@ -9,7 +10,7 @@ class NotificationStatus(str, Enum):
     SENT = "sent"
     FAILED = "failed"
 
-@dataclass
+@dataclass(slots=True)
 class EmailNotification:
     id: Optional[int] = None
     email: str = ""
@@ -22,16 +23,7 @@ class EmailNotification:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'EmailNotification':
-        return cls(
-            id=data.get('id'),
-            email=data.get('email', ''),
-            name=data.get('name', ''),
-            issue=data.get('issue', ''),
-            status=NotificationStatus(data.get('status', 'pending')),
-            created_at=datetime.fromisoformat(data.get('created_at').replace('Z', '+00:00')) if data.get('created_at') else None,
-            updated_at=datetime.fromisoformat(data.get('updated_at').replace('Z', '+00:00')) if data.get('updated_at') else None,
-            sent_at=datetime.fromisoformat(data.get('sent_at').replace('Z', '+00:00')) if data.get('sent_at') else None
-        )
+        return _hydrate_email_notification(data)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -43,4 +35,15 @@ class EmailNotification:
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
             'sent_at': self.sent_at.isoformat() if self.sent_at else None
-        } 
\ No newline at end of file
+        } 
+
+_hydrate_email_notification = compile_hydrator(EmailNotification, {
+    'id': value('id'),
+    'email': value('email', ''),
+    'name': value('name', ''),
+    'issue': value('issue', ''),
+    'status': choice(NotificationStatus, 'status', 'pending'),
+    'created_at': timestamp('created_at'),
+    'updated_at': timestamp('updated_at'),
+    'sent_at': timestamp('sent_at')
+})
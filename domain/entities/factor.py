@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from datetime import datetime
+from domain.entities.hydration import compile_hydrator, timestamp, value
 
-@dataclass
+@dataclass(slots=True)
 class Factor:
     id: str
     client_id: str
@@ -12,13 +13,7 @@ class Factor:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Factor':
-        return cls(
-            id=data.get('id', ''),
-            client_id=data.get('clientId', ''),
-            name=data.get('name', ''),
-            percentage=data.get('percentage', 0),
-            created_at=datetime.fromisoformat(data.get('created_at')) if data.get('created_at') else datetime.now()
-        )
+        return _hydrate_factor(data)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -28,3 +23,11 @@ class Factor:
             'percentage': self.percentage,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
+
+_hydrate_factor = compile_hydrator(Factor, {
+    'id': value('id', ''),
+    'client_id': value('clientId', ''),
+    'name': value('name', ''),
+    'percentage': value('percentage', 0),
+    'created_at': timestamp('created_at', default_factory=datetime.now)
+})
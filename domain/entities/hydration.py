@@ -0,0 +1,137 @@
+# Compiled hydration of entities from row dictionaries
+#
+# Entities are built from PostgREST rows (and Postgres records converted to
+# the same shape) on every list response. compile_hydrator() takes a
+# declarative description of how each field is read from a row and generates
+# a dedicated function for it, the way dataclasses generates __init__: each
+# key is looked up once with a bound `data.get`, enum members come from a
+# value -> member dict instead of the Enum constructor, timestamps are looked
+# up in a memo before being parsed, and the entity is built with a single
+# positional constructor call.
+#
+# The timestamp memo is a plain dict cleared when it reaches
+# TIMESTAMP_MEMO_SIZE entries. Rows written together share their created_at
+# and updated_at values, so bulk results parse far fewer distinct strings
+# than they hold.
+from dataclasses import dataclass, fields as dataclass_fields
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Mapping, Optional, Type, TypeVar, Union
+
+T = TypeVar("T")
+
+TIMESTAMP_MEMO_SIZE = 4096
+
+# Fields are converted only when the raw value passes this check
+ALWAYS = "always"
+PRESENT = "present"  # value is not None
+TRUTHY = "truthy"
+
+_timestamps: Dict[str, datetime] = {}
+
+
+def parse_timestamp(value: Union[str, datetime]) -> datetime:
+    """Parse an ISO 8601 timestamp, memoizing recent values; datetimes pass through"""
+    if isinstance(value, datetime):
+        return value
+    parsed = _timestamps.get(value)
+    if parsed is None:
+        if len(_timestamps) >= TIMESTAMP_MEMO_SIZE:
+            _timestamps.clear()
+        parsed = _timestamps[value] = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    key: str
+    default: Any = None
+    convert: Optional[Callable[[Any], Any]] = None
+    when: str = ALWAYS
+    default_factory: Optional[Callable[[], Any]] = None
+
+
+def value(key: str, default: Any = None, default_factory: Optional[Callable[[], Any]] = None) -> FieldSpec:
+    """The raw value, or `default` (a fresh `default_factory()`) when the key is missing"""
+    return FieldSpec(key, default, default_factory=default_factory)
+
+
+def number(key: str, default: Any = None, convert: Callable[[Any], Any] = float, when: str = PRESENT) -> FieldSpec:
+    """A numeric value converted with `convert`; `default` when the value fails `when`"""
+    return FieldSpec(key, default, convert, when)
+
+
+def timestamp(key: str, default_factory: Optional[Callable[[], Any]] = None) -> FieldSpec:
+    """A timestamp; blank values become None, or `default_factory()`"""
+    return FieldSpec(key, None, parse_timestamp, TRUTHY, default_factory)
+
+
+def choice(enum: Type[Enum], key: str, default: Any) -> FieldSpec:
+    """An enum member looked up from the value, or from `default` when the key is missing"""
+    return FieldSpec(key, default, enum)
+
+
+def nested(hydrate: Callable[[Any], Any], key: str, default: Any = None) -> FieldSpec:
+    """A nested value object built by another hydrator"""
+    return FieldSpec(key, default, hydrate)
+
+
+_MISSING = object()
+
+
+def compile_hydrator(cls: Type[T], specs: Dict[str, FieldSpec]) -> Callable[[Mapping[str, Any]], T]:
+    """Generate a function building the dataclass `cls` from a row
+
+    `specs` describes every constructor argument; fields left out keep their
+    dataclass defaults, and are passed by keyword after the others.
+    """
+    namespace: Dict[str, Any] = {
+        "cls": cls, "MISSING": _MISSING,
+        "timestamps_get": _timestamps.get, "parse_timestamp": parse_timestamp
+    }
+    lines = ["def hydrate(data):", "    get = data.get"]
+    order = [field.name for field in dataclass_fields(cls) if field.init]
+    names = [name for name in order if name in specs]
+    if sorted(names) != sorted(specs):
+        raise ValueError(f"{cls.__name__} has no fields {sorted(set(specs) - set(order))}")
+    positional = names == order[:len(names)]
+    for index, name in enumerate(names):
+        spec = specs[name]
+        variable, convert, default, factory = f"v{index}", f"convert{index}", f"default{index}", f"factory{index}"
+        namespace[convert], namespace[default], namespace[factory] = spec.convert, spec.default, spec.default_factory
+        fallback = f"{factory}()" if spec.default_factory else default
+        if spec.convert is None:
+            if spec.default_factory:
+                lines.append(f"    {variable} = get({spec.key!r}, MISSING)")
+                lines.append(f"    if {variable} is MISSING: {variable} = {fallback}")
+            else:
+                lines.append(f"    {variable} = get({spec.key!r}, {default})")
+            continue
+        if isinstance(spec.convert, type) and issubclass(spec.convert, Enum):
+            # The Enum constructor is slow; it is only called for values that
+            # are not members, to raise its usual ValueError
+            members = f"members{index}"
+            namespace[members] = {member.value: member for member in spec.convert}
+            lines.append(f"    {variable} = get({spec.key!r}, {default})")
+            lines.append(f"    {variable} = {members}.get({variable}) or {convert}({variable})")
+            continue
+        if spec.convert is parse_timestamp:
+            converted = f"(timestamps_get({variable}) or parse_timestamp({variable}))"
+        else:
+            converted = f"{convert}({variable})"
+        if spec.when == ALWAYS:
+            lines.append(f"    {variable} = get({spec.key!r}, {default})")
+            lines.append(f"    {variable} = {converted}")
+        else:
+            check = f"{variable} is not None" if spec.when == PRESENT else variable
+            lines.append(f"    {variable} = get({spec.key!r})")
+            lines.append(f"    {variable} = {converted} if {check} else {fallback}")
+    if positional:
+        arguments = [f"v{index}" for index in range(len(names))]
+    else:
+        arguments = [f"{name}=v{index}" for index, name in enumerate(names)]
+    lines.append(f"    return cls({', '.join(arguments)})")
+    exec("\n".join(lines), namespace)
+    hydrate = namespace["hydrate"]
+    hydrate.__qualname__ = f"{cls.__qualname__}.hydrate"
+    return hydrate
@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+from enum import Enum
+
+class ImportJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+@dataclass
+class ImportJob:
+    id: str
+    kind: str
+    filename: str
+    owner_id: Optional[str] = None
+    status: ImportJobStatus = ImportJobStatus.QUEUED
+    total_bytes: int = 0
+    processed_bytes: int = 0
+    total_rows: int = 0
+    created_count: int = 0
+    failed_count: int = 0
+    error_count: int = 0
+    errors: List[str] = field(default_factory=list)
+    message: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (ImportJobStatus.COMPLETED, ImportJobStatus.FAILED)
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the uploaded file processed so far, from 0 to 1"""
+        if self.status == ImportJobStatus.COMPLETED:
+            return 1.0
+        if not self.total_bytes:
+            return 0.0
+        return min(self.processed_bytes / self.total_bytes, 1.0)
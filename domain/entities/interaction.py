@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from datetime import datetime
+from domain.entities.hydration import compile_hydrator, timestamp, value
 
-@dataclass
+@dataclass(slots=True)
 class Interaction:
     id: str
     client_id: str
@@ -13,14 +14,7 @@ class Interaction:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Interaction':
-        return cls(
-            id=data.get('id', ''),
-            client_id=data.get('clientId', ''),
-            type=data.get('type', ''),
-            date=data.get('date', ''),
-            details=data.get('details', ''),
-            created_at=datetime.fromisoformat(data.get('created_at')) if data.get('created_at') else datetime.now()
-        )
+        return _hydrate_interaction(data)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -31,3 +25,12 @@ class Interaction:
             'details': self.details,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
+
+_hydrate_interaction = compile_hydrator(Interaction, {
+    'id': value('id', ''),
+    'client_id': value('clientId', ''),
+    'type': value('type', ''),
+    'date': value('date', ''),
+    'details': value('details', ''),
+    'created_at': timestamp('created_at', default_factory=datetime.now)
+})
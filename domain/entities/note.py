@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from domain.entities.hydration import compile_hydrator, timestamp, value
 
-@dataclass
+@dataclass(slots=True)
 class Note:
     id: str
     title: str
@@ -14,15 +15,7 @@ class Note:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Note':
-        return cls(
-            id=data.get('id', ''),
-            title=data.get('title', ''),
-            description=data.get('description', ''),
-            sender_id=data.get('sender_id', ''),
-            recipients=data.get('recipients', []),
-            is_read=data.get('is_read', False),
-            timestamp=datetime.fromisoformat(data.get('timestamp')) if data.get('timestamp') else datetime.now()
-        )
+        return _hydrate_note(data)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -33,4 +26,14 @@ class Note:
             'recipients': self.recipients,
             'is_read': self.is_read,
             'timestamp': self.timestamp.isoformat() if self.timestamp else None
-        } 
\ No newline at end of file
+        } 
+
+_hydrate_note = compile_hydrator(Note, {
+    'id': value('id', ''),
+    'title': value('title', ''),
+    'description': value('description', ''),
+    'sender_id': value('sender_id', ''),
+    'recipients': value('recipients', default_factory=list),
+    'is_read': value('is_read', False),
+    'timestamp': timestamp('timestamp', default_factory=datetime.now)
+})
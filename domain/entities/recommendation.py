@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from datetime import datetime
+from domain.entities.hydration import compile_hydrator, timestamp, value
 
-@dataclass
+@dataclass(slots=True)
 class Recommendation:
     id: str
     client_id: str
@@ -13,14 +14,7 @@ class Recommendation:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Recommendation':
-        return cls(
-            id=data.get('id', ''),
-            client_id=data.get('clientId', ''),
-            title=data.get('title', ''),
-            impact=data.get('impact', 0),
-            details=data.get('details', ''),
-            created_at=datetime.fromisoformat(data.get('created_at')) if data.get('created_at') else datetime.now()
-        )
+        return _hydrate_recommendation(data)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -31,3 +25,12 @@ class Recommendation:
             'details': self.details,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
+
+_hydrate_recommendation = compile_hydrator(Recommendation, {
+    'id': value('id', ''),
+    'client_id': value('clientId', ''),
+    'title': value('title', ''),
+    'impact': value('impact', 0),
+    'details': value('details', ''),
+    'created_at': timestamp('created_at', default_factory=datetime.now)
+})
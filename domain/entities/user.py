@@ -2,13 +2,14 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
+from domain.entities.hydration import choice, compile_hydrator, timestamp, value
 
 class UserRole(str, Enum):
     ADMIN = "admin"
     MARKETING_AGENT = "marketing_agent"
     TECHNICAL_AGENT = "technical_agent"
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: str
     email: str
@@ -22,17 +23,7 @@ class User:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'User':
-        return cls(
-            id=data.get('id', ''),
-            email=data.get('email', ''),
-            full_name=data.get('full_name', ''),
-            role=UserRole(data.get('role', 'admin')),
-            password=data.get('password', ''),
-            cin=data.get('cin', ''),
-            code=data.get('code', ''),
-            created_at=datetime.fromisoformat(data.get('created_at')) if data.get('created_at') else datetime.now(),
-            updated_at=datetime.fromisoformat(data.get('updated_at')) if data.get('updated_at') else None
-        )
+        return _hydrate_user(data)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -46,3 +37,15 @@ class User:
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+
+_hydrate_user = compile_hydrator(User, {
+    'id': value('id', ''),
+    'email': value('email', ''),
+    'full_name': value('full_name', ''),
+    'role': choice(UserRole, 'role', 'admin'),
+    'password': value('password', ''),
+    'cin': value('cin', ''),
+    'code': value('code', ''),
+    'created_at': timestamp('created_at', default_factory=datetime.now),
+    'updated_at': timestamp('updated_at')
+})
@@ -1,24 +1,45 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from domain.entities.client import Client
+from domain.value_objects.client_detail import ClientDetail
+from domain.value_objects.page import Page, PageRequest
 
 class ClientRepositoryInterface(ABC):
     @abstractmethod
     async def get_all(self) -> List[Client]:
         pass
     
+    @abstractmethod
+    async def get_page(self, page_request: PageRequest) -> Page[Client]:
+        """Return one keyset page, ordered and filtered in the database"""
+        pass
+    
     @abstractmethod
     async def get_by_id(self, client_id: str) -> Optional[Client]:
         pass
     
+    @abstractmethod
+    async def get_details_by_ids(self, client_ids: List[str]) -> List[ClientDetail]:
+        """Return clients with their interactions, recommendations and factors
+
+        Child rows are loaded together with the clients rather than with one
+        query per collection. Unknown ids are skipped; order follows client_ids.
+        """
+        pass
+    
     @abstractmethod
     async def create(self, client: Client) -> Client:
         pass
     
     @abstractmethod
-    async def update(self, client: Client) -> Client:
+    async def update(self, client_id: str, client: Client) -> Client:
         pass
     
     @abstractmethod
     async def delete(self, client_id: str) -> bool:
+        """Delete a client; False if it does not exist or still has child rows
+
+        Interactions, recommendations and factors are not deleted along with
+        their client, so they have to be removed first.
+        """
         pass
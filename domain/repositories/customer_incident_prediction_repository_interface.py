@@ -1,11 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Set
 from datetime import datetime
 from domain.entities.customer_incident_prediction import CustomerIncidentPrediction, IncidentType
+from domain.value_objects.batch_write_result import BatchWriteResult
+from domain.value_objects.page import Page, PageRequest
+from domain.value_objects.prediction_collection import PredictionCollection
 
 class CustomerIncidentPredictionRepositoryInterface(ABC):
     @abstractmethod
-    async def get_all(self) -> List[CustomerIncidentPrediction]:
+    async def get_all(self) -> PredictionCollection:
+        pass
+    
+    @abstractmethod
+    async def get_page(self, page_request: PageRequest) -> Page[CustomerIncidentPrediction]:
+        """Return one keyset page, ordered and filtered in the database"""
         pass
     
     @abstractmethod
@@ -17,15 +25,24 @@ class CustomerIncidentPredictionRepositoryInterface(ABC):
         pass
     
     @abstractmethod
-    async def get_by_region(self, client_region: str) -> List[CustomerIncidentPrediction]:
+    async def get_existing_customer_ids(self, customer_ids: List[str]) -> Set[str]:
+        """Return the subset of customer_ids that already have a prediction"""
+        pass
+    
+    @abstractmethod
+    async def get_all_customer_ids(self) -> Set[str]:
+        pass
+    
+    @abstractmethod
+    async def get_by_region(self, client_region: str) -> PredictionCollection:
         pass
     
     @abstractmethod
-    async def get_by_incident_type(self, incident_type: IncidentType) -> List[CustomerIncidentPrediction]:
+    async def get_by_incident_type(self, incident_type: IncidentType) -> PredictionCollection:
         pass
     
     @abstractmethod
-    async def get_by_risk_level(self, min_avg_risk: float) -> List[CustomerIncidentPrediction]:
+    async def get_by_risk_level(self, min_avg_risk: float) -> PredictionCollection:
         pass
     
     @abstractmethod
@@ -33,7 +50,8 @@ class CustomerIncidentPredictionRepositoryInterface(ABC):
         pass
     
     @abstractmethod
-    async def batch_create(self, predictions: List[CustomerIncidentPrediction]) -> List[CustomerIncidentPrediction]:
+    async def batch_create(self, predictions: List[CustomerIncidentPrediction]) -> BatchWriteResult[CustomerIncidentPrediction]:
+        """Insert in chunks; rows in failed chunks are reported, not raised"""
         pass
     
     @abstractmethod
@@ -1,18 +1,26 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from domain.entities.customer_issue import CustomerIssue
+from domain.value_objects.batch_write_result import BatchWriteResult
+from domain.value_objects.page import Page, PageRequest
 
 class CustomerIssueRepositoryInterface(ABC):
     @abstractmethod
     async def get_all(self) -> List[CustomerIssue]:
         pass
     
+    @abstractmethod
+    async def get_page(self, page_request: PageRequest) -> Page[CustomerIssue]:
+        """Return one keyset page, ordered and filtered in the database"""
+        pass
+    
     @abstractmethod
     async def create(self, customer_issue: CustomerIssue) -> CustomerIssue:
         pass
     
     @abstractmethod
-    async def batch_create(self, customer_issues: List[CustomerIssue]) -> List[CustomerIssue]:
+    async def batch_create(self, customer_issues: List[CustomerIssue]) -> BatchWriteResult[CustomerIssue]:
+        """Insert in chunks; rows in failed chunks are reported, not raised"""
         pass
     
     @abstractmethod
@@ -2,12 +2,19 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from datetime import datetime
 from domain.entities.email_notification import EmailNotification, NotificationStatus
+from domain.value_objects.batch_write_result import BatchWriteResult
+from domain.value_objects.page import Page, PageRequest
 
 class EmailNotificationRepositoryInterface(ABC):
     @abstractmethod
     async def get_all(self) -> List[EmailNotification]:
         pass
     
+    @abstractmethod
+    async def get_page(self, page_request: PageRequest) -> Page[EmailNotification]:
+        """Return one keyset page, ordered and filtered in the database"""
+        pass
+    
     @abstractmethod
     async def get_by_id(self, notification_id: int) -> Optional[EmailNotification]:
         pass
@@ -21,7 +28,8 @@ class EmailNotificationRepositoryInterface(ABC):
         pass
     
     @abstractmethod
-    async def batch_create(self, email_notifications: List[EmailNotification]) -> List[EmailNotification]:
+    async def batch_create(self, email_notifications: List[EmailNotification]) -> BatchWriteResult[EmailNotification]:
+        """Insert in chunks; rows in failed chunks are reported, not raised"""
         pass
     
     @abstractmethod
@@ -32,6 +40,21 @@ class EmailNotificationRepositoryInterface(ABC):
     async def update_status(self, notification_id: int, status: NotificationStatus, sent_at: Optional[datetime] = None) -> bool:
         pass
     
+    @abstractmethod
+    async def claim_for_sending(self, notification_ids: List[int], statuses: List[NotificationStatus],
+                                stale_before: Optional[datetime] = None) -> List[EmailNotification]:
+        """Mark those of the notifications still in one of `statuses` as SENDING in one statement and return them
+
+        With `stale_before`, SENDING notifications last updated before it
+        (claims abandoned by an interrupted send) are claimed as well.
+        """
+        pass
+    
+    @abstractmethod
+    async def update_statuses(self, notification_ids: List[int], status: NotificationStatus, sent_at: Optional[datetime] = None) -> int:
+        """Set the status of many notifications in one statement; returns how many were updated"""
+        pass
+    
     @abstractmethod
     async def delete(self, notification_id: int) -> bool:
         pass 
\ No newline at end of file
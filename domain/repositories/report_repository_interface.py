@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import List
+from domain.value_objects.report_totals import FactorTotals, MonthlyClientTotals, RecommendationTotals, SegmentClientTotals
+
+class ReportRepositoryInterface(ABC):
+    @abstractmethod
+    async def get_monthly_client_totals(self, months: int) -> List[MonthlyClientTotals]:
+        """Totals of the most recent months in which clients were added, oldest first"""
+        pass
+
+    @abstractmethod
+    async def get_segment_client_totals(self) -> List[SegmentClientTotals]:
+        pass
+
+    @abstractmethod
+    async def get_factor_totals(self) -> List[FactorTotals]:
+        pass
+
+    @abstractmethod
+    async def get_recommendation_totals(self) -> List[RecommendationTotals]:
+        pass
@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Sequence
+
+class TableVersionRepositoryInterface(ABC):
+    @abstractmethod
+    async def get_versions(self, tables: Sequence[str]) -> Dict[str, int]:
+        """Change counters of the given tables; tables never written report 0"""
+        pass
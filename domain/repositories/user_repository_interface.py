@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from domain.entities.user import User
+from domain.value_objects.page import Page, PageRequest
 
 class UserRepositoryInterface(ABC):
     @abstractmethod
@@ -23,6 +24,11 @@ class UserRepositoryInterface(ABC):
     async def get_all(self) -> List[User]:
         pass
     
+    @abstractmethod
+    async def get_page(self, page_request: PageRequest) -> Page[User]:
+        """Return one keyset page, ordered and filtered in the database"""
+        pass
+    
     @abstractmethod
     async def create(self, user: User) -> User:
         pass
@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from typing import Generic, List, TypeVar
+
+T = TypeVar("T")
+
+@dataclass
+class FailedChunk:
+    start: int  # index of the first row in the submitted list
+    end: int  # index after the last row
+    error: str
+
+    @property
+    def row_count(self) -> int:
+        return self.end - self.start
+
+@dataclass
+class BatchWriteResult(Generic[T]):
+    created: List[T] = field(default_factory=list)
+    failed_chunks: List[FailedChunk] = field(default_factory=list)
+
+    @property
+    def created_count(self) -> int:
+        return len(self.created)
+
+    @property
+    def failed_count(self) -> int:
+        return sum(chunk.row_count for chunk in self.failed_chunks)
+
+    @property
+    def failed_rows(self) -> List[int]:
+        return [row for chunk in self.failed_chunks for row in range(chunk.start, chunk.end)]
+
+    def failure_messages(self, row_numbers: List[int]) -> List[str]:
+        """Describe failed chunks using the source row number of each submitted row"""
+        messages = []
+        for chunk in self.failed_chunks:
+            first, last = row_numbers[chunk.start], row_numbers[chunk.end - 1]
+            rows = f"Row {first}" if first == last else f"Rows {first}-{last}"
+            messages.append(f"{rows}: {chunk.error}")
+        return messages
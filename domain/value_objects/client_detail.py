@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import List
+from domain.entities.client import Client
+from domain.entities.factor import Factor
+from domain.entities.interaction import Interaction
+from domain.entities.recommendation import Recommendation
+
+@dataclass
+class ClientDetail:
+    """A client with its interactions, recommendations and churn factors"""
+    client: Client
+    interactions: List[Interaction] = field(default_factory=list)
+    recommendations: List[Recommendation] = field(default_factory=list)
+    factors: List[Factor] = field(default_factory=list)
@@ -0,0 +1,93 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+import base64
+import binascii
+import json
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Filter keys are "<column>" for equality or "<column>__<operator>"
+FILTER_OPERATORS = ("eq", "gt", "gte", "lt", "lte", "in")
+
+
+class InvalidPageRequestError(ValueError):
+    """Raised for unknown sort keys or filters and malformed cursors"""
+
+
+@dataclass
+class PageRequest:
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: Optional[str] = None
+    sort_by: Optional[str] = None  # None selects the repository's default sort key
+    descending: bool = True
+    filters: Dict[str, Any] = field(default_factory=dict)
+    columns: Optional[List[str]] = None  # Column projection; None selects every column
+
+    def resolve_sort(self, sort_columns: Sequence[str], default_sort: str) -> str:
+        sort_by = self.sort_by or default_sort
+        if sort_by not in sort_columns:
+            raise InvalidPageRequestError(f"Cannot sort by '{sort_by}'. Valid sort keys: {list(sort_columns)}")
+        return sort_by
+
+    def resolve_filters(self, filter_columns: Sequence[str]) -> List[Tuple[str, str, Any]]:
+        """Return (column, operator, value) triples, rejecting unknown columns"""
+        resolved = []
+        for key, value in self.filters.items():
+            column, _, operator = key.partition("__")
+            operator = operator or "eq"
+            if column not in filter_columns:
+                raise InvalidPageRequestError(f"Cannot filter by '{column}'. Valid filters: {list(filter_columns)}")
+            if operator not in FILTER_OPERATORS:
+                raise InvalidPageRequestError(f"Unknown filter operator '{operator}'")
+            resolved.append((column, operator, value))
+        return resolved
+
+    def resolve_columns(self, selectable_columns: Sequence[str], sort_by: str) -> List[str]:
+        """Columns to select: the projection plus id and the sort column, which the cursor needs
+
+        Without a projection every selectable column is returned.
+        """
+        if self.columns is None:
+            return list(selectable_columns)
+        unknown = [column for column in self.columns if column not in selectable_columns]
+        if unknown:
+            raise InvalidPageRequestError(f"Cannot select {unknown}. Valid columns: {list(selectable_columns)}")
+        return list(dict.fromkeys(["id", sort_by, *self.columns]))
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(sort_by: str, descending: bool, last_value: Any, last_id: Any) -> str:
+    """Encode the keyset position after the last row of a page"""
+    payload = json.dumps([sort_by, descending, last_value, last_id], separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, descending: bool) -> Tuple[Any, Any]:
+    """Decode a cursor into (last sort value, last id) for the given ordering"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort_by, cursor_descending, last_value, last_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError, binascii.Error):
+        raise InvalidPageRequestError("Malformed cursor")
+    if cursor_sort_by != sort_by or cursor_descending != descending:
+        raise InvalidPageRequestError("Cursor does not match the requested sort order")
+    return last_value, last_id
+
+
+def build_page(rows: List[Dict[str, Any]], page_request: PageRequest, sort_by: str, hydrate) -> Page:
+    """Build a page from rows fetched with `limit + 1`, hydrating each row"""
+    has_more = len(rows) > page_request.limit
+    rows = rows[:page_request.limit]
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor(sort_by, page_request.descending, last.get(sort_by), last.get("id"))
+    return Page(items=[hydrate(row) for row in rows], next_cursor=next_cursor)
@@ -0,0 +1,122 @@
+# Column-oriented collection of customer incident predictions
+#
+# Bulk query results are held one column per field instead of one object per
+# row. Quarter predictions and client categories are kept in float arrays
+# (8 bytes a value, NaN for a missing category), and the other fields in
+# plain lists. A CustomerIncidentPrediction is only built when a row is
+# accessed, and aggregates such as the average risk are computed straight
+# from the columns.
+from array import array
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Union
+from domain.entities.customer_incident_prediction import CustomerIncidentPrediction, IncidentType, risk_level_for
+from domain.entities.hydration import parse_timestamp
+import math
+
+_NAN = float("nan")
+
+
+class PredictionCollection(Sequence):
+    __slots__ = ("ids", "customer_ids", "client_regions", "client_types", "client_categories",
+                 "q1_predictions", "q2_predictions", "q3_predictions", "q4_predictions",
+                 "incidents", "recommendations", "created_at", "updated_at")
+
+    def __init__(self):
+        self.ids: List[Optional[int]] = []
+        self.customer_ids: List[str] = []
+        self.client_regions: List[str] = []
+        self.client_types: List[str] = []
+        self.client_categories = array("d")
+        self.q1_predictions = array("d")
+        self.q2_predictions = array("d")
+        self.q3_predictions = array("d")
+        self.q4_predictions = array("d")
+        self.incidents: List[IncidentType] = []
+        self.recommendations: List[str] = []
+        self.created_at: List[Optional[datetime]] = []
+        self.updated_at: List[Optional[datetime]] = []
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> "PredictionCollection":
+        """Build a collection from PostgREST rows or database records
+
+        Values are read as CustomerIncidentPrediction.from_dict reads them;
+        timestamps may be ISO 8601 strings or datetimes.
+        """
+        collection = cls()
+        for row in rows:
+            category, created_at, updated_at = row.get('client_category'), row.get('created_at'), row.get('updated_at')
+            collection.ids.append(row.get('id'))
+            collection.customer_ids.append(row.get('customer_id', ''))
+            collection.client_regions.append(row.get('client_region', ''))
+            collection.client_types.append(row.get('client_type', ''))
+            collection.client_categories.append(_NAN if category is None else float(category))
+            collection.q1_predictions.append(float(row.get('q1_prediction') or 0.0))
+            collection.q2_predictions.append(float(row.get('q2_prediction') or 0.0))
+            collection.q3_predictions.append(float(row.get('q3_prediction') or 0.0))
+            collection.q4_predictions.append(float(row.get('q4_prediction') or 0.0))
+            collection.incidents.append(IncidentType(row.get('most_likely_incident', 'other_incident')))
+            collection.recommendations.append(row.get('recommendation', ''))
+            collection.created_at.append(parse_timestamp(created_at) if created_at else None)
+            collection.updated_at.append(parse_timestamp(updated_at) if updated_at else None)
+        return collection
+
+    @classmethod
+    def from_predictions(cls, predictions: Iterable[CustomerIncidentPrediction]) -> "PredictionCollection":
+        collection = cls()
+        for prediction in predictions:
+            collection.append(prediction)
+        return collection
+
+    def append(self, prediction: CustomerIncidentPrediction) -> None:
+        self.ids.append(prediction.id)
+        self.customer_ids.append(prediction.customer_id)
+        self.client_regions.append(prediction.client_region)
+        self.client_types.append(prediction.client_type)
+        self.client_categories.append(_NAN if prediction.client_category is None else prediction.client_category)
+        self.q1_predictions.append(prediction.q1_prediction)
+        self.q2_predictions.append(prediction.q2_prediction)
+        self.q3_predictions.append(prediction.q3_prediction)
+        self.q4_predictions.append(prediction.q4_prediction)
+        self.incidents.append(prediction.most_likely_incident)
+        self.recommendations.append(prediction.recommendation)
+        self.created_at.append(prediction.created_at)
+        self.updated_at.append(prediction.updated_at)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[CustomerIncidentPrediction, "PredictionCollection"]:
+        if isinstance(index, slice):
+            return PredictionCollection.from_predictions(self[i] for i in range(*index.indices(len(self))))
+        category = self.client_categories[index]
+        return CustomerIncidentPrediction(
+            id=self.ids[index],
+            customer_id=self.customer_ids[index],
+            client_region=self.client_regions[index],
+            client_type=self.client_types[index],
+            client_category=None if math.isnan(category) else category,
+            q1_prediction=self.q1_predictions[index],
+            q2_prediction=self.q2_predictions[index],
+            q3_prediction=self.q3_predictions[index],
+            q4_prediction=self.q4_predictions[index],
+            most_likely_incident=self.incidents[index],
+            recommendation=self.recommendations[index],
+            created_at=self.created_at[index],
+            updated_at=self.updated_at[index]
+        )
+
+    def __iter__(self) -> Iterator[CustomerIncidentPrediction]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def average_risk(self) -> array:
+        """Average of the four quarter predictions for every row"""
+        return array("d", [
+            (q1 + q2 + q3 + q4) / 4
+            for q1, q2, q3, q4 in zip(self.q1_predictions, self.q2_predictions, self.q3_predictions, self.q4_predictions)
+        ])
+
+    def risk_levels(self) -> List[str]:
+        return [risk_level_for(average) for average in self.average_risk()]
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from datetime import date
+
+# Pre-aggregated totals behind the churn reports (migration 0006). Churn risk
+# sums only cover clients whose churn_risk is numeric, counted in risk_count;
+# revenue sums likewise only cover numeric monthly revenues.
+
+@dataclass
+class MonthlyClientTotals:
+    month: date  # first day of the month the clients were added (created_at), UTC
+    client_count: int
+    risk_sum: float
+    risk_count: int
+
+    @property
+    def average_risk(self) -> float:
+        return self.risk_sum / self.risk_count if self.risk_count else 0.0
+
+@dataclass
+class SegmentClientTotals:
+    segment: str
+    client_count: int
+    risk_sum: float
+    risk_count: int
+    revenue_sum: float
+    revenue_count: int
+
+@dataclass
+class FactorTotals:
+    name: str
+    factor_count: int
+    percentage_sum: int
+
+@dataclass
+class RecommendationTotals:
+    title: str
+    recommendation_count: int
+    impact_sum: int  # expected change in churn risk points, negative when it lowers risk
+
+    @property
+    def average_impact(self) -> float:
+        return self.impact_sum / self.recommendation_count if self.recommendation_count else 0.0
@@ -0,0 +1,132 @@
+-- Initial schema: the tables previously created on every startup by db_schema_initializer
+
+-- Create clients table
+CREATE TABLE IF NOT EXISTS clients (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    name text NOT NULL,
+    segment text NOT NULL,
+    since text NOT NULL,
+    churn_risk text NOT NULL,
+    contacts jsonb NOT NULL,
+    monthly_revenue text,
+    churn_trend text,
+    churn_trend_days integer,
+    created_at timestamptz DEFAULT NOW(),
+    updated_at timestamptz
+);
+
+-- Create notes table
+CREATE TABLE IF NOT EXISTS notes (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    title text NOT NULL,
+    description text NOT NULL,
+    sender_id uuid NOT NULL,
+    recipients text[] NOT NULL,
+    is_read boolean DEFAULT FALSE,
+    timestamp timestamptz NOT NULL
+);
+
+-- Create users table
+CREATE TABLE IF NOT EXISTS users (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    email text UNIQUE NOT NULL,
+    full_name text NOT NULL,
+    role text NOT NULL,
+    password text NOT NULL,
+    cin text UNIQUE NOT NULL,
+    code text UNIQUE NOT NULL,
+    created_at timestamptz NOT NULL,
+    updated_at timestamptz
+);
+
+-- Create email_notifications table
+CREATE TABLE IF NOT EXISTS email_notifications (
+    id SERIAL PRIMARY KEY,
+    email text NOT NULL,
+    name text NOT NULL,
+    issue text NOT NULL,
+    status text NOT NULL DEFAULT 'pending',
+    created_at timestamptz DEFAULT NOW(),
+    updated_at timestamptz DEFAULT NOW(),
+    sent_at timestamptz
+);
+
+-- Create customer_issues table
+CREATE TABLE IF NOT EXISTS customer_issues (
+    id SERIAL PRIMARY KEY,
+    customer_id float,
+    code_contrat float,
+    client_type float,
+    client_region float,
+    client_categorie float,
+    incident_title text,
+    churn_risk float,
+    status text DEFAULT 'not sent',
+    created_at timestamptz DEFAULT NOW(),
+    updated_at timestamptz DEFAULT NOW()
+);
+
+-- Create customer_incident_predictions table
+CREATE TABLE IF NOT EXISTS customer_incident_predictions (
+    id SERIAL PRIMARY KEY,
+    customer_id text,
+    client_region text,
+    client_type text,
+    client_category text,
+    q1_prediction float,
+    q2_prediction float,
+    q3_prediction float,
+    q4_prediction float,
+    most_likely_incident text,
+    recommendation text,
+    created_at timestamptz DEFAULT NOW(),
+    updated_at timestamptz DEFAULT NOW()
+);
+
+-- Stored average risk and risk level, indexed for high-risk range queries.
+-- Thresholds match CustomerIncidentPrediction.get_risk_level.
+ALTER TABLE customer_incident_predictions
+    ADD COLUMN IF NOT EXISTS avg_risk double precision GENERATED ALWAYS AS (
+        (COALESCE(q1_prediction, 0) + COALESCE(q2_prediction, 0)
+         + COALESCE(q3_prediction, 0) + COALESCE(q4_prediction, 0)) / 4
+    ) STORED,
+    ADD COLUMN IF NOT EXISTS risk_level text GENERATED ALWAYS AS (
+        CASE
+            WHEN (COALESCE(q1_prediction, 0) + COALESCE(q2_prediction, 0)
+                  + COALESCE(q3_prediction, 0) + COALESCE(q4_prediction, 0)) / 4 >= 60 THEN 'High'
+            WHEN (COALESCE(q1_prediction, 0) + COALESCE(q2_prediction, 0)
+                  + COALESCE(q3_prediction, 0) + COALESCE(q4_prediction, 0)) / 4 >= 30 THEN 'Medium'
+            ELSE 'Low'
+        END
+    ) STORED;
+CREATE INDEX IF NOT EXISTS idx_customer_incident_predictions_avg_risk
+    ON customer_incident_predictions (avg_risk DESC, id DESC);
+
+-- Create interactions table
+CREATE TABLE IF NOT EXISTS interactions (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    clientId uuid NOT NULL,
+    type text NOT NULL,
+    date text NOT NULL,
+    details text NOT NULL,
+    created_at timestamptz DEFAULT NOW()
+);
+
+-- Create recommendations table
+CREATE TABLE IF NOT EXISTS recommendations (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    clientId uuid NOT NULL,
+    title text NOT NULL,
+    impact integer NOT NULL,
+    details text NOT NULL,
+    created_at timestamptz DEFAULT NOW()
+);
+
+-- Create factors table
+CREATE TABLE IF NOT EXISTS factors (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    clientId uuid NOT NULL,
+    name text NOT NULL,
+    percentage integer NOT NULL,
+    created_at timestamptz DEFAULT NOW()
+);
@@ -0,0 +1,24 @@
+-- Secondary indexes for the repository query patterns.
+-- users.email, users.cin and users.code are already covered by their UNIQUE constraints.
+
+-- Prediction lookups by customer_id (get_by_customer_id, CSV duplicate checks)
+CREATE INDEX IF NOT EXISTS idx_customer_incident_predictions_customer_id
+    ON customer_incident_predictions (customer_id);
+
+-- Client detail: interactions, factors and recommendations by client
+-- (clientId is unquoted in the table definitions, so the column is clientid)
+CREATE INDEX IF NOT EXISTS idx_interactions_clientid ON interactions (clientid);
+CREATE INDEX IF NOT EXISTS idx_factors_clientid ON factors (clientid);
+CREATE INDEX IF NOT EXISTS idx_recommendations_clientid ON recommendations (clientid);
+
+-- Notification lists filtered by status, newest first
+CREATE INDEX IF NOT EXISTS idx_email_notifications_status_created_at
+    ON email_notifications (status, created_at DESC, id DESC);
+
+-- Customer issue lookups, updates and deletes by customer and incident title
+CREATE INDEX IF NOT EXISTS idx_customer_issues_customer_id_incident_title
+    ON customer_issues (customer_id, incident_title);
+
+-- Sent notes by sender, inbox by recipient role (recipients @> ARRAY[role])
+CREATE INDEX IF NOT EXISTS idx_notes_sender_id ON notes (sender_id);
+CREATE INDEX IF NOT EXISTS idx_notes_recipients ON notes USING GIN (recipients);
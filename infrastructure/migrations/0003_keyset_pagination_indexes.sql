@@ -0,0 +1,7 @@
+-- (sort key, id) indexes backing the default keyset pagination order of the list endpoints
+CREATE INDEX IF NOT EXISTS idx_clients_created_at_id ON clients (created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_customer_incident_predictions_created_at_id
+    ON customer_incident_predictions (created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_email_notifications_created_at_id
+    ON email_notifications (created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_users_created_at_id ON users (created_at DESC, id DESC);
@@ -0,0 +1,26 @@
+-- Foreign keys from the client child tables to clients.
+--
+-- They let PostgREST embed interactions, recommendations and factors in a
+-- single clients select (client detail views). NOT VALID skips checking rows
+-- that already exist, so orphaned legacy rows do not block the migration;
+-- new rows must reference an existing client. The default NO ACTION keeps
+-- child rows from being deleted along with their client: a client that still
+-- has interactions, recommendations or factors cannot be deleted until they
+-- are removed.
+ALTER TABLE interactions DROP CONSTRAINT IF EXISTS fk_interactions_client;
+ALTER TABLE interactions
+    ADD CONSTRAINT fk_interactions_client FOREIGN KEY (clientid)
+    REFERENCES clients (id) NOT VALID;
+
+ALTER TABLE recommendations DROP CONSTRAINT IF EXISTS fk_recommendations_client;
+ALTER TABLE recommendations
+    ADD CONSTRAINT fk_recommendations_client FOREIGN KEY (clientid)
+    REFERENCES clients (id) NOT VALID;
+
+ALTER TABLE factors DROP CONSTRAINT IF EXISTS fk_factors_client;
+ALTER TABLE factors
+    ADD CONSTRAINT fk_factors_client FOREIGN KEY (clientid)
+    REFERENCES clients (id) NOT VALID;
+
+-- Make PostgREST pick up the new relationships
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,54 @@
+-- Per-table change counters used for ETags on list and report endpoints.
+--
+-- A statement-level trigger on each data table bumps its row in
+-- table_versions on INSERT, UPDATE, DELETE and TRUNCATE, in the same
+-- transaction as the change, so a version is visible exactly when the data it
+-- describes is. Deletes are counted too, which max(updated_at) would miss.
+-- A transaction-local setting makes only the first statement per table and
+-- transaction do the upsert; later statements in that transaction return at
+-- once instead of updating (and re-locking) the counter row again. Statements
+-- that touch no rows still bump the version; that only costs the next poll a
+-- full response.
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name text PRIMARY KEY,
+    version bigint NOT NULL DEFAULT 0,
+    updated_at timestamptz NOT NULL DEFAULT NOW()
+);
+
+CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    guard text := 'table_versions.bumped_' || TG_TABLE_NAME;
+BEGIN
+    IF current_setting(guard, true) IS DISTINCT FROM 'on' THEN
+        PERFORM set_config(guard, 'on', true);
+        INSERT INTO table_versions (table_name, version, updated_at)
+        VALUES (TG_TABLE_NAME, 1, NOW())
+        ON CONFLICT (table_name)
+        DO UPDATE SET version = table_versions.version + 1, updated_at = NOW();
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DO $$
+DECLARE
+    versioned_table text;
+BEGIN
+    FOREACH versioned_table IN ARRAY ARRAY[
+        'clients', 'customer_incident_predictions', 'customer_issues', 'email_notifications',
+        'factors', 'interactions', 'notes', 'recommendations'
+    ] LOOP
+        INSERT INTO table_versions (table_name) VALUES (versioned_table) ON CONFLICT DO NOTHING;
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_version ON %I', versioned_table, versioned_table);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_version AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON %I '
+            'FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()',
+            versioned_table, versioned_table
+        );
+    END LOOP;
+END;
+$$;
+
+-- Make PostgREST pick up the new table
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,210 @@
+-- Summary tables behind the churn reports.
+--
+-- Each report reads a handful of pre-aggregated rows instead of scanning
+-- clients, factors or recommendations. Statement-level triggers keep the
+-- totals current: every INSERT, UPDATE or DELETE subtracts the old rows and
+-- adds the new ones, read from the statement's transition tables and grouped
+-- per summary key, in the same transaction as the change. A bulk insert
+-- therefore costs one upsert per touched key, not one per row. Each table has
+-- one trigger per side of the change, all exposing their transition table as
+-- changed_rows and passing the sign of the delta as the trigger argument.
+--
+-- Totals are stored as sums and counts so they can be updated by deltas;
+-- averages and shares are computed when the report is read. Keys whose count
+-- drops to zero are kept and filtered out by the readers.
+
+-- Numeric value of clients.churn_risk (stored as text, e.g. '91' or '91%')
+CREATE OR REPLACE FUNCTION churn_risk_value(risk text) RETURNS numeric
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT CASE
+        WHEN risk ~ '^\s*\d+(\.\d+)?\s*%?\s*$' THEN replace(risk, '%', '')::numeric
+    END
+$$;
+
+-- Numeric value of clients.monthly_revenue (stored as text, e.g. '120.50')
+CREATE OR REPLACE FUNCTION monthly_revenue_value(revenue text) RETURNS numeric
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT CASE
+        WHEN revenue ~ '^\s*\d+(\.\d+)?\s*$' THEN revenue::numeric
+    END
+$$;
+
+-- Client totals per month the clients were added (created_at, UTC), for the
+-- churn trend. clients.since is free text, so it cannot be grouped by.
+CREATE TABLE IF NOT EXISTS report_client_months (
+    month date PRIMARY KEY,
+    client_count bigint NOT NULL DEFAULT 0,
+    risk_sum numeric NOT NULL DEFAULT 0,
+    risk_count bigint NOT NULL DEFAULT 0
+);
+
+-- Client totals per segment
+CREATE TABLE IF NOT EXISTS report_client_segments (
+    segment text PRIMARY KEY,
+    client_count bigint NOT NULL DEFAULT 0,
+    risk_sum numeric NOT NULL DEFAULT 0,
+    risk_count bigint NOT NULL DEFAULT 0,
+    revenue_sum numeric NOT NULL DEFAULT 0,
+    revenue_count bigint NOT NULL DEFAULT 0
+);
+
+-- Churn factor totals per factor name
+CREATE TABLE IF NOT EXISTS report_factor_totals (
+    name text PRIMARY KEY,
+    factor_count bigint NOT NULL DEFAULT 0,
+    percentage_sum bigint NOT NULL DEFAULT 0
+);
+
+-- Recommendation totals per title; impact is the expected change in churn risk
+CREATE TABLE IF NOT EXISTS report_recommendation_totals (
+    title text PRIMARY KEY,
+    recommendation_count bigint NOT NULL DEFAULT 0,
+    impact_sum bigint NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION refresh_client_report_totals() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    delta_sign integer := TG_ARGV[0]::integer;
+BEGIN
+    INSERT INTO report_client_months AS t (month, client_count, risk_sum, risk_count)
+    SELECT date_trunc('month', created_at AT TIME ZONE 'UTC')::date,
+           delta_sign * count(*),
+           delta_sign * COALESCE(sum(churn_risk_value(churn_risk)), 0),
+           delta_sign * count(churn_risk_value(churn_risk))
+    FROM changed_rows
+    WHERE created_at IS NOT NULL
+    GROUP BY 1
+    ON CONFLICT (month) DO UPDATE SET
+        client_count = t.client_count + EXCLUDED.client_count,
+        risk_sum = t.risk_sum + EXCLUDED.risk_sum,
+        risk_count = t.risk_count + EXCLUDED.risk_count;
+
+    INSERT INTO report_client_segments AS t (segment, client_count, risk_sum, risk_count, revenue_sum, revenue_count)
+    SELECT segment,
+           delta_sign * count(*),
+           delta_sign * COALESCE(sum(churn_risk_value(churn_risk)), 0),
+           delta_sign * count(churn_risk_value(churn_risk)),
+           delta_sign * COALESCE(sum(monthly_revenue_value(monthly_revenue)), 0),
+           delta_sign * count(monthly_revenue_value(monthly_revenue))
+    FROM changed_rows
+    GROUP BY segment
+    ON CONFLICT (segment) DO UPDATE SET
+        client_count = t.client_count + EXCLUDED.client_count,
+        risk_sum = t.risk_sum + EXCLUDED.risk_sum,
+        risk_count = t.risk_count + EXCLUDED.risk_count,
+        revenue_sum = t.revenue_sum + EXCLUDED.revenue_sum,
+        revenue_count = t.revenue_count + EXCLUDED.revenue_count;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION refresh_factor_report_totals() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    delta_sign integer := TG_ARGV[0]::integer;
+BEGIN
+    INSERT INTO report_factor_totals AS t (name, factor_count, percentage_sum)
+    SELECT name, delta_sign * count(*), delta_sign * sum(percentage)
+    FROM changed_rows
+    GROUP BY name
+    ON CONFLICT (name) DO UPDATE SET
+        factor_count = t.factor_count + EXCLUDED.factor_count,
+        percentage_sum = t.percentage_sum + EXCLUDED.percentage_sum;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION refresh_recommendation_report_totals() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    delta_sign integer := TG_ARGV[0]::integer;
+BEGIN
+    INSERT INTO report_recommendation_totals AS t (title, recommendation_count, impact_sum)
+    SELECT title, delta_sign * count(*), delta_sign * sum(impact)
+    FROM changed_rows
+    GROUP BY title
+    ON CONFLICT (title) DO UPDATE SET
+        recommendation_count = t.recommendation_count + EXCLUDED.recommendation_count,
+        impact_sum = t.impact_sum + EXCLUDED.impact_sum;
+    RETURN NULL;
+END;
+$$;
+
+-- TRUNCATE has no transition tables: empty the table's summaries instead
+CREATE OR REPLACE FUNCTION clear_report_totals() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    summary_table text;
+BEGIN
+    FOREACH summary_table IN ARRAY TG_ARGV LOOP
+        EXECUTE format('DELETE FROM %I', summary_table);
+    END LOOP;
+    RETURN NULL;
+END;
+$$;
+
+DO $$
+DECLARE
+    source record;
+BEGIN
+    FOR source IN
+        SELECT * FROM (VALUES
+            ('clients', 'refresh_client_report_totals', '''report_client_months'', ''report_client_segments'''),
+            ('factors', 'refresh_factor_report_totals', '''report_factor_totals'''),
+            ('recommendations', 'refresh_recommendation_report_totals', '''report_recommendation_totals''')
+        ) AS sources (table_name, refresh_function, summary_tables)
+    LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_report_insert ON %I', source.table_name, source.table_name);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_report_update_old ON %I', source.table_name, source.table_name);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_report_update_new ON %I', source.table_name, source.table_name);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_report_delete ON %I', source.table_name, source.table_name);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_report_truncate ON %I', source.table_name, source.table_name);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_report_insert AFTER INSERT ON %I REFERENCING NEW TABLE AS changed_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION %I(''1'')',
+            source.table_name, source.table_name, source.refresh_function);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_report_update_old AFTER UPDATE ON %I REFERENCING OLD TABLE AS changed_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION %I(''-1'')',
+            source.table_name, source.table_name, source.refresh_function);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_report_update_new AFTER UPDATE ON %I REFERENCING NEW TABLE AS changed_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION %I(''1'')',
+            source.table_name, source.table_name, source.refresh_function);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_report_delete AFTER DELETE ON %I REFERENCING OLD TABLE AS changed_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION %I(''-1'')',
+            source.table_name, source.table_name, source.refresh_function);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_report_truncate AFTER TRUNCATE ON %I '
+            'FOR EACH STATEMENT EXECUTE FUNCTION clear_report_totals(%s)',
+            source.table_name, source.table_name, source.summary_tables);
+    END LOOP;
+END;
+$$;
+
+-- Initial totals from the rows already present
+TRUNCATE report_client_months, report_client_segments, report_factor_totals, report_recommendation_totals;
+
+INSERT INTO report_client_months (month, client_count, risk_sum, risk_count)
+SELECT date_trunc('month', created_at AT TIME ZONE 'UTC')::date, count(*),
+       COALESCE(sum(churn_risk_value(churn_risk)), 0), count(churn_risk_value(churn_risk))
+FROM clients
+WHERE created_at IS NOT NULL
+GROUP BY 1;
+
+INSERT INTO report_client_segments (segment, client_count, risk_sum, risk_count, revenue_sum, revenue_count)
+SELECT segment, count(*), COALESCE(sum(churn_risk_value(churn_risk)), 0), count(churn_risk_value(churn_risk)),
+       COALESCE(sum(monthly_revenue_value(monthly_revenue)), 0), count(monthly_revenue_value(monthly_revenue))
+FROM clients
+GROUP BY segment;
+
+INSERT INTO report_factor_totals (name, factor_count, percentage_sum)
+SELECT name, count(*), sum(percentage) FROM factors GROUP BY name;
+
+INSERT INTO report_recommendation_totals (title, recommendation_count, impact_sum)
+SELECT title, count(*), sum(impact) FROM recommendations GROUP BY title;
+
+-- Make PostgREST pick up the new tables
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,49 @@
+-- One prediction per customer_id.
+--
+-- CSV uploads reject customer_ids that already have a prediction, but that
+-- check runs before the insert, so concurrent uploads (or another worker's
+-- in-memory customer_id index) could still insert the same customer twice.
+-- The unique index makes the database the final check: a duplicate row fails
+-- its insert and is reported as a failed row.
+--
+-- Existing duplicates are not removed: the migration stops and lists them, so
+-- they can be resolved by hand (keep one prediction per customer_id) before
+-- it is applied. Rows without a customer_id are not affected.
+DO $$
+DECLARE
+    duplicate_count integer;
+    duplicate_ids text;
+BEGIN
+    SELECT count(*) INTO duplicate_count
+    FROM (
+        SELECT customer_id
+        FROM customer_incident_predictions
+        WHERE customer_id IS NOT NULL
+        GROUP BY customer_id
+        HAVING count(*) > 1
+    ) duplicates;
+
+    IF duplicate_count > 0 THEN
+        -- Name the first 100; the count says how many there are in all
+        SELECT string_agg(quote_literal(customer_id), ', ' ORDER BY customer_id) INTO duplicate_ids
+        FROM (
+            SELECT customer_id
+            FROM customer_incident_predictions
+            WHERE customer_id IS NOT NULL
+            GROUP BY customer_id
+            HAVING count(*) > 1
+            ORDER BY customer_id
+            LIMIT 100
+        ) duplicates;
+        RAISE EXCEPTION 'customer_incident_predictions has % customer_ids with more than one prediction: %',
+            duplicate_count, duplicate_ids
+            USING HINT = 'Delete or merge the extra predictions for these customer_ids, then restart to apply the unique index.';
+    END IF;
+END;
+$$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_customer_incident_predictions_customer_id
+    ON customer_incident_predictions (customer_id);
+
+-- Lookups by customer_id use the unique index from here on
+DROP INDEX IF EXISTS idx_customer_incident_predictions_customer_id;
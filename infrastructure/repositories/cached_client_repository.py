@@ -0,0 +1,49 @@
+# Read-through cache for clients
+#
+# get_by_id is served from an in-process TTL/LRU cache; create, update and
+# delete through this repository invalidate the client's entry.
+from domain.repositories.client_repository_interface import ClientRepositoryInterface
+from domain.entities.client import Client
+from domain.value_objects.client_detail import ClientDetail
+from domain.value_objects.page import Page, PageRequest
+from infrastructure.services.entity_cache import EntityCache
+from typing import List, Optional
+
+class CachedClientRepository(ClientRepositoryInterface):
+    def __init__(self, repository: ClientRepositoryInterface, cache: EntityCache):
+        self.repository = repository
+        self.cache = cache
+
+    async def get_by_id(self, client_id: str) -> Optional[Client]:
+        client = self.cache.get(client_id)
+        if client is None:
+            client = await self.repository.get_by_id(client_id)
+            if client is not None:
+                self.cache.set(client_id, client)
+        return client
+
+    async def get_all(self) -> List[Client]:
+        return await self.repository.get_all()
+
+    async def get_page(self, page_request: PageRequest) -> Page[Client]:
+        return await self.repository.get_page(page_request)
+
+    async def get_details_by_ids(self, client_ids: List[str]) -> List[ClientDetail]:
+        return await self.repository.get_details_by_ids(client_ids)
+
+    async def create(self, client: Client) -> Client:
+        created = await self.repository.create(client)
+        self.cache.invalidate(created.id)
+        return created
+
+    async def update(self, client_id: str, client: Client) -> Client:
+        try:
+            return await self.repository.update(client_id, client)
+        finally:
+            self.cache.invalidate(client_id)
+
+    async def delete(self, client_id: str) -> bool:
+        try:
+            return await self.repository.delete(client_id)
+        finally:
+            self.cache.invalidate(client_id)
@@ -0,0 +1,82 @@
+# Read-through cache for customer incident predictions
+#
+# Predictions are cached by id. get_by_customer_id caches a customer_id -> id
+# pointer and resolves it through the id entry, so invalidating a
+# prediction's id entry on update or delete also invalidates its
+# customer_id lookup. A pointer is only trusted if the entity it resolves to
+# still has that customer_id.
+from domain.repositories.customer_incident_prediction_repository_interface import CustomerIncidentPredictionRepositoryInterface
+from domain.entities.customer_incident_prediction import CustomerIncidentPrediction, IncidentType
+from domain.value_objects.batch_write_result import BatchWriteResult
+from domain.value_objects.page import Page, PageRequest
+from domain.value_objects.prediction_collection import PredictionCollection
+from infrastructure.services.entity_cache import EntityCache
+from typing import List, Optional, Set
+
+class CachedCustomerIncidentPredictionRepository(CustomerIncidentPredictionRepositoryInterface):
+    def __init__(self, repository: CustomerIncidentPredictionRepositoryInterface, cache: EntityCache):
+        self.repository = repository
+        self.cache = cache
+
+    def _store(self, prediction: CustomerIncidentPrediction) -> None:
+        self.cache.set(("id", prediction.id), prediction)
+        if prediction.customer_id:
+            self.cache.set(("customer_id", prediction.customer_id), prediction.id)
+
+    async def get_by_id(self, prediction_id: int) -> Optional[CustomerIncidentPrediction]:
+        prediction = self.cache.get(("id", prediction_id))
+        if prediction is None:
+            prediction = await self.repository.get_by_id(prediction_id)
+            if prediction is not None:
+                self._store(prediction)
+        return prediction
+
+    async def get_by_customer_id(self, customer_id: str) -> Optional[CustomerIncidentPrediction]:
+        prediction_id = self.cache.get(("customer_id", customer_id))
+        if prediction_id is not None:
+            prediction = self.cache.get(("id", prediction_id))
+            if prediction is not None and prediction.customer_id == customer_id:
+                return prediction
+        prediction = await self.repository.get_by_customer_id(customer_id)
+        if prediction is not None:
+            self._store(prediction)
+        return prediction
+
+    async def get_existing_customer_ids(self, customer_ids: List[str]) -> Set[str]:
+        return await self.repository.get_existing_customer_ids(customer_ids)
+
+    async def get_all_customer_ids(self) -> Set[str]:
+        return await self.repository.get_all_customer_ids()
+
+    async def get_all(self) -> PredictionCollection:
+        return await self.repository.get_all()
+
+    async def get_page(self, page_request: PageRequest) -> Page[CustomerIncidentPrediction]:
+        return await self.repository.get_page(page_request)
+
+    async def get_by_region(self, client_region: str) -> PredictionCollection:
+        return await self.repository.get_by_region(client_region)
+
+    async def get_by_incident_type(self, incident_type: IncidentType) -> PredictionCollection:
+        return await self.repository.get_by_incident_type(incident_type)
+
+    async def get_by_risk_level(self, min_avg_risk: float) -> PredictionCollection:
+        return await self.repository.get_by_risk_level(min_avg_risk)
+
+    async def create(self, prediction: CustomerIncidentPrediction) -> CustomerIncidentPrediction:
+        return await self.repository.create(prediction)
+
+    async def batch_create(self, predictions: List[CustomerIncidentPrediction]) -> BatchWriteResult[CustomerIncidentPrediction]:
+        return await self.repository.batch_create(predictions)
+
+    async def update(self, prediction_id: int, prediction: CustomerIncidentPrediction) -> Optional[CustomerIncidentPrediction]:
+        try:
+            return await self.repository.update(prediction_id, prediction)
+        finally:
+            self.cache.invalidate(("id", prediction_id))
+
+    async def delete(self, prediction_id: int) -> bool:
+        try:
+            return await self.repository.delete(prediction_id)
+        finally:
+            self.cache.invalidate(("id", prediction_id))
@@ -0,0 +1,55 @@
+# Read-through cache for users
+#
+# get_by_id runs on every authenticated request (to resolve the token's
+# subject), so it is served from an in-process TTL/LRU cache. update and
+# delete through this repository invalidate the user's entry. Lookups by
+# email, cin and code back uniqueness checks and login, and always go to the
+# database.
+from domain.repositories.user_repository_interface import UserRepositoryInterface
+from domain.entities.user import User
+from domain.value_objects.page import Page, PageRequest
+from infrastructure.services.entity_cache import EntityCache
+from typing import List, Optional
+
+class CachedUserRepository(UserRepositoryInterface):
+    def __init__(self, repository: UserRepositoryInterface, cache: EntityCache):
+        self.repository = repository
+        self.cache = cache
+
+    async def get_by_id(self, user_id: str) -> Optional[User]:
+        user = self.cache.get(user_id)
+        if user is None:
+            user = await self.repository.get_by_id(user_id)
+            if user is not None:
+                self.cache.set(user_id, user)
+        return user
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return await self.repository.get_by_email(email)
+
+    async def get_by_cin(self, cin: str) -> Optional[User]:
+        return await self.repository.get_by_cin(cin)
+
+    async def get_by_code(self, code: str) -> Optional[User]:
+        return await self.repository.get_by_code(code)
+
+    async def get_all(self) -> List[User]:
+        return await self.repository.get_all()
+
+    async def get_page(self, page_request: PageRequest) -> Page[User]:
+        return await self.repository.get_page(page_request)
+
+    async def create(self, user: User) -> User:
+        return await self.repository.create(user)
+
+    async def update(self, user: User) -> User:
+        try:
+            return await self.repository.update(user)
+        finally:
+            self.cache.invalidate(user.id)
+
+    async def delete(self, user_id: str) -> bool:
+        try:
+            return await self.repository.delete(user_id)
+        finally:
+            self.cache.invalidate(user_id)
@@ -1,29 +1,130 @@
 from domain.repositories.client_repository_interface import ClientRepositoryInterface
 from domain.entities.client import Client, Contact
+from domain.entities.factor import Factor
+from domain.entities.interaction import Interaction
+from domain.entities.recommendation import Recommendation
+from domain.value_objects.client_detail import ClientDetail
+from domain.value_objects.page import Page, PageRequest, build_page
+from postgrest.exceptions import APIError
 from supabase import Client as SupabaseClient
+from infrastructure.repositories.pagination import apply_page_request
+from infrastructure.services.query_executor import execute_query
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+import asyncio
+import logging
 import uuid
 
+SORT_COLUMNS = ("created_at", "name", "segment")
+FILTER_COLUMNS = ("name", "segment", "churn_risk")
+DEFAULT_SORT = "created_at"
+# Columns a page request may project
+SELECTABLE_COLUMNS = ("id", "name", "segment", "since", "churn_risk", "contacts", "monthly_revenue",
+                      "churn_trend", "churn_trend_days", "created_at", "updated_at")
+
+# Child collections of the client detail view: (table, entity, detail field).
+# Embedding them needs the clientId foreign keys (migration 0004).
+DETAIL_CHILDREN = (
+    ("interactions", Interaction, "interactions"),
+    ("recommendations", Recommendation, "recommendations"),
+    ("factors", Factor, "factors"),
+)
+DETAIL_SELECT = "*, " + ", ".join(f"{table}(*)" for table, _, _ in DETAIL_CHILDREN)
+# PostgREST error code when no relationship exists between the tables
+PGRST_RELATIONSHIP_NOT_FOUND = "PGRST200"
+
 class ClientRepository(ClientRepositoryInterface):
     def __init__(self, supabase: SupabaseClient):
         self.supabase = supabase
         self.table = "clients"
+        self._embedding_supported = True
     
     async def get_all(self) -> List[Client]:
-        response = self.supabase.table(self.table).select("*").execute()
+        response = await execute_query(self.supabase.table(self.table).select("*"))
         data = response.data or []
         return [Client.from_dict(item) for item in data]
     
+    async def get_page(self, page_request: PageRequest) -> Page[Client]:
+        query, sort_by = apply_page_request(
+            self.supabase.table(self.table), page_request, SORT_COLUMNS, FILTER_COLUMNS, DEFAULT_SORT, SELECTABLE_COLUMNS
+        )
+        response = await execute_query(query)
+        return build_page(response.data or [], page_request, sort_by, Client.from_dict)
+    
     async def get_by_id(self, client_id: str) -> Optional[Client]:
-        response = self.supabase.table(self.table).select("*").eq("id", client_id).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("id", client_id))
         data = response.data
         if not data:
             return None
         return Client.from_dict(data[0])
+
+    async def get_details_by_ids(self, client_ids: List[str]) -> List[ClientDetail]:
+        ids = list(dict.fromkeys(client_ids))
+        if not ids:
+            return []
+        details = None
+        if self._embedding_supported:
+            try:
+                details = await self._get_embedded_details(ids)
+            except APIError as e:
+                if e.code != PGRST_RELATIONSHIP_NOT_FOUND:
+                    raise
+                logging.warning(
+                    "clientId foreign keys not found; loading client details with concurrent queries. "
+                    "Apply migration 0004 to enable embedded selects."
+                )
+                self._embedding_supported = False
+        if details is None:
+            details = await self._get_details_concurrently(ids)
+        return [details[client_id] for client_id in ids if client_id in details]
+
+    async def _get_embedded_details(self, ids: List[str]) -> Dict[str, ClientDetail]:
+        """One request: clients with their child rows embedded by PostgREST"""
+        response = await execute_query(self.supabase.table(self.table).select(DETAIL_SELECT).in_("id", ids))
+        details = {}
+        for row in response.data or []:
+            children = {table: row.pop(table, None) or [] for table, _, _ in DETAIL_CHILDREN}
+            client = Client.from_dict(row)
+            detail = ClientDetail(client=client)
+            for table, entity, attribute in DETAIL_CHILDREN:
+                setattr(detail, attribute, self._hydrate_children(children[table], entity, client.id))
+            details[client.id] = detail
+        return details
+
+    async def _get_details_concurrently(self, ids: List[str]) -> Dict[str, ClientDetail]:
+        """Four concurrent requests: the clients and each child table filtered by clientId"""
+        client_response, *child_responses = await asyncio.gather(
+            execute_query(self.supabase.table(self.table).select("*").in_("id", ids)),
+            *(execute_query(self.supabase.table(table).select("*").in_("clientId", ids)) for table, _, _ in DETAIL_CHILDREN)
+        )
+        details = {}
+        for row in client_response.data or []:
+            client = Client.from_dict(row)
+            details[client.id] = ClientDetail(client=client)
+        for (table, entity, attribute), response in zip(DETAIL_CHILDREN, child_responses):
+            rows_by_client: Dict[str, List[Dict[str, Any]]] = {}
+            for row in response.data or []:
+                rows_by_client.setdefault(self._child_client_id(row), []).append(row)
+            for client_id, rows in rows_by_client.items():
+                if client_id in details:
+                    setattr(details[client_id], attribute, self._hydrate_children(rows, entity, client_id))
+        return details
+
+    @staticmethod
+    def _child_client_id(row: Dict[str, Any]) -> str:
+        # The column is created unquoted, so PostgREST may return it lowercased
+        return row.get("clientId") or row.get("clientid") or ""
+
+    @staticmethod
+    def _hydrate_children(rows: List[Dict[str, Any]], entity: Any, client_id: str) -> List[Any]:
+        children = [entity.from_dict(row) for row in rows]
+        for child in children:
+            child.client_id = client_id
+        return children
+
     # e.g. in client_repository.py
     async def create_from_dict(self, data: dict) -> Client:
-        response = self.supabase.table(self.table).insert(data).execute()
+        response = await execute_query(self.supabase.table(self.table).insert(data))
         return Client(**response.data[0])
 
     
@@ -33,7 +134,7 @@ class ClientRepository(ClientRepositoryInterface):
         client.created_at = datetime.now()
         client.updated_at = None
         client_dict = client.to_dict()
-        self.supabase.table(self.table).insert(client_dict).execute()
+        await execute_query(self.supabase.table(self.table).insert(client_dict))
         return client
     
     async def update(self, client_id: str, client: Client) -> Client:
@@ -45,11 +146,12 @@ class ClientRepository(ClientRepositoryInterface):
             "contacts": client.contacts.dict(),
             # any other fields…
         }
-        resp = await self.supabase \
-            .from_(self.table) \
-            .update(data) \
-            .eq("id", client_id) \
-            .execute()
+        resp = await execute_query(
+            self.supabase
+            .from_(self.table)
+            .update(data)
+            .eq("id", client_id)
+        )
 
         updated = resp.data[0]
         return Client(
@@ -63,5 +165,12 @@ class ClientRepository(ClientRepositoryInterface):
         )
     
     async def delete(self, client_id: str) -> bool:
-        self.supabase.table(self.table).delete().eq("id", client_id).execute()
-        return True
+        try:
+            resp = await execute_query(self.supabase.table(self.table).delete().eq("id", client_id))
+        except APIError as e:
+            # foreign_key_violation: the client still has child rows
+            if e.code == "23503":
+                logging.warning(f"Client {client_id} not deleted, it still has child rows: {e.message}")
+                return False
+            raise
+        return bool(resp.data)
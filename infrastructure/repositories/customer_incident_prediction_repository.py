@@ -1,47 +1,107 @@
 from domain.repositories.customer_incident_prediction_repository_interface import CustomerIncidentPredictionRepositoryInterface
 from domain.entities.customer_incident_prediction import CustomerIncidentPrediction, IncidentType
+from domain.value_objects.batch_write_result import BatchWriteResult
+from domain.value_objects.page import Page, PageRequest, build_page
+from domain.value_objects.prediction_collection import PredictionCollection
 from supabase import Client as SupabaseClient
-from typing import List, Optional
+from infrastructure.repositories.pagination import apply_page_request
+from infrastructure.services.batch_writer import BatchWriter
+from infrastructure.services.query_executor import execute_query
+from typing import List, Optional, Set
 from datetime import datetime
+import asyncio
+import os
+
+SORT_COLUMNS = ("created_at", "id", "customer_id", "avg_risk")
+FILTER_COLUMNS = ("customer_id", "client_region", "client_type", "most_likely_incident", "avg_risk", "risk_level")
+DEFAULT_SORT = "created_at"
+# Columns a page request may project
+SELECTABLE_COLUMNS = ("id", "customer_id", "client_region", "client_type", "client_category",
+                      "q1_prediction", "q2_prediction", "q3_prediction", "q4_prediction",
+                      "most_likely_incident", "recommendation", "created_at", "updated_at",
+                      "avg_risk", "risk_level")
+# customer_id values per IN (...) filter, bounded by the PostgREST URL length
+EXISTENCE_CHECK_CHUNK_SIZE = int(os.getenv("EXISTENCE_CHECK_CHUNK_SIZE", "200"))
+CUSTOMER_ID_SCAN_PAGE_SIZE = 1000
 
 class CustomerIncidentPredictionRepository(CustomerIncidentPredictionRepositoryInterface):
     def __init__(self, supabase: SupabaseClient):
         self.supabase = supabase
         self.table = "customer_incident_predictions"
     
-    async def get_all(self) -> List[CustomerIncidentPrediction]:
-        response = self.supabase.table(self.table).select("*").order("created_at", desc=True).execute()
-        data = response.data or []
-        return [CustomerIncidentPrediction.from_dict(item) for item in data]
+    async def get_all(self) -> PredictionCollection:
+        response = await execute_query(self.supabase.table(self.table).select("*").order("created_at", desc=True))
+        return PredictionCollection.from_rows(response.data or [])
+    
+    async def get_page(self, page_request: PageRequest) -> Page[CustomerIncidentPrediction]:
+        query, sort_by = apply_page_request(
+            self.supabase.table(self.table), page_request, SORT_COLUMNS, FILTER_COLUMNS, DEFAULT_SORT, SELECTABLE_COLUMNS
+        )
+        response = await execute_query(query)
+        return build_page(response.data or [], page_request, sort_by, CustomerIncidentPrediction.from_dict)
     
     async def get_by_id(self, prediction_id: int) -> Optional[CustomerIncidentPrediction]:
-        response = self.supabase.table(self.table).select("*").eq("id", prediction_id).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("id", prediction_id))
         data = response.data
         if not data:
             return None
         return CustomerIncidentPrediction.from_dict(data[0])
     
     async def get_by_customer_id(self, customer_id: str) -> Optional[CustomerIncidentPrediction]:
-        response = self.supabase.table(self.table).select("*").eq("customer_id", customer_id).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("customer_id", customer_id))
         data = response.data
         if not data:
             return None
         return CustomerIncidentPrediction.from_dict(data[0])
     
-    async def get_by_region(self, client_region: str) -> List[CustomerIncidentPrediction]:
-        response = self.supabase.table(self.table).select("*").eq("client_region", client_region).order("created_at", desc=True).execute()
-        data = response.data or []
-        return [CustomerIncidentPrediction.from_dict(item) for item in data]
+    async def get_existing_customer_ids(self, customer_ids: List[str]) -> Set[str]:
+        unique_ids = list(dict.fromkeys(customer_ids))
+        chunks = [
+            unique_ids[start:start + EXISTENCE_CHECK_CHUNK_SIZE]
+            for start in range(0, len(unique_ids), EXISTENCE_CHECK_CHUNK_SIZE)
+        ]
+        responses = await asyncio.gather(*(
+            execute_query(self.supabase.table(self.table).select("customer_id").in_("customer_id", chunk))
+            for chunk in chunks
+        ))
+        return {item["customer_id"] for response in responses for item in (response.data or [])}
+    
+    async def get_all_customer_ids(self) -> Set[str]:
+        # Walk the table by id so each request stays under the PostgREST row limit
+        customer_ids: Set[str] = set()
+        last_id = 0
+        while True:
+            response = await execute_query(
+                self.supabase.table(self.table)
+                .select("id, customer_id")
+                .gt("id", last_id)
+                .order("id")
+                .limit(CUSTOMER_ID_SCAN_PAGE_SIZE)
+            )
+            data = response.data or []
+            customer_ids.update(item["customer_id"] for item in data if item["customer_id"] is not None)
+            if len(data) < CUSTOMER_ID_SCAN_PAGE_SIZE:
+                return customer_ids
+            last_id = data[-1]["id"]
     
-    async def get_by_incident_type(self, incident_type: IncidentType) -> List[CustomerIncidentPrediction]:
-        response = self.supabase.table(self.table).select("*").eq("most_likely_incident", incident_type.value).order("created_at", desc=True).execute()
-        data = response.data or []
-        return [CustomerIncidentPrediction.from_dict(item) for item in data]
+    async def get_by_region(self, client_region: str) -> PredictionCollection:
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("client_region", client_region).order("created_at", desc=True))
+        return PredictionCollection.from_rows(response.data or [])
     
-    async def get_by_risk_level(self, min_avg_risk: float) -> List[CustomerIncidentPrediction]:
-        # Note: This is a simplified version. For complex calculations, you might want to use a database view or raw SQL
-        all_predictions = await self.get_all()
-        return [pred for pred in all_predictions if pred.get_average_risk_percentage() >= min_avg_risk]
+    async def get_by_incident_type(self, incident_type: IncidentType) -> PredictionCollection:
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("most_likely_incident", incident_type.value).order("created_at", desc=True))
+        return PredictionCollection.from_rows(response.data or [])
+    
+    async def get_by_risk_level(self, min_avg_risk: float) -> PredictionCollection:
+        # Range scan on the indexed avg_risk column, highest risk first
+        response = await execute_query(
+            self.supabase.table(self.table)
+            .select("*")
+            .gte("avg_risk", min_avg_risk)
+            .order("avg_risk", desc=True)
+            .order("id", desc=True)
+        )
+        return PredictionCollection.from_rows(response.data or [])
     
     async def create(self, prediction: CustomerIncidentPrediction) -> CustomerIncidentPrediction:
         prediction_dict = prediction.to_dict()
@@ -54,11 +114,11 @@ class CustomerIncidentPredictionRepository(CustomerIncidentPredictionRepositoryI
         if 'updated_at' in prediction_dict:
             del prediction_dict['updated_at']
         
-        response = self.supabase.table(self.table).insert(prediction_dict).execute()
+        response = await execute_query(self.supabase.table(self.table).insert(prediction_dict))
         return CustomerIncidentPrediction.from_dict(response.data[0])
     
-    async def batch_create(self, predictions: List[CustomerIncidentPrediction]) -> List[CustomerIncidentPrediction]:
-        """Insert multiple customer incident predictions in batch"""
+    async def batch_create(self, predictions: List[CustomerIncidentPrediction]) -> BatchWriteResult[CustomerIncidentPrediction]:
+        """Insert multiple customer incident predictions in concurrent chunks"""
         predictions_data = []
         for prediction in predictions:
             prediction_dict = prediction.to_dict()
@@ -71,15 +131,17 @@ class CustomerIncidentPredictionRepository(CustomerIncidentPredictionRepositoryI
             if 'updated_at' in prediction_dict:
                 del prediction_dict['updated_at']
             predictions_data.append(prediction_dict)
-        
+        return await BatchWriter().write(predictions_data, self._insert_chunk)
+    
+    async def _insert_chunk(self, predictions_data: List[dict]) -> List[CustomerIncidentPrediction]:
         try:
-            response = self.supabase.table(self.table).insert(predictions_data).execute()
+            response = await execute_query(self.supabase.table(self.table).insert(predictions_data))
             return [CustomerIncidentPrediction.from_dict(item) for item in response.data]
         except Exception as e:
             # Handle Supabase errors more specifically
             error_msg = str(e)
             if "409" in error_msg or "duplicate key" in error_msg.lower() or "unique constraint" in error_msg.lower():
-                raise ValueError("Duplicate customer_id found. Each customer_id must be unique in the database.")
+                raise ValueError("Duplicate customer_id found. Each customer_id must be unique in the database.") from e
             else:
                 raise e
     
@@ -93,12 +155,12 @@ class CustomerIncidentPredictionRepository(CustomerIncidentPredictionRepositoryI
         if 'updated_at' in prediction_dict:
             del prediction_dict['updated_at']
         
-        response = self.supabase.table(self.table).update(prediction_dict).eq("id", prediction_id).execute()
+        response = await execute_query(self.supabase.table(self.table).update(prediction_dict).eq("id", prediction_id))
         data = response.data
         if not data:
             return None
         return CustomerIncidentPrediction.from_dict(data[0])
     
     async def delete(self, prediction_id: int) -> bool:
-        self.supabase.table(self.table).delete().eq("id", prediction_id).execute()
+        await execute_query(self.supabase.table(self.table).delete().eq("id", prediction_id))
         return True 
\ No newline at end of file
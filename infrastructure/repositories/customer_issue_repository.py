@@ -1,40 +1,62 @@
 from domain.repositories.customer_issue_repository_interface import CustomerIssueRepositoryInterface
 from domain.entities.customer_issue import CustomerIssue
+from domain.value_objects.batch_write_result import BatchWriteResult
+from domain.value_objects.page import Page, PageRequest, build_page
 from supabase import Client as SupabaseClient
+from infrastructure.repositories.pagination import apply_page_request
+from infrastructure.services.batch_writer import BatchWriter
+from infrastructure.services.query_executor import execute_query
 from typing import List, Optional
 from datetime import datetime
 
+SORT_COLUMNS = ("id", "created_at")
+FILTER_COLUMNS = ("customer_id", "client_region", "incident_title", "status", "churn_risk")
+DEFAULT_SORT = "id"
+# Columns a page request may project
+SELECTABLE_COLUMNS = ("id", "customer_id", "code_contrat", "client_type", "client_region", "client_categorie",
+                      "incident_title", "churn_risk", "status", "created_at", "updated_at")
+
 class CustomerIssueRepository(CustomerIssueRepositoryInterface):
     def __init__(self, supabase: SupabaseClient):
         self.supabase = supabase
         self.table = "customer_issues"
     
     async def get_all(self) -> List[CustomerIssue]:
-        response = self.supabase.table(self.table).select("*").execute()
+        response = await execute_query(self.supabase.table(self.table).select("*"))
         data = response.data or []
         return [CustomerIssue.from_dict(item) for item in data]
     
+    async def get_page(self, page_request: PageRequest) -> Page[CustomerIssue]:
+        query, sort_by = apply_page_request(
+            self.supabase.table(self.table), page_request, SORT_COLUMNS, FILTER_COLUMNS, DEFAULT_SORT, SELECTABLE_COLUMNS
+        )
+        response = await execute_query(query)
+        return build_page(response.data or [], page_request, sort_by, CustomerIssue.from_dict)
+    
     async def get_by_customer_id(self, customer_id: float) -> List[CustomerIssue]:
-        response = self.supabase.table(self.table).select("*").eq("customer_id", customer_id).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("customer_id", customer_id))
         data = response.data or []
         return [CustomerIssue.from_dict(item) for item in data]
     
     async def create(self, customer_issue: CustomerIssue) -> CustomerIssue:
         issue_dict = customer_issue.to_dict()
-        response = self.supabase.table(self.table).insert(issue_dict).execute()
+        response = await execute_query(self.supabase.table(self.table).insert(issue_dict))
         return CustomerIssue.from_dict(response.data[0])
     
-    async def batch_create(self, customer_issues: List[CustomerIssue]) -> List[CustomerIssue]:
-        """Insert multiple customer issues in batch"""
+    async def batch_create(self, customer_issues: List[CustomerIssue]) -> BatchWriteResult[CustomerIssue]:
+        """Insert multiple customer issues in concurrent chunks"""
         issues_data = [issue.to_dict() for issue in customer_issues]
-        response = self.supabase.table(self.table).insert(issues_data).execute()
+        return await BatchWriter().write(issues_data, self._insert_chunk)
+    
+    async def _insert_chunk(self, issues_data: List[dict]) -> List[CustomerIssue]:
+        response = await execute_query(self.supabase.table(self.table).insert(issues_data))
         return [CustomerIssue.from_dict(item) for item in response.data]
     
     async def update_by_customer_id_and_title(self, customer_id: float, incident_title: str, customer_issue: CustomerIssue) -> bool:
         issue_dict = customer_issue.to_dict()
-        response = self.supabase.table(self.table).update(issue_dict).eq("customer_id", customer_id).eq("incident_title", incident_title).execute()
+        response = await execute_query(self.supabase.table(self.table).update(issue_dict).eq("customer_id", customer_id).eq("incident_title", incident_title))
         return len(response.data) > 0
     
     async def delete_by_customer_id_and_title(self, customer_id: float, incident_title: str) -> bool:
-        response = self.supabase.table(self.table).delete().eq("customer_id", customer_id).eq("incident_title", incident_title).execute()
+        response = await execute_query(self.supabase.table(self.table).delete().eq("customer_id", customer_id).eq("incident_title", incident_title))
         return True 
\ No newline at end of file
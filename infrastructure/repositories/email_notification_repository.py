@@ -1,8 +1,19 @@
 from domain.repositories.email_notification_repository_interface import EmailNotificationRepositoryInterface
 from domain.entities.email_notification import EmailNotification, NotificationStatus
+from domain.value_objects.batch_write_result import BatchWriteResult
+from domain.value_objects.page import Page, PageRequest, build_page
 from supabase import Client as SupabaseClient
+from infrastructure.repositories.pagination import apply_page_request
+from infrastructure.services.batch_writer import BatchWriter
+from infrastructure.services.query_executor import execute_query
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
+
+SORT_COLUMNS = ("created_at", "id")
+FILTER_COLUMNS = ("status", "email")
+DEFAULT_SORT = "created_at"
+# Columns a page request may project
+SELECTABLE_COLUMNS = ("id", "email", "name", "issue", "status", "created_at", "updated_at", "sent_at")
 
 class EmailNotificationRepository(EmailNotificationRepositoryInterface):
     def __init__(self, supabase: SupabaseClient):
@@ -10,19 +21,26 @@ class EmailNotificationRepository(EmailNotificationRepositoryInterface):
         self.table = "email_notifications"
     
     async def get_all(self) -> List[EmailNotification]:
-        response = self.supabase.table(self.table).select("*").order("created_at", desc=True).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").order("created_at", desc=True))
         data = response.data or []
         return [EmailNotification.from_dict(item) for item in data]
     
+    async def get_page(self, page_request: PageRequest) -> Page[EmailNotification]:
+        query, sort_by = apply_page_request(
+            self.supabase.table(self.table), page_request, SORT_COLUMNS, FILTER_COLUMNS, DEFAULT_SORT, SELECTABLE_COLUMNS
+        )
+        response = await execute_query(query)
+        return build_page(response.data or [], page_request, sort_by, EmailNotification.from_dict)
+    
     async def get_by_id(self, notification_id: int) -> Optional[EmailNotification]:
-        response = self.supabase.table(self.table).select("*").eq("id", notification_id).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("id", notification_id))
         data = response.data
         if not data:
             return None
         return EmailNotification.from_dict(data[0])
     
     async def get_by_status(self, status: NotificationStatus) -> List[EmailNotification]:
-        response = self.supabase.table(self.table).select("*").eq("status", status.value).order("created_at", desc=True).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("status", status.value).order("created_at", desc=True))
         data = response.data or []
         return [EmailNotification.from_dict(item) for item in data]
     
@@ -37,11 +55,11 @@ class EmailNotificationRepository(EmailNotificationRepositoryInterface):
         if 'updated_at' in notification_dict:
             del notification_dict['updated_at']
         
-        response = self.supabase.table(self.table).insert(notification_dict).execute()
+        response = await execute_query(self.supabase.table(self.table).insert(notification_dict))
         return EmailNotification.from_dict(response.data[0])
     
-    async def batch_create(self, email_notifications: List[EmailNotification]) -> List[EmailNotification]:
-        """Insert multiple email notifications in batch"""
+    async def batch_create(self, email_notifications: List[EmailNotification]) -> BatchWriteResult[EmailNotification]:
+        """Insert multiple email notifications in concurrent chunks"""
         notifications_data = []
         for notification in email_notifications:
             notification_dict = notification.to_dict()
@@ -54,8 +72,10 @@ class EmailNotificationRepository(EmailNotificationRepositoryInterface):
             if 'updated_at' in notification_dict:
                 del notification_dict['updated_at']
             notifications_data.append(notification_dict)
-        
-        response = self.supabase.table(self.table).insert(notifications_data).execute()
+        return await BatchWriter().write(notifications_data, self._insert_chunk)
+    
+    async def _insert_chunk(self, notifications_data: List[dict]) -> List[EmailNotification]:
+        response = await execute_query(self.supabase.table(self.table).insert(notifications_data))
         return [EmailNotification.from_dict(item) for item in response.data]
     
     async def update(self, notification_id: int, email_notification: EmailNotification) -> Optional[EmailNotification]:
@@ -68,7 +88,7 @@ class EmailNotificationRepository(EmailNotificationRepositoryInterface):
         if 'updated_at' in notification_dict:
             del notification_dict['updated_at']
         
-        response = self.supabase.table(self.table).update(notification_dict).eq("id", notification_id).execute()
+        response = await execute_query(self.supabase.table(self.table).update(notification_dict).eq("id", notification_id))
         data = response.data
         if not data:
             return None
@@ -79,9 +99,29 @@ class EmailNotificationRepository(EmailNotificationRepositoryInterface):
         if sent_at:
             update_data["sent_at"] = sent_at.isoformat()
         
-        response = self.supabase.table(self.table).update(update_data).eq("id", notification_id).execute()
+        response = await execute_query(self.supabase.table(self.table).update(update_data).eq("id", notification_id))
         return len(response.data) > 0
     
+    async def claim_for_sending(self, notification_ids: List[int], statuses: List[NotificationStatus],
+                                stale_before: Optional[datetime] = None) -> List[EmailNotification]:
+        # updated_at marks when the claim was taken, for reclaiming stale ones
+        update_data = {"status": NotificationStatus.SENDING.value, "updated_at": datetime.now(timezone.utc).isoformat()}
+        query = self.supabase.table(self.table).update(update_data).in_("id", notification_ids)
+        status_filter = f"status.in.({','.join(status.value for status in statuses)})"
+        if stale_before:
+            status_filter += f",and(status.eq.{NotificationStatus.SENDING.value},updated_at.lt.{stale_before.isoformat()})"
+        query = query.or_(status_filter)
+        response = await execute_query(query)
+        return [EmailNotification.from_dict(item) for item in response.data]
+    
+    async def update_statuses(self, notification_ids: List[int], status: NotificationStatus, sent_at: Optional[datetime] = None) -> int:
+        update_data = {"status": status.value, "updated_at": datetime.now(timezone.utc).isoformat()}
+        if sent_at:
+            update_data["sent_at"] = sent_at.isoformat()
+        
+        response = await execute_query(self.supabase.table(self.table).update(update_data).in_("id", notification_ids))
+        return len(response.data)
+    
     async def delete(self, notification_id: int) -> bool:
-        self.supabase.table(self.table).delete().eq("id", notification_id).execute()
+        await execute_query(self.supabase.table(self.table).delete().eq("id", notification_id))
         return True 
\ No newline at end of file
@@ -1,6 +1,7 @@
 from domain.repositories.factor_repository_interface import FactorRepositoryInterface
 from domain.entities.factor import Factor
 from supabase import Client as SupabaseClient
+from infrastructure.services.query_executor import execute_query
 from typing import List, Optional
 from datetime import datetime
 import uuid
@@ -11,7 +12,7 @@ class FactorRepository(FactorRepositoryInterface):
         self.table = "factors"
     
     async def get_by_client_id(self, client_id: str) -> List[Factor]:
-        response = self.supabase.table(self.table).select("*").eq("clientId", client_id).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("clientId", client_id))
         data = response.data or []
         return [Factor.from_dict(item) for item in data]
     
@@ -20,9 +21,9 @@ class FactorRepository(FactorRepositoryInterface):
             factor.id = str(uuid.uuid4())
         factor.created_at = datetime.now()
         factor_dict = factor.to_dict()
-        self.supabase.table(self.table).insert(factor_dict).execute()
+        await execute_query(self.supabase.table(self.table).insert(factor_dict))
         return factor
     
     async def delete(self, factor_id: str) -> bool:
-        self.supabase.table(self.table).delete().eq("id", factor_id).execute()
+        await execute_query(self.supabase.table(self.table).delete().eq("id", factor_id))
         return True
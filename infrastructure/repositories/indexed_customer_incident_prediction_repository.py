@@ -0,0 +1,99 @@
+# In-process customer_id index for customer incident predictions
+#
+# Wraps another prediction repository and keeps the set of known customer_ids
+# in memory so duplicate detection for large CSV uploads is a set lookup.
+# The set is loaded on first use and updated on every create, update and
+# delete that goes through this process.
+#
+# The index is only trusted for negative answers: ids it reports as present
+# are confirmed against the database, so stale entries never reject a valid
+# upload. Rows inserted by other processes or concurrent uploads are not seen
+# here; those are still caught by the unique index on customer_id (migration
+# 0007), which fails the duplicate row's insert.
+from domain.repositories.customer_incident_prediction_repository_interface import CustomerIncidentPredictionRepositoryInterface
+from domain.entities.customer_incident_prediction import CustomerIncidentPrediction, IncidentType
+from domain.value_objects.batch_write_result import BatchWriteResult
+from domain.value_objects.page import Page, PageRequest
+from domain.value_objects.prediction_collection import PredictionCollection
+from typing import List, Optional, Set
+import asyncio
+import logging
+
+class IndexedCustomerIncidentPredictionRepository(CustomerIncidentPredictionRepositoryInterface):
+    def __init__(self, repository: CustomerIncidentPredictionRepositoryInterface):
+        self.repository = repository
+        self._customer_ids: Optional[Set[str]] = None
+        self._load_lock = asyncio.Lock()
+
+    async def _index(self) -> Set[str]:
+        if self._customer_ids is None:
+            async with self._load_lock:
+                if self._customer_ids is None:
+                    self._customer_ids = await self.repository.get_all_customer_ids()
+                    logging.info(f"Loaded customer_id index with {len(self._customer_ids)} entries")
+        return self._customer_ids
+
+    def _add(self, predictions: List[CustomerIncidentPrediction]) -> None:
+        if self._customer_ids is not None:
+            self._customer_ids.update(prediction.customer_id for prediction in predictions if prediction.customer_id)
+
+    def _discard(self, customer_id: Optional[str]) -> None:
+        if self._customer_ids is not None and customer_id:
+            self._customer_ids.discard(customer_id)
+
+    async def get_existing_customer_ids(self, customer_ids: List[str]) -> Set[str]:
+        index = await self._index()
+        candidates = [customer_id for customer_id in set(customer_ids) if customer_id in index]
+        if not candidates:
+            return set()
+        return await self.repository.get_existing_customer_ids(candidates)
+
+    async def get_all_customer_ids(self) -> Set[str]:
+        return set(await self._index())
+
+    async def get_all(self) -> PredictionCollection:
+        return await self.repository.get_all()
+
+    async def get_page(self, page_request: PageRequest) -> Page[CustomerIncidentPrediction]:
+        return await self.repository.get_page(page_request)
+
+    async def get_by_id(self, prediction_id: int) -> Optional[CustomerIncidentPrediction]:
+        return await self.repository.get_by_id(prediction_id)
+
+    async def get_by_customer_id(self, customer_id: str) -> Optional[CustomerIncidentPrediction]:
+        return await self.repository.get_by_customer_id(customer_id)
+
+    async def get_by_region(self, client_region: str) -> PredictionCollection:
+        return await self.repository.get_by_region(client_region)
+
+    async def get_by_incident_type(self, incident_type: IncidentType) -> PredictionCollection:
+        return await self.repository.get_by_incident_type(incident_type)
+
+    async def get_by_risk_level(self, min_avg_risk: float) -> PredictionCollection:
+        return await self.repository.get_by_risk_level(min_avg_risk)
+
+    async def create(self, prediction: CustomerIncidentPrediction) -> CustomerIncidentPrediction:
+        created = await self.repository.create(prediction)
+        self._add([created])
+        return created
+
+    async def batch_create(self, predictions: List[CustomerIncidentPrediction]) -> BatchWriteResult[CustomerIncidentPrediction]:
+        result = await self.repository.batch_create(predictions)
+        self._add(result.created)
+        return result
+
+    async def update(self, prediction_id: int, prediction: CustomerIncidentPrediction) -> Optional[CustomerIncidentPrediction]:
+        existing = await self.repository.get_by_id(prediction_id) if self._customer_ids is not None else None
+        updated = await self.repository.update(prediction_id, prediction)
+        if updated:
+            if existing and existing.customer_id != updated.customer_id:
+                self._discard(existing.customer_id)
+            self._add([updated])
+        return updated
+
+    async def delete(self, prediction_id: int) -> bool:
+        existing = await self.repository.get_by_id(prediction_id) if self._customer_ids is not None else None
+        deleted = await self.repository.delete(prediction_id)
+        if deleted and existing:
+            self._discard(existing.customer_id)
+        return deleted
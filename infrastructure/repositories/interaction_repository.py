@@ -1,6 +1,7 @@
 from domain.repositories.interaction_repository_interface import InteractionRepositoryInterface
 from domain.entities.interaction import Interaction
 from supabase import Client as SupabaseClient
+from infrastructure.services.query_executor import execute_query
 from typing import List, Optional
 from datetime import datetime
 import uuid
@@ -11,7 +12,7 @@ class InteractionRepository(InteractionRepositoryInterface):
         self.table = "interactions"
     
     async def get_by_client_id(self, client_id: str) -> List[Interaction]:
-        response = self.supabase.table(self.table).select("*").eq("clientId", client_id).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("clientId", client_id))
         data = response.data or []
         return [Interaction.from_dict(item) for item in data]
     
@@ -20,9 +21,9 @@ class InteractionRepository(InteractionRepositoryInterface):
             interaction.id = str(uuid.uuid4())
         interaction.created_at = datetime.now()
         interaction_dict = interaction.to_dict()
-        self.supabase.table(self.table).insert(interaction_dict).execute()
+        await execute_query(self.supabase.table(self.table).insert(interaction_dict))
         return interaction
     
     async def delete(self, interaction_id: str) -> bool:
-        self.supabase.table(self.table).delete().eq("id", interaction_id).execute()
+        await execute_query(self.supabase.table(self.table).delete().eq("id", interaction_id))
         return True
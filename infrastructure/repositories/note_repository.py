@@ -1,6 +1,7 @@
 from domain.repositories.note_repository_interface import NoteRepositoryInterface
 from domain.entities.note import Note
 from supabase import Client
+from infrastructure.services.query_executor import execute_query
 from typing import List, Optional
 from datetime import datetime
 
@@ -10,20 +11,20 @@ class NoteRepository(NoteRepositoryInterface):
         self.table = "notes"
     
     async def get_by_id(self, note_id: str) -> Optional[Note]:
-        response = self.supabase.table(self.table).select("*").eq("id", note_id).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("id", note_id))
         data = response.data
         if not data:
             return None
         return Note.from_dict(data[0])
     
     async def get_by_sender_id(self, sender_id: str) -> List[Note]:
-        response = self.supabase.table(self.table).select("*").eq("sender_id", sender_id).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("sender_id", sender_id))
         data = response.data
         return [Note.from_dict(item) for item in data]
     
     async def get_by_recipient(self, role: str) -> List[Note]:
         # Use ?in Supabase operator to check if role is in the recipients array
-        response = self.supabase.table(self.table).select("*").contains("recipients", [role]).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").contains("recipients", [role]))
         data = response.data
         return [Note.from_dict(item) for item in data]
     
@@ -41,9 +42,10 @@ class NoteRepository(NoteRepositoryInterface):
         payload = note.to_dict()
         payload.pop("id", None)
         # Insert & return the full row (including generated id)
-        response = self.supabase.table(self.table) \
-            .insert(payload, returning="representation") \
-            .execute()
+        response = await execute_query(
+            self.supabase.table(self.table)
+            .insert(payload, returning="representation")
+        )
         inserted_rows = response.data or []
         if not inserted_rows:
             raise Exception("Failed to insert note")
@@ -53,13 +55,13 @@ class NoteRepository(NoteRepositoryInterface):
     
     async def update(self, note: Note) -> Note:
         note_dict = note.to_dict()
-        self.supabase.table(self.table).update(note_dict).eq("id", note.id).execute()
+        await execute_query(self.supabase.table(self.table).update(note_dict).eq("id", note.id))
         return note
     
     async def delete(self, note_id: str) -> bool:
-        self.supabase.table(self.table).delete().eq("id", note_id).execute()
+        await execute_query(self.supabase.table(self.table).delete().eq("id", note_id))
         return True
     
     async def mark_as_read(self, note_id: str) -> bool:
-        self.supabase.table(self.table).update({"is_read": True}).eq("id", note_id).execute()
+        await execute_query(self.supabase.table(self.table).update({"is_read": True}).eq("id", note_id))
         return True 
\ No newline at end of file
@@ -0,0 +1,43 @@
+# Keyset pagination for PostgREST queries
+#
+# Pages are ordered by (sort column, id) and the cursor carries the values of
+# the last row, so each page is an index range scan instead of an OFFSET.
+from typing import Any, Sequence, Tuple
+from domain.value_objects.page import PageRequest, decode_cursor
+
+def _quote(value: Any) -> str:
+    """Quote a value for use inside a PostgREST logical filter"""
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+def apply_page_request(table_query, page_request: PageRequest, sort_columns: Sequence[str],
+                       filter_columns: Sequence[str], default_sort: str,
+                       selectable_columns: Sequence[str]) -> Tuple[Any, str]:
+    """Build the select for one page on a table query builder
+
+    Projection, filters, keyset predicate, ordering and limit are all pushed
+    down to PostgREST. Returns the query and the resolved sort column.
+    """
+    sort_by = page_request.resolve_sort(sort_columns, default_sort)
+    query = table_query.select(",".join(page_request.resolve_columns(selectable_columns, sort_by)))
+    for column, operator, value in page_request.resolve_filters(filter_columns):
+        if operator == "in":
+            query = query.in_(column, list(value))
+        else:
+            query = query.filter(column, operator, value)
+
+    operator = "lt" if page_request.descending else "gt"
+    if page_request.cursor:
+        last_value, last_id = decode_cursor(page_request.cursor, sort_by, page_request.descending)
+        if sort_by == "id":
+            query = query.filter("id", operator, last_id)
+        else:
+            query = query.or_(
+                f"{sort_by}.{operator}.{_quote(last_value)},"
+                f"and({sort_by}.eq.{_quote(last_value)},id.{operator}.{_quote(last_id)})"
+            )
+
+    query = query.order(sort_by, desc=page_request.descending)
+    if sort_by != "id":
+        query = query.order("id", desc=page_request.descending)
+    return query.limit(page_request.limit + 1), sort_by
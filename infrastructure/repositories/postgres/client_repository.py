@@ -0,0 +1,153 @@
+from domain.repositories.client_repository_interface import ClientRepositoryInterface
+from domain.entities.client import Client
+from domain.entities.factor import Factor
+from domain.entities.interaction import Interaction
+from domain.entities.recommendation import Recommendation
+from domain.value_objects.client_detail import ClientDetail
+from domain.value_objects.page import Page, PageRequest, build_page
+from infrastructure.repositories.postgres.pagination import build_page_query
+from infrastructure.repositories.postgres.records import record_to_dict, to_text
+from infrastructure.services.postgres_pool import get_postgres_pool
+from typing import List, Optional
+from datetime import datetime
+import asyncpg
+import logging
+import uuid
+
+SELECT_ALL = "SELECT * FROM clients"
+SELECT_BY_ID = "SELECT * FROM clients WHERE id = $1"
+# Clients with their child rows aggregated in the same query
+SELECT_DETAILS_BY_IDS = """
+SELECT c.*,
+    COALESCE((
+        SELECT json_agg(json_build_object(
+            'id', i.id, 'clientId', i.clientid, 'type', i.type, 'date', i.date,
+            'details', i.details, 'created_at', i.created_at))
+        FROM interactions i WHERE i.clientid = c.id
+    ), '[]'::json) AS interactions,
+    COALESCE((
+        SELECT json_agg(json_build_object(
+            'id', r.id, 'clientId', r.clientid, 'title', r.title, 'impact', r.impact,
+            'details', r.details, 'created_at', r.created_at))
+        FROM recommendations r WHERE r.clientid = c.id
+    ), '[]'::json) AS recommendations,
+    COALESCE((
+        SELECT json_agg(json_build_object(
+            'id', f.id, 'clientId', f.clientid, 'name', f.name, 'percentage', f.percentage,
+            'created_at', f.created_at))
+        FROM factors f WHERE f.clientid = c.id
+    ), '[]'::json) AS factors
+FROM clients c
+WHERE c.id = ANY($1::uuid[])
+"""
+INSERT = """
+INSERT INTO clients (id, name, segment, since, churn_risk, contacts, monthly_revenue,
+                     churn_trend, churn_trend_days, created_at, updated_at)
+VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+"""
+UPDATE = """
+UPDATE clients
+SET name = $2, segment = $3, since = $4, churn_risk = $5, contacts = $6,
+    monthly_revenue = $7, churn_trend = $8, churn_trend_days = $9, updated_at = NOW()
+WHERE id = $1
+RETURNING *
+"""
+DELETE = "DELETE FROM clients WHERE id = $1"
+
+SORT_COLUMNS = ("created_at", "name", "segment")
+FILTER_COLUMNS = ("name", "segment", "churn_risk")
+DEFAULT_SORT = "created_at"
+# Columns a page request may project
+SELECTABLE_COLUMNS = ("id", "name", "segment", "since", "churn_risk", "contacts", "monthly_revenue",
+                      "churn_trend", "churn_trend_days", "created_at", "updated_at")
+COLUMN_TYPES = {
+    "id": "uuid",
+    "created_at": "timestamptz",
+    "name": "text",
+    "segment": "text",
+    "churn_risk": "text"
+}
+
+class PostgresClientRepository(ClientRepositoryInterface):
+    async def get_all(self) -> List[Client]:
+        records = await get_postgres_pool().fetch(SELECT_ALL)
+        return [Client.from_dict(record_to_dict(record)) for record in records]
+
+    async def get_page(self, page_request: PageRequest) -> Page[Client]:
+        sql, args, sort_by = build_page_query(
+            "clients", page_request, COLUMN_TYPES, SORT_COLUMNS, FILTER_COLUMNS, DEFAULT_SORT,
+            SELECTABLE_COLUMNS
+        )
+        records = await get_postgres_pool().fetch(sql, *args)
+        return build_page([record_to_dict(record) for record in records], page_request, sort_by, Client.from_dict)
+
+    async def get_by_id(self, client_id: str) -> Optional[Client]:
+        record = await get_postgres_pool().fetchrow(SELECT_BY_ID, client_id)
+        if not record:
+            return None
+        return Client.from_dict(record_to_dict(record))
+
+    async def get_details_by_ids(self, client_ids: List[str]) -> List[ClientDetail]:
+        ids = list(dict.fromkeys(client_ids))
+        if not ids:
+            return []
+        records = await get_postgres_pool().fetch(SELECT_DETAILS_BY_IDS, ids)
+        details = {}
+        for record in records:
+            row = record_to_dict(record)
+            interactions = row.pop("interactions")
+            recommendations = row.pop("recommendations")
+            factors = row.pop("factors")
+            details[row["id"]] = ClientDetail(
+                client=Client.from_dict(row),
+                interactions=[Interaction.from_dict(item) for item in interactions],
+                recommendations=[Recommendation.from_dict(item) for item in recommendations],
+                factors=[Factor.from_dict(item) for item in factors]
+            )
+        return [details[client_id] for client_id in ids if client_id in details]
+
+    async def create(self, client: Client) -> Client:
+        if not client.id:
+            client.id = str(uuid.uuid4())
+        client.created_at = datetime.now()
+        client.updated_at = None
+        row = client.to_dict()
+        await get_postgres_pool().execute(
+            INSERT,
+            client.id,
+            client.name,
+            client.segment,
+            client.since,
+            to_text(client.churn_risk),
+            row["contacts"],
+            to_text(client.monthly_revenue),
+            client.churn_trend,
+            client.churn_trend_days,
+            client.created_at,
+            client.updated_at
+        )
+        return client
+
+    async def update(self, client_id: str, client: Client) -> Client:
+        row = client.to_dict()
+        record = await get_postgres_pool().fetchrow(
+            UPDATE,
+            client_id,
+            client.name,
+            client.segment,
+            client.since,
+            to_text(client.churn_risk),
+            row["contacts"],
+            to_text(client.monthly_revenue),
+            client.churn_trend,
+            client.churn_trend_days
+        )
+        return Client.from_dict(record_to_dict(record))
+
+    async def delete(self, client_id: str) -> bool:
+        try:
+            status = await get_postgres_pool().execute(DELETE, client_id)
+        except asyncpg.ForeignKeyViolationError as e:
+            logging.warning(f"Client {client_id} not deleted, it still has child rows: {str(e)}")
+            return False
+        return status != "DELETE 0"
@@ -0,0 +1,154 @@
+from domain.repositories.customer_incident_prediction_repository_interface import CustomerIncidentPredictionRepositoryInterface
+from domain.entities.customer_incident_prediction import CustomerIncidentPrediction, IncidentType
+from domain.value_objects.batch_write_result import BatchWriteResult
+from domain.value_objects.page import Page, PageRequest, build_page
+from domain.value_objects.prediction_collection import PredictionCollection
+from infrastructure.repositories.postgres.pagination import build_page_query
+from infrastructure.repositories.postgres.records import record_to_dict, to_text
+from infrastructure.services.batch_writer import BatchWriter
+from infrastructure.services.postgres_pool import get_postgres_pool
+from typing import Any, List, Optional, Set
+import asyncpg
+
+SELECT_ALL = "SELECT * FROM customer_incident_predictions ORDER BY created_at DESC"
+SELECT_BY_ID = "SELECT * FROM customer_incident_predictions WHERE id = $1"
+SELECT_BY_CUSTOMER_ID = "SELECT * FROM customer_incident_predictions WHERE customer_id = $1 LIMIT 1"
+SELECT_EXISTING_CUSTOMER_IDS = "SELECT DISTINCT customer_id FROM customer_incident_predictions WHERE customer_id = ANY($1::text[])"
+SELECT_ALL_CUSTOMER_IDS = "SELECT DISTINCT customer_id FROM customer_incident_predictions WHERE customer_id IS NOT NULL"
+SELECT_BY_REGION = "SELECT * FROM customer_incident_predictions WHERE client_region = $1 ORDER BY created_at DESC"
+SELECT_BY_INCIDENT_TYPE = "SELECT * FROM customer_incident_predictions WHERE most_likely_incident = $1 ORDER BY created_at DESC"
+SELECT_BY_MIN_RISK = """
+SELECT * FROM customer_incident_predictions
+WHERE avg_risk >= $1
+ORDER BY avg_risk DESC, id DESC
+"""
+INSERT = """
+INSERT INTO customer_incident_predictions (customer_id, client_region, client_type, client_category,
+                                           q1_prediction, q2_prediction, q3_prediction, q4_prediction,
+                                           most_likely_incident, recommendation)
+VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+RETURNING *
+"""
+BATCH_INSERT = """
+INSERT INTO customer_incident_predictions (customer_id, client_region, client_type, client_category,
+                                           q1_prediction, q2_prediction, q3_prediction, q4_prediction,
+                                           most_likely_incident, recommendation)
+SELECT * FROM unnest($1::text[], $2::text[], $3::text[], $4::text[],
+                     $5::float8[], $6::float8[], $7::float8[], $8::float8[],
+                     $9::text[], $10::text[])
+RETURNING *
+"""
+UPDATE = """
+UPDATE customer_incident_predictions
+SET customer_id = $2, client_region = $3, client_type = $4, client_category = $5,
+    q1_prediction = $6, q2_prediction = $7, q3_prediction = $8, q4_prediction = $9,
+    most_likely_incident = $10, recommendation = $11, updated_at = NOW()
+WHERE id = $1
+RETURNING *
+"""
+DELETE = "DELETE FROM customer_incident_predictions WHERE id = $1"
+
+SORT_COLUMNS = ("created_at", "id", "customer_id", "avg_risk")
+FILTER_COLUMNS = ("customer_id", "client_region", "client_type", "most_likely_incident", "avg_risk", "risk_level")
+DEFAULT_SORT = "created_at"
+# Columns a page request may project
+SELECTABLE_COLUMNS = ("id", "customer_id", "client_region", "client_type", "client_category",
+                      "q1_prediction", "q2_prediction", "q3_prediction", "q4_prediction",
+                      "most_likely_incident", "recommendation", "created_at", "updated_at",
+                      "avg_risk", "risk_level")
+COLUMN_TYPES = {
+    "id": "integer",
+    "created_at": "timestamptz",
+    "customer_id": "text",
+    "client_region": "text",
+    "client_type": "text",
+    "most_likely_incident": "text",
+    "avg_risk": "float8",
+    "risk_level": "text"
+}
+
+def _values(prediction: CustomerIncidentPrediction) -> List[Any]:
+    return [
+        prediction.customer_id,
+        prediction.client_region,
+        prediction.client_type,
+        to_text(prediction.client_category),
+        prediction.q1_prediction,
+        prediction.q2_prediction,
+        prediction.q3_prediction,
+        prediction.q4_prediction,
+        prediction.most_likely_incident.value,
+        prediction.recommendation
+    ]
+
+class PostgresCustomerIncidentPredictionRepository(CustomerIncidentPredictionRepositoryInterface):
+    async def get_all(self) -> PredictionCollection:
+        records = await get_postgres_pool().fetch(SELECT_ALL)
+        return PredictionCollection.from_rows(records)
+
+    async def get_page(self, page_request: PageRequest) -> Page[CustomerIncidentPrediction]:
+        sql, args, sort_by = build_page_query(
+            "customer_incident_predictions", page_request, COLUMN_TYPES, SORT_COLUMNS, FILTER_COLUMNS, DEFAULT_SORT,
+            SELECTABLE_COLUMNS
+        )
+        records = await get_postgres_pool().fetch(sql, *args)
+        return build_page([record_to_dict(record) for record in records], page_request, sort_by, CustomerIncidentPrediction.from_dict)
+
+    async def get_by_id(self, prediction_id: int) -> Optional[CustomerIncidentPrediction]:
+        record = await get_postgres_pool().fetchrow(SELECT_BY_ID, prediction_id)
+        if not record:
+            return None
+        return CustomerIncidentPrediction.from_dict(record_to_dict(record))
+
+    async def get_by_customer_id(self, customer_id: str) -> Optional[CustomerIncidentPrediction]:
+        record = await get_postgres_pool().fetchrow(SELECT_BY_CUSTOMER_ID, customer_id)
+        if not record:
+            return None
+        return CustomerIncidentPrediction.from_dict(record_to_dict(record))
+
+    async def get_existing_customer_ids(self, customer_ids: List[str]) -> Set[str]:
+        # A single array parameter, so no chunking is needed
+        records = await get_postgres_pool().fetch(SELECT_EXISTING_CUSTOMER_IDS, list(set(customer_ids)))
+        return {record["customer_id"] for record in records}
+
+    async def get_all_customer_ids(self) -> Set[str]:
+        records = await get_postgres_pool().fetch(SELECT_ALL_CUSTOMER_IDS)
+        return {record["customer_id"] for record in records}
+
+    async def get_by_region(self, client_region: str) -> PredictionCollection:
+        records = await get_postgres_pool().fetch(SELECT_BY_REGION, client_region)
+        return PredictionCollection.from_rows(records)
+
+    async def get_by_incident_type(self, incident_type: IncidentType) -> PredictionCollection:
+        records = await get_postgres_pool().fetch(SELECT_BY_INCIDENT_TYPE, incident_type.value)
+        return PredictionCollection.from_rows(records)
+
+    async def get_by_risk_level(self, min_avg_risk: float) -> PredictionCollection:
+        records = await get_postgres_pool().fetch(SELECT_BY_MIN_RISK, min_avg_risk)
+        return PredictionCollection.from_rows(records)
+
+    async def create(self, prediction: CustomerIncidentPrediction) -> CustomerIncidentPrediction:
+        record = await get_postgres_pool().fetchrow(INSERT, *_values(prediction))
+        return CustomerIncidentPrediction.from_dict(record_to_dict(record))
+
+    async def batch_create(self, predictions: List[CustomerIncidentPrediction]) -> BatchWriteResult[CustomerIncidentPrediction]:
+        """Insert multiple customer incident predictions, one statement per chunk"""
+        return await BatchWriter().write([_values(prediction) for prediction in predictions], self._insert_chunk)
+
+    async def _insert_chunk(self, rows: List[List[Any]]) -> List[CustomerIncidentPrediction]:
+        columns = [list(column) for column in zip(*rows)]
+        try:
+            records = await get_postgres_pool().fetch(BATCH_INSERT, *columns)
+        except asyncpg.UniqueViolationError as e:
+            raise ValueError("Duplicate customer_id found. Each customer_id must be unique in the database.") from e
+        return [CustomerIncidentPrediction.from_dict(record_to_dict(record)) for record in records]
+
+    async def update(self, prediction_id: int, prediction: CustomerIncidentPrediction) -> Optional[CustomerIncidentPrediction]:
+        record = await get_postgres_pool().fetchrow(UPDATE, prediction_id, *_values(prediction))
+        if not record:
+            return None
+        return CustomerIncidentPrediction.from_dict(record_to_dict(record))
+
+    async def delete(self, prediction_id: int) -> bool:
+        await get_postgres_pool().execute(DELETE, prediction_id)
+        return True
@@ -0,0 +1,101 @@
+from domain.repositories.customer_issue_repository_interface import CustomerIssueRepositoryInterface
+from domain.entities.customer_issue import CustomerIssue
+from domain.value_objects.batch_write_result import BatchWriteResult
+from domain.value_objects.page import Page, PageRequest, build_page
+from infrastructure.repositories.postgres.pagination import build_page_query
+from infrastructure.repositories.postgres.records import record_to_dict
+from infrastructure.services.batch_writer import BatchWriter
+from infrastructure.services.postgres_pool import get_postgres_pool
+from typing import Any, List
+
+SELECT_ALL = "SELECT * FROM customer_issues"
+SELECT_BY_CUSTOMER_ID = "SELECT * FROM customer_issues WHERE customer_id = $1"
+INSERT = """
+INSERT INTO customer_issues (customer_id, code_contrat, client_type, client_region,
+                             client_categorie, incident_title, churn_risk, status)
+VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+RETURNING *
+"""
+BATCH_INSERT = """
+INSERT INTO customer_issues (customer_id, code_contrat, client_type, client_region,
+                             client_categorie, incident_title, churn_risk, status)
+SELECT * FROM unnest($1::float8[], $2::float8[], $3::float8[], $4::float8[],
+                     $5::float8[], $6::text[], $7::float8[], $8::text[])
+RETURNING *
+"""
+UPDATE_BY_CUSTOMER_ID_AND_TITLE = """
+UPDATE customer_issues
+SET customer_id = $3, code_contrat = $4, client_type = $5, client_region = $6,
+    client_categorie = $7, incident_title = $8, churn_risk = $9, status = $10, updated_at = NOW()
+WHERE customer_id = $1 AND incident_title = $2
+RETURNING id
+"""
+DELETE_BY_CUSTOMER_ID_AND_TITLE = "DELETE FROM customer_issues WHERE customer_id = $1 AND incident_title = $2"
+
+SORT_COLUMNS = ("id", "created_at")
+FILTER_COLUMNS = ("customer_id", "client_region", "incident_title", "status", "churn_risk")
+DEFAULT_SORT = "id"
+# Columns a page request may project
+SELECTABLE_COLUMNS = ("id", "customer_id", "code_contrat", "client_type", "client_region", "client_categorie",
+                      "incident_title", "churn_risk", "status", "created_at", "updated_at")
+COLUMN_TYPES = {
+    "id": "integer",
+    "created_at": "timestamptz",
+    "customer_id": "float8",
+    "client_region": "float8",
+    "incident_title": "text",
+    "status": "text",
+    "churn_risk": "float8"
+}
+
+def _values(customer_issue: CustomerIssue) -> List[Any]:
+    return [
+        customer_issue.customer_id,
+        customer_issue.code_contrat,
+        customer_issue.client_type,
+        customer_issue.client_region,
+        customer_issue.client_categorie,
+        customer_issue.incident_title,
+        customer_issue.churn_risk,
+        customer_issue.status
+    ]
+
+class PostgresCustomerIssueRepository(CustomerIssueRepositoryInterface):
+    async def get_all(self) -> List[CustomerIssue]:
+        records = await get_postgres_pool().fetch(SELECT_ALL)
+        return [CustomerIssue.from_dict(record_to_dict(record)) for record in records]
+
+    async def get_page(self, page_request: PageRequest) -> Page[CustomerIssue]:
+        sql, args, sort_by = build_page_query(
+            "customer_issues", page_request, COLUMN_TYPES, SORT_COLUMNS, FILTER_COLUMNS, DEFAULT_SORT,
+            SELECTABLE_COLUMNS
+        )
+        records = await get_postgres_pool().fetch(sql, *args)
+        return build_page([record_to_dict(record) for record in records], page_request, sort_by, CustomerIssue.from_dict)
+
+    async def get_by_customer_id(self, customer_id: float) -> List[CustomerIssue]:
+        records = await get_postgres_pool().fetch(SELECT_BY_CUSTOMER_ID, customer_id)
+        return [CustomerIssue.from_dict(record_to_dict(record)) for record in records]
+
+    async def create(self, customer_issue: CustomerIssue) -> CustomerIssue:
+        record = await get_postgres_pool().fetchrow(INSERT, *_values(customer_issue))
+        return CustomerIssue.from_dict(record_to_dict(record))
+
+    async def batch_create(self, customer_issues: List[CustomerIssue]) -> BatchWriteResult[CustomerIssue]:
+        """Insert multiple customer issues, one statement per chunk"""
+        return await BatchWriter().write([_values(issue) for issue in customer_issues], self._insert_chunk)
+
+    async def _insert_chunk(self, rows: List[List[Any]]) -> List[CustomerIssue]:
+        columns = [list(column) for column in zip(*rows)]
+        records = await get_postgres_pool().fetch(BATCH_INSERT, *columns)
+        return [CustomerIssue.from_dict(record_to_dict(record)) for record in records]
+
+    async def update_by_customer_id_and_title(self, customer_id: float, incident_title: str, customer_issue: CustomerIssue) -> bool:
+        records = await get_postgres_pool().fetch(
+            UPDATE_BY_CUSTOMER_ID_AND_TITLE, customer_id, incident_title, *_values(customer_issue)
+        )
+        return len(records) > 0
+
+    async def delete_by_customer_id_and_title(self, customer_id: float, incident_title: str) -> bool:
+        await get_postgres_pool().execute(DELETE_BY_CUSTOMER_ID_AND_TITLE, customer_id, incident_title)
+        return True
@@ -0,0 +1,144 @@
+from domain.repositories.email_notification_repository_interface import EmailNotificationRepositoryInterface
+from domain.entities.email_notification import EmailNotification, NotificationStatus
+from domain.value_objects.batch_write_result import BatchWriteResult
+from domain.value_objects.page import Page, PageRequest, build_page
+from infrastructure.repositories.postgres.pagination import build_page_query
+from infrastructure.repositories.postgres.records import record_to_dict
+from infrastructure.services.batch_writer import BatchWriter
+from infrastructure.services.postgres_pool import get_postgres_pool
+from typing import List, Optional
+from datetime import datetime
+
+SELECT_ALL = "SELECT * FROM email_notifications ORDER BY created_at DESC"
+SELECT_BY_ID = "SELECT * FROM email_notifications WHERE id = $1"
+SELECT_BY_STATUS = "SELECT * FROM email_notifications WHERE status = $1 ORDER BY created_at DESC"
+INSERT = """
+INSERT INTO email_notifications (email, name, issue, status, sent_at)
+VALUES ($1, $2, $3, $4, $5)
+RETURNING *
+"""
+BATCH_INSERT = """
+INSERT INTO email_notifications (email, name, issue, status, sent_at)
+SELECT * FROM unnest($1::text[], $2::text[], $3::text[], $4::text[], $5::timestamptz[])
+RETURNING *
+"""
+UPDATE = """
+UPDATE email_notifications
+SET email = $2, name = $3, issue = $4, status = $5, sent_at = $6, updated_at = NOW()
+WHERE id = $1
+RETURNING *
+"""
+UPDATE_STATUS = """
+UPDATE email_notifications
+SET status = $2, sent_at = COALESCE($3, sent_at), updated_at = NOW()
+WHERE id = $1
+RETURNING id
+"""
+CLAIM_FOR_SENDING = """
+UPDATE email_notifications
+SET status = 'sending', updated_at = NOW()
+WHERE id = ANY($1::int[])
+  AND (status = ANY($2::text[]) OR (status = 'sending' AND updated_at < $3::timestamptz))
+RETURNING *
+"""
+UPDATE_STATUSES = """
+UPDATE email_notifications
+SET status = $2, sent_at = COALESCE($3, sent_at), updated_at = NOW()
+WHERE id = ANY($1::int[])
+RETURNING id
+"""
+DELETE = "DELETE FROM email_notifications WHERE id = $1"
+
+SORT_COLUMNS = ("created_at", "id")
+FILTER_COLUMNS = ("status", "email")
+DEFAULT_SORT = "created_at"
+# Columns a page request may project
+SELECTABLE_COLUMNS = ("id", "email", "name", "issue", "status", "created_at", "updated_at", "sent_at")
+COLUMN_TYPES = {
+    "id": "integer",
+    "created_at": "timestamptz",
+    "status": "text",
+    "email": "text"
+}
+
+class PostgresEmailNotificationRepository(EmailNotificationRepositoryInterface):
+    async def get_all(self) -> List[EmailNotification]:
+        records = await get_postgres_pool().fetch(SELECT_ALL)
+        return [EmailNotification.from_dict(record_to_dict(record)) for record in records]
+
+    async def get_page(self, page_request: PageRequest) -> Page[EmailNotification]:
+        sql, args, sort_by = build_page_query(
+            "email_notifications", page_request, COLUMN_TYPES, SORT_COLUMNS, FILTER_COLUMNS, DEFAULT_SORT,
+            SELECTABLE_COLUMNS
+        )
+        records = await get_postgres_pool().fetch(sql, *args)
+        return build_page([record_to_dict(record) for record in records], page_request, sort_by, EmailNotification.from_dict)
+
+    async def get_by_id(self, notification_id: int) -> Optional[EmailNotification]:
+        record = await get_postgres_pool().fetchrow(SELECT_BY_ID, notification_id)
+        if not record:
+            return None
+        return EmailNotification.from_dict(record_to_dict(record))
+
+    async def get_by_status(self, status: NotificationStatus) -> List[EmailNotification]:
+        records = await get_postgres_pool().fetch(SELECT_BY_STATUS, status.value)
+        return [EmailNotification.from_dict(record_to_dict(record)) for record in records]
+
+    async def create(self, email_notification: EmailNotification) -> EmailNotification:
+        record = await get_postgres_pool().fetchrow(
+            INSERT,
+            email_notification.email,
+            email_notification.name,
+            email_notification.issue,
+            email_notification.status.value,
+            email_notification.sent_at
+        )
+        return EmailNotification.from_dict(record_to_dict(record))
+
+    async def batch_create(self, email_notifications: List[EmailNotification]) -> BatchWriteResult[EmailNotification]:
+        """Insert multiple email notifications, one statement per chunk"""
+        return await BatchWriter().write(email_notifications, self._insert_chunk)
+
+    async def _insert_chunk(self, email_notifications: List[EmailNotification]) -> List[EmailNotification]:
+        records = await get_postgres_pool().fetch(
+            BATCH_INSERT,
+            [notification.email for notification in email_notifications],
+            [notification.name for notification in email_notifications],
+            [notification.issue for notification in email_notifications],
+            [notification.status.value for notification in email_notifications],
+            [notification.sent_at for notification in email_notifications]
+        )
+        return [EmailNotification.from_dict(record_to_dict(record)) for record in records]
+
+    async def update(self, notification_id: int, email_notification: EmailNotification) -> Optional[EmailNotification]:
+        record = await get_postgres_pool().fetchrow(
+            UPDATE,
+            notification_id,
+            email_notification.email,
+            email_notification.name,
+            email_notification.issue,
+            email_notification.status.value,
+            email_notification.sent_at
+        )
+        if not record:
+            return None
+        return EmailNotification.from_dict(record_to_dict(record))
+
+    async def update_status(self, notification_id: int, status: NotificationStatus, sent_at: Optional[datetime] = None) -> bool:
+        record = await get_postgres_pool().fetchrow(UPDATE_STATUS, notification_id, status.value, sent_at)
+        return record is not None
+
+    async def claim_for_sending(self, notification_ids: List[int], statuses: List[NotificationStatus],
+                                stale_before: Optional[datetime] = None) -> List[EmailNotification]:
+        records = await get_postgres_pool().fetch(
+            CLAIM_FOR_SENDING, notification_ids, [status.value for status in statuses], stale_before
+        )
+        return [EmailNotification.from_dict(record_to_dict(record)) for record in records]
+
+    async def update_statuses(self, notification_ids: List[int], status: NotificationStatus, sent_at: Optional[datetime] = None) -> int:
+        records = await get_postgres_pool().fetch(UPDATE_STATUSES, notification_ids, status.value, sent_at)
+        return len(records)
+
+    async def delete(self, notification_id: int) -> bool:
+        await get_postgres_pool().execute(DELETE, notification_id)
+        return True
@@ -0,0 +1,33 @@
+from domain.repositories.factor_repository_interface import FactorRepositoryInterface
+from domain.entities.factor import Factor
+from infrastructure.repositories.postgres.records import record_to_dict
+from infrastructure.services.postgres_pool import get_postgres_pool
+from typing import List
+from datetime import datetime
+import uuid
+
+SELECT_BY_CLIENT_ID = """
+SELECT id, clientId AS "clientId", name, percentage, created_at
+FROM factors
+WHERE clientId = $1
+"""
+INSERT = "INSERT INTO factors (id, clientId, name, percentage, created_at) VALUES ($1, $2, $3, $4, $5)"
+DELETE = "DELETE FROM factors WHERE id = $1"
+
+class PostgresFactorRepository(FactorRepositoryInterface):
+    async def get_by_client_id(self, client_id: str) -> List[Factor]:
+        records = await get_postgres_pool().fetch(SELECT_BY_CLIENT_ID, client_id)
+        return [Factor.from_dict(record_to_dict(record)) for record in records]
+
+    async def create(self, factor: Factor) -> Factor:
+        if not factor.id:
+            factor.id = str(uuid.uuid4())
+        factor.created_at = datetime.now()
+        await get_postgres_pool().execute(
+            INSERT, factor.id, factor.client_id, factor.name, factor.percentage, factor.created_at
+        )
+        return factor
+
+    async def delete(self, factor_id: str) -> bool:
+        await get_postgres_pool().execute(DELETE, factor_id)
+        return True
@@ -0,0 +1,39 @@
+from domain.repositories.interaction_repository_interface import InteractionRepositoryInterface
+from domain.entities.interaction import Interaction
+from infrastructure.repositories.postgres.records import record_to_dict
+from infrastructure.services.postgres_pool import get_postgres_pool
+from typing import List
+from datetime import datetime
+import uuid
+
+SELECT_BY_CLIENT_ID = """
+SELECT id, clientId AS "clientId", type, date, details, created_at
+FROM interactions
+WHERE clientId = $1
+"""
+INSERT = "INSERT INTO interactions (id, clientId, type, date, details, created_at) VALUES ($1, $2, $3, $4, $5, $6)"
+DELETE = "DELETE FROM interactions WHERE id = $1"
+
+class PostgresInteractionRepository(InteractionRepositoryInterface):
+    async def get_by_client_id(self, client_id: str) -> List[Interaction]:
+        records = await get_postgres_pool().fetch(SELECT_BY_CLIENT_ID, client_id)
+        return [Interaction.from_dict(record_to_dict(record)) for record in records]
+
+    async def create(self, interaction: Interaction) -> Interaction:
+        if not interaction.id:
+            interaction.id = str(uuid.uuid4())
+        interaction.created_at = datetime.now()
+        await get_postgres_pool().execute(
+            INSERT,
+            interaction.id,
+            interaction.client_id,
+            interaction.type,
+            interaction.date,
+            interaction.details,
+            interaction.created_at
+        )
+        return interaction
+
+    async def delete(self, interaction_id: str) -> bool:
+        await get_postgres_pool().execute(DELETE, interaction_id)
+        return True
@@ -0,0 +1,78 @@
+from domain.repositories.note_repository_interface import NoteRepositoryInterface
+from domain.entities.note import Note
+from infrastructure.repositories.postgres.records import record_to_dict
+from infrastructure.services.postgres_pool import get_postgres_pool
+from typing import List, Optional
+from datetime import datetime
+
+SELECT_BY_ID = "SELECT * FROM notes WHERE id = $1"
+SELECT_BY_SENDER_ID = "SELECT * FROM notes WHERE sender_id = $1"
+SELECT_BY_RECIPIENT = "SELECT * FROM notes WHERE recipients @> $1::text[]"
+INSERT = """
+INSERT INTO notes (title, description, sender_id, recipients, is_read, timestamp)
+VALUES ($1, $2, $3, $4, $5, $6)
+RETURNING id
+"""
+UPDATE = """
+UPDATE notes
+SET title = $2, description = $3, sender_id = $4, recipients = $5, is_read = $6, timestamp = $7
+WHERE id = $1
+"""
+DELETE = "DELETE FROM notes WHERE id = $1"
+MARK_AS_READ = "UPDATE notes SET is_read = TRUE WHERE id = $1"
+
+class PostgresNoteRepository(NoteRepositoryInterface):
+    async def get_by_id(self, note_id: str) -> Optional[Note]:
+        record = await get_postgres_pool().fetchrow(SELECT_BY_ID, note_id)
+        if not record:
+            return None
+        return Note.from_dict(record_to_dict(record))
+
+    async def get_by_sender_id(self, sender_id: str) -> List[Note]:
+        records = await get_postgres_pool().fetch(SELECT_BY_SENDER_ID, sender_id)
+        return [Note.from_dict(record_to_dict(record)) for record in records]
+
+    async def get_by_recipient(self, role: str) -> List[Note]:
+        records = await get_postgres_pool().fetch(SELECT_BY_RECIPIENT, [role])
+        return [Note.from_dict(record_to_dict(record)) for record in records]
+
+    async def get_by_recipient_for_user(self, user_id: str, role: str) -> List[Note]:
+        """Get notes where the user is a recipient based on their role"""
+        return await self.get_by_recipient(role)
+
+    async def create(self, note: Note) -> Note:
+        note.timestamp = datetime.now()
+        note_id = await get_postgres_pool().fetchval(
+            INSERT,
+            note.title,
+            note.description,
+            note.sender_id,
+            note.recipients,
+            note.is_read,
+            note.timestamp
+        )
+        if note_id is None:
+            raise Exception("Failed to insert note")
+        note.id = str(note_id)
+        return note
+
+    async def update(self, note: Note) -> Note:
+        await get_postgres_pool().execute(
+            UPDATE,
+            note.id,
+            note.title,
+            note.description,
+            note.sender_id,
+            note.recipients,
+            note.is_read,
+            note.timestamp
+        )
+        return note
+
+    async def delete(self, note_id: str) -> bool:
+        await get_postgres_pool().execute(DELETE, note_id)
+        return True
+
+    async def mark_as_read(self, note_id: str) -> bool:
+        await get_postgres_pool().execute(MARK_AS_READ, note_id)
+        return True
@@ -0,0 +1,49 @@
+# Keyset pagination for the asyncpg backend
+#
+# Identifiers come from each repository's whitelist and every value is bound
+# as text and cast to the column type, so a page query is always
+# parameterized and served by the (sort column, id) index.
+from typing import Any, Dict, List, Sequence, Tuple
+from domain.value_objects.page import PageRequest, decode_cursor
+
+SQL_OPERATORS = {"eq": "=", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+def build_page_query(table: str, page_request: PageRequest, column_types: Dict[str, str],
+                     sort_columns: Sequence[str], filter_columns: Sequence[str],
+                     default_sort: str, selectable_columns: Sequence[str]) -> Tuple[str, List[Any], str]:
+    """Build the SELECT for one page
+
+    `column_types` maps each sortable/filterable column (and id) to its
+    Postgres type; `selectable_columns` whitelists the columns a page request
+    may project. Returns the SQL, its arguments and the resolved sort column.
+    """
+    sort_by = page_request.resolve_sort(sort_columns, default_sort)
+    clauses: List[str] = []
+    args: List[Any] = []
+
+    def bind(value: Any, column: str) -> str:
+        args.append(None if value is None else str(value))
+        return f"${len(args)}::text::{column_types[column]}"
+
+    for column, operator, value in page_request.resolve_filters(filter_columns):
+        if operator == "in":
+            args.append([str(item) for item in value])
+            clauses.append(f"{column} = ANY(${len(args)}::text[]::{column_types[column]}[])")
+        else:
+            clauses.append(f"{column} {SQL_OPERATORS[operator]} {bind(value, column)}")
+
+    comparison = "<" if page_request.descending else ">"
+    if page_request.cursor:
+        last_value, last_id = decode_cursor(page_request.cursor, sort_by, page_request.descending)
+        if sort_by == "id":
+            clauses.append(f"id {comparison} {bind(last_id, 'id')}")
+        else:
+            clauses.append(f"({sort_by}, id) {comparison} ({bind(last_value, sort_by)}, {bind(last_id, 'id')})")
+
+    direction = "DESC" if page_request.descending else "ASC"
+    order_by = f"{sort_by} {direction}" if sort_by == "id" else f"{sort_by} {direction}, id {direction}"
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    args.append(page_request.limit + 1)
+    columns = ", ".join(page_request.resolve_columns(selectable_columns, sort_by))
+    sql = f"SELECT {columns} FROM {table}{where} ORDER BY {order_by} LIMIT ${len(args)}"
+    return sql, args, sort_by
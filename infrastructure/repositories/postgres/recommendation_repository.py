@@ -0,0 +1,39 @@
+from domain.repositories.recommendation_repository_interface import RecommendationRepositoryInterface
+from domain.entities.recommendation import Recommendation
+from infrastructure.repositories.postgres.records import record_to_dict
+from infrastructure.services.postgres_pool import get_postgres_pool
+from typing import List
+from datetime import datetime
+import uuid
+
+SELECT_BY_CLIENT_ID = """
+SELECT id, clientId AS "clientId", title, impact, details, created_at
+FROM recommendations
+WHERE clientId = $1
+"""
+INSERT = "INSERT INTO recommendations (id, clientId, title, impact, details, created_at) VALUES ($1, $2, $3, $4, $5, $6)"
+DELETE = "DELETE FROM recommendations WHERE id = $1"
+
+class PostgresRecommendationRepository(RecommendationRepositoryInterface):
+    async def get_by_client_id(self, client_id: str) -> List[Recommendation]:
+        records = await get_postgres_pool().fetch(SELECT_BY_CLIENT_ID, client_id)
+        return [Recommendation.from_dict(record_to_dict(record)) for record in records]
+
+    async def create(self, recommendation: Recommendation) -> Recommendation:
+        if not recommendation.id:
+            recommendation.id = str(uuid.uuid4())
+        recommendation.created_at = datetime.now()
+        await get_postgres_pool().execute(
+            INSERT,
+            recommendation.id,
+            recommendation.client_id,
+            recommendation.title,
+            recommendation.impact,
+            recommendation.details,
+            recommendation.created_at
+        )
+        return recommendation
+
+    async def delete(self, recommendation_id: str) -> bool:
+        await get_postgres_pool().execute(DELETE, recommendation_id)
+        return True
@@ -0,0 +1,25 @@
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from uuid import UUID
+import asyncpg
+
+def record_to_dict(record: asyncpg.Record) -> Dict[str, Any]:
+    """Convert an asyncpg record into the row shape returned by PostgREST
+
+    Entities hydrate from PostgREST JSON rows, so UUIDs are rendered as strings
+    and timestamps as ISO 8601 strings.
+    """
+    row = dict(record)
+    for key, value in row.items():
+        if isinstance(value, UUID):
+            row[key] = str(value)
+        elif isinstance(value, datetime):
+            row[key] = value.isoformat()
+    return row
+
+def records_to_dicts(records: List[asyncpg.Record]) -> List[Dict[str, Any]]:
+    return [record_to_dict(record) for record in records]
+
+def to_text(value: Any) -> Optional[str]:
+    """Render a value for a text column"""
+    return None if value is None else str(value)
@@ -0,0 +1,57 @@
+from domain.repositories.report_repository_interface import ReportRepositoryInterface
+from domain.value_objects.report_totals import FactorTotals, MonthlyClientTotals, RecommendationTotals, SegmentClientTotals
+from infrastructure.services.postgres_pool import get_postgres_pool
+from typing import List
+
+SELECT_CLIENT_MONTHS = """
+SELECT * FROM (
+    SELECT month, client_count, risk_sum, risk_count
+    FROM report_client_months
+    WHERE client_count > 0
+    ORDER BY month DESC
+    LIMIT $1
+) recent
+ORDER BY month
+"""
+SELECT_CLIENT_SEGMENTS = """
+SELECT segment, client_count, risk_sum, risk_count, revenue_sum, revenue_count
+FROM report_client_segments
+WHERE client_count > 0
+"""
+SELECT_FACTOR_TOTALS = """
+SELECT name, factor_count, percentage_sum
+FROM report_factor_totals
+WHERE factor_count > 0
+"""
+SELECT_RECOMMENDATION_TOTALS = """
+SELECT title, recommendation_count, impact_sum
+FROM report_recommendation_totals
+WHERE recommendation_count > 0
+"""
+
+class PostgresReportRepository(ReportRepositoryInterface):
+    async def get_monthly_client_totals(self, months: int) -> List[MonthlyClientTotals]:
+        records = await get_postgres_pool().fetch(SELECT_CLIENT_MONTHS, months)
+        return [
+            MonthlyClientTotals(record["month"], record["client_count"], float(record["risk_sum"]), record["risk_count"])
+            for record in records
+        ]
+
+    async def get_segment_client_totals(self) -> List[SegmentClientTotals]:
+        records = await get_postgres_pool().fetch(SELECT_CLIENT_SEGMENTS)
+        return [
+            SegmentClientTotals(record["segment"], record["client_count"], float(record["risk_sum"]), record["risk_count"],
+                                float(record["revenue_sum"]), record["revenue_count"])
+            for record in records
+        ]
+
+    async def get_factor_totals(self) -> List[FactorTotals]:
+        records = await get_postgres_pool().fetch(SELECT_FACTOR_TOTALS)
+        return [FactorTotals(record["name"], record["factor_count"], record["percentage_sum"]) for record in records]
+
+    async def get_recommendation_totals(self) -> List[RecommendationTotals]:
+        records = await get_postgres_pool().fetch(SELECT_RECOMMENDATION_TOTALS)
+        return [
+            RecommendationTotals(record["title"], record["recommendation_count"], record["impact_sum"])
+            for record in records
+        ]
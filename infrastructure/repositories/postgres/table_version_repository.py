@@ -0,0 +1,14 @@
+from domain.repositories.table_version_repository_interface import TableVersionRepositoryInterface
+from infrastructure.services.postgres_pool import get_postgres_pool
+from typing import Dict, Sequence
+
+SELECT_VERSIONS = "SELECT table_name, version FROM table_versions WHERE table_name = ANY($1::text[])"
+
+class PostgresTableVersionRepository(TableVersionRepositoryInterface):
+    async def get_versions(self, tables: Sequence[str]) -> Dict[str, int]:
+        if not tables:
+            return {}
+        records = await get_postgres_pool().fetch(SELECT_VERSIONS, list(tables))
+        versions = dict.fromkeys(tables, 0)
+        versions.update((record["table_name"], record["version"]) for record in records)
+        return versions
@@ -0,0 +1,110 @@
+from domain.repositories.user_repository_interface import UserRepositoryInterface
+from domain.entities.user import User
+from domain.value_objects.page import Page, PageRequest, build_page
+from infrastructure.repositories.postgres.pagination import build_page_query
+from infrastructure.repositories.postgres.records import record_to_dict
+from infrastructure.services.postgres_pool import get_postgres_pool
+from typing import List, Optional
+from datetime import datetime
+
+SELECT_BY_ID = "SELECT * FROM users WHERE id = $1"
+SELECT_BY_EMAIL = "SELECT * FROM users WHERE email = $1"
+SELECT_BY_CIN = "SELECT * FROM users WHERE cin = $1"
+SELECT_BY_CODE = "SELECT * FROM users WHERE code = $1"
+SELECT_ALL = "SELECT * FROM users"
+INSERT = """
+INSERT INTO users (email, full_name, role, password, cin, code, created_at, updated_at)
+VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+RETURNING id
+"""
+UPDATE = """
+UPDATE users
+SET email = $2, full_name = $3, role = $4, password = $5, cin = $6, code = $7, updated_at = $8
+WHERE id = $1
+"""
+DELETE = "DELETE FROM users WHERE id = $1"
+
+SORT_COLUMNS = ("created_at", "full_name", "email")
+FILTER_COLUMNS = ("role", "email")
+DEFAULT_SORT = "created_at"
+# Columns a page request may project; users.password is never selected by list queries
+SELECTABLE_COLUMNS = ("id", "email", "full_name", "role", "cin", "code", "created_at", "updated_at")
+COLUMN_TYPES = {
+    "id": "uuid",
+    "created_at": "timestamptz",
+    "full_name": "text",
+    "email": "text",
+    "role": "text"
+}
+
+class PostgresUserRepository(UserRepositoryInterface):
+    async def _get_one(self, query: str, value: str) -> Optional[User]:
+        record = await get_postgres_pool().fetchrow(query, value)
+        if not record:
+            return None
+        return User.from_dict(record_to_dict(record))
+
+    async def get_by_id(self, user_id: str) -> Optional[User]:
+        return await self._get_one(SELECT_BY_ID, user_id)
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return await self._get_one(SELECT_BY_EMAIL, email)
+
+    async def get_by_cin(self, cin: str) -> Optional[User]:
+        return await self._get_one(SELECT_BY_CIN, cin)
+
+    async def get_by_code(self, code: str) -> Optional[User]:
+        return await self._get_one(SELECT_BY_CODE, code)
+
+    async def get_all(self) -> List[User]:
+        records = await get_postgres_pool().fetch(SELECT_ALL)
+        return [User.from_dict(record_to_dict(record)) for record in records]
+
+    async def get_page(self, page_request: PageRequest) -> Page[User]:
+        sql, args, sort_by = build_page_query(
+            "users", page_request, COLUMN_TYPES, SORT_COLUMNS, FILTER_COLUMNS, DEFAULT_SORT,
+            SELECTABLE_COLUMNS
+        )
+        records = await get_postgres_pool().fetch(sql, *args)
+        return build_page([record_to_dict(record) for record in records], page_request, sort_by, User.from_dict)
+
+    async def create(self, user: User) -> User:
+        try:
+            user.created_at = datetime.now()
+            user.updated_at = None
+            user_id = await get_postgres_pool().fetchval(
+                INSERT,
+                user.email,
+                user.full_name,
+                user.role.value,
+                user.password,
+                user.cin,
+                user.code,
+                user.created_at,
+                user.updated_at
+            )
+            if user_id is None:
+                raise Exception("Failed to insert user: No ID returned from database")
+            user.id = str(user_id)
+            return user
+        except Exception as e:
+            raise Exception(f"Failed to create user: {str(e)}")
+
+    async def update(self, user: User) -> User:
+        user.updated_at = datetime.now()
+        await get_postgres_pool().execute(
+            UPDATE,
+            user.id,
+            user.email,
+            user.full_name,
+            user.role.value,
+            user.password,
+            user.cin,
+            user.code,
+            user.updated_at
+        )
+        return user
+
+    async def delete(self, user_id: str) -> bool:
+        await get_postgres_pool().execute(DELETE, user_id)
+        return True
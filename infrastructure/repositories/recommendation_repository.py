@@ -1,6 +1,7 @@
 from domain.repositories.recommendation_repository_interface import RecommendationRepositoryInterface
 from domain.entities.recommendation import Recommendation
 from supabase import Client as SupabaseClient
+from infrastructure.services.query_executor import execute_query
 from typing import List, Optional
 from datetime import datetime
 import uuid
@@ -11,7 +12,7 @@ class RecommendationRepository(RecommendationRepositoryInterface):
         self.table = "recommendations"
     
     async def get_by_client_id(self, client_id: str) -> List[Recommendation]:
-        response = self.supabase.table(self.table).select("*").eq("clientId", client_id).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("clientId", client_id))
         data = response.data or []
         return [Recommendation.from_dict(item) for item in data]
     
@@ -20,9 +21,9 @@ class RecommendationRepository(RecommendationRepositoryInterface):
             recommendation.id = str(uuid.uuid4())
         recommendation.created_at = datetime.now()
         recommendation_dict = recommendation.to_dict()
-        self.supabase.table(self.table).insert(recommendation_dict).execute()
+        await execute_query(self.supabase.table(self.table).insert(recommendation_dict))
         return recommendation
     
     async def delete(self, recommendation_id: str) -> bool:
-        self.supabase.table(self.table).delete().eq("id", recommendation_id).execute()
+        await execute_query(self.supabase.table(self.table).delete().eq("id", recommendation_id))
         return True
@@ -0,0 +1,58 @@
+from domain.repositories.report_repository_interface import ReportRepositoryInterface
+from domain.value_objects.report_totals import FactorTotals, MonthlyClientTotals, RecommendationTotals, SegmentClientTotals
+from supabase import Client as SupabaseClient
+from infrastructure.services.query_executor import execute_query
+from typing import List
+from datetime import date
+
+class ReportRepository(ReportRepositoryInterface):
+    def __init__(self, supabase: SupabaseClient):
+        self.supabase = supabase
+
+    async def get_monthly_client_totals(self, months: int) -> List[MonthlyClientTotals]:
+        response = await execute_query(
+            self.supabase.table("report_client_months")
+            .select("month, client_count, risk_sum, risk_count")
+            .gt("client_count", 0)
+            .order("month", desc=True)
+            .limit(months)
+        )
+        return [
+            MonthlyClientTotals(date.fromisoformat(row["month"]), int(row["client_count"]),
+                                float(row["risk_sum"]), int(row["risk_count"]))
+            for row in reversed(response.data or [])
+        ]
+
+    async def get_segment_client_totals(self) -> List[SegmentClientTotals]:
+        response = await execute_query(
+            self.supabase.table("report_client_segments")
+            .select("segment, client_count, risk_sum, risk_count, revenue_sum, revenue_count")
+            .gt("client_count", 0)
+        )
+        return [
+            SegmentClientTotals(row["segment"], int(row["client_count"]), float(row["risk_sum"]), int(row["risk_count"]),
+                                float(row["revenue_sum"]), int(row["revenue_count"]))
+            for row in response.data or []
+        ]
+
+    async def get_factor_totals(self) -> List[FactorTotals]:
+        response = await execute_query(
+            self.supabase.table("report_factor_totals")
+            .select("name, factor_count, percentage_sum")
+            .gt("factor_count", 0)
+        )
+        return [
+            FactorTotals(row["name"], int(row["factor_count"]), int(row["percentage_sum"]))
+            for row in response.data or []
+        ]
+
+    async def get_recommendation_totals(self) -> List[RecommendationTotals]:
+        response = await execute_query(
+            self.supabase.table("report_recommendation_totals")
+            .select("title, recommendation_count, impact_sum")
+            .gt("recommendation_count", 0)
+        )
+        return [
+            RecommendationTotals(row["title"], int(row["recommendation_count"]), int(row["impact_sum"]))
+            for row in response.data or []
+        ]
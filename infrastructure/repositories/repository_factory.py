@@ -0,0 +1,175 @@
+# Repository factory
+#
+# Chooses the implementation behind every repository interface from the
+# REPOSITORY_BACKEND environment variable:
+#
+#   supabase - PostgREST over HTTP through the Supabase client (default)
+#   postgres - direct asyncpg connection pool on SUPABASE_DB_URL
+#
+# Each repository is created once per process and shared by all routers.
+#
+# CUSTOMER_ID_INDEX_ENABLED=true wraps the prediction repository with an
+# in-memory customer_id index used for duplicate checks on CSV import.
+#
+# CACHE_ENABLED=true wraps the client, prediction and user repositories with
+# read-through TTL/LRU caches (see infrastructure/services/entity_cache.py).
+from functools import lru_cache
+import os
+
+from domain.repositories.client_repository_interface import ClientRepositoryInterface
+from domain.repositories.customer_incident_prediction_repository_interface import CustomerIncidentPredictionRepositoryInterface
+from domain.repositories.customer_issue_repository_interface import CustomerIssueRepositoryInterface
+from domain.repositories.email_notification_repository_interface import EmailNotificationRepositoryInterface
+from domain.repositories.factor_repository_interface import FactorRepositoryInterface
+from domain.repositories.interaction_repository_interface import InteractionRepositoryInterface
+from domain.repositories.note_repository_interface import NoteRepositoryInterface
+from domain.repositories.recommendation_repository_interface import RecommendationRepositoryInterface
+from domain.repositories.report_repository_interface import ReportRepositoryInterface
+from domain.repositories.table_version_repository_interface import TableVersionRepositoryInterface
+from domain.repositories.user_repository_interface import UserRepositoryInterface
+from infrastructure.services.entity_cache import get_entity_cache
+from infrastructure.services.supabase_initializer import get_supabase_client
+
+SUPABASE_BACKEND = "supabase"
+POSTGRES_BACKEND = "postgres"
+
+
+def get_repository_backend() -> str:
+    backend = os.getenv("REPOSITORY_BACKEND", SUPABASE_BACKEND).strip().lower()
+    if backend not in (SUPABASE_BACKEND, POSTGRES_BACKEND):
+        raise ValueError(f"Unknown REPOSITORY_BACKEND '{backend}'. Use '{SUPABASE_BACKEND}' or '{POSTGRES_BACKEND}'.")
+    return backend
+
+
+def uses_postgres_backend() -> bool:
+    return get_repository_backend() == POSTGRES_BACKEND
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "false").strip().lower() in ("1", "true", "yes")
+
+
+def cache_enabled() -> bool:
+    return _env_flag("CACHE_ENABLED")
+
+
+@lru_cache(maxsize=None)
+def _supabase_client():
+    return get_supabase_client()
+
+
+@lru_cache(maxsize=None)
+def get_client_repository() -> ClientRepositoryInterface:
+    if uses_postgres_backend():
+        from infrastructure.repositories.postgres.client_repository import PostgresClientRepository
+        repository = PostgresClientRepository()
+    else:
+        from infrastructure.repositories.client_repository import ClientRepository
+        repository = ClientRepository(_supabase_client())
+    if cache_enabled():
+        from infrastructure.repositories.cached_client_repository import CachedClientRepository
+        return CachedClientRepository(repository, get_entity_cache("clients", default_ttl_seconds=60))
+    return repository
+
+
+@lru_cache(maxsize=None)
+def get_customer_incident_prediction_repository() -> CustomerIncidentPredictionRepositoryInterface:
+    if uses_postgres_backend():
+        from infrastructure.repositories.postgres.customer_incident_prediction_repository import PostgresCustomerIncidentPredictionRepository
+        repository = PostgresCustomerIncidentPredictionRepository()
+    else:
+        from infrastructure.repositories.customer_incident_prediction_repository import CustomerIncidentPredictionRepository
+        repository = CustomerIncidentPredictionRepository(_supabase_client())
+    if _env_flag("CUSTOMER_ID_INDEX_ENABLED"):
+        from infrastructure.repositories.indexed_customer_incident_prediction_repository import IndexedCustomerIncidentPredictionRepository
+        repository = IndexedCustomerIncidentPredictionRepository(repository)
+    if cache_enabled():
+        from infrastructure.repositories.cached_customer_incident_prediction_repository import CachedCustomerIncidentPredictionRepository
+        return CachedCustomerIncidentPredictionRepository(repository, get_entity_cache("predictions", default_ttl_seconds=60))
+    return repository
+
+
+@lru_cache(maxsize=None)
+def get_customer_issue_repository() -> CustomerIssueRepositoryInterface:
+    if uses_postgres_backend():
+        from infrastructure.repositories.postgres.customer_issue_repository import PostgresCustomerIssueRepository
+        return PostgresCustomerIssueRepository()
+    from infrastructure.repositories.customer_issue_repository import CustomerIssueRepository
+    return CustomerIssueRepository(_supabase_client())
+
+
+@lru_cache(maxsize=None)
+def get_email_notification_repository() -> EmailNotificationRepositoryInterface:
+    if uses_postgres_backend():
+        from infrastructure.repositories.postgres.email_notification_repository import PostgresEmailNotificationRepository
+        return PostgresEmailNotificationRepository()
+    from infrastructure.repositories.email_notification_repository import EmailNotificationRepository
+    return EmailNotificationRepository(_supabase_client())
+
+
+@lru_cache(maxsize=None)
+def get_factor_repository() -> FactorRepositoryInterface:
+    if uses_postgres_backend():
+        from infrastructure.repositories.postgres.factor_repository import PostgresFactorRepository
+        return PostgresFactorRepository()
+    from infrastructure.repositories.factor_repository import FactorRepository
+    return FactorRepository(_supabase_client())
+
+
+@lru_cache(maxsize=None)
+def get_interaction_repository() -> InteractionRepositoryInterface:
+    if uses_postgres_backend():
+        from infrastructure.repositories.postgres.interaction_repository import PostgresInteractionRepository
+        return PostgresInteractionRepository()
+    from infrastructure.repositories.interaction_repository import InteractionRepository
+    return InteractionRepository(_supabase_client())
+
+
+@lru_cache(maxsize=None)
+def get_note_repository() -> NoteRepositoryInterface:
+    if uses_postgres_backend():
+        from infrastructure.repositories.postgres.note_repository import PostgresNoteRepository
+        return PostgresNoteRepository()
+    from infrastructure.repositories.note_repository import NoteRepository
+    return NoteRepository(_supabase_client())
+
+
+@lru_cache(maxsize=None)
+def get_recommendation_repository() -> RecommendationRepositoryInterface:
+    if uses_postgres_backend():
+        from infrastructure.repositories.postgres.recommendation_repository import PostgresRecommendationRepository
+        return PostgresRecommendationRepository()
+    from infrastructure.repositories.recommendation_repository import RecommendationRepository
+    return RecommendationRepository(_supabase_client())
+
+
+@lru_cache(maxsize=None)
+def get_report_repository() -> ReportRepositoryInterface:
+    if uses_postgres_backend():
+        from infrastructure.repositories.postgres.report_repository import PostgresReportRepository
+        return PostgresReportRepository()
+    from infrastructure.repositories.report_repository import ReportRepository
+    return ReportRepository(_supabase_client())
+
+
+@lru_cache(maxsize=None)
+def get_table_version_repository() -> TableVersionRepositoryInterface:
+    if uses_postgres_backend():
+        from infrastructure.repositories.postgres.table_version_repository import PostgresTableVersionRepository
+        return PostgresTableVersionRepository()
+    from infrastructure.repositories.table_version_repository import TableVersionRepository
+    return TableVersionRepository(_supabase_client())
+
+
+@lru_cache(maxsize=None)
+def get_user_repository() -> UserRepositoryInterface:
+    if uses_postgres_backend():
+        from infrastructure.repositories.postgres.user_repository import PostgresUserRepository
+        repository = PostgresUserRepository()
+    else:
+        from infrastructure.repositories.user_repository import UserRepository
+        repository = UserRepository(_supabase_client())
+    if cache_enabled():
+        from infrastructure.repositories.cached_user_repository import CachedUserRepository
+        return CachedUserRepository(repository, get_entity_cache("users", default_ttl_seconds=300))
+    return repository
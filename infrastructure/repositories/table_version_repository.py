@@ -0,0 +1,19 @@
+from domain.repositories.table_version_repository_interface import TableVersionRepositoryInterface
+from supabase import Client as SupabaseClient
+from infrastructure.services.query_executor import execute_query
+from typing import Dict, Sequence
+
+class TableVersionRepository(TableVersionRepositoryInterface):
+    def __init__(self, supabase: SupabaseClient):
+        self.supabase = supabase
+        self.table = "table_versions"
+
+    async def get_versions(self, tables: Sequence[str]) -> Dict[str, int]:
+        if not tables:
+            return {}
+        response = await execute_query(
+            self.supabase.table(self.table).select("table_name, version").in_("table_name", list(tables))
+        )
+        versions = dict.fromkeys(tables, 0)
+        versions.update((row["table_name"], int(row["version"])) for row in response.data or [])
+        return versions
@@ -1,47 +1,63 @@
 from domain.repositories.user_repository_interface import UserRepositoryInterface
 from domain.entities.user import User
+from domain.value_objects.page import Page, PageRequest, build_page
 from supabase import Client
+from infrastructure.repositories.pagination import apply_page_request
+from infrastructure.services.query_executor import execute_query
 from typing import List, Optional
 from datetime import datetime
 
+SORT_COLUMNS = ("created_at", "full_name", "email")
+FILTER_COLUMNS = ("role", "email")
+DEFAULT_SORT = "created_at"
+# Columns a page request may project; users.password is never selected by list queries
+SELECTABLE_COLUMNS = ("id", "email", "full_name", "role", "cin", "code", "created_at", "updated_at")
+
 class UserRepository(UserRepositoryInterface):
     def __init__(self, supabase: Client):
         self.supabase = supabase
         self.table = "users"
     
     async def get_by_id(self, user_id: str) -> Optional[User]:
-        response = self.supabase.table(self.table).select("*").eq("id", user_id).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("id", user_id))
         data = response.data
         if not data:
             return None
         return User.from_dict(data[0])
     
     async def get_by_email(self, email: str) -> Optional[User]:
-        response = self.supabase.table(self.table).select("*").eq("email", email).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("email", email))
         data = response.data
         if not data:
             return None
         return User.from_dict(data[0])
     
     async def get_by_cin(self, cin: str) -> Optional[User]:
-        response = self.supabase.table(self.table).select("*").eq("cin", cin).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("cin", cin))
         data = response.data
         if not data:
             return None
         return User.from_dict(data[0])
     
     async def get_by_code(self, code: str) -> Optional[User]:
-        response = self.supabase.table(self.table).select("*").eq("code", code).execute()
+        response = await execute_query(self.supabase.table(self.table).select("*").eq("code", code))
         data = response.data
         if not data:
             return None
         return User.from_dict(data[0])
     
     async def get_all(self) -> List[User]:
-        response = self.supabase.table(self.table).select("*").execute()
+        response = await execute_query(self.supabase.table(self.table).select("*"))
         data = response.data
         return [User.from_dict(item) for item in data]
     
+    async def get_page(self, page_request: PageRequest) -> Page[User]:
+        query, sort_by = apply_page_request(
+            self.supabase.table(self.table), page_request, SORT_COLUMNS, FILTER_COLUMNS, DEFAULT_SORT, SELECTABLE_COLUMNS
+        )
+        response = await execute_query(query)
+        return build_page(response.data or [], page_request, sort_by, User.from_dict)
+    
     async def create(self, user: User) -> User:
         try:
             # 1. Stamp creation time
@@ -53,9 +69,10 @@ class UserRepository(UserRepositoryInterface):
             payload.pop("id", None)
             
             # 3. Insert & return the full row (including generated id)
-            response = self.supabase.table(self.table) \
-                .insert(payload, returning="representation") \
-                .execute()
+            response = await execute_query(
+                self.supabase.table(self.table)
+                .insert(payload, returning="representation")
+            )
             
             if not response.data or len(response.data) == 0:
                 raise Exception("Failed to insert user: No data returned from database")
@@ -74,9 +91,9 @@ class UserRepository(UserRepositoryInterface):
     async def update(self, user: User) -> User:
         user.updated_at = datetime.now()
         user_dict = user.to_dict()
-        self.supabase.table(self.table).update(user_dict).eq("id", user.id).execute()
+        await execute_query(self.supabase.table(self.table).update(user_dict).eq("id", user.id))
         return user
     
     async def delete(self, user_id: str) -> bool:
-        self.supabase.table(self.table).delete().eq("id", user_id).execute()
+        await execute_query(self.supabase.table(self.table).delete().eq("id", user_id))
         return True
@@ -0,0 +1,99 @@
+# Chunked, concurrent batch writes
+#
+# Splits a list of rows into chunks, inserts up to BATCH_WRITE_CONCURRENCY
+# chunks at a time and collects the created rows plus the chunks that failed.
+# Each chunk is one INSERT, so it either commits completely or not at all.
+# With BATCH_WRITE_ISOLATE_FAILURES enabled, a chunk that failed because of
+# its rows (a constraint violation or an invalid value) is split in half and
+# retried recursively until the offending rows are isolated, so one bad row
+# only costs itself. Splitting stops once BATCH_WRITE_MAX_RETRIES extra
+# inserts have been spent on one write; the remaining failing chunks are
+# reported whole.
+#
+# Any other error (connection lost, timeout, auth, missing table) is not
+# retried: the chunk is reported as failed, and chunks that have not started
+# yet are reported with the same error instead of being sent to a backend
+# that is already failing.
+from domain.value_objects.batch_write_result import BatchWriteResult, FailedChunk
+from postgrest.exceptions import APIError
+from typing import Awaitable, Callable, List, Optional, Sequence, Tuple, TypeVar
+import asyncio
+import asyncpg
+import logging
+import os
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# SQLSTATE classes caused by the rows themselves: data exceptions (22) and
+# integrity constraint violations (23)
+ROW_ERROR_SQLSTATE_CLASSES = ("22", "23")
+
+def is_row_error(error: BaseException) -> bool:
+    """Whether an insert failed because of the rows it wrote, following `raise ... from`"""
+    while error is not None:
+        if isinstance(error, asyncpg.PostgresError):
+            code = error.sqlstate
+        elif isinstance(error, APIError):
+            code = error.code
+        else:
+            error = error.__cause__
+            continue
+        return bool(code) and code[:2] in ROW_ERROR_SQLSTATE_CLASSES
+    return False
+
+class BatchWriter:
+    def __init__(
+        self,
+        chunk_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        isolate_failures: Optional[bool] = None,
+        max_retries: Optional[int] = None
+    ):
+        self.chunk_size = chunk_size or int(os.getenv("BATCH_WRITE_CHUNK_SIZE", "500"))
+        self.max_concurrency = max_concurrency or int(os.getenv("BATCH_WRITE_CONCURRENCY", "4"))
+        if isolate_failures is None:
+            isolate_failures = os.getenv("BATCH_WRITE_ISOLATE_FAILURES", "true").strip().lower() in ("1", "true", "yes")
+        self.isolate_failures = isolate_failures
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv("BATCH_WRITE_MAX_RETRIES", "100"))
+
+    async def write(self, rows: Sequence[T], insert_chunk: Callable[[List[T]], Awaitable[List[R]]]) -> BatchWriteResult[R]:
+        """Insert rows chunk by chunk; created rows keep the input order"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        retries_left = self.max_retries
+        backend_error: Optional[str] = None
+
+        def failed(start: int, end: int, error: str) -> Tuple[List[R], List[FailedChunk]]:
+            return [], [FailedChunk(start=start, end=end, error=error)]
+
+        async def write_range(start: int, end: int) -> Tuple[List[R], List[FailedChunk]]:
+            nonlocal retries_left, backend_error
+            try:
+                async with semaphore:
+                    if backend_error is not None:
+                        return failed(start, end, f"Not attempted after an earlier chunk failed: {backend_error}")
+                    return await insert_chunk(list(rows[start:end])), []
+            except Exception as e:
+                if not is_row_error(e):
+                    logging.warning(f"Batch write failed for rows {start}-{end - 1}, not retrying: {str(e)}")
+                    backend_error = backend_error or str(e)
+                    return failed(start, end, str(e))
+                if not self.isolate_failures or end - start == 1 or retries_left < 2:
+                    logging.warning(f"Batch write failed for rows {start}-{end - 1}: {str(e)}")
+                    return failed(start, end, str(e))
+                retries_left -= 2
+            middle = (start + end) // 2
+            (left_created, left_failed), (right_created, right_failed) = await asyncio.gather(
+                write_range(start, middle), write_range(middle, end)
+            )
+            return left_created + right_created, left_failed + right_failed
+
+        results = await asyncio.gather(*(
+            write_range(start, min(start + self.chunk_size, len(rows)))
+            for start in range(0, len(rows), self.chunk_size)
+        ))
+        result: BatchWriteResult[R] = BatchWriteResult()
+        for created, failed_chunks in results:
+            result.created.extend(created)
+            result.failed_chunks.extend(failed_chunks)
+        return result
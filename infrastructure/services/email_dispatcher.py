@@ -0,0 +1,146 @@
+# Concurrent email dispatch
+#
+# EmailDispatcher sends a list of messages with at most `concurrency` in
+# flight at once, so a large send proceeds in parallel over the SMTP pool while
+# the event loop stays free for HTTP requests. Messages are taken in batches of
+# `batch_size`; each batch is sent concurrently and `on_batch` is awaited with
+# the running totals once it has finished.
+#
+# Callers that track delivery state per message can hand it over a batch at a
+# time instead of per message: `claim_batch` turns a batch of keys into the
+# items to send (claiming them in the database in one statement, dropping any
+# already taken), and `record_batch` receives the batch's sent and failed items
+# once all of them have been attempted. If either hook raises, dispatch stops
+# after counting what was sent so far and the error is returned in the
+# progress, so the totals still describe the messages that went out.
+#
+# Recipient domains are rate limited separately with token buckets: each
+# domain may receive `domain_burst` messages at once and then
+# `domain_rate_per_second` on average, which keeps a batch dominated by one
+# provider (gmail.com, ...) from tripping that provider's throttling. A message
+# waiting for its domain's bucket does not hold a concurrency slot, so other
+# domains keep flowing. A rate of 0 disables the limit.
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+import asyncio
+import logging
+import os
+import time
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+
+@dataclass
+class DispatchProgress(Generic[T]):
+    total: int
+    batches: int
+    batch: int = 0  # batches finished so far
+    sent: int = 0
+    failed: int = 0
+    skipped: int = 0  # not returned by `claim_batch`
+    errors: List[Tuple[T, str]] = field(default_factory=list)
+    error: Optional[str] = None  # why dispatch stopped early
+
+
+@dataclass
+class BatchOutcome(Generic[T]):
+    sent: List[T] = field(default_factory=list)
+    failed: List[Tuple[T, str]] = field(default_factory=list)
+
+
+class DomainRateLimiter:
+    """Token bucket per recipient domain"""
+
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate_per_second = rate_per_second
+        self.burst = max(burst, 1)
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # domain -> (tokens, updated at)
+
+    async def acquire(self, domain: str) -> None:
+        if self.rate_per_second <= 0:
+            return
+        while True:
+            now = time.monotonic()
+            tokens, updated_at = self._buckets.get(domain, (float(self.burst), now))
+            tokens = min(self.burst, tokens + (now - updated_at) * self.rate_per_second)
+            if tokens >= 1:
+                self._buckets[domain] = (tokens - 1, now)
+                return
+            self._buckets[domain] = (tokens, now)
+            await asyncio.sleep((1 - tokens) / self.rate_per_second)
+
+
+def recipient_domain(email: str) -> str:
+    return email.rpartition("@")[2].strip().lower()
+
+
+class EmailDispatcher:
+    def __init__(self, concurrency: int, batch_size: int, domain_rate_per_second: float, domain_burst: int):
+        if concurrency < 1 or batch_size < 1:
+            raise ValueError("Email dispatch needs a concurrency and batch size of at least 1")
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.rate_limiter = DomainRateLimiter(domain_rate_per_second, domain_burst)
+        self._slots = asyncio.Semaphore(concurrency)
+
+    async def dispatch(self, items: Sequence[K], email_of: Callable[[T], str],
+                       send: Callable[[T], Awaitable[None]],
+                       on_batch: Optional[Callable[[DispatchProgress[T]], Awaitable[None]]] = None,
+                       claim_batch: Optional[Callable[[List[K]], Awaitable[List[T]]]] = None,
+                       record_batch: Optional[Callable[[BatchOutcome[T]], Awaitable[None]]] = None
+                       ) -> DispatchProgress[T]:
+        """Send every item with `send`; exceptions it raises count the item as failed
+
+        Without `claim_batch` the items are sent as given.
+        """
+        progress: DispatchProgress[T] = DispatchProgress(
+            total=len(items), batches=(len(items) + self.batch_size - 1) // self.batch_size
+        )
+
+        async def send_one(item: T, outcome: BatchOutcome[T]) -> None:
+            await self.rate_limiter.acquire(recipient_domain(email_of(item)))
+            async with self._slots:
+                try:
+                    await send(item)
+                except Exception as e:
+                    outcome.failed.append((item, str(e)))
+                    return
+            outcome.sent.append(item)
+
+        for start in range(0, len(items), self.batch_size):
+            keys = list(items[start:start + self.batch_size])
+            try:
+                batch = await claim_batch(keys) if claim_batch is not None else keys
+            except Exception as e:
+                progress.error = f"Claiming batch {progress.batch + 1} failed: {str(e)}"
+                break
+            outcome: BatchOutcome[T] = BatchOutcome()
+            await asyncio.gather(*(send_one(item, outcome) for item in batch))
+            progress.batch += 1
+            progress.sent += len(outcome.sent)
+            progress.failed += len(outcome.failed)
+            progress.skipped += len(keys) - len(batch)
+            progress.errors.extend(outcome.failed)
+            if record_batch is not None:
+                try:
+                    await record_batch(outcome)
+                except Exception as e:
+                    progress.error = f"Recording batch {progress.batch} failed: {str(e)}"
+            if on_batch is not None:
+                await on_batch(progress)
+            if progress.error is not None:
+                break
+        return progress
+
+
+def email_dispatcher_from_env() -> EmailDispatcher:
+    """An EmailDispatcher configured from the EMAIL_SEND_* and EMAIL_DOMAIN_* settings"""
+    dispatcher = EmailDispatcher(
+        concurrency=int(os.getenv("EMAIL_SEND_CONCURRENCY", os.getenv("SMTP_POOL_SIZE", "4"))),
+        batch_size=int(os.getenv("EMAIL_SEND_BATCH_SIZE", "100")),
+        domain_rate_per_second=float(os.getenv("EMAIL_DOMAIN_RATE_PER_SECOND", "10")),
+        domain_burst=int(os.getenv("EMAIL_DOMAIN_BURST", "10"))
+    )
+    logging.info(f"Email dispatcher sends up to {dispatcher.concurrency} messages at once")
+    return dispatcher
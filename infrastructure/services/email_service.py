@@ -1,8 +1,8 @@
-import smtplib
 import os
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Optional
+from infrastructure.services.smtp_pool import get_smtp_pool
 import logging
 
 class EmailService:
@@ -48,14 +48,8 @@ class EmailService:
                 logging.info(f"EMAIL BODY: {body}")
                 return True, None
             
-            # Real email sending
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.smtp_username, self.smtp_password)
-            
-            text = msg.as_string()
-            server.sendmail(self.from_email, to_email, text)
-            server.quit()
+            # Real email sending, over a pooled authenticated connection
+            await get_smtp_pool().send_message(msg)
             
             return True, None
             
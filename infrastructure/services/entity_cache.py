@@ -0,0 +1,106 @@
+# In-process read-through cache for repository entities.
+#
+# Each named cache is an LRU bounded by max_entries, with a per-entry TTL.
+# Caches are per process: with several workers, an update made through one
+# worker is only seen by the others once their entries expire, so TTLs bound
+# cross-worker staleness. Stored values are copied on the way in and out so
+# callers can mutate returned entities without corrupting the cache.
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+import copy
+import os
+import threading
+import time
+
+_MISSING = object()
+
+
+class EntityCache:
+    def __init__(self, name: str, max_entries: int, ttl_seconds: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a copy of the cached value, or default on a miss"""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, *keys: Hashable) -> None:
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, _MISSING) is not _MISSING:
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations
+            }
+
+
+_caches: Dict[str, EntityCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_entity_cache(name: str, default_ttl_seconds: float = 60, default_max_entries: int = 10000) -> EntityCache:
+    """Return the named cache, sized by CACHE_<NAME>_TTL_SECONDS / CACHE_<NAME>_MAX_ENTRIES"""
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            prefix = f"CACHE_{name.upper()}"
+            cache = EntityCache(
+                name,
+                max_entries=int(os.getenv(f"{prefix}_MAX_ENTRIES", str(default_max_entries))),
+                ttl_seconds=float(os.getenv(f"{prefix}_TTL_SECONDS", str(default_ttl_seconds)))
+            )
+            _caches[name] = cache
+        return cache
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Hit/miss metrics for every cache created in this process"""
+    with _caches_lock:
+        caches = list(_caches.values())
+    return {cache.name: cache.stats() for cache in caches}
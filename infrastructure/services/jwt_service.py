@@ -7,16 +7,17 @@ class JWTService:
     def __init__(self):
         self.secret_key = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
         self.algorithm = "HS256"
-        self.access_token_expire_minutes = 720
+        self.access_token_expire_minutes = int(os.getenv("JWT_EXPIRE_MINUTES", "720"))
     
     def create_access_token(self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
         """Create a new JWT access token"""
         to_encode = data.copy()
+        issued_at = datetime.utcnow()
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = issued_at + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
-        to_encode.update({"exp": expire})
+            expire = issued_at + timedelta(minutes=self.access_token_expire_minutes)
+        to_encode.update({"exp": expire, "iat": issued_at})
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
         return encoded_jwt
     
@@ -0,0 +1,119 @@
+# Versioned schema migrations.
+#
+# Migrations are the NNNN_description.sql files in infrastructure/migrations,
+# applied in version order. Each one runs in its own transaction and is
+# recorded in schema_migrations with a SHA-256 checksum of its contents, so
+# startup only executes migrations that have not been applied yet. A
+# session-level advisory lock keeps concurrently starting workers from
+# applying the same migration twice.
+#
+# Applied migrations must not be edited: a checksum mismatch stops the run.
+# Add a new file instead.
+#
+# Run manually with: python -m infrastructure.services.migration_runner
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+import asyncio
+import asyncpg
+import hashlib
+import logging
+import os
+import re
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
+MIGRATION_FILE_PATTERN = re.compile(r"^(\d+)_(\w+)\.sql$")
+# Arbitrary application-wide key for pg_advisory_lock
+MIGRATION_LOCK_KEY = 724_310_001
+
+CREATE_MIGRATIONS_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version integer PRIMARY KEY,
+    name text NOT NULL,
+    checksum text NOT NULL,
+    applied_at timestamptz NOT NULL DEFAULT NOW()
+)
+"""
+SELECT_APPLIED = "SELECT version, checksum FROM schema_migrations"
+INSERT_APPLIED = "INSERT INTO schema_migrations (version, name, checksum) VALUES ($1, $2, $3)"
+
+
+@dataclass
+class Migration:
+    version: int
+    name: str
+    sql: str
+
+    @property
+    def checksum(self) -> str:
+        return hashlib.sha256(self.sql.encode("utf-8")).hexdigest()
+
+
+def load_migrations(directory: Path = MIGRATIONS_DIR) -> List[Migration]:
+    """Read migration files from disk, ordered by version"""
+    migrations = []
+    for path in directory.glob("*.sql"):
+        match = MIGRATION_FILE_PATTERN.match(path.name)
+        if not match:
+            logging.warning(f"Ignoring {path.name}: migration files must be named NNNN_description.sql")
+            continue
+        migrations.append(Migration(version=int(match.group(1)), name=match.group(2), sql=path.read_text(encoding="utf-8")))
+    migrations.sort(key=lambda migration: migration.version)
+    versions = [migration.version for migration in migrations]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError("Duplicate migration version numbers in infrastructure/migrations")
+    return migrations
+
+
+async def apply_migrations(conn: asyncpg.Connection, migrations: List[Migration]) -> int:
+    """Apply pending migrations on an open connection; returns how many were applied"""
+    await conn.execute("SELECT pg_advisory_lock($1)", MIGRATION_LOCK_KEY)
+    try:
+        await conn.execute(CREATE_MIGRATIONS_TABLE)
+        applied: Dict[int, str] = {record["version"]: record["checksum"] for record in await conn.fetch(SELECT_APPLIED)}
+
+        count = 0
+        for migration in migrations:
+            if migration.version in applied:
+                if applied[migration.version] != migration.checksum:
+                    raise RuntimeError(
+                        f"Migration {migration.version:04d}_{migration.name} was modified after it was applied"
+                    )
+                continue
+            async with conn.transaction():
+                await conn.execute(migration.sql)
+                await conn.execute(INSERT_APPLIED, migration.version, migration.name, migration.checksum)
+            logging.info(f"Applied migration {migration.version:04d}_{migration.name}")
+            count += 1
+        return count
+    finally:
+        await conn.execute("SELECT pg_advisory_unlock($1)", MIGRATION_LOCK_KEY)
+
+
+async def run_migrations() -> None:
+    """Bring the database schema up to date on SUPABASE_DB_URL"""
+    db_url = os.getenv("SUPABASE_DB_URL")
+    if not db_url:
+        logging.warning("SUPABASE_DB_URL not set. Database migrations will not be applied.")
+        return
+
+    try:
+        conn = await asyncpg.connect(dsn=db_url)
+        try:
+            count = await apply_migrations(conn, load_migrations())
+        finally:
+            await conn.close()
+        if count:
+            logging.info(f"Database schema updated ({count} migrations applied).")
+        else:
+            logging.info("Database schema is up to date.")
+    except Exception as e:
+        logging.error(f"Error applying database migrations: {str(e)}")
+        logging.info("Application will continue without database connection. Some features may not work correctly.")
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run_migrations())
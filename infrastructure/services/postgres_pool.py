@@ -0,0 +1,67 @@
+# asyncpg connection pool shared by the PostgreSQL repository backend.
+#
+# The pool is created on application startup and closed on shutdown. asyncpg
+# prepares every query it runs and keeps the prepared statements in a
+# per-connection LRU cache (DB_STATEMENT_CACHE_SIZE), so the fixed SQL used by
+# the repositories is parsed and planned once per connection. Set the cache
+# size to 0 when connecting through a transaction-mode pooler such as
+# PgBouncer / Supavisor on port 6543, which cannot keep prepared statements.
+from typing import Optional
+import asyncpg
+import json
+import logging
+import os
+
+_pool: Optional[asyncpg.Pool] = None
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    # Decode json/jsonb columns into Python objects, as PostgREST does
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name,
+            encoder=json.dumps,
+            decoder=json.loads,
+            schema="pg_catalog"
+        )
+
+
+async def init_postgres_pool() -> asyncpg.Pool:
+    """Create the shared connection pool from SUPABASE_DB_URL"""
+    global _pool
+    if _pool is not None:
+        return _pool
+
+    db_url = os.getenv("SUPABASE_DB_URL")
+    if not db_url:
+        error_msg = "SUPABASE_DB_URL must be set to use the postgres repository backend."
+        logging.error(error_msg)
+        raise ValueError(error_msg)
+
+    min_size = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+    max_size = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+    _pool = await asyncpg.create_pool(
+        dsn=db_url,
+        min_size=min_size,
+        max_size=max_size,
+        statement_cache_size=int(os.getenv("DB_STATEMENT_CACHE_SIZE", "256")),
+        init=_init_connection
+    )
+    logging.info(f"PostgreSQL connection pool initialized ({min_size}-{max_size} connections)")
+    return _pool
+
+
+def get_postgres_pool() -> asyncpg.Pool:
+    """Return the shared connection pool"""
+    if _pool is None:
+        raise RuntimeError("PostgreSQL connection pool is not initialized. It is created on application startup.")
+    return _pool
+
+
+async def close_postgres_pool() -> None:
+    """Close the shared connection pool"""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+        logging.info("PostgreSQL connection pool closed")
@@ -0,0 +1,45 @@
+# Bounded executor for Supabase (PostgREST) queries.
+#
+# The supabase-py client is synchronous: `.execute()` performs a blocking HTTP
+# round trip. Running it directly inside an `async def` repository method stalls
+# the event loop for every concurrent request, so all repository queries are
+# dispatched to a dedicated, size-limited thread pool instead.
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+import asyncio
+import logging
+import os
+import threading
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_query_executor() -> ThreadPoolExecutor:
+    """Return the shared query executor, creating it on first use"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                max_workers = int(os.getenv("SUPABASE_MAX_WORKERS", "32"))
+                _executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix="supabase-query"
+                )
+                logging.info(f"Supabase query executor started with {max_workers} workers")
+    return _executor
+
+
+async def execute_query(query: Any) -> Any:
+    """Run a PostgREST query builder's blocking `execute()` off the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_query_executor(), query.execute)
+
+
+def shutdown_query_executor() -> None:
+    """Stop the shared query executor, waiting for in-flight queries"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
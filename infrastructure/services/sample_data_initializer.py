@@ -6,12 +6,12 @@ from domain.entities.recommendation import Recommendation
 from domain.entities.factor import Factor
 from domain.entities.user import User, UserRole
 from domain.entities.note import Note
-from infrastructure.repositories.client_repository import ClientRepository
-from infrastructure.repositories.interaction_repository import InteractionRepository
-from infrastructure.repositories.recommendation_repository import RecommendationRepository
-from infrastructure.repositories.factor_repository import FactorRepository
-from infrastructure.repositories.user_repository import UserRepository
-from infrastructure.repositories.note_repository import NoteRepository
+from domain.repositories.client_repository_interface import ClientRepositoryInterface
+from domain.repositories.interaction_repository_interface import InteractionRepositoryInterface
+from domain.repositories.recommendation_repository_interface import RecommendationRepositoryInterface
+from domain.repositories.factor_repository_interface import FactorRepositoryInterface
+from domain.repositories.user_repository_interface import UserRepositoryInterface
+from domain.repositories.note_repository_interface import NoteRepositoryInterface
 from datetime import datetime, timedelta
 import uuid
 import random
@@ -27,11 +27,11 @@ logger = logging.getLogger(__name__)
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 async def initialize_sample_data(
-    client_repo: ClientRepository,
-    interaction_repo: InteractionRepository,
-    recommendation_repo: RecommendationRepository,
-    factor_repo: FactorRepository,
-    note_repo: Optional[NoteRepository] = None
+    client_repo: ClientRepositoryInterface,
+    interaction_repo: InteractionRepositoryInterface,
+    recommendation_repo: RecommendationRepositoryInterface,
+    factor_repo: FactorRepositoryInterface,
+    note_repo: Optional[NoteRepositoryInterface] = None
 ):
     """Initialize database with comprehensive sample data if empty"""
     try:
@@ -318,7 +318,7 @@ async def initialize_sample_data(
         logger.error(f"Error initializing sample data: {str(e)}")
         raise
 
-async def initialize_sample_users(user_repo: UserRepository):
+async def initialize_sample_users(user_repo: UserRepositoryInterface):
     """Initialize sample users with different roles"""
     try:
         # Check if users already exist
@@ -518,7 +518,7 @@ def generate_realistic_client_data(segment: str, base_churn_risk: int) -> Dict[s
 
 
 async def generate_additional_sample_clients(
-    client_repo: ClientRepository,
+    client_repo: ClientRepositoryInterface,
     count: int = 20
 ) -> List[Client]:
     """Generate additional diverse sample clients"""
@@ -589,12 +589,12 @@ async def generate_additional_sample_clients(
 
 
 async def initialize_comprehensive_sample_data(
-    client_repo: ClientRepository,
-    interaction_repo: InteractionRepository,
-    recommendation_repo: RecommendationRepository,
-    factor_repo: FactorRepository,
-    user_repo: UserRepository,
-    note_repo: Optional[NoteRepository] = None,
+    client_repo: ClientRepositoryInterface,
+    interaction_repo: InteractionRepositoryInterface,
+    recommendation_repo: RecommendationRepositoryInterface,
+    factor_repo: FactorRepositoryInterface,
+    user_repo: UserRepositoryInterface,
+    note_repo: Optional[NoteRepositoryInterface] = None,
     include_additional_clients: bool = True,
     additional_client_count: int = 15
 ):
@@ -638,9 +638,9 @@ async def initialize_comprehensive_sample_data(
 
 async def _add_sample_data_for_clients(
     clients: List[Client],
-    factor_repo: FactorRepository,
-    interaction_repo: InteractionRepository,
-    recommendation_repo: RecommendationRepository
+    factor_repo: FactorRepositoryInterface,
+    interaction_repo: InteractionRepositoryInterface,
+    recommendation_repo: RecommendationRepositoryInterface
 ):
     """Add factors, interactions, and recommendations for a list of clients"""
 
@@ -0,0 +1,188 @@
+# Pooled SMTP connections
+#
+# Opening an SMTP connection costs a TCP connect, EHLO, STARTTLS (a TLS
+# handshake and a second EHLO) and AUTH before the first message can go out.
+# SmtpConnectionPool keeps authenticated connections open and hands them out
+# for one message at a time, so a batch of notifications pays for that once
+# per connection instead of once per message.
+#
+# - At most `max_connections` connections are open at once; senders wait for
+#   a free one.
+# - A connection is closed after `max_messages_per_connection` messages
+#   (servers commonly cap messages per session) or once it has sat idle for
+#   `idle_timeout_seconds`, before the server drops it on its own.
+# - When a reused connection turns out to be dead (server disconnect, 421,
+#   socket error), it is discarded and the message is retried once on a fresh
+#   connection. Rejections of the message itself (bad recipient, data refused)
+#   are raised without a retry and leave the connection in the pool.
+#
+# smtplib is blocking, so messages are sent from a dedicated thread pool with
+# one thread per connection, off the event loop.
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from email.message import Message
+from typing import List, Optional
+import asyncio
+import logging
+import os
+import smtplib
+import threading
+import time
+
+# Reply code of a server closing the connection
+SERVICE_CLOSING = 421
+
+
+@dataclass
+class _PooledConnection:
+    smtp: smtplib.SMTP
+    last_used: float = field(default_factory=time.monotonic)
+    messages_sent: int = 0
+
+
+class SmtpConnectionPool:
+    def __init__(self, host: str, port: int, username: Optional[str], password: Optional[str],
+                 starttls: bool = True, max_connections: int = 4, max_messages_per_connection: int = 100,
+                 idle_timeout_seconds: float = 60.0, timeout_seconds: float = 30.0):
+        if max_connections < 1 or max_messages_per_connection < 1:
+            raise ValueError("SMTP pool needs at least one connection and one message per connection")
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.max_connections = max_connections
+        self.max_messages_per_connection = max_messages_per_connection
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.timeout_seconds = timeout_seconds
+        self._idle: List[_PooledConnection] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix="smtp")
+        self.connections_opened = 0
+        self.messages_sent = 0
+
+    async def send_message(self, message: Message) -> None:
+        """Send `message` to its To/Cc/Bcc recipients on a pooled connection"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self.send_message_sync, message)
+
+    def send_message_sync(self, message: Message) -> None:
+        with self._slots:
+            connection = self._take_idle()
+            reused = connection is not None
+            try:
+                if connection is None:
+                    connection = self._connect()
+                try:
+                    connection.smtp.send_message(message)
+                except Exception as e:
+                    if not reused or not self._is_connection_error(e):
+                        raise
+                    # The server closed the idle connection: retry once on a new one
+                    self._discard(connection)
+                    connection = None
+                    connection = self._connect()
+                    connection.smtp.send_message(message)
+            except Exception as e:
+                if connection is not None and self._is_connection_error(e):
+                    self._discard(connection)
+                elif connection is not None:
+                    self._release(connection)
+                raise
+            connection.messages_sent += 1
+            with self._lock:
+                self.messages_sent += 1
+            self._release(connection)
+
+    def close(self) -> None:
+        """Close idle connections and stop the sending threads"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            self._discard(connection)
+        self._executor.shutdown(wait=True)
+
+    def _connect(self) -> _PooledConnection:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout_seconds)
+        try:
+            if self.starttls:
+                smtp.starttls()
+            if self.username and self.password:
+                smtp.login(self.username, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        with self._lock:
+            self.connections_opened += 1
+        return _PooledConnection(smtp)
+
+    def _take_idle(self) -> Optional[_PooledConnection]:
+        """The most recently used idle connection, closing those idle for too long"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [c for c in self._idle if now - c.last_used >= self.idle_timeout_seconds]
+            self._idle = [c for c in self._idle if now - c.last_used < self.idle_timeout_seconds]
+            connection = self._idle.pop() if self._idle else None
+        for candidate in expired:
+            self._discard(candidate)
+        return connection
+
+    def _release(self, connection: _PooledConnection) -> None:
+        if connection.messages_sent >= self.max_messages_per_connection:
+            self._discard(connection)
+            return
+        connection.last_used = time.monotonic()
+        with self._lock:
+            self._idle.append(connection)
+
+    def _discard(self, connection: _PooledConnection) -> None:
+        try:
+            connection.smtp.quit()
+        except Exception:
+            connection.smtp.close()
+
+    @staticmethod
+    def _is_connection_error(error: Exception) -> bool:
+        # SMTP exceptions are OSErrors too: tell message rejections apart first
+        if isinstance(error, smtplib.SMTPServerDisconnected):
+            return True
+        if isinstance(error, smtplib.SMTPResponseException):
+            return error.smtp_code == SERVICE_CLOSING
+        if isinstance(error, smtplib.SMTPException):
+            return False
+        return isinstance(error, OSError)
+
+
+_pool: Optional[SmtpConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_smtp_pool() -> SmtpConnectionPool:
+    """Return the shared SMTP pool configured from the SMTP_* settings, creating it on first use"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = SmtpConnectionPool(
+                    host=os.getenv("SMTP_SERVER", "smtp.gmail.com"),
+                    port=int(os.getenv("SMTP_PORT", "587")),
+                    username=os.getenv("SMTP_USERNAME"),
+                    password=os.getenv("SMTP_PASSWORD"),
+                    starttls=os.getenv("SMTP_STARTTLS", "true").strip().lower() in ("1", "true", "yes"),
+                    max_connections=int(os.getenv("SMTP_POOL_SIZE", "4")),
+                    max_messages_per_connection=int(os.getenv("SMTP_MAX_MESSAGES_PER_CONNECTION", "100")),
+                    idle_timeout_seconds=float(os.getenv("SMTP_IDLE_TIMEOUT_SECONDS", "60")),
+                    timeout_seconds=float(os.getenv("SMTP_TIMEOUT_SECONDS", "30"))
+                )
+                logging.info(f"SMTP pool started with up to {_pool.max_connections} connections")
+    return _pool
+
+
+def close_smtp_pool() -> None:
+    """Close the shared SMTP pool's connections, if it was started"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
@@ -0,0 +1,95 @@
+# In-process background task queue
+#
+# A bounded asyncio queue drained by a fixed number of worker tasks running on
+# the application's event loop. Work is lost if the process exits before it
+# runs: the queue is meant for jobs whose progress is tracked elsewhere and
+# that a client can resubmit, not as a durable job store. Each worker process
+# has its own queue.
+from typing import Awaitable, Callable, Dict, List, Optional
+import asyncio
+import logging
+import os
+
+Task = Callable[[], Awaitable[None]]
+
+
+class TaskQueueFullError(Exception):
+    pass
+
+
+class TaskQueue:
+    def __init__(self, name: str, workers: int, max_size: int):
+        self.name = name
+        self.workers = workers
+        self.max_size = max_size
+        self._queue: Optional["asyncio.Queue[Task]"] = None
+        self._workers: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """Start the worker tasks on the running event loop"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"{self.name}-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logging.info(f"Task queue '{self.name}' started with {self.workers} workers")
+
+    async def stop(self) -> None:
+        """Cancel the workers; queued tasks that have not started are dropped"""
+        if not self.running:
+            return
+        dropped = self._queue.qsize()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        if dropped:
+            logging.warning(f"Task queue '{self.name}' stopped with {dropped} tasks still queued")
+
+    def submit(self, task: Task) -> None:
+        """Queue `task` to run on a worker; raises TaskQueueFullError when the queue is full"""
+        self.start()
+        try:
+            self._queue.put_nowait(task)
+        except asyncio.QueueFull:
+            raise TaskQueueFullError(f"Task queue '{self.name}' is full ({self.max_size} tasks)")
+
+    async def _work(self) -> None:
+        while True:
+            task = await self._queue.get()
+            try:
+                await task()
+            except Exception as e:
+                logging.error(f"Task in queue '{self.name}' failed: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+
+_queues: Dict[str, TaskQueue] = {}
+
+
+def get_task_queue(name: str, default_workers: int = 2, default_max_size: int = 100) -> TaskQueue:
+    """Return the named queue, sized by TASK_QUEUE_<NAME>_WORKERS / TASK_QUEUE_<NAME>_MAX_SIZE"""
+    queue = _queues.get(name)
+    if queue is None:
+        prefix = f"TASK_QUEUE_{name.upper()}"
+        queue = TaskQueue(
+            name,
+            workers=int(os.getenv(f"{prefix}_WORKERS", str(default_workers))),
+            max_size=int(os.getenv(f"{prefix}_MAX_SIZE", str(default_max_size)))
+        )
+        _queues[name] = queue
+    return queue
+
+
+async def stop_task_queues() -> None:
+    """Stop every queue created in this process"""
+    for queue in list(_queues.values()):
+        await queue.stop()
@@ -20,23 +20,54 @@ load_dotenv()
 # Import API modules
 from presentation.api.auth_api import router as auth_router
 from presentation.api.client_api import router as client_router
-from presentation.api.report_api import router as report_router
+from presentation.api.report_api import router as report_router, report_snapshots
 from presentation.api.note_api import router as note_router
 from presentation.api.customer_issues_api import router as customer_issues_router
 from presentation.api.email_notifications_api import router as email_notifications_router
 from presentation.api.customer_incident_predictions_api import router as customer_incident_predictions_router
+from presentation.api.imports_api import router as imports_router
+
+# Import pagination support
+from presentation.api.pagination import NEXT_CURSOR_HEADER
+
+# Import fast JSON response serialization and response compression
+from presentation.api.json_responses import FastJSONResponse
+from presentation.api.compression import CompressionMiddleware
+from domain.value_objects.page import InvalidPageRequestError
 
 # Import Supabase initializer
 from infrastructure.services.supabase_initializer import get_supabase_client
 
-# Import database schema initializer
-from infrastructure.services.db_schema_initializer import create_tables
+# Import database migration runner
+from infrastructure.services.migration_runner import run_migrations
+
+# Import Supabase query executor
+from infrastructure.services.query_executor import shutdown_query_executor
+
+# Import pooled SMTP connections
+from infrastructure.services.smtp_pool import close_smtp_pool
+
+# Import background import job queue and CSV parse executor
+from infrastructure.services.task_queue import stop_task_queues
+from application.services.csv_ingestion import shutdown_csv_executor
+
+# Import repository backend selection and PostgreSQL pool
+from infrastructure.repositories import repository_factory
+from infrastructure.services.postgres_pool import init_postgres_pool, close_postgres_pool
+
+# Import repository cache metrics
+from infrastructure.services.entity_cache import get_cache_stats
+
+# FAST_JSON_RESPONSES=false serializes responses with FastAPI's default
+# JSONResponse and response model validation instead of orjson
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "true").strip().lower() in ("1", "true", "yes")
 
 # Initialize FastAPI app
 app = FastAPI(
     title="ChurnGuard API", 
     description="API for ChurnGuard application",
-    version="1.0.0"
+    version="2.0.0",
+    default_response_class=FastJSONResponse if FAST_JSON_RESPONSES else JSONResponse
 )
 
 # Error handling middleware
@@ -62,6 +93,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
+)
+
+# Compress responses with brotli or gzip; bodies under COMPRESSION_MINIMUM_SIZE
+# bytes are sent as they are
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024")),
+    gzip_level=int(os.getenv("COMPRESSION_GZIP_LEVEL", "6")),
+    brotli_quality=int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4")),
 )
 
 # Global exception handlers
@@ -72,6 +113,13 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         content={"detail": exc.errors(), "body": exc.body},
     )
 
+@app.exception_handler(InvalidPageRequestError)
+async def invalid_page_request_handler(request: Request, exc: InvalidPageRequestError):
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": str(exc)},
+    )
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     logging.error(f"Unhandled exception: {str(exc)}")
@@ -81,13 +129,6 @@ async def global_exception_handler(request: Request, exc: Exception):
         content={"detail": "Internal server error"},
     )
 
-# Initialize Supabase
-try:
-    supabase = get_supabase_client()
-except ValueError as e:
-    logging.error(f"Failed to initialize Supabase: {str(e)}")
-    supabase = None
-
 # Include routers
 app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 app.include_router(client_router, prefix="/clients", tags=["Clients"])
@@ -96,40 +137,49 @@ app.include_router(note_router, prefix="/notes", tags=["Notes"])
 app.include_router(customer_issues_router, prefix="/customer-issues", tags=["Customer Issues"])
 app.include_router(email_notifications_router, prefix="/email-notifications", tags=["Email Notifications"])
 app.include_router(customer_incident_predictions_router, prefix="/customer-incident-predictions", tags=["Customer Incident Predictions"])
+app.include_router(imports_router, prefix="/imports", tags=["Imports"])
 
 # Health check endpoint
 @app.get("/health", tags=["Health"])
 async def health_check():
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
+@app.get("/health/cache", tags=["Health"])
+async def cache_metrics():
+    """Hit/miss metrics of the repository caches in this worker"""
+    return {"enabled": repository_factory.cache_enabled(), "caches": get_cache_stats()}
+
 # Initialize sample data on startup
 @app.on_event("startup")
 async def startup_db_client():
     try:
-        # First create database tables if they don't exist
-        await create_tables()
+        # First bring the database schema up to date
+        await run_migrations()
         
-        # Initialize Supabase connection
-        try:
-            supabase_client = get_supabase_client()
-        except ValueError as e:
-            logging.error(f"Supabase client initialization failed: {str(e)}")
-            logging.warning("Application will run with limited functionality.")
-            return
+        # Initialize the database connection for the selected repository backend
+        if repository_factory.uses_postgres_backend():
+            try:
+                await init_postgres_pool()
+            except Exception as e:
+                logging.error(f"PostgreSQL pool initialization failed: {str(e)}")
+                logging.warning("Application will run with limited functionality.")
+                return
+        else:
+            try:
+                get_supabase_client()
+            except ValueError as e:
+                logging.error(f"Supabase client initialization failed: {str(e)}")
+                logging.warning("Application will run with limited functionality.")
+                return
             
         # Then initialize repositories and sample data
-        from infrastructure.repositories.client_repository import ClientRepository
-        from infrastructure.repositories.interaction_repository import InteractionRepository
-        from infrastructure.repositories.recommendation_repository import RecommendationRepository
-        from infrastructure.repositories.factor_repository import FactorRepository
-        from infrastructure.repositories.user_repository import UserRepository
         from infrastructure.services.sample_data_initializer import initialize_sample_data, initialize_sample_users
         
-        client_repo = ClientRepository(supabase)
-        interaction_repo = InteractionRepository(supabase)
-        recommendation_repo = RecommendationRepository(supabase)
-        factor_repo = FactorRepository(supabase)
-        user_repo = UserRepository(supabase)
+        client_repo = repository_factory.get_client_repository()
+        interaction_repo = repository_factory.get_interaction_repository()
+        recommendation_repo = repository_factory.get_recommendation_repository()
+        factor_repo = repository_factory.get_factor_repository()
+        user_repo = repository_factory.get_user_repository()
         
         try:
             # Initialize sample clients, interactions, etc.
@@ -145,10 +195,24 @@ async def startup_db_client():
         except Exception as e:
             logging.error(f"Error initializing sample data: {str(e)}")
             logging.warning("Application will continue without sample data.")
+
+        # Precompute report snapshots once the sample data is in place
+        report_snapshots.start()
     except Exception as e:
         logging.error(f"Startup process failed: {str(e)}")
         logging.warning("Application started with errors. Some features may not work correctly.")
 
+@app.on_event("shutdown")
+async def shutdown_db_client():
+    # Stop background imports before the connections they write through
+    await stop_task_queues()
+    shutdown_csv_executor()
+    await report_snapshots.stop()
+    close_smtp_pool()
+    # Let in-flight Supabase queries finish before the worker exits
+    shutdown_query_executor()
+    await close_postgres_pool()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
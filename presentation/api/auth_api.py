@@ -1,23 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Body, Query, Response
 from fastapi.security import OAuth2PasswordBearer
-from application.services.auth_service import AuthApplicationService
+from application.services.auth_service import AUTH_MODE_STATELESS, AuthApplicationService
 from application.dtos.auth_dtos import UserCreateDTO, UserLoginDTO, TokenResponseDTO, UserProfileDTO, UserListDTO, UserUpdateDTO
-from infrastructure.repositories.user_repository import UserRepository
+from domain.value_objects.page import PageRequest
+from infrastructure.repositories.repository_factory import get_user_repository
 from infrastructure.services.jwt_service import JWTService
-from infrastructure.services.supabase_initializer import get_supabase_client
+from presentation.api.fields import sparse_fields_param, sparse_response
+from presentation.api.pagination import page_request_params, set_next_cursor
+from presentation.api.json_responses import FastJSONRoute
 import jwt
 from pydantic import BaseModel
+from typing import List, Optional
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 # Services
-supabase_client = get_supabase_client()
-user_repository = UserRepository(supabase_client)
+user_repository = get_user_repository()
 jwt_service = JWTService()
-auth_service = AuthApplicationService(user_repository, jwt_service, supabase_client)
+auth_service = AuthApplicationService(user_repository, jwt_service)
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserProfileDTO:
     """Get current user from token"""
@@ -34,7 +37,8 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserProfileDT
     except jwt.PyJWTError:
         raise credentials_exception
     
-    return await auth_service.get_current_user(user_id)
+    # With AUTH_MODE=stateless this is answered from the token's id and role
+    return await auth_service.get_current_user_from_claims(payload)
 
 @router.post("/register", response_model=TokenResponseDTO)
 async def register_user(user: UserCreateDTO):
@@ -49,12 +53,30 @@ async def login_user(user: UserLoginDTO):
 @router.get("/me", response_model=UserProfileDTO)
 async def read_users_me(current_user: UserProfileDTO = Depends(get_current_user)):
     """Get current user profile"""
+    if auth_service.auth_mode == AUTH_MODE_STATELESS:
+        # Stateless tokens only identify the user and role
+        return await auth_service.get_current_user(current_user.id)
     return current_user
 
 @router.get("/users", response_model=UserListDTO)
-async def get_all_users(current_user: UserProfileDTO = Depends(get_current_user)):
-    """Get all users (admin only)"""
-    return await auth_service.get_all_users(current_user)
+async def get_all_users(
+    response: Response,
+    role: Optional[str] = Query(None, description="Filter by role"),
+    page_request: PageRequest = Depends(page_request_params),
+    fields: Optional[List[str]] = Depends(sparse_fields_param(UserProfileDTO)),
+    current_user: UserProfileDTO = Depends(get_current_user)
+):
+    """Get one page of users (admin only)
+
+    Sort keys: created_at (default), full_name, email.
+    """
+    if role:
+        page_request.filters["role"] = role
+    user_list = await auth_service.get_all_users(current_user, page_request, fields)
+    if fields:
+        return sparse_response(user_list, user_list)
+    set_next_cursor(response, user_list)
+    return user_list
 
 @router.delete("/users/{user_id}")
 async def delete_user(
@@ -1,25 +1,28 @@
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query, Response
 from application.services.client_service import ClientApplicationService
 from application.dtos.auth_dtos import UserProfileDTO
 from application.dtos.client_dtos import ClientDTO, ClientDetailDTO, ClientCreateDTO
-from infrastructure.repositories.client_repository import ClientRepository
-from infrastructure.repositories.interaction_repository import InteractionRepository
-from infrastructure.repositories.recommendation_repository import RecommendationRepository
-from infrastructure.repositories.factor_repository import FactorRepository
+from infrastructure.repositories.repository_factory import (
+    get_client_repository,
+    get_interaction_repository,
+    get_recommendation_repository,
+    get_factor_repository
+)
+from domain.value_objects.page import PageRequest
 from presentation.api.auth_api import get_current_user
-from typing import List
-from infrastructure.services.supabase_initializer import get_supabase_client
-
-router = APIRouter()
+from presentation.api.conditional import conditional_get
+from presentation.api.fields import sparse_fields_param, sparse_response
+from presentation.api.pagination import page_request_params, set_next_cursor
+from presentation.api.json_responses import FastJSONRoute
+from typing import List, Optional
 
-# Supabase client
-supabase_client = get_supabase_client()
+router = APIRouter(route_class=FastJSONRoute)
 
 # Repositories
-client_repository = ClientRepository(supabase_client)
-interaction_repository = InteractionRepository(supabase_client)
-recommendation_repository = RecommendationRepository(supabase_client)
-factor_repository = FactorRepository(supabase_client)
+client_repository = get_client_repository()
+interaction_repository = get_interaction_repository()
+recommendation_repository = get_recommendation_repository()
+factor_repository = get_factor_repository()
 
 # Services
 client_service = ClientApplicationService(
@@ -29,10 +32,44 @@ client_service = ClientApplicationService(
     factor_repository
 )
 
-@router.get("/", response_model=List[ClientDTO])
-async def get_clients(current_user: UserProfileDTO = Depends(get_current_user)):
-    """Get all clients"""
-    return await client_service.get_all_clients()
+@router.get("/", response_model=List[ClientDTO], dependencies=[Depends(conditional_get("clients"))])
+async def get_clients(
+    response: Response,
+    segment: Optional[str] = Query(None, description="Filter by segment"),
+    churn_risk: Optional[str] = Query(None, description="Filter by churn risk"),
+    page_request: PageRequest = Depends(page_request_params),
+    fields: Optional[List[str]] = Depends(sparse_fields_param(ClientDTO)),
+    current_user: UserProfileDTO = Depends(get_current_user)
+):
+    """Get one page of clients
+
+    Sort keys: created_at (default), name, segment.
+    """
+    if segment:
+        page_request.filters["segment"] = segment
+    if churn_risk:
+        page_request.filters["churn_risk"] = churn_risk
+    page = await client_service.get_clients_page(page_request, fields)
+    if fields:
+        return sparse_response(page.items, page)
+    set_next_cursor(response, page)
+    return page.items
+
+@router.get(
+    "/details",
+    response_model=List[ClientDetailDTO],
+    dependencies=[Depends(conditional_get("clients", "interactions", "recommendations", "factors"))]
+)
+async def get_client_details(
+    ids: List[str] = Query(..., description="Client IDs, repeated or comma-separated"),
+    current_user: UserProfileDTO = Depends(get_current_user)
+):
+    """Get detailed information for several clients at once
+
+    Unknown IDs are skipped; results follow the requested order.
+    """
+    client_ids = [client_id.strip() for value in ids for client_id in value.split(",") if client_id.strip()]
+    return await client_service.get_client_details(client_ids)
 
 @router.get("/{client_id}/detail", response_model=ClientDetailDTO)
 async def get_client_detail(
@@ -0,0 +1,165 @@
+# Response compression
+#
+# CompressionMiddleware compresses response bodies with brotli or gzip,
+# whichever the client accepts (brotli is preferred when both are). Bodies
+# smaller than `minimum_size` are sent as they are, since compressing them
+# costs more than it saves, and so are responses that are already encoded or
+# whose media type does not compress well.
+#
+# Streaming responses (CSV and NDJSON exports) are compressed chunk by chunk:
+# only the first `minimum_size` bytes are held back to decide whether to
+# compress at all, and every chunk is flushed to the client as soon as it is
+# compressed, so the download starts before the export has finished.
+#
+# Every response with a compressible media type carries `Vary: Accept-Encoding`,
+# including the ones sent uncompressed because they are small or because the
+# client accepts no supported encoding, so caches never hand an encoding
+# chosen for one client to another.
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import List, Optional
+import brotli
+import zlib
+
+COMPRESSIBLE_MEDIA_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+)
+
+# Server preference when the client accepts several encodings equally
+ENCODINGS = ("br", "gzip")
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """The preferred encoding accepted by an Accept-Encoding header, or None"""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, parameters = item.partition(";")
+        name = name.strip().lower()
+        quality = 1.0
+        parameter, _, value = parameters.partition("=")
+        if parameter.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name] = quality
+    wildcard = accepted.get("*", 0.0)
+    candidates = [(accepted.get(encoding, wildcard), -rank, encoding) for rank, encoding in enumerate(ENCODINGS)]
+    quality, _, encoding = max(candidates)
+    return encoding if quality > 0 else None
+
+
+class _Compressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+            self._gzip = None
+        else:
+            self._brotli = None
+            # wbits 16 + MAX_WBITS writes a gzip header and trailer
+            self._gzip = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """Compress a chunk; non-final chunks are flushed so the client can decode them"""
+        if self._brotli is not None:
+            output = self._brotli.process(data) if data else b""
+            return output + (self._brotli.finish() if final else self._brotli.flush())
+        return self._gzip.compress(data) + self._gzip.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        if minimum_size < 0 or not 1 <= gzip_level <= 9 or not 0 <= brotli_quality <= 11:
+            raise ValueError("Invalid compression settings: gzip level is 1-9 and brotli quality 0-11")
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        responder = _CompressionResponder(send, encoding, self.minimum_size, self.gzip_level, self.brotli_quality)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: Optional[str], minimum_size: int, gzip_level: int, brotli_quality: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self._start: Optional[Message] = None
+        self._pending: List[bytes] = []
+        self._pending_size = 0
+        self._compressor: Optional[_Compressor] = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            compressible = self._compressible(Headers(raw=message["headers"]))
+            if compressible:
+                MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+            self._passthrough = not compressible or self.encoding is None
+            if self._passthrough:
+                await self._send(message)
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._compressor is not None:
+            await self._send_compressed(body, more_body)
+            return
+        # Hold back chunks until the body is known to be large enough
+        self._pending.append(body)
+        self._pending_size += len(body)
+        if self._pending_size < self.minimum_size and more_body:
+            return
+        body = b"".join(self._pending)
+        self._pending = []
+        if self._pending_size < self.minimum_size:
+            await self._send(self._start)
+            await self._send({"type": "http.response.body", "body": body, "more_body": False})
+            return
+        headers = MutableHeaders(raw=self._start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # The compressed body is a different representation of the resource
+            headers["ETag"] = f"W/{etag}"
+        self._compressor = _Compressor(self.encoding, self.gzip_level, self.brotli_quality)
+        if more_body:
+            del headers["Content-Length"]
+            await self._send(self._start)
+            await self._send_compressed(body, more_body)
+            return
+        compressed = self._compressor.compress(body, final=True)
+        headers["Content-Length"] = str(len(compressed))
+        await self._send(self._start)
+        await self._send({"type": "http.response.body", "body": compressed, "more_body": False})
+
+    async def _send_compressed(self, body: bytes, more_body: bool) -> None:
+        await self._send({
+            "type": "http.response.body",
+            "body": self._compressor.compress(body, final=not more_body),
+            "more_body": more_body
+        })
+
+    def _compressible(self, headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return media_type.startswith(COMPRESSIBLE_MEDIA_TYPES) or media_type.endswith("+json")
+
@@ -0,0 +1,97 @@
+# Conditional GET for polled endpoints
+#
+# conditional_get(*tables) is a route dependency that computes a strong ETag
+# from the change counters of the tables an endpoint reads (table_versions,
+# migration 0005), the request path and query string, and the API version.
+# When the request's If-None-Match already holds that ETag, it answers
+# 304 Not Modified before the endpoint runs, so unchanged polls cost one
+# primary-key lookup instead of the full query and serialization.
+#
+# Versions are read before the data, so a write landing in between only makes
+# the next poll fetch again; it can never hide a change. If-None-Match is
+# compared weakly, since CompressionMiddleware sends a compressed body's ETag
+# as W/"...".
+#
+# ETAGS_ENABLED=false turns the dependency into a no-op.
+from fastapi import Depends, HTTPException, Request, Response, status
+from application.dtos.auth_dtos import UserProfileDTO
+from infrastructure.repositories.repository_factory import get_table_version_repository
+from presentation.api.auth_api import get_current_user
+from typing import Callable, Dict, Optional, Sequence
+import hashlib
+import logging
+import os
+
+_versions_unavailable_logged = False
+
+
+def etags_enabled() -> bool:
+    return os.getenv("ETAGS_ENABLED", "true").strip().lower() in ("1", "true", "yes")
+
+
+def compute_etag(request: Request, versions: Dict[str, int]) -> str:
+    """Strong ETag of a response given the versions of the tables it reads"""
+    key = "\n".join([
+        request.app.version,
+        request.url.path,
+        request.url.query,
+        ",".join(f"{table}:{version}" for table, version in sorted(versions.items()))
+    ])
+    return '"' + hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest() + '"'
+
+
+def matching_etag(if_none_match: str, etag: str) -> Optional[str]:
+    """The If-None-Match entry that weakly matches `etag`, as the client sent it"""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return etag
+        if candidate.removeprefix("W/") == etag:
+            return candidate
+    return None
+
+
+async def read_table_versions(tables: Sequence[str]) -> Optional[Dict[str, int]]:
+    """Current versions of `tables`, or None when they cannot be read"""
+    global _versions_unavailable_logged
+    try:
+        return await get_table_version_repository().get_versions(tables)
+    except Exception as e:
+        # Without the table_versions migration, serve responses without ETags
+        if not _versions_unavailable_logged:
+            logging.warning(f"Table versions unavailable, ETags disabled: {str(e)}")
+            _versions_unavailable_logged = True
+        return None
+
+
+def check_not_modified(request: Request, response: Response, versions: Dict[str, int]) -> None:
+    """Raise 304 when the client holds the ETag for `versions`, else set it on the response
+
+    Headers already set on `response` are sent with the 304 too.
+    """
+    etag = compute_etag(request, versions)
+    matched = matching_etag(request.headers.get("if-none-match", ""), etag)
+    if matched:
+        # Echo the client's tag, which may be the weak form of a compressed body
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={**response.headers, "ETag": matched})
+    response.headers["ETag"] = etag
+
+
+def conditional_get(*tables: str) -> Callable[..., None]:
+    """Dependency answering 304 when none of `tables` changed since the client's copy
+
+    Endpoints that read no tables get an ETag that changes only with the
+    request and API version.
+    """
+    async def check_etag(
+        request: Request,
+        response: Response,
+        current_user: UserProfileDTO = Depends(get_current_user)
+    ) -> None:
+        if not etags_enabled():
+            return
+        versions = await read_table_versions(tables)
+        if versions is not None:
+            check_not_modified(request, response, versions)
+
+    return check_etag
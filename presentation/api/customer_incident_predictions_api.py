@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Path, Query, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, Path, Query, HTTPException, Response, UploadFile, File
 from application.services.customer_incident_prediction_service import CustomerIncidentPredictionApplicationService
 from application.dtos.auth_dtos import UserProfileDTO
 from application.dtos.customer_incident_prediction_dtos import (
@@ -7,42 +7,80 @@ from application.dtos.customer_incident_prediction_dtos import (
     CustomerIncidentPredictionUpdateDTO
 )
 from domain.entities.customer_incident_prediction import IncidentType
-from infrastructure.repositories.customer_incident_prediction_repository import CustomerIncidentPredictionRepository
+from domain.value_objects.page import PageRequest
+from infrastructure.repositories.repository_factory import get_customer_incident_prediction_repository
 from presentation.api.auth_api import get_current_user
+from presentation.api.conditional import conditional_get
+from presentation.api.imports_api import queue_csv_import
+from presentation.api.fields import sparse_fields_param, sparse_response
+from presentation.api.export import export_format_param, export_page_request, export_response
+from presentation.api.pagination import page_request_params, set_next_cursor
+from presentation.api.json_responses import FastJSONRoute
 from typing import List, Optional
-from infrastructure.services.supabase_initializer import get_supabase_client
 
-router = APIRouter()
-
-# Supabase client
-supabase_client = get_supabase_client()
+router = APIRouter(route_class=FastJSONRoute)
 
 # Repository
-prediction_repository = CustomerIncidentPredictionRepository(supabase_client)
+prediction_repository = get_customer_incident_prediction_repository()
 
 # Service
 prediction_service = CustomerIncidentPredictionApplicationService(prediction_repository)
 
-@router.get("/", response_model=List[CustomerIncidentPredictionDTO])
+@router.get("/", response_model=List[CustomerIncidentPredictionDTO], dependencies=[Depends(conditional_get("customer_incident_predictions"))])
 async def get_all_customer_incident_predictions(
+    response: Response,
     region: Optional[str] = Query(None, description="Filter by client region"),
+    client_type: Optional[str] = Query(None, description="Filter by client type"),
     incident_type: Optional[IncidentType] = Query(None, description="Filter by incident type"),
     min_risk: Optional[float] = Query(None, description="Filter by minimum average risk percentage"),
+    risk_level: Optional[str] = Query(None, regex="^(High|Medium|Low)$", description="Filter by risk level"),
+    page_request: PageRequest = Depends(page_request_params),
+    fields: Optional[List[str]] = Depends(sparse_fields_param(CustomerIncidentPredictionDTO)),
     current_user: UserProfileDTO = Depends(get_current_user)
 ):
-    """Get all customer incident predictions with optional filters"""
+    """Get one page of customer incident predictions with optional filters
+
+    Sort keys: created_at (default), id, customer_id, avg_risk.
+    """
     if region:
-        return await prediction_service.get_predictions_by_region(region)
-    elif incident_type:
-        return await prediction_service.get_predictions_by_incident_type(incident_type)
-    elif min_risk is not None:
-        return await prediction_service.get_high_risk_predictions(min_risk)
-    else:
-        return await prediction_service.get_all_predictions()
+        page_request.filters["client_region"] = region
+    if client_type:
+        page_request.filters["client_type"] = client_type
+    if incident_type:
+        page_request.filters["most_likely_incident"] = incident_type.value
+    if min_risk is not None:
+        page_request.filters["avg_risk__gte"] = min_risk
+    if risk_level:
+        page_request.filters["risk_level"] = risk_level
+    page = await prediction_service.get_predictions_page(page_request, fields)
+    if fields:
+        return sparse_response(page.items, page)
+    set_next_cursor(response, page)
+    return page.items
+
+@router.get("/export")
+async def export_customer_incident_predictions(
+    region: Optional[str] = Query(None, description="Filter by client region"),
+    risk_level: Optional[str] = Query(None, regex="^(High|Medium|Low)$", description="Filter by risk level"),
+    export_format: str = Depends(export_format_param),
+    current_user: UserProfileDTO = Depends(get_current_user)
+):
+    """Stream all customer incident predictions as CSV or NDJSON, in id order"""
+    page_request = export_page_request()
+    if region:
+        page_request.filters["client_region"] = region
+    if risk_level:
+        page_request.filters["risk_level"] = risk_level
+    return export_response(
+        prediction_service.get_predictions_page, page_request, CustomerIncidentPredictionDTO,
+        export_format, "customer-incident-predictions"
+    )
 
 @router.post("/upload-csv")
 async def upload_csv_customer_incident_predictions(
+    response: Response,
     file: UploadFile = File(...),
+    wait: bool = Query(False, description="Process the file within the request instead of queueing an import job"),
     current_user: UserProfileDTO = Depends(get_current_user)
 ):
     """Upload and process a CSV file with customer incident predictions
@@ -52,18 +90,21 @@ async def upload_csv_customer_incident_predictions(
     Valid incident types: internet_problem, wifi_issue, hardware_config, slow_connection, disconnection, other_incident
     
     Note: Each customer_id must be unique. If a customer_id already exists in the database, the upload will fail.
+    
+    The file is queued as a background import job: the response is 202 with
+    the job id, and progress is polled at GET /imports/{job_id}. With
+    `wait=true` the file is processed before responding.
     """
     # Validate file type
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="File must be a CSV file")
     
+    if not wait:
+        return await queue_csv_import("customer_incident_predictions", file, prediction_service.process_csv_file, response, current_user)
+    
     try:
-        # Read file content
-        content = await file.read()
-        csv_content = content.decode('utf-8')
-        
-        # Process the CSV file
-        result = await prediction_service.process_csv_file(csv_content)
+        # Parse the spooled upload incrementally instead of reading it into memory
+        result = await prediction_service.process_csv_file(file.file)
         
         if result["success"]:
             return {
@@ -90,6 +131,8 @@ async def upload_csv_customer_incident_predictions(
                 detail=error_detail
             )
             
+    except HTTPException:
+        raise
     except UnicodeDecodeError:
         raise HTTPException(status_code=400, detail="File must be a valid UTF-8 encoded CSV file")
     except Exception as e:
@@ -106,15 +149,15 @@ async def get_prediction_by_customer_id(
         raise HTTPException(status_code=404, detail="Customer incident prediction not found")
     return prediction
 
-@router.get("/high-risk", response_model=List[CustomerIncidentPredictionDTO])
+@router.get("/high-risk", response_model=List[CustomerIncidentPredictionDTO], dependencies=[Depends(conditional_get("customer_incident_predictions"))])
 async def get_high_risk_predictions(
     min_risk: float = Query(60.0, description="Minimum average risk percentage (default: 60.0)"),
     current_user: UserProfileDTO = Depends(get_current_user)
 ):
-    """Get high-risk customer predictions"""
+    """Get high-risk customer predictions, highest average risk first"""
     return await prediction_service.get_high_risk_predictions(min_risk)
 
-@router.get("/region/{region}", response_model=List[CustomerIncidentPredictionDTO])
+@router.get("/region/{region}", response_model=List[CustomerIncidentPredictionDTO], dependencies=[Depends(conditional_get("customer_incident_predictions"))])
 async def get_predictions_by_region(
     region: str = Path(..., title="The client region to filter by"),
     current_user: UserProfileDTO = Depends(get_current_user)
@@ -122,7 +165,7 @@ async def get_predictions_by_region(
     """Get customer incident predictions by region"""
     return await prediction_service.get_predictions_by_region(region)
 
-@router.get("/incident-type/{incident_type}", response_model=List[CustomerIncidentPredictionDTO])
+@router.get("/incident-type/{incident_type}", response_model=List[CustomerIncidentPredictionDTO], dependencies=[Depends(conditional_get("customer_incident_predictions"))])
 async def get_predictions_by_incident_type(
     incident_type: IncidentType = Path(..., title="The incident type to filter by"),
     current_user: UserProfileDTO = Depends(get_current_user)
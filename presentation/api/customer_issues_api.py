@@ -1,48 +1,87 @@
-from fastapi import APIRouter, Depends, Path, Query, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, Path, Query, HTTPException, Response, UploadFile, File
 from application.services.customer_issue_service import CustomerIssueApplicationService
 from application.dtos.auth_dtos import UserProfileDTO
 from application.dtos.customer_issue_dtos import CustomerIssueDTO, CustomerIssueCreateDTO, CustomerIssueUpdateDTO
-from infrastructure.repositories.customer_issue_repository import CustomerIssueRepository
+from domain.value_objects.page import PageRequest
+from infrastructure.repositories.repository_factory import get_customer_issue_repository
 from presentation.api.auth_api import get_current_user
-from typing import List
-from infrastructure.services.supabase_initializer import get_supabase_client
+from presentation.api.imports_api import queue_csv_import
+from presentation.api.export import export_format_param, export_page_request, export_response
+from presentation.api.pagination import page_request_params, set_next_cursor
+from presentation.api.json_responses import FastJSONRoute
+from typing import List, Optional
 
-router = APIRouter()
-
-# Supabase client
-supabase_client = get_supabase_client()
+router = APIRouter(route_class=FastJSONRoute)
 
 # Repository
-customer_issue_repository = CustomerIssueRepository(supabase_client)
+customer_issue_repository = get_customer_issue_repository()
 
 # Service
 customer_issue_service = CustomerIssueApplicationService(customer_issue_repository)
 
 @router.get("/", response_model=List[CustomerIssueDTO])
-async def get_all_customer_issues(current_user: UserProfileDTO = Depends(get_current_user)):
-    """Get all customer issues with all columns"""
-    return await customer_issue_service.get_all_customer_issues()
+async def get_all_customer_issues(
+    response: Response,
+    status: Optional[str] = Query(None, description="Filter by status"),
+    incident_title: Optional[str] = Query(None, description="Filter by incident title"),
+    min_churn_risk: Optional[float] = Query(None, description="Filter by minimum churn risk"),
+    page_request: PageRequest = Depends(page_request_params),
+    current_user: UserProfileDTO = Depends(get_current_user)
+):
+    """Get one page of customer issues with all columns
+
+    Sort keys: id (default), created_at.
+    """
+    if status:
+        page_request.filters["status"] = status
+    if incident_title:
+        page_request.filters["incident_title"] = incident_title
+    if min_churn_risk is not None:
+        page_request.filters["churn_risk__gte"] = min_churn_risk
+    page = await customer_issue_service.get_customer_issues_page(page_request)
+    set_next_cursor(response, page)
+    return page.items
+
+@router.get("/export")
+async def export_customer_issues(
+    status: Optional[str] = Query(None, description="Filter by status"),
+    export_format: str = Depends(export_format_param),
+    current_user: UserProfileDTO = Depends(get_current_user)
+):
+    """Stream all customer issues as CSV or NDJSON, in id order"""
+    page_request = export_page_request()
+    if status:
+        page_request.filters["status"] = status
+    return export_response(
+        customer_issue_service.get_customer_issues_page, page_request, CustomerIssueDTO,
+        export_format, "customer-issues"
+    )
 
 @router.post("/upload-csv")
 async def upload_csv_customer_issues(
+    response: Response,
     file: UploadFile = File(...),
+    wait: bool = Query(False, description="Process the file within the request instead of queueing an import job"),
     current_user: UserProfileDTO = Depends(get_current_user)
 ):
     """Upload and process a CSV file with customer issues
     
     Expected CSV headers: customer_id,code_contrat,client_type,client_region,client_categorie,incident_title,churn_risk
+    
+    The file is queued as a background import job: the response is 202 with
+    the job id, and progress is polled at GET /imports/{job_id}. With
+    `wait=true` the file is processed before responding.
     """
     # Validate file type
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="File must be a CSV file")
     
+    if not wait:
+        return await queue_csv_import("customer_issues", file, customer_issue_service.process_csv_file, response, current_user)
+    
     try:
-        # Read file content
-        content = await file.read()
-        csv_content = content.decode('utf-8')
-        
-        # Process the CSV file
-        result = await customer_issue_service.process_csv_file(csv_content)
+        # Parse the spooled upload incrementally instead of reading it into memory
+        result = await customer_issue_service.process_csv_file(file.file)
         
         if result["success"]:
             return {
@@ -60,6 +99,8 @@ async def upload_csv_customer_issues(
                 }
             )
             
+    except HTTPException:
+        raise
     except UnicodeDecodeError:
         raise HTTPException(status_code=400, detail="File must be a valid UTF-8 encoded CSV file")
     except Exception as e:
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Path, Query, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, Path, Query, HTTPException, Response, UploadFile, File
 from application.services.email_notification_service import EmailNotificationApplicationService
 from application.dtos.auth_dtos import UserProfileDTO
 from application.dtos.email_notification_dtos import (
@@ -9,52 +9,80 @@ from application.dtos.email_notification_dtos import (
     EmailSendResponseDTO
 )
 from domain.entities.email_notification import NotificationStatus
-from infrastructure.repositories.email_notification_repository import EmailNotificationRepository
+from domain.value_objects.page import PageRequest
+from infrastructure.repositories.repository_factory import get_email_notification_repository
 from presentation.api.auth_api import get_current_user
+from presentation.api.imports_api import queue_csv_import
+from presentation.api.export import export_format_param, export_page_request, export_response
+from presentation.api.pagination import page_request_params, set_next_cursor
+from presentation.api.json_responses import FastJSONRoute
 from typing import List, Optional
-from infrastructure.services.supabase_initializer import get_supabase_client
 
-router = APIRouter()
-
-# Supabase client
-supabase_client = get_supabase_client()
+router = APIRouter(route_class=FastJSONRoute)
 
 # Repository
-email_notification_repository = EmailNotificationRepository(supabase_client)
+email_notification_repository = get_email_notification_repository()
 
 # Service
 email_notification_service = EmailNotificationApplicationService(email_notification_repository)
 
 @router.get("/", response_model=List[EmailNotificationDTO])
 async def get_all_email_notifications(
+    response: Response,
     status: Optional[NotificationStatus] = Query(None, description="Filter by status"),
+    page_request: PageRequest = Depends(page_request_params),
     current_user: UserProfileDTO = Depends(get_current_user)
 ):
-    """Get all email notifications, optionally filtered by status"""
+    """Get one page of email notifications, optionally filtered by status
+
+    Sort keys: created_at (default), id.
+    """
     if status:
-        return await email_notification_service.get_notifications_by_status(status)
-    return await email_notification_service.get_all_email_notifications()
+        page_request.filters["status"] = status.value
+    page = await email_notification_service.get_email_notifications_page(page_request)
+    set_next_cursor(response, page)
+    return page.items
+
+@router.get("/export")
+async def export_email_notifications(
+    status: Optional[NotificationStatus] = Query(None, description="Filter by status"),
+    export_format: str = Depends(export_format_param),
+    current_user: UserProfileDTO = Depends(get_current_user)
+):
+    """Stream all email notifications as CSV or NDJSON, in id order"""
+    page_request = export_page_request()
+    if status:
+        page_request.filters["status"] = status.value
+    return export_response(
+        email_notification_service.get_email_notifications_page, page_request, EmailNotificationDTO,
+        export_format, "email-notifications"
+    )
 
 @router.post("/upload-csv")
 async def upload_csv_email_notifications(
+    response: Response,
     file: UploadFile = File(...),
+    wait: bool = Query(False, description="Process the file within the request instead of queueing an import job"),
     current_user: UserProfileDTO = Depends(get_current_user)
 ):
     """Upload and process a CSV file with email notifications
     
     Expected CSV headers: email,name,issue,status (status is optional, defaults to 'pending')
+    
+    The file is queued as a background import job: the response is 202 with
+    the job id, and progress is polled at GET /imports/{job_id}. With
+    `wait=true` the file is processed before responding.
     """
     # Validate file type
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="File must be a CSV file")
     
+    if not wait:
+        return await queue_csv_import("email_notifications", file, email_notification_service.process_csv_file, response, current_user)
+    
     try:
-        # Read file content
-        content = await file.read()
-        csv_content = content.decode('utf-8')
-        
-        # Process the CSV file
-        result = await email_notification_service.process_csv_file(csv_content)
+        # Parse the spooled upload incrementally instead of reading it into memory
+        result = await email_notification_service.process_csv_file(file.file)
         
         if result["success"]:
             return {
@@ -72,6 +100,8 @@ async def upload_csv_email_notifications(
                 }
             )
             
+    except HTTPException:
+        raise
     except UnicodeDecodeError:
         raise HTTPException(status_code=400, detail="File must be a valid UTF-8 encoded CSV file")
     except Exception as e:
@@ -0,0 +1,38 @@
+from fastapi import HTTPException, Query, status
+from domain.value_objects.page import Page
+from presentation.api.json_responses import FastJSONResponse
+from presentation.api.pagination import set_next_cursor
+from pydantic import BaseModel
+from typing import Any, List, Optional, Type
+
+def sparse_fields_param(dto_class: Type[BaseModel]):
+    """Build a dependency parsing `fields=` into DTO field names (None when absent)
+
+    `id` is always included so rows stay addressable.
+    """
+    valid_fields = list(dto_class.__fields__)
+
+    def dependency(
+        fields: Optional[str] = Query(None, description=f"Comma-separated subset of: {', '.join(valid_fields)}")
+    ) -> Optional[List[str]]:
+        if fields is None:
+            return None
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = [name for name in requested if name not in valid_fields]
+        if unknown or not requested:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields {unknown}. Valid fields: {valid_fields}"
+            )
+        if "id" in valid_fields:
+            requested.insert(0, "id")
+        return list(dict.fromkeys(requested))
+
+    return dependency
+
+def sparse_response(content: Any, page: Optional[Page] = None) -> FastJSONResponse:
+    """Serialize partial DTOs as-is, bypassing the endpoint's full response model"""
+    response = FastJSONResponse(content=content)
+    if page is not None:
+        set_next_cursor(response, page)
+    return response
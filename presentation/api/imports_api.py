@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends, Path, Response, UploadFile, status
+from application.services.import_job_service import CsvProcessor, ImportJobApplicationService
+from application.dtos.auth_dtos import UserProfileDTO
+from application.dtos.import_job_dtos import ImportJobAcceptedDTO, ImportJobDTO
+from presentation.api.auth_api import get_current_user
+from presentation.api.json_responses import FastJSONRoute
+
+router = APIRouter(route_class=FastJSONRoute)
+
+# Service
+import_job_service = ImportJobApplicationService()
+
+async def queue_csv_import(kind: str, file: UploadFile, process: CsvProcessor,
+                           response: Response, current_user: UserProfileDTO) -> ImportJobAcceptedDTO:
+    """Queue an uploaded CSV file as a background import job and answer 202 Accepted"""
+    job = await import_job_service.submit_csv_import(kind, file.filename, file.file, process, current_user)
+    status_url = f"/imports/{job.id}"
+    response.status_code = status.HTTP_202_ACCEPTED
+    response.headers["Location"] = status_url
+    return ImportJobAcceptedDTO(job_id=job.id, status=job.status, status_url=status_url)
+
+@router.get("/{job_id}", response_model=ImportJobDTO)
+async def get_import_job(
+    job_id: str = Path(..., title="The ID of the import job"),
+    current_user: UserProfileDTO = Depends(get_current_user)
+):
+    """Get the status, progress, row counts and errors of a CSV import job
+
+    `progress` is the fraction of the file processed so far. Counts are
+    updated after every chunk while the job runs; `result` holds the final
+    upload summary once it has finished.
+    """
+    return import_job_service.get_job(job_id, current_user)
@@ -0,0 +1,124 @@
+# Fast JSON responses
+#
+# FastJSONResponse renders content with orjson instead of the standard json
+# module. FastJSONRoute adds a shortcut for endpoints whose response model is
+# a DTO or a list of DTOs: when the endpoint returns exactly those DTOs, as the
+# application services build them, they are dumped straight to JSON. FastAPI
+# would otherwise validate every DTO again against the response model and
+# walk it with jsonable_encoder before serializing. Anything else the endpoint
+# returns (dicts, Responses, other models) takes FastAPI's usual path.
+#
+# The shortcut is only used when the route's response class is
+# FastJSONResponse, so the default_response_class given to the app in main.py
+# switches both on or off.
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.dependencies.utils import get_typed_signature
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from pydantic.utils import lenient_issubclass
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
+from typing import Any, Callable, List, Optional, Tuple, Type, get_args, get_origin
+import asyncio
+import inspect
+import orjson
+
+
+def _default(value: Any) -> Any:
+    # Types orjson does not handle natively (Decimal, sets, nested models, ...)
+    return jsonable_encoder(value)
+
+
+def dump_json(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+
+def _dto_response_model(response_model: Any) -> Optional[Tuple[Type[BaseModel], bool]]:
+    """The DTO class of a response model and whether it is a list of them"""
+    many = get_origin(response_model) in (list, List)
+    model = get_args(response_model)[0] if many else response_model
+    if not lenient_issubclass(model, BaseModel) or model.__config__.json_encoders:
+        return None
+    return model, many
+
+
+def _dump_function(model: Type[BaseModel], options: dict) -> Callable[[BaseModel], Any]:
+    """Convert a DTO to JSON-ready values as FastAPI would for its response model"""
+    aliased = any(field.alias != name for name, field in model.__fields__.items())
+    if aliased or any(options.values()):
+        return lambda dto: dto.dict(by_alias=True, **options)
+    # A validated DTO's __dict__ holds exactly its fields
+    return lambda dto: dto.__dict__
+
+
+class FastJSONRoute(APIRoute):
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        response_class = kwargs.get("response_class")
+        if isinstance(response_class, DefaultPlaceholder):
+            response_class = response_class.value
+        response_model = kwargs.get("response_model")
+        dto_model = None
+        if lenient_issubclass(response_class, FastJSONResponse) and not isinstance(response_model, DefaultPlaceholder):
+            dto_model = _dto_response_model(response_model)
+        if dto_model is not None and kwargs.get("response_model_by_alias", True):
+            options = dict(
+                include=kwargs.get("response_model_include"),
+                exclude=kwargs.get("response_model_exclude"),
+                exclude_unset=kwargs.get("response_model_exclude_unset", False),
+                exclude_defaults=kwargs.get("response_model_exclude_defaults", False),
+                exclude_none=kwargs.get("response_model_exclude_none", False)
+            )
+            endpoint = _fast_json_endpoint(endpoint, *dto_model, _dump_function(dto_model[0], options),
+                                           kwargs.get("status_code"), response_class.media_type)
+        super().__init__(path, endpoint, **kwargs)
+
+
+def _fast_json_endpoint(endpoint: Callable[..., Any], model: Type[BaseModel], many: bool,
+                        dump: Callable[[BaseModel], Any], status_code: Optional[int],
+                        media_type: str) -> Callable[..., Any]:
+    """Wrap an endpoint so that DTO results are returned as a ready-made JSON response
+
+    The wrapper takes the endpoint's parameters plus, if the endpoint has none,
+    a Response parameter, so that headers and status codes set on it by the
+    endpoint or its dependencies still reach the client.
+    """
+    signature = get_typed_signature(endpoint)
+    parameters = list(signature.parameters.values())
+    response_param = next((p.name for p in parameters if lenient_issubclass(p.annotation, Response)), None)
+    added_response_param = response_param is None
+    if added_response_param:
+        response_param = "_fast_json_response"
+        parameters.append(inspect.Parameter(response_param, inspect.Parameter.KEYWORD_ONLY, annotation=Response))
+    is_coroutine = asyncio.iscoroutinefunction(endpoint)
+
+    async def fast_json_endpoint(**values: Any) -> Any:
+        sub_response = values.pop(response_param) if added_response_param else values[response_param]
+        if is_coroutine:
+            result = await endpoint(**values)
+        else:
+            result = await run_in_threadpool(endpoint, **values)
+        if many:
+            if type(result) is not list or not all(type(item) is model for item in result):
+                return result
+            content = dump_json([dump(item) for item in result])
+        elif type(result) is model:
+            content = dump_json(dump(result))
+        else:
+            return result
+        response = Response(content, status_code=sub_response.status_code or status_code or 200, media_type=media_type)
+        response.headers.raw.extend(sub_response.headers.raw)
+        return response
+
+    fast_json_endpoint.__name__ = endpoint.__name__
+    fast_json_endpoint.__qualname__ = endpoint.__qualname__
+    fast_json_endpoint.__doc__ = endpoint.__doc__
+    fast_json_endpoint.__module__ = endpoint.__module__
+    fast_json_endpoint.__signature__ = signature.replace(parameters=parameters)
+    return fast_json_endpoint
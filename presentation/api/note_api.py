@@ -2,18 +2,15 @@ from fastapi import APIRouter, Depends, Path, HTTPException, status
 from application.services.note_service import NoteApplicationService
 from application.dtos.auth_dtos import UserProfileDTO
 from application.dtos.note_dtos import NoteCreateDTO, NoteResponseDTO, NoteBriefDTO
-from infrastructure.repositories.note_repository import NoteRepository
+from infrastructure.repositories.repository_factory import get_note_repository
 from presentation.api.auth_api import get_current_user
+from presentation.api.json_responses import FastJSONRoute
 from typing import List
-from infrastructure.services.supabase_initializer import get_supabase_client
 
-router = APIRouter()
-
-# Supabase client
-supabase_client = get_supabase_client()
+router = APIRouter(route_class=FastJSONRoute)
 
 # Repositories
-note_repository = NoteRepository(supabase_client)
+note_repository = get_note_repository()
 
 # Services
 note_service = NoteApplicationService(note_repository)
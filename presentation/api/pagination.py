@@ -0,0 +1,19 @@
+from fastapi import Query, Response
+from domain.value_objects.page import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page, PageRequest
+from typing import Optional
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def page_request_params(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of rows to return"),
+    cursor: Optional[str] = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    sort: Optional[str] = Query(None, description="Column to sort by"),
+    order: str = Query("desc", regex="^(asc|desc)$", description="Sort direction")
+) -> PageRequest:
+    """Common keyset pagination query parameters"""
+    return PageRequest(limit=limit, cursor=cursor, sort_by=sort, descending=order == "desc")
+
+def set_next_cursor(response: Response, page: Page) -> None:
+    """Expose the cursor of the following page, if any, as a response header"""
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
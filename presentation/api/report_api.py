@@ -1,30 +1,96 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from application.services.report_service import ReportApplicationService
+from application.services.report_snapshots import REPORT_TABLES, ReportSnapshot, ReportSnapshotScheduler
 from application.dtos.auth_dtos import UserProfileDTO
 from application.dtos.report_dtos import ChurnTrendsDTO, ChurnBySegmentDTO, ChurnFactorsDTO, RetentionActionsDTO
+from infrastructure.repositories.repository_factory import get_report_repository, get_table_version_repository
 from presentation.api.auth_api import get_current_user
+from presentation.api.conditional import check_not_modified, etags_enabled, read_table_versions
+from presentation.api.json_responses import FastJSONRoute
+from typing import Callable, Optional
+import os
 
-router = APIRouter()
+router = APIRouter(route_class=FastJSONRoute)
 
 # Services
-report_service = ReportApplicationService()
+report_service = ReportApplicationService(get_report_repository())
+
+# Reports are served from a snapshot refreshed in the background (started
+# and stopped by main.py); 0 computes them on every request instead
+REPORT_SNAPSHOT_INTERVAL_SECONDS = float(os.getenv("REPORT_SNAPSHOT_INTERVAL_SECONDS", "60"))
+report_snapshots = ReportSnapshotScheduler(report_service, get_table_version_repository(), REPORT_SNAPSHOT_INTERVAL_SECONDS)
+
+GENERATION_HEADER = "X-Report-Generation"
+COMPUTED_AT_HEADER = "X-Report-Computed-At"
+
+def report_snapshot_param(report: str) -> Callable[..., Optional[ReportSnapshot]]:
+    """Dependency returning the current snapshot, or None when the report must be computed
+
+    Sets the snapshot's staleness headers and its ETag, and answers 304 when
+    the client already holds that ETag.
+    """
+    tables = REPORT_TABLES[report]
+
+    async def current_report_snapshot(
+        request: Request,
+        response: Response,
+        current_user: UserProfileDTO = Depends(get_current_user)
+    ) -> Optional[ReportSnapshot]:
+        snapshot = report_snapshots.current
+        if snapshot is not None:
+            response.headers[GENERATION_HEADER] = str(snapshot.generation)
+            response.headers[COMPUTED_AT_HEADER] = snapshot.computed_at.isoformat()
+            response.headers["Age"] = str(int(snapshot.age_seconds()))
+        if not etags_enabled():
+            return snapshot
+        if snapshot is None:
+            versions = await read_table_versions(tables)
+        elif snapshot.versions is not None:
+            versions = {table: snapshot.versions[table] for table in tables}
+        else:
+            versions = {"report_generation": snapshot.generation}
+        if versions is not None:
+            check_not_modified(request, response, versions)
+        return snapshot
+
+    return current_report_snapshot
 
 @router.get("/churn-trends", response_model=ChurnTrendsDTO)
-async def get_churn_trends(current_user: UserProfileDTO = Depends(get_current_user)):
+async def get_churn_trends(
+    snapshot: Optional[ReportSnapshot] = Depends(report_snapshot_param("churn_trends")),
+    current_user: UserProfileDTO = Depends(get_current_user)
+):
     """Get churn trend data for reports"""
+    if snapshot:
+        return snapshot.churn_trends
     return await report_service.get_churn_trends()
 
 @router.get("/churn-by-segment", response_model=ChurnBySegmentDTO)
-async def get_churn_by_segment(current_user: UserProfileDTO = Depends(get_current_user)):
+async def get_churn_by_segment(
+    snapshot: Optional[ReportSnapshot] = Depends(report_snapshot_param("churn_by_segment")),
+    current_user: UserProfileDTO = Depends(get_current_user)
+):
     """Get churn data by segment for reports"""
+    if snapshot:
+        return snapshot.churn_by_segment
     return await report_service.get_churn_by_segment()
 
 @router.get("/churn-factors", response_model=ChurnFactorsDTO)
-async def get_churn_factors(current_user: UserProfileDTO = Depends(get_current_user)):
+async def get_churn_factors(
+    snapshot: Optional[ReportSnapshot] = Depends(report_snapshot_param("churn_factors")),
+    current_user: UserProfileDTO = Depends(get_current_user)
+):
     """Get churn factors data for reports"""
+    if snapshot:
+        return snapshot.churn_factors
     return await report_service.get_churn_factors()
 
 @router.get("/retention-actions", response_model=RetentionActionsDTO)
-async def get_retention_actions(current_user: UserProfileDTO = Depends(get_current_user)):
+async def get_retention_actions(
+    snapshot: Optional[ReportSnapshot] = Depends(report_snapshot_param("retention_actions")),
+    current_user: UserProfileDTO = Depends(get_current_user)
+):
     """Get retention actions data for reports"""
+    if snapshot:
+        return snapshot.retention_actions
     return await report_service.get_retention_actions()
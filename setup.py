@@ -14,7 +14,11 @@ setup(
         "pyjwt>=2.6.0,<3.0.0",
         "python-multipart==0.0.6",
         "pydantic==1.10.7",
-        "email-validator==2.0.0"
+        "email-validator==2.0.0",
+        "asyncpg>=0.27.0",
+        "numpy>=1.24",
+        "orjson>=3.8",
+        "brotli>=1.0.9"
     ],
 )
 
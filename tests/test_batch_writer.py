@@ -0,0 +1,96 @@
+# BatchWriter splits failing chunks until exactly the bad rows are left,
+# within its retry budget, and stops on errors that are not caused by rows.
+from infrastructure.services.batch_writer import BatchWriter, is_row_error
+from postgrest.exceptions import APIError
+import asyncio
+import asyncpg
+import pytest
+
+
+class FakeTable:
+    """insert_chunk stand-in that rejects a whole chunk containing a bad row, like one INSERT"""
+
+    def __init__(self, bad_rows=(), error=None):
+        self.bad_rows = set(bad_rows)
+        self.error = error
+        self.inserts = 0
+        self.stored = []
+
+    async def insert_chunk(self, rows):
+        self.inserts += 1
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        bad = self.bad_rows.intersection(rows)
+        if bad:
+            raise asyncpg.exceptions.UniqueViolationError(f"duplicate key {min(bad)}")
+        self.stored.extend(rows)
+        return [row * 10 for row in rows]
+
+
+def write(writer, rows, table):
+    return asyncio.run(writer.write(rows, table.insert_chunk))
+
+
+def test_clean_rows_are_written_in_chunks_in_order():
+    table = FakeTable()
+    result = write(BatchWriter(chunk_size=3, max_concurrency=2), list(range(10)), table)
+    assert result.created == [row * 10 for row in range(10)]
+    assert result.failed_chunks == []
+    assert table.inserts == 4
+
+
+@pytest.mark.parametrize("bad_rows", [{0}, {5}, {9}, {3, 4}, {0, 7, 15}, set(range(16))])
+def test_bisection_isolates_exactly_the_bad_rows(bad_rows):
+    rows = list(range(16))
+    table = FakeTable(bad_rows)
+    result = write(BatchWriter(chunk_size=8, max_concurrency=4, isolate_failures=True, max_retries=1000), rows, table)
+    assert result.failed_rows == sorted(bad_rows)
+    assert all(chunk.row_count == 1 for chunk in result.failed_chunks)
+    assert result.created == [row * 10 for row in rows if row not in bad_rows]
+    assert sorted(table.stored) == [row for row in rows if row not in bad_rows]
+
+
+def test_failure_isolation_can_be_turned_off():
+    table = FakeTable({5})
+    result = write(BatchWriter(chunk_size=8, isolate_failures=False), list(range(16)), table)
+    assert [(chunk.start, chunk.end) for chunk in result.failed_chunks] == [(0, 8)]
+    assert result.created_count == 8
+    assert table.inserts == 2
+
+
+def test_retry_budget_limits_extra_inserts():
+    rows = list(range(64))
+    table = FakeTable(set(range(0, 64, 2)))
+    result = write(BatchWriter(chunk_size=64, isolate_failures=True, max_retries=6), rows, table)
+    # One first attempt, then two inserts per split while the budget lasts
+    assert table.inserts <= 1 + 6
+    assert result.created_count + result.failed_count == len(rows)
+    assert set(result.failed_rows) >= set(range(0, 64, 2))
+    # Chunks left when the budget ran out are reported whole
+    assert any(chunk.row_count > 1 for chunk in result.failed_chunks)
+
+
+def test_backend_error_is_not_retried_and_stops_later_chunks():
+    table = FakeTable(error=ConnectionError("connection lost"))
+    result = write(BatchWriter(chunk_size=2, max_concurrency=1, isolate_failures=True), list(range(8)), table)
+    assert table.inserts == 1
+    assert result.failed_count == 8
+    assert result.created == []
+    assert result.failed_chunks[0].error == "connection lost"
+    assert all("Not attempted" in chunk.error for chunk in result.failed_chunks[1:])
+
+
+def test_row_errors_are_recognized_through_causes():
+    assert is_row_error(asyncpg.exceptions.UniqueViolationError("dup"))
+    assert is_row_error(asyncpg.exceptions.InvalidTextRepresentationError("bad"))
+    assert is_row_error(APIError({"code": "23505", "message": "dup"}))
+    assert not is_row_error(APIError({"code": "42P01", "message": "missing table"}))
+    assert not is_row_error(ConnectionError("lost"))
+    try:
+        try:
+            raise asyncpg.exceptions.ForeignKeyViolationError("fk")
+        except Exception as e:
+            raise RuntimeError("insert failed") from e
+    except RuntimeError as wrapped:
+        assert is_row_error(wrapped)
@@ -0,0 +1,134 @@
+# CompressionMiddleware: gzip and brotli round-trips for whole and streamed
+# bodies, Vary on every compressible response, and ETag weakening.
+from presentation.api.compression import CompressionMiddleware, negotiate_encoding
+from presentation.api.conditional import matching_etag
+from starlette.responses import PlainTextResponse, Response, StreamingResponse
+import asyncio
+import brotli
+import gzip
+import pytest
+import zlib
+
+BODY = "".join(f"row {index},client {index % 7},{index * 1.5}\n" for index in range(2000)).encode()
+
+
+def serve(app, accept_encoding, minimum_size=1024):
+    """Run one GET through the middleware; returns (headers, body chunks)"""
+    middleware = CompressionMiddleware(app, minimum_size=minimum_size)
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/", "query_string": b"",
+             "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    asyncio.run(middleware(scope, receive, send))
+    headers = {name.decode().lower(): value.decode() for name, value in messages[0]["headers"]}
+    return headers, [message.get("body", b"") for message in messages[1:]]
+
+
+def streamed(chunks, media_type="application/x-ndjson"):
+    async def generate():
+        for chunk in chunks:
+            await asyncio.sleep(0)
+            yield chunk
+    return StreamingResponse(generate(), media_type=media_type)
+
+
+def decompressor(encoding):
+    if encoding == "br":
+        return brotli.Decompressor().process
+    return zlib.decompressobj(16 + zlib.MAX_WBITS).decompress
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip, deflate, br", "br"),
+    ("gzip", "gzip"),
+    ("br;q=0.5, gzip", "gzip"),
+    ("*", "br"),
+    ("gzip;q=0, br;q=0", None),
+    ("identity", None),
+    ("", None),
+    ("gzip;q=abc, br", "br"),
+])
+def test_negotiate_encoding(accept_encoding, expected):
+    assert negotiate_encoding(accept_encoding) == expected
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+def test_whole_body_round_trips(encoding):
+    headers, chunks = serve(PlainTextResponse(BODY), encoding)
+    body = b"".join(chunks)
+    assert headers["content-encoding"] == encoding
+    assert headers["vary"] == "Accept-Encoding"
+    assert int(headers["content-length"]) == len(body) < len(BODY)
+    assert (gzip.decompress(body) if encoding == "gzip" else brotli.decompress(body)) == BODY
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+def test_streamed_body_round_trips_chunk_by_chunk(encoding):
+    pieces = [b"{}\n"] + [BODY[start:start + 3000] for start in range(0, len(BODY), 3000)]
+    headers, chunks = serve(streamed(pieces), encoding)
+    assert headers["content-encoding"] == encoding
+    assert "content-length" not in headers
+    decompress = decompressor(encoding)
+    decoded = b""
+    for chunk in chunks:
+        decoded += decompress(chunk)
+        # Every flushed chunk can be decoded as soon as it arrives
+        assert b"".join(pieces).startswith(decoded)
+    assert decoded == b"".join(pieces)
+    assert len(chunks) > 2
+
+
+def test_small_streamed_body_is_sent_as_is_with_vary():
+    headers, chunks = serve(streamed([b"{}\n", b"{}\n"]), "gzip")
+    assert "content-encoding" not in headers
+    assert headers["vary"] == "Accept-Encoding"
+    assert b"".join(chunks) == b"{}\n{}\n"
+
+
+def test_small_body_keeps_strong_etag_and_gets_vary():
+    headers, chunks = serve(PlainTextResponse("ok", headers={"ETag": '"abc"'}), "br")
+    assert "content-encoding" not in headers
+    assert headers["etag"] == '"abc"'
+    assert headers["vary"] == "Accept-Encoding"
+    assert chunks == [b"ok"]
+
+
+def test_uncompressed_response_to_client_without_encodings_gets_vary():
+    headers, chunks = serve(PlainTextResponse(BODY), "identity")
+    assert "content-encoding" not in headers
+    assert headers["vary"] == "Accept-Encoding"
+    assert b"".join(chunks) == BODY
+
+
+@pytest.mark.parametrize("response", [
+    lambda: Response(BODY, media_type="image/png"),
+    lambda: Response(BODY, media_type="application/json", headers={"Content-Encoding": "identity"}),
+])
+def test_incompressible_responses_pass_through(response):
+    headers, chunks = serve(response(), "gzip")
+    assert "vary" not in headers
+    assert b"".join(chunks) == BODY
+
+
+def test_compressed_body_weakens_strong_etag():
+    headers, _ = serve(PlainTextResponse(BODY, headers={"ETag": '"abc"'}), "gzip")
+    assert headers["etag"] == 'W/"abc"'
+
+
+def test_weak_etag_stays_as_is():
+    headers, _ = serve(PlainTextResponse(BODY, headers={"ETag": 'W/"abc"'}), "gzip")
+    assert headers["etag"] == 'W/"abc"'
+
+
+def test_weakened_etag_still_matches_if_none_match():
+    assert matching_etag('W/"abc"', '"abc"') == 'W/"abc"'
+    assert matching_etag('"other", W/"abc"', '"abc"') == 'W/"abc"'
+    assert matching_etag('"abc"', '"abc"') == '"abc"'
+    assert matching_etag("*", '"abc"') == '"abc"'
+    assert matching_etag('W/"other"', '"abc"') is None
@@ -0,0 +1,183 @@
+# The compiled from_dict hydrators must build exactly what the hand-written
+# constructors they replaced built, including for rows with missing keys,
+# nulls, blank timestamps and falsy numbers.
+from datetime import datetime
+from domain.entities.client import Client, Contact
+from domain.entities.customer_incident_prediction import CustomerIncidentPrediction, IncidentType
+from domain.entities.customer_issue import CustomerIssue
+from domain.entities.email_notification import EmailNotification, NotificationStatus
+from domain.entities.hydration import TIMESTAMP_MEMO_SIZE, compile_hydrator, parse_timestamp, value
+import dataclasses
+import pytest
+
+
+def _timestamp(data, key):
+    return datetime.fromisoformat(data.get(key).replace('Z', '+00:00')) if data.get(key) else None
+
+
+def _float_or_none(data, key):
+    return float(data.get(key)) if data.get(key) is not None else None
+
+
+def reference_prediction(data):
+    return CustomerIncidentPrediction(
+        id=data.get('id'),
+        customer_id=data.get('customer_id', ''),
+        client_region=data.get('client_region', ''),
+        client_type=data.get('client_type', ''),
+        client_category=_float_or_none(data, 'client_category'),
+        q1_prediction=float(data.get('q1_prediction') or 0.0),
+        q2_prediction=float(data.get('q2_prediction') or 0.0),
+        q3_prediction=float(data.get('q3_prediction') or 0.0),
+        q4_prediction=float(data.get('q4_prediction') or 0.0),
+        most_likely_incident=IncidentType(data.get('most_likely_incident', 'other_incident')),
+        recommendation=data.get('recommendation', ''),
+        created_at=_timestamp(data, 'created_at'),
+        updated_at=_timestamp(data, 'updated_at')
+    )
+
+
+def reference_notification(data):
+    return EmailNotification(
+        id=data.get('id'),
+        email=data.get('email', ''),
+        name=data.get('name', ''),
+        issue=data.get('issue', ''),
+        status=NotificationStatus(data.get('status', 'pending')),
+        created_at=_timestamp(data, 'created_at'),
+        updated_at=_timestamp(data, 'updated_at'),
+        sent_at=_timestamp(data, 'sent_at')
+    )
+
+
+def reference_issue(data):
+    return CustomerIssue(
+        customer_id=_float_or_none(data, 'customer_id'),
+        code_contrat=_float_or_none(data, 'code_contrat'),
+        client_type=_float_or_none(data, 'client_type'),
+        client_region=_float_or_none(data, 'client_region'),
+        client_categorie=_float_or_none(data, 'client_categorie'),
+        incident_title=data.get('incident_title'),
+        churn_risk=_float_or_none(data, 'churn_risk'),
+        status=data.get('status', 'not sent')
+    )
+
+
+def reference_client(data):
+    contacts_data = data.get('contacts', {})
+    return Client(
+        id=data.get('id', ''),
+        name=data.get('name', ''),
+        segment=data.get('segment', ''),
+        since=data.get('since', ''),
+        churn_risk=data.get('churn_risk', ''),
+        contacts=Contact(
+            primary=contacts_data.get('primary', ''),
+            secondary=contacts_data.get('secondary'),
+            preferred_time=contacts_data.get('preferred_time'),
+            last_call=contacts_data.get('last_call')
+        ),
+        monthly_revenue=_float_or_none(data, 'monthly_revenue'),
+        churn_trend=data.get('churn_trend'),
+        churn_trend_days=data.get('churn_trend_days'),
+        created_at=_timestamp(data, 'created_at'),
+        updated_at=_timestamp(data, 'updated_at')
+    )
+
+
+PREDICTION_ROWS = [
+    {},
+    {'id': 7, 'customer_id': 'c7', 'client_region': 'north', 'client_type': 'pro', 'client_category': '3',
+     'q1_prediction': '12.5', 'q2_prediction': 0, 'q3_prediction': None, 'q4_prediction': 99.9,
+     'most_likely_incident': 'wifi_issue', 'recommendation': 'call',
+     'created_at': '2025-01-02T03:04:05Z', 'updated_at': '2025-01-02T03:04:05.123456+01:00'},
+    {'client_category': 0, 'q1_prediction': '', 'created_at': '', 'updated_at': None},
+    {'client_category': None, 'most_likely_incident': 'other_incident', 'created_at': '2025-06-30T23:59:59'},
+]
+
+NOTIFICATION_ROWS = [
+    {},
+    {'id': 1, 'email': 'a@example.com', 'name': 'A', 'issue': 'slow', 'status': 'sent',
+     'created_at': '2025-01-02T03:04:05Z', 'updated_at': '2025-01-02T03:04:06Z', 'sent_at': '2025-01-02T03:04:07+00:00'},
+    {'status': 'sending', 'created_at': '', 'sent_at': None},
+    {'email': None, 'name': None, 'status': 'failed'},
+]
+
+ISSUE_ROWS = [
+    {},
+    {'customer_id': '12', 'code_contrat': 0, 'client_type': 1.5, 'client_region': '2', 'client_categorie': 3,
+     'incident_title': 'Panne', 'churn_risk': '0.75', 'status': 'sent'},
+    {'customer_id': None, 'churn_risk': 0.0, 'incident_title': None},
+]
+
+CLIENT_ROWS = [
+    {'created_at': '2025-01-02T03:04:05+00:00'},
+    {'id': 'c1', 'name': 'Jean', 'segment': 'Premium', 'since': '3 ans', 'churn_risk': '91',
+     'contacts': {'primary': '0600', 'secondary': '0700', 'preferred_time': 'am', 'last_call': 'hier'},
+     'monthly_revenue': '120.50', 'churn_trend': 'up', 'churn_trend_days': 30,
+     'created_at': '2025-01-02T03:04:05', 'updated_at': '2025-02-02T03:04:05+00:00'},
+    {'contacts': {}, 'monthly_revenue': 0, 'churn_trend_days': None,
+     'created_at': '2025-01-02T03:04:05Z', 'updated_at': ''},
+]
+
+
+@pytest.mark.parametrize("row", PREDICTION_ROWS)
+def test_prediction_matches_reference(row):
+    assert CustomerIncidentPrediction.from_dict(row) == reference_prediction(row)
+
+
+@pytest.mark.parametrize("row", NOTIFICATION_ROWS)
+def test_notification_matches_reference(row):
+    assert EmailNotification.from_dict(row) == reference_notification(row)
+
+
+@pytest.mark.parametrize("row", ISSUE_ROWS)
+def test_issue_matches_reference(row):
+    assert CustomerIssue.from_dict(row) == reference_issue(row)
+
+
+@pytest.mark.parametrize("row", CLIENT_ROWS)
+def test_client_matches_reference(row):
+    assert Client.from_dict(row) == reference_client(row)
+
+
+def test_missing_client_created_at_defaults_to_now():
+    before = datetime.now()
+    client = Client.from_dict({})
+    assert before <= client.created_at <= datetime.now()
+    assert client.contacts == Contact(primary='')
+
+
+def test_unknown_enum_value_raises_like_the_enum():
+    with pytest.raises(ValueError):
+        CustomerIncidentPrediction.from_dict({'most_likely_incident': 'flood'})
+    with pytest.raises(ValueError):
+        EmailNotification.from_dict({'status': 'bounced'})
+
+
+def test_datetimes_pass_through():
+    created_at = datetime(2025, 1, 2, 3, 4, 5)
+    assert EmailNotification.from_dict({'created_at': created_at}).created_at is created_at
+
+
+def test_timestamp_memo_is_bounded():
+    for second in range(TIMESTAMP_MEMO_SIZE + 10):
+        parsed = parse_timestamp(f"2025-01-01T00:00:00.{second:06d}")
+        assert parsed.microsecond == second
+    assert parse_timestamp("2025-01-01T00:00:00.000001Z").tzinfo is not None
+
+
+def test_fields_out_of_order_are_passed_by_keyword():
+    @dataclasses.dataclass
+    class Pair:
+        first: str = "a"
+        second: str = "b"
+
+    hydrate = compile_hydrator(Pair, {'second': value('s', 'y')})
+    assert hydrate({}) == Pair(second='y')
+    assert hydrate({'s': 'z'}) == Pair(first='a', second='z')
+
+
+def test_unknown_field_is_rejected():
+    with pytest.raises(ValueError):
+        compile_hydrator(Contact, {'tertiary': value('tertiary')})
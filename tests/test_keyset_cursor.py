@@ -0,0 +1,109 @@
+# Keyset cursors: encoding round-trips, rejection of foreign or malformed
+# cursors, and the predicates built from them.
+from datetime import datetime, timezone
+from domain.value_objects.page import InvalidPageRequestError, PageRequest, build_page, decode_cursor, encode_cursor
+from infrastructure.repositories.postgres.pagination import build_page_query
+import base64
+import pytest
+
+COLUMN_TYPES = {"id": "uuid", "created_at": "timestamptz", "name": "text", "avg_risk": "double precision"}
+SORT_COLUMNS = ("created_at", "name", "avg_risk", "id")
+FILTER_COLUMNS = ("name", "avg_risk")
+SELECTABLE_COLUMNS = ("id", "created_at", "name", "avg_risk")
+
+
+@pytest.mark.parametrize("last_value, last_id", [
+    ("2025-01-02T03:04:05+00:00", "5d0f1a9e-0000-4000-8000-000000000001"),
+    (42, 7),
+    (0.5, 1),
+    (None, 3),
+    ("Résolution \"technique\", 100%/?&=", "x"),
+    ("", ""),
+])
+def test_cursor_round_trips(last_value, last_id):
+    cursor = encode_cursor("name", True, last_value, last_id)
+    assert decode_cursor(cursor, "name", True) == (last_value, last_id)
+
+
+def test_cursor_is_url_safe_without_padding():
+    for length in range(1, 12):
+        cursor = encode_cursor("name", False, "?" * length, ">" * length)
+        assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+        assert decode_cursor(cursor, "name", False) == ("?" * length, ">" * length)
+
+
+def test_datetime_values_are_encoded_as_text():
+    created_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    cursor = encode_cursor("created_at", True, created_at, 1)
+    last_value, _ = decode_cursor(cursor, "created_at", True)
+    assert datetime.fromisoformat(last_value) == created_at
+
+
+@pytest.mark.parametrize("sort_by, descending", [("created_at", True), ("name", False)])
+def test_cursor_for_another_ordering_is_rejected(sort_by, descending):
+    cursor = encode_cursor("name", True, "a", 1)
+    with pytest.raises(InvalidPageRequestError):
+        decode_cursor(cursor, sort_by, descending)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor",
+    "%%%",
+    base64.urlsafe_b64encode(b"{}").decode(),
+    base64.urlsafe_b64encode(b'["name", true, "a"]').decode(),
+    base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidPageRequestError):
+        decode_cursor(cursor, "name", True)
+
+
+def test_build_page_sets_cursor_only_when_more_rows_exist():
+    rows = [{"id": index, "name": f"n{index}"} for index in range(4)]
+    page = build_page(rows, PageRequest(limit=3, sort_by="name"), "name", lambda row: row["id"])
+    assert page.items == [0, 1, 2]
+    assert decode_cursor(page.next_cursor, "name", True) == ("n2", 2)
+
+    last_page = build_page(rows[:3], PageRequest(limit=3, sort_by="name"), "name", lambda row: row["id"])
+    assert last_page.items == [0, 1, 2]
+    assert last_page.next_cursor is None
+
+
+def page_query(page_request):
+    return build_page_query("clients", page_request, COLUMN_TYPES, SORT_COLUMNS, FILTER_COLUMNS,
+                            "created_at", SELECTABLE_COLUMNS)
+
+
+def test_first_page_query_orders_by_sort_column_and_id():
+    sql, args, sort_by = page_query(PageRequest(limit=10))
+    assert sort_by == "created_at"
+    assert "WHERE" not in sql
+    assert sql.endswith("ORDER BY created_at DESC, id DESC LIMIT $1")
+    assert args == [11]
+
+
+def test_cursor_becomes_a_row_comparison_with_bound_values():
+    cursor = encode_cursor("name", False, "O'Brien", "id-1")
+    sql, args, _ = page_query(PageRequest(limit=5, sort_by="name", descending=False, cursor=cursor,
+                                          filters={"avg_risk__gte": 50}))
+    assert "avg_risk >= $1::text::double precision" in sql
+    assert "(name, id) > ($2::text::text, $3::text::uuid)" in sql
+    assert "O'Brien" not in sql
+    assert args == ["50", "O'Brien", "id-1", 6]
+
+
+def test_id_sort_compares_the_id_only():
+    cursor = encode_cursor("id", True, "id-9", "id-9")
+    sql, args, _ = page_query(PageRequest(limit=5, sort_by="id", cursor=cursor))
+    assert "WHERE id < $1::text::uuid" in sql
+    assert sql.endswith("ORDER BY id DESC LIMIT $2")
+    assert args == ["id-9", 6]
+
+
+def test_unknown_sort_and_filter_are_rejected():
+    with pytest.raises(InvalidPageRequestError):
+        page_query(PageRequest(sort_by="password"))
+    with pytest.raises(InvalidPageRequestError):
+        page_query(PageRequest(filters={"password": "x"}))
+    with pytest.raises(InvalidPageRequestError):
+        page_query(PageRequest(filters={"name__like": "x"}))